@@ -3,7 +3,21 @@
 Query multiple AI models in parallel via OpenRouter
 Built with love by Moon Dev
 """
-from .director_agent import DirectorAgent
-from .swarm_agent import SwarmAgent
+
+# Loaded on first access so `from ai_agents.session_cache import ...` stays light
+_EXPORTS = {
+    "DirectorAgent": "ai_agents.director_agent",
+    "SwarmAgent": "ai_agents.swarm_agent",
+}
 
 __all__ = ["DirectorAgent", "SwarmAgent"]
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module 'ai_agents' has no attribute {name!r}")
+    from importlib import import_module
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
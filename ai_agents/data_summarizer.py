@@ -0,0 +1,481 @@
+"""
+🌙 Moon Dev's Data Summarizer
+Squeeze API results into a token budget before they go to the swarm
+
+Built with love by Moon Dev 🚀
+
+Usage:
+    from ai_agents.data_summarizer import DataSummarizer
+
+    summarizer = DataSummarizer(token_budget=6000)
+    text = summarizer.summarize({"get_positions()": api.get_positions()})
+
+Each endpoint has a reducer that keeps the signal (top-N by USD, aggregates,
+recent rows) and renders it as minified JSON and compact CSV-style tables.
+Reducers are retried at lower detail levels until the whole summary fits
+the budget, and budget left over by small results is handed to big ones.
+"""
+
+import json
+
+# ============================================
+# 🎯 SUMMARIZER CONFIGURATION - Moon Dev
+# ============================================
+
+DEFAULT_TOKEN_BUDGET = 6000  # tokens for ALL calls in one prompt
+CHARS_PER_TOKEN = 4          # rough estimate, good enough for budgeting
+DETAIL_LEVELS = (50, 25, 10, 5, 3, 1)  # rows kept per table, tried in order
+MAX_TABLE_COLUMNS = 10
+MAX_DEPTH = 4
+
+# Field names that hold a USD amount, in order of preference
+USD_KEYS = (
+    "value_usd", "usd_value", "value", "position_value", "positionValue",
+    "net_value", "notional", "total_value_usd", "total_value", "volume", "usd",
+)
+
+# Field names that hold a timestamp, in order of preference
+TIME_KEYS = ("time", "timestamp", "t", "datetime", "created_at")
+
+# ============================================
+
+
+def estimate_tokens(text):
+    """Rough token count for a string"""
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+def minify(obj):
+    """JSON without whitespace"""
+    return json.dumps(obj, separators=(",", ":"), default=str)
+
+
+def to_float(value, default=0.0):
+    """Best-effort float conversion for the string numbers the API returns"""
+    if isinstance(value, bool):
+        return default
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str):
+        try:
+            return float(value.replace(",", "").replace("$", ""))
+        except ValueError:
+            return default
+    return default
+
+
+def _is_scalar(value):
+    return value is None or isinstance(value, (str, int, float, bool))
+
+
+def _fmt(value):
+    """Compact cell rendering for tables"""
+    if isinstance(value, float):
+        if abs(value) >= 1000 or value.is_integer():
+            return str(round(value))
+        return f"{value:.6g}"
+    if value is None:
+        return ""
+    text = str(value)
+    if "," in text or "\n" in text:
+        text = '"' + text.replace('"', "'").replace("\n", " ") + '"'
+    return text
+
+
+def usd_key(rows):
+    """First USD-like key present in a list of dict rows"""
+    for key in USD_KEYS:
+        if any(isinstance(r, dict) and key in r for r in rows[:20]):
+            return key
+    return None
+
+
+def time_key(rows):
+    """First timestamp-like key present in a list of dict rows"""
+    for key in TIME_KEYS:
+        if any(isinstance(r, dict) and key in r for r in rows[:20]):
+            return key
+    return None
+
+
+def table_columns(rows):
+    """Scalar columns seen in the rows, most common first"""
+    counts = {}
+    for row in rows[:50]:
+        for key, value in row.items():
+            if _is_scalar(value):
+                counts[key] = counts.get(key, 0) + 1
+    ordered = sorted(counts, key=lambda k: -counts[k])
+    return ordered[:MAX_TABLE_COLUMNS]
+
+
+def csv_table(rows, columns=None):
+    """Render dict rows as a header line plus comma separated rows"""
+    if not rows:
+        return ""
+    columns = columns or table_columns(rows)
+    lines = [",".join(columns)]
+    for row in rows:
+        lines.append(",".join(_fmt(row.get(c)) for c in columns))
+    return "\n".join(lines)
+
+
+def top_rows(rows, top_n, key=None, by_time=False):
+    """
+    Pick the rows worth showing.
+
+    Sorted by |USD| descending by default, or most recent first when
+    `by_time` is set. Returns (selected_rows, sort_key_used).
+    """
+    rows = [r for r in rows if isinstance(r, dict)]
+    if by_time:
+        key = key or time_key(rows)
+        if key:
+            rows = sorted(rows, key=lambda r: to_float(r.get(key)), reverse=True)
+    else:
+        key = key or usd_key(rows)
+        if key:
+            rows = sorted(rows, key=lambda r: abs(to_float(r.get(key))), reverse=True)
+    return rows[:top_n], key
+
+
+def describe_rows(name, rows, top_n, by_time=False):
+    """Aggregate line plus a top-N table for a list of dict rows"""
+    selected, key = top_rows(rows, top_n, by_time=by_time)
+    header = f"{name}: {len(rows)} rows"
+    if key and not by_time:
+        total = sum(to_float(r.get(key)) for r in rows if isinstance(r, dict))
+        header += f", sum {key}={_fmt(total)}, top {len(selected)} by |{key}|"
+    elif key:
+        header += f", latest {len(selected)} by {key}"
+    else:
+        header += f", first {len(selected)}"
+    return header + "\n" + csv_table(selected)
+
+
+# ==================== REDUCERS ====================
+# Every reducer takes (result, top_n) and returns a string.
+
+def reduce_generic(result, top_n, name="data", depth=0):
+    """Walk any JSON payload keeping scalars, top-N tables and short lists"""
+    if _is_scalar(result):
+        return f"{name}: {_fmt(result)}"
+
+    if isinstance(result, list):
+        if not result:
+            return f"{name}: []"
+        if all(isinstance(r, dict) for r in result):
+            return describe_rows(name, result, top_n, by_time=usd_key(result) is None)
+        shown = result[:top_n]
+        more = f" (+{len(result) - len(shown)} more)" if len(result) > len(shown) else ""
+        return f"{name}: {minify(shown)}{more}"
+
+    if not isinstance(result, dict):
+        return f"{name}: {_fmt(result)}"
+
+    if depth >= MAX_DEPTH:
+        return f"{name}: {minify(result)[:top_n * 40]}"
+
+    # A dict of similar dicts (e.g. symbol -> stats) reads best as a table
+    values = list(result.values())
+    if len(values) > 3 and all(isinstance(v, dict) for v in values):
+        rows = [dict({"key": k}, **{ck: cv for ck, cv in v.items() if _is_scalar(cv)})
+                for k, v in result.items()]
+        return describe_rows(name, rows, top_n)
+
+    scalars = {k: v for k, v in result.items() if _is_scalar(v)}
+    parts = []
+    if scalars:
+        parts.append(f"{name}: {minify(scalars)}" if name != "data" else minify(scalars))
+    for key, value in result.items():
+        if key in scalars:
+            continue
+        child = key if name == "data" else f"{name}.{key}"
+        parts.append(reduce_generic(value, top_n, child, depth + 1))
+    return "\n".join(parts)
+
+
+def _side_rows(payload, side_keys=("longs", "shorts")):
+    """Merge longs/shorts lists into one list tagged with side"""
+    rows = []
+    for side_key in side_keys:
+        for pos in payload.get(side_key, []) or []:
+            if isinstance(pos, dict):
+                rows.append(dict(pos, side=pos.get("side", side_key[:-1].upper())))
+    return rows
+
+
+def reduce_positions(result, top_n):
+    """Positions near liquidation: stats, risk buckets, closest and largest"""
+    if not isinstance(result, dict):
+        return reduce_generic(result, top_n)
+    rows = _side_rows(result)
+    scalars = {k: v for k, v in result.items() if _is_scalar(v)}
+
+    buckets = {"<2%": 0.0, "2-5%": 0.0, "5-10%": 0.0, ">10%": 0.0}
+    for pos in rows:
+        dist = to_float(pos.get("distance_pct"), 100.0)
+        bucket = "<2%" if dist < 2 else "2-5%" if dist < 5 else "5-10%" if dist < 10 else ">10%"
+        buckets[bucket] += to_float(pos.get("value"))
+
+    closest = sorted(rows, key=lambda p: to_float(p.get("distance_pct"), 100.0))[:top_n]
+    largest, _ = top_rows(rows, max(1, top_n // 2))
+    return "\n".join([
+        minify(scalars),
+        f"value_by_distance_to_liq: {minify({k: round(v) for k, v in buckets.items()})}",
+        f"closest_to_liq ({len(closest)} of {len(rows)}):",
+        csv_table(closest),
+        f"largest ({len(largest)}):",
+        csv_table(largest),
+    ])
+
+
+def reduce_all_positions(result, top_n):
+    """All 148 symbols: per-symbol aggregates plus the biggest positions overall"""
+    if not isinstance(result, dict) or not isinstance(result.get("symbols"), dict):
+        return reduce_generic(result, top_n)
+    symbol_rows = []
+    all_rows = []
+    for symbol, sym in result["symbols"].items():
+        if not isinstance(sym, dict):
+            continue
+        long_val = to_float(sym.get("total_long_value"))
+        short_val = to_float(sym.get("total_short_value"))
+        symbol_rows.append({
+            "symbol": symbol,
+            "positions": sym.get("total_positions", 0),
+            "long_value": round(long_val),
+            "short_value": round(short_val),
+            "total_value": round(long_val + short_val),
+        })
+        for pos in _side_rows(sym):
+            all_rows.append(dict(pos, coin=pos.get("coin", symbol)))
+
+    symbols, _ = top_rows(symbol_rows, top_n, key="total_value")
+    positions, _ = top_rows(all_rows, top_n)
+    scalars = {k: v for k, v in result.items() if _is_scalar(v)}
+    return "\n".join([
+        minify(scalars),
+        f"symbols: {len(symbol_rows)}, top {len(symbols)} by total_value",
+        csv_table(symbols),
+        f"largest positions across all symbols ({len(positions)} of {len(all_rows)}):",
+        csv_table(positions),
+    ])
+
+
+def reduce_fills(result, top_n):
+    """Fills: totals, per-coin aggregates and the most recent fills"""
+    fills = result.get("fills", []) if isinstance(result, dict) else result
+    if not isinstance(fills, list):
+        return reduce_generic(result, top_n)
+    by_coin = {}
+    for fill in fills:
+        if not isinstance(fill, dict):
+            continue
+        agg = by_coin.setdefault(fill.get("coin", "?"), {
+            "coin": fill.get("coin", "?"), "fills": 0, "volume": 0.0, "pnl": 0.0, "fees": 0.0})
+        agg["fills"] += 1
+        agg["volume"] += to_float(fill.get("px")) * to_float(fill.get("sz"))
+        agg["pnl"] += to_float(fill.get("closedPnl"))
+        agg["fees"] += to_float(fill.get("fee"))
+    coins = sorted(by_coin.values(), key=lambda a: -a["volume"])
+    for agg in coins:
+        for key in ("volume", "pnl", "fees"):
+            agg[key] = round(agg[key], 2)
+    totals = {
+        "fills": len(fills),
+        "volume": round(sum(a["volume"] for a in coins), 2),
+        "pnl": round(sum(a["pnl"] for a in coins), 2),
+        "fees": round(sum(a["fees"] for a in coins), 2),
+    }
+    scalars = {k: v for k, v in result.items() if _is_scalar(v)} if isinstance(result, dict) else {}
+    recent, _ = top_rows(fills, top_n, by_time=True)
+    columns = [c for c in ("time", "coin", "side", "dir", "px", "sz", "closedPnl", "fee")
+               if any(c in f for f in recent)]
+    return "\n".join([
+        minify(dict(scalars, **totals)),
+        f"by_coin (top {min(top_n, len(coins))} of {len(coins)} by volume):",
+        csv_table(coins[:top_n]),
+        f"recent fills ({len(recent)}):",
+        csv_table(recent, columns or None),
+    ])
+
+
+def reduce_series(result, top_n, list_key, price_key):
+    """Ticks/candles: range statistics plus an evenly downsampled series"""
+    points = result.get(list_key, []) if isinstance(result, dict) else result
+    if not isinstance(points, list) or not points or not isinstance(points[0], dict):
+        return reduce_generic(result, top_n)
+    prices = [to_float(p.get(price_key)) for p in points]
+    first, last = prices[0], prices[-1]
+    stats = {
+        "points": len(points),
+        "first": first,
+        "last": last,
+        "min": min(prices),
+        "max": max(prices),
+        "change_pct": round((last - first) / first * 100, 4) if first else 0,
+    }
+    step = max(1, len(points) // max(1, top_n))
+    sampled = points[::step]
+    if sampled[-1] is not points[-1]:
+        sampled.append(points[-1])
+    scalars = {k: v for k, v in result.items() if _is_scalar(v)} if isinstance(result, dict) else {}
+    return "\n".join([
+        minify(dict(scalars, **stats)),
+        f"series (every {step}th point):",
+        csv_table(sampled),
+    ])
+
+
+def reduce_ticks(result, top_n):
+    return reduce_series(result, top_n, "ticks", "p")
+
+
+def reduce_candles(result, top_n):
+    return reduce_series(result, top_n, "candles", "c")
+
+
+def reduce_prices(result, top_n):
+    """224 coins of price/funding/OI: a table of the biggest OI plus funding extremes"""
+    if not isinstance(result, dict) or not isinstance(result.get("prices"), dict):
+        return reduce_generic(result, top_n)
+    funding = result.get("funding_rates", {}) or {}
+    oi = result.get("open_interest", {}) or {}
+    rows = []
+    for coin, price in result["prices"].items():
+        px = to_float(price)
+        rows.append({
+            "coin": coin,
+            "price": px,
+            "funding": to_float(funding.get(coin)),
+            "oi_usd": round(to_float(oi.get(coin)) * px),
+        })
+    by_oi, _ = top_rows(rows, top_n, key="oi_usd")
+    by_funding = sorted(rows, key=lambda r: r["funding"])
+    extremes = by_funding[:max(1, top_n // 5)] + by_funding[-max(1, top_n // 5):]
+    scalars = {k: v for k, v in result.items() if _is_scalar(v)}
+    return "\n".join([
+        minify(scalars),
+        f"top {len(by_oi)} of {len(rows)} coins by open interest (USD):",
+        csv_table(by_oi),
+        "funding extremes (most negative, most positive):",
+        csv_table(extremes),
+    ])
+
+
+def reduce_orderbook(result, top_n):
+    """L2 book: top-of-book stats plus the first levels each side"""
+    if not isinstance(result, dict) or not isinstance(result.get("levels"), list):
+        return reduce_generic(result, top_n)
+    levels = result["levels"]
+    bids = levels[0] if len(levels) > 0 else []
+    asks = levels[1] if len(levels) > 1 else []
+    depth = max(1, top_n // 2)
+    scalars = {k: v for k, v in result.items() if _is_scalar(v)}
+    scalars["bid_size_total"] = round(sum(to_float(l.get("sz")) for l in bids), 6)
+    scalars["ask_size_total"] = round(sum(to_float(l.get("sz")) for l in asks), 6)
+    return "\n".join([
+        minify(scalars),
+        f"bids (top {min(depth, len(bids))}):",
+        csv_table(bids[:depth], ["px", "sz", "n"]),
+        f"asks (top {min(depth, len(asks))}):",
+        csv_table(asks[:depth], ["px", "sz", "n"]),
+    ])
+
+
+def reduce_address_list(result, top_n):
+    """Plain address lists: count plus a sample"""
+    if not isinstance(result, list):
+        return reduce_generic(result, top_n)
+    shown = result[:top_n]
+    return f"{len(result)} addresses, first {len(shown)}:\n" + "\n".join(map(str, shown))
+
+
+# Director method name -> reducer. Anything else falls back to reduce_generic.
+REDUCERS = {
+    "get_positions": reduce_positions,
+    "get_all_positions": reduce_all_positions,
+    "get_user_fills": reduce_fills,
+    "get_fills": reduce_fills,
+    "get_hlp_trades": lambda r, n: reduce_fills(
+        {**r, "fills": r.get("trades", [])} if isinstance(r, dict) else r, n),
+    "get_ticks": reduce_ticks,
+    "get_candles": reduce_candles,
+    "get_prices": reduce_prices,
+    "get_orderbook": reduce_orderbook,
+    "get_whale_addresses": reduce_address_list,
+}
+
+
+class DataSummarizer:
+    """
+    🌙 Moon Dev's Data Summarizer
+
+    Turns a dict of {call_label: api_result} into one prompt-ready block
+    that fits inside `token_budget` tokens.
+    """
+
+    def __init__(self, token_budget=DEFAULT_TOKEN_BUDGET, reducers=None):
+        """
+        Args:
+            token_budget: Total tokens allowed for all calls together
+            reducers: Optional {method_name: reducer} overrides
+        """
+        self.token_budget = token_budget
+        self.reducers = dict(REDUCERS, **(reducers or {}))
+
+    def reduce(self, label, result, top_n):
+        """Run the endpoint reducer for a call label at one detail level"""
+        method_name = label.split("(")[0].strip()
+        reducer = self.reducers.get(method_name)
+        try:
+            if reducer is not None:
+                return reducer(result, top_n)
+        except Exception:
+            # Unexpected payload shape - the generic walker still works
+            pass
+        return reduce_generic(result, top_n)
+
+    def summarize_call(self, label, result, budget):
+        """Most detailed rendering of one call that fits in `budget` tokens"""
+        text = ""
+        for top_n in DETAIL_LEVELS:
+            text = self.reduce(label, result, top_n)
+            if estimate_tokens(text) <= budget:
+                return text
+        # Even the lowest detail is too big - hard cut as a last resort
+        limit = max(0, budget * CHARS_PER_TOKEN - 20)
+        return text[:limit] + "\n... [truncated]"
+
+    def summarize(self, data):
+        """
+        Summarize all results within the token budget.
+
+        Smaller results are rendered first so the budget they leave unused
+        flows to the larger ones.
+
+        Args:
+            data: Dict mapping call labels to API results
+
+        Returns:
+            String ready to drop into a swarm prompt
+        """
+        if not data:
+            return ""
+
+        # Order by raw size so cheap results go first
+        sizes = {label: len(minify(result)) for label, result in data.items()}
+        remaining_budget = self.token_budget
+        remaining_calls = len(data)
+        sections = {}
+        for label in sorted(data, key=lambda k: sizes[k]):
+            header = f"\n=== {label} ===\n"
+            share = remaining_budget // remaining_calls - estimate_tokens(header)
+            text = self.summarize_call(label, data[label], max(share, 1))
+            sections[label] = header + text
+            remaining_budget -= estimate_tokens(sections[label])
+            remaining_calls -= 1
+
+        # Keep the plan order in the prompt
+        return "\n".join(sections[label] for label in data)
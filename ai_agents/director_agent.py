@@ -16,22 +16,24 @@ The Director:
 """
 
 import os
+import re
 import sys
+import ast
 import json
+import inspect
+import contextlib
+from collections import namedtuple
 
-# Add parent directory to path for api.py import
+# Add parent directory to path for the api package
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from dotenv import load_dotenv
-from openai import OpenAI
 from termcolor import cprint
 
-# Load environment variables
-load_dotenv()
-
 # Import after path setup
-from api import MoonDevAPI
+from api import MoonDevAPI, TraceProfiler
 from ai_agents.swarm_agent import SwarmAgent
+from ai_agents.data_summarizer import DataSummarizer
+from ai_agents.session_cache import SessionCache
 
 # ============================================
 # 🎯 API KNOWLEDGE - What the Director knows
@@ -156,6 +158,26 @@ AVAILABLE HYPERLIQUID API ENDPOINTS (Moon Dev's Data Layer):
 # Director model (Grok 4 Fast via OpenRouter for SPEED!)
 DIRECTOR_MODEL = "x-ai/grok-4-fast"  # Fast reasoning model via OpenRouter
 
+# Token budget for ALL API data in one swarm prompt (see data_summarizer.py)
+DATA_TOKEN_BUDGET = 6000
+
+# Stop waiting once this many swarm models answered (None = wait for all)
+SWARM_QUORUM = None
+
+# System prompt for data analysis - kept identical across a session so the
+# provider-side prompt cache can reuse the data block
+SWARM_SYSTEM_PROMPT = """You are an expert crypto analyst reviewing Hyperliquid exchange data.
+This is institutional-grade data from Moon Dev's Data Layer API.
+Provide clear, actionable analysis based on the data provided.
+Focus on what the numbers mean for trading decisions."""
+
+# A validated API call from a plan. `label` is the canonical call string
+# (defaults dropped) - it is the dedup key and the heading the swarm sees.
+PlanCall = namedtuple("PlanCall", ["label", "method", "args", "kwargs"])
+
+# Matches the start of an API method name anywhere in a plan line
+PLAN_CALL_PATTERN = re.compile(r'\bget_\w+')
+
 
 class DirectorAgent:
     """
@@ -165,11 +187,20 @@ class DirectorAgent:
     executes with AI swarm for multi-perspective insights.
     """
 
-    def __init__(self):
+    def __init__(self, token_budget=DATA_TOKEN_BUDGET):
+        """
+        Args:
+            token_budget: Max tokens of API data sent to the swarm per prompt
+        """
         cprint("\n" + "=" * 60, "cyan")
         cprint("🌙 Moon Dev's Director Agent", "cyan", attrs=['bold'])
         cprint("=" * 60, "cyan")
 
+        # Deferred until a Director is actually created - openai is slow to import
+        from dotenv import load_dotenv
+        from openai import OpenAI
+        load_dotenv()
+
         openrouter_key = os.getenv("OPENROUTER_API_KEY")
         if not openrouter_key:
             raise ValueError("OPENROUTER_API_KEY not found in environment!")
@@ -183,6 +214,8 @@ class DirectorAgent:
         # MoonDevAPI for data fetching
         cprint("\n📡 Connecting to Moon Dev API...", "yellow")
         self.api = MoonDevAPI()
+        # MOONDEV_TRACE=trace.json writes a flame-graph trace of every plan run
+        self.profiler = TraceProfiler.from_env(self.api)
 
         if not self.api.api_key:
             cprint("⚠️  MOONDEV_API_KEY not found - API calls will fail", "yellow")
@@ -192,6 +225,12 @@ class DirectorAgent:
         # Swarm for multi-model analysis
         self.swarm = SwarmAgent()
 
+        # Fits fetched data into the swarm prompt budget
+        self.summarizer = DataSummarizer(token_budget=token_budget)
+
+        # API results fetched this session, reused while still fresh
+        self.session_cache = SessionCache()
+
         cprint("\n✅ Director ready!", "green")
         cprint("\n" + "-" * 60, "cyan")
         cprint("🎬 DIRECTOR MODE - I know all 40+ Hyperliquid APIs!", "cyan", attrs=['bold'])
@@ -211,6 +250,9 @@ INSTRUCTIONS:
 3. Format your plan with [PLAN] tag when proposing API calls
 4. Be concise, direct, and helpful
 5. Use Moon Dev branding
+6. Write each plan step as a Python call with literal arguments, using the
+   exact parameter names, e.g. get_user_fills("0x...", limit=500) or
+   get_candles("BTC", interval="1h")
 
 Example plan format:
 [PLAN]
@@ -220,6 +262,14 @@ Example plan format:
 
 When user asks "what can I do" or similar, give a helpful overview.
 When user asks for specific analysis, propose a concrete plan with [PLAN] tag.
+"""
+
+        warm = self.session_cache.describe()
+        if warm:
+            system_prompt += f"""
+DATA ALREADY FETCHED THIS SESSION (returns instantly - prefer these exact
+calls when they answer the question, and only add calls for what is missing):
+{warm}
 """
 
         response = self.client.chat.completions.create(
@@ -236,8 +286,24 @@ When user asks for specific analysis, propose a concrete plan with [PLAN] tag.
 
     def execute_plan(self, plan_text, original_question):
         """Execute API calls from plan and send to swarm"""
+        if self.profiler is None:
+            return self._execute_plan(plan_text, original_question)
+
+        self.profiler.reset()
+        try:
+            with self.profiler.span("execute_plan", question=original_question):
+                return self._execute_plan(plan_text, original_question)
+        finally:
+            self.profiler.save()
+
+    def _span(self, name, **args):
+        """Profiler span when tracing is on, otherwise a no-op"""
+        return self.profiler.span(name, **args) if self.profiler else contextlib.nullcontext()
+
+    def _execute_plan(self, plan_text, original_question):
         # Parse API calls from plan
-        api_calls = self._parse_plan(plan_text)
+        with self._span("parse_plan"):
+            api_calls = self._parse_plan(plan_text)
 
         if not api_calls:
             cprint("❌ No API calls found in plan", "red")
@@ -247,118 +313,292 @@ When user asks for specific analysis, propose a concrete plan with [PLAN] tag.
         cprint("\n📡 Fetching data from Moon Dev API...", "yellow")
         data = {}
         for call in api_calls:
-            cprint(f"   → {call}", "cyan")
-            result = self._execute_api_call(call)
+            result = self.session_cache.get(call.label)
+            if result is not None:
+                data[call.label] = result
+                self.api.record_cache_hit(call.method)
+                age = self.session_cache.age(call.label)
+                cprint(f"   ⚡ {call.label} (session cache, {age:.0f}s old)", "green")
+                continue
+
+            cprint(f"   → {call.label}", "cyan")
+            with self._span(call.label):
+                result = self._execute_api_call(call)
             if result is not None:
-                data[call] = result
-                cprint(f"   ✅ {call}", "green")
+                data[call.label] = result
+                self.session_cache.put(call.label, call.method, result)
+                cprint(f"   ✅ {call.label}", "green")
             else:
-                cprint(f"   ❌ {call} - failed", "red")
+                cprint(f"   ❌ {call.label} - failed", "red")
 
         if not data:
             cprint("❌ No data retrieved from APIs", "red")
             return None, None
 
         # Format data for swarm
-        data_summary = self._format_data(data)
+        with self._span("summarize"):
+            data_summary = self._format_data(data)
 
-        # Build swarm prompt
+        # Build swarm prompt - the data goes in a separate, cacheable context
+        # block so follow-up questions in _swarm_loop reuse the provider cache
         swarm_prompt = f"""
 QUESTION: {original_question}
 
-DATA FROM HYPERLIQUID APIs (Moon Dev's Data Layer):
-{data_summary}
-
 Analyze this data and provide your perspective on the question.
 Be specific about what the data tells us. Include actionable insights.
 Keep your response concise but thorough.
 """
 
-        system_prompt = """You are an expert crypto analyst reviewing Hyperliquid exchange data.
-This is institutional-grade data from Moon Dev's Data Layer API.
-Provide clear, actionable analysis based on the data provided.
-Focus on what the numbers mean for trading decisions."""
-
         cprint("\n🌊 Sending to AI Swarm for analysis...", "cyan")
-        results = self.swarm.query(swarm_prompt, system_prompt)
+        with self._span("swarm"):
+            results = self._ask_swarm(swarm_prompt, SWARM_SYSTEM_PROMPT,
+                                      context=self._data_context(data_summary))
         return results, data_summary
 
     def _parse_plan(self, plan_text):
-        """Extract API calls from plan text"""
+        """
+        Extract API calls from plan text.
+
+        Every `get_*(...)` expression is parsed with `ast`, bound against the
+        matching MoonDevAPI method signature and coerced to the parameter
+        types. Identical calls (after defaults are applied) are only
+        returned once, so `get_liquidations()` and `get_liquidations("1h")`
+        fetch a single time.
+
+        Returns:
+            list of PlanCall in plan order
+        """
         calls = []
+        seen = set()
         for line in plan_text.split('\n'):
-            if 'get_' in line:
-                # Extract method call including arguments
-                start = line.find('get_')
-                end = line.find(')', start) + 1
-                if end > start:
-                    call = line[start:end]
-                    # Handle calls without closing paren
-                    if ')' not in call:
-                        # Try to find the method name at least
-                        paren = call.find('(')
-                        if paren == -1:
-                            call = call.split()[0] + "()"
-                    calls.append(call)
+            pos = 0
+            while True:
+                match = PLAN_CALL_PATTERN.search(line, pos)
+                if not match:
+                    break
+                expr, pos = self._extract_call_expr(line, match.start())
+                call = self._parse_call(expr)
+                if call is None or call.label in seen:
+                    continue
+                seen.add(call.label)
+                calls.append(call)
         return calls
 
-    def _execute_api_call(self, call):
-        """Execute a single API call dynamically"""
+    @staticmethod
+    def _extract_call_expr(line, start):
+        """Slice `name(...)` out of a line starting at `start`, respecting quotes and nesting"""
+        name_end = start
+        while name_end < len(line) and (line[name_end].isalnum() or line[name_end] == '_'):
+            name_end += 1
+
+        i = name_end
+        while i < len(line) and line[i] == ' ':
+            i += 1
+        if i >= len(line) or line[i] != '(':
+            # Bare method name ("get_hlp_sentiment - check retail") means no args
+            return line[start:name_end] + "()", name_end
+
+        depth = 0
+        quote = None
+        escaped = False
+        for j in range(i, len(line)):
+            ch = line[j]
+            if quote:
+                if escaped:
+                    escaped = False
+                elif ch == '\\':
+                    escaped = True
+                elif ch == quote:
+                    quote = None
+            elif ch in ('"', "'"):
+                quote = ch
+            elif ch in '([{':
+                depth += 1
+            elif ch in ')]}':
+                depth -= 1
+                if depth == 0:
+                    return line[start:j + 1], j + 1
+
+        # Unbalanced - close the call ourselves and let the parser judge it
+        return line[start:] + ")", len(line)
+
+    def _parse_call(self, expr):
+        """Parse and validate a single call expression, returning a PlanCall or None"""
+        method_name = expr.split('(')[0].strip()
+        method = getattr(self.api, method_name, None)
+        if not method_name.startswith('get_') or not callable(method):
+            cprint(f"      ⚠️  Method {method_name} not found", "yellow")
+            return None
+
         try:
-            # Parse method name and arguments
-            if '(' in call:
-                method_name = call.split('(')[0]
-                args_str = call[call.find('(')+1:call.find(')')]
-            else:
-                method_name = call.strip()
-                args_str = ""
-
-            # Get method from API
-            method = getattr(self.api, method_name, None)
-            if not method:
-                cprint(f"      ⚠️  Method {method_name} not found", "yellow")
-                return None
-
-            # Execute with or without args
-            if args_str:
-                # Clean up argument string
-                args_str = args_str.strip().strip('"').strip("'")
-                return method(args_str)
+            args, kwargs = self._parse_call_args(expr)
+        except ValueError as e:
+            cprint(f"      ⚠️  Could not parse {expr}: {e}", "yellow")
+            return None
+
+        signature = inspect.signature(method)
+        try:
+            bound = signature.bind(*args, **kwargs)
+        except TypeError as e:
+            cprint(f"      ⚠️  {expr} does not match {method_name}{signature}: {e}", "yellow")
+            return None
+
+        # Coerce values to the type of each parameter's default (e.g. "500" -> 500)
+        for name, value in bound.arguments.items():
+            default = signature.parameters[name].default
+            bound.arguments[name] = self._coerce_arg(value, default)
+
+        # Canonical label: required args positionally, optional ones only if non-default
+        parts = []
+        for name, param in signature.parameters.items():
+            if name not in bound.arguments:
+                continue
+            value = bound.arguments[name]
+            if param.default is inspect.Parameter.empty:
+                parts.append(self._format_arg(value))
+            elif value != param.default:
+                parts.append(f"{name}={self._format_arg(value)}")
+        label = f"{method_name}({', '.join(parts)})"
+
+        bound.apply_defaults()
+        return PlanCall(label, method_name, tuple(bound.args), dict(bound.kwargs))
+
+    @staticmethod
+    def _parse_call_args(expr):
+        """Return (args, kwargs) for a call expression, raising ValueError if unusable"""
+        source = expr.strip()
+
+        def literal(node):
+            # Bare identifiers like BTC or 1h-less names become strings
+            if isinstance(node, ast.Name):
+                return node.id
+            # An unquoted wallet address parses as a hex int - keep it as written
+            if isinstance(node, ast.Constant) and isinstance(node.value, int):
+                text = ast.get_source_segment(source, node) or ''
+                if text.lower().startswith('0x'):
+                    return text
+            return ast.literal_eval(node)
+
+        try:
+            tree = ast.parse(source, mode='eval')
+        except SyntaxError:
+            tree = None
+
+        if tree is not None:
+            if not isinstance(tree.body, ast.Call):
+                raise ValueError("not a function call")
+            try:
+                args = [literal(arg) for arg in tree.body.args]
+                kwargs = {kw.arg: literal(kw.value) for kw in tree.body.keywords if kw.arg}
+            except (ValueError, SyntaxError, TypeError) as e:
+                raise ValueError(f"arguments must be literals ({e})")
+            return args, kwargs
+
+        # Lenient fallback for plans like get_candles(BTC, interval=1h)
+        inner = expr[expr.find('(') + 1:expr.rfind(')')]
+        args, kwargs = [], {}
+        for piece in (p.strip() for p in inner.split(',')):
+            if not piece:
+                continue
+            key, sep, value = piece.partition('=')
+            if sep and key.strip().isidentifier():
+                kwargs[key.strip()] = DirectorAgent._lenient_value(value)
+            elif kwargs:
+                raise ValueError("positional argument follows keyword argument")
             else:
-                return method()
+                args.append(DirectorAgent._lenient_value(piece))
+        return args, kwargs
+
+    @staticmethod
+    def _lenient_value(text):
+        """Literal value if it parses, otherwise the bare text as a string"""
+        text = text.strip()
+        if text.lower().startswith('0x'):
+            return text
+        try:
+            return ast.literal_eval(text)
+        except (ValueError, SyntaxError):
+            return text.strip('"').strip("'")
+
+    @staticmethod
+    def _coerce_arg(value, default):
+        """Coerce a parsed value to the type of the parameter default"""
+        if default is inspect.Parameter.empty or default is None or value is None:
+            return value
+        try:
+            if isinstance(default, bool):
+                if isinstance(value, str):
+                    return value.strip().lower() in ('true', '1', 'yes')
+                return bool(value)
+            if isinstance(default, int):
+                if isinstance(value, float) and value.is_integer():
+                    return int(value)
+                if isinstance(value, str):
+                    return int(float(value))
+            if isinstance(default, float) and isinstance(value, (int, str)):
+                return float(value)
+            if isinstance(default, str) and isinstance(value, (int, float)):
+                return str(value)
+        except ValueError:
+            pass
+        return value
+
+    @staticmethod
+    def _format_arg(value):
+        """Render an argument the way a plan would write it"""
+        if isinstance(value, str):
+            return json.dumps(value)
+        return repr(value)
 
+    def _execute_api_call(self, call):
+        """Execute a single parsed API call"""
+        try:
+            method = getattr(self.api, call.method)
+            return method(*call.args, **call.kwargs)
         except Exception as e:
             cprint(f"      ⚠️  Error: {str(e)[:50]}", "yellow")
             return None
 
     def _format_data(self, data):
-        """Format API data for swarm prompt"""
-        formatted = []
-        for call, result in data.items():
-            # Truncate large responses
-            result_str = json.dumps(result, indent=2, default=str)
-            if len(result_str) > 3000:
-                result_str = result_str[:3000] + "\n... [truncated]"
-            formatted.append(f"\n=== {call} ===\n{result_str}")
-        return "\n".join(formatted)
+        """Format API data for swarm prompt within the token budget"""
+        return self.summarizer.summarize(data)
 
-    def _display_results(self, results, original_data):
-        """Display swarm results beautifully - FULL responses, no truncation!"""
+    @staticmethod
+    def _data_context(data_summary):
+        """The data block shared by a plan's first swarm call and every follow-up"""
+        return f"DATA FROM HYPERLIQUID APIs (Moon Dev's Data Layer):\n{data_summary}"
+
+    def _ask_swarm(self, prompt, system_prompt, context=None):
+        """Query the swarm, printing each model's FULL answer as soon as it lands"""
         cprint("\n" + "=" * 60, "green")
         cprint("🤖 AI SWARM RESPONSES", "green", attrs=['bold'])
         cprint("=" * 60, "green")
 
-        for model, data in results.items():
-            if data["success"]:
-                cprint(f"\n💡 {model}:", "yellow", attrs=['bold'])
+        results = {}
+        for event in self.swarm.query_stream(prompt, system_prompt, quorum=SWARM_QUORUM,
+                                             context=context):
+            if event["type"] != "result":
+                continue
+            model = event["model"]
+            results[model] = {"response": event["response"], "success": event["success"]}
+            if self.profiler:
+                self.profiler.instant(f"{model} answered", success=event["success"],
+                                      cached=bool(event.get("cached")))
+            if event["success"]:
+                cached = " (cached)" if event.get("cached") else ""
+                cprint(f"\n💡 {model}{cached}:", "yellow", attrs=['bold'])
                 cprint("-" * 40, "yellow")
-                cprint(data["response"], "white")
+                cprint(event["response"], "white")
             else:
-                cprint(f"\n❌ {model}: {data['response']}", "red")
+                cprint(f"\n❌ {model}: {event['response']}", "red")
 
         cprint("\n" + "=" * 60, "green")
         cprint("🌙 Analysis complete! - Moon Dev", "cyan", attrs=['bold'])
+        return results
 
+    def _display_results(self, results, original_data):
+        """Wrap up a streamed swarm run and hand over to the follow-up loop"""
+        # Responses were already printed as they streamed in (see _ask_swarm)
         # Swarm follow-up loop - returns "exit" or "director"
         return self._swarm_loop(original_data)
 
@@ -370,10 +610,7 @@ Focus on what the numbers mean for trading decisions."""
         cprint("   Type 'quit' to exit", "grey")
         cprint("-" * 60, "cyan")
 
-        system_prompt = """You are an expert crypto analyst reviewing Hyperliquid exchange data.
-This is institutional-grade data from Moon Dev's Data Layer API.
-Provide clear, actionable analysis based on the data provided.
-Focus on what the numbers mean for trading decisions."""
+        context = self._data_context(data_summary)
 
         while True:
             try:
@@ -393,34 +630,16 @@ Focus on what the numbers mean for trading decisions."""
                 cprint("\n🎬 Back to Director mode!", "cyan")
                 return "director"
 
-            # Ask the swarm with the data context
+            # Ask the swarm - same system prompt and context as the plan run,
+            # so providers serve the data block from their prompt cache
             swarm_prompt = f"""
-CONTEXT - DATA FROM HYPERLIQUID APIs:
-{data_summary}
-
 USER QUESTION: {user_input}
 
 Analyze the data and answer the user's question.
 Be specific and actionable.
 """
             cprint("\n🌊 Asking the swarm...", "cyan")
-            results = self.swarm.query(swarm_prompt, system_prompt)
-
-            # Display results
-            cprint("\n" + "=" * 60, "green")
-            cprint("🤖 AI SWARM RESPONSES", "green", attrs=['bold'])
-            cprint("=" * 60, "green")
-
-            for model, response_data in results.items():
-                if response_data["success"]:
-                    cprint(f"\n💡 {model}:", "yellow", attrs=['bold'])
-                    cprint("-" * 40, "yellow")
-                    cprint(response_data["response"], "white")
-                else:
-                    cprint(f"\n❌ {model}: {response_data['response']}", "red")
-
-            cprint("\n" + "=" * 60, "green")
-            cprint("🌙 Analysis complete! - Moon Dev", "cyan", attrs=['bold'])
+            self._ask_swarm(swarm_prompt, SWARM_SYSTEM_PROMPT, context=context)
 
     def run(self):
         """Interactive chat loop"""
@@ -493,23 +712,7 @@ Add any additional insights, correct any errors, or expand on key points.
                         system_prompt = """You are an expert crypto analyst reviewing another AI's analysis of Hyperliquid data.
 Provide your own perspective, add insights, and highlight what's most actionable."""
 
-                        results = self.swarm.query(swarm_prompt, system_prompt)
-
-                        # Display results
-                        cprint("\n" + "=" * 60, "green")
-                        cprint("🤖 AI SWARM RESPONSES", "green", attrs=['bold'])
-                        cprint("=" * 60, "green")
-
-                        for model, data in results.items():
-                            if data["success"]:
-                                cprint(f"\n💡 {model}:", "yellow", attrs=['bold'])
-                                cprint("-" * 40, "yellow")
-                                cprint(data["response"], "white")
-                            else:
-                                cprint(f"\n❌ {model}: {data['response']}", "red")
-
-                        cprint("\n" + "=" * 60, "green")
-                        cprint("🌙 Analysis complete! - Moon Dev", "cyan", attrs=['bold'])
+                        self._ask_swarm(swarm_prompt, system_prompt)
 
                         # Back to Director - break inner loop
                         cprint("\n" + "-" * 60, "cyan")
@@ -0,0 +1,136 @@
+"""
+🌙 Moon Dev's Swarm Response Cache
+Remember what each model said so repeated questions come back instantly
+
+Built with love by Moon Dev 🚀
+
+Usage:
+    from ai_agents.response_cache import ResponseCache
+
+    cache = ResponseCache(ttl=600, max_entries=500)
+    key = cache.make_key("openai/gpt-4o", system_prompt, prompt, context=data)
+    cached = cache.get(key)
+    if cached is None:
+        cache.put(key, "openai/gpt-4o", answer)
+
+Entries live in a small SQLite file, keyed on (model, system prompt, data
+context, normalized prompt). Prompts are normalized (case, whitespace,
+trailing punctuation) so "What's BTC doing?" and "what's btc doing" share
+an entry. Entries expire after `ttl` seconds and the least recently used
+ones are evicted past `max_entries`.
+"""
+
+import os
+import re
+import time
+import sqlite3
+import hashlib
+import threading
+
+# ============================================
+# 🎯 CACHE CONFIGURATION - Moon Dev
+# ============================================
+
+DEFAULT_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "moondev", "swarm_responses.sqlite3")
+DEFAULT_TTL = 600           # seconds an answer stays valid
+DEFAULT_MAX_ENTRIES = 500   # LRU eviction beyond this
+
+# ============================================
+
+
+class ResponseCache:
+    """
+    🌙 Moon Dev's Swarm Response Cache
+
+    Thread-safe on-disk cache of model responses with TTL and LRU eviction.
+    """
+
+    def __init__(self, path=DEFAULT_CACHE_PATH, ttl=DEFAULT_TTL, max_entries=DEFAULT_MAX_ENTRIES):
+        """
+        Args:
+            path: SQLite file to store responses in (":memory:" for a throwaway cache)
+            ttl: Seconds before an entry expires
+            max_entries: Max entries kept, least recently used go first
+        """
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                " key TEXT PRIMARY KEY, model TEXT, response TEXT,"
+                " created REAL, accessed REAL)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_accessed ON responses (accessed)")
+
+    @staticmethod
+    def normalize_prompt(text):
+        """Collapse whitespace, lowercase and drop trailing punctuation"""
+        text = " ".join(text.split()).lower()
+        return re.sub(r"[\s?!.]+$", "", text)
+
+    @staticmethod
+    def normalize_block(text):
+        """Whitespace-only normalization for system prompts and data blocks"""
+        return " ".join((text or "").split())
+
+    def make_key(self, model_id, system_prompt, prompt, context=None):
+        """Cache key for one model answering one prompt"""
+        parts = [
+            model_id,
+            self.normalize_block(system_prompt),
+            self.normalize_block(context),
+            self.normalize_prompt(prompt),
+        ]
+        return hashlib.sha256("\x1f".join(parts).encode("utf-8")).hexdigest()
+
+    def get(self, key):
+        """Cached response for `key`, or None if missing/expired"""
+        now = time.time()
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT response, created FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or now - row[1] > self.ttl:
+                if row is not None:
+                    self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self.misses += 1
+                return None
+            self._conn.execute("UPDATE responses SET accessed = ? WHERE key = ?", (now, key))
+            self.hits += 1
+            return row[0]
+
+    def put(self, key, model_id, response):
+        """Store a response and evict expired/overflow entries"""
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, model, response, created, accessed)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (key, model_id, response, now, now),
+            )
+            self._conn.execute("DELETE FROM responses WHERE created < ?", (now - self.ttl,))
+            self._conn.execute(
+                "DELETE FROM responses WHERE key IN ("
+                " SELECT key FROM responses ORDER BY accessed DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+
+    def clear(self):
+        """Drop every cached response"""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM responses")
+
+    def stats(self):
+        """Hit/miss counters and current size"""
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+        return {"hits": self.hits, "misses": self.misses, "entries": entries}
@@ -0,0 +1,144 @@
+"""
+🌙 Moon Dev's Session Cache
+Keep API results warm for the length of a Director chat session
+
+Built with love by Moon Dev 🚀
+
+Usage:
+    from ai_agents.session_cache import SessionCache
+
+    cache = SessionCache()
+    result = cache.get('get_hlp_sentiment()')
+    if result is None:
+        result = api.get_hlp_sentiment()
+        cache.put('get_hlp_sentiment()', 'get_hlp_sentiment', result)
+
+Entries are keyed on the Director's canonical call label, so
+`get_liquidations()` and `get_liquidations("1h")` share one entry. Each
+method gets a freshness window that matches how often its endpoint
+updates, e.g. 1s for positions.json and 60s for positions/all.json.
+"""
+
+import time
+
+# ============================================
+# 🎯 FRESHNESS WINDOWS - Moon Dev
+# ============================================
+
+# Default: the API refreshes most data every 30 seconds
+DEFAULT_TTL = 30
+
+# Seconds a result stays fresh, per MoonDevAPI method (see the api package docs)
+ENDPOINT_TTL = {
+    # Real-time feeds
+    "get_positions": 1,            # updates every 1s
+    "get_price": 1,
+    "get_orderbook": 1,
+    "get_trades": 5,
+    "get_tick_latest": 5,
+    "get_prices": 5,
+    "get_events": 10,
+    "get_whales": 10,
+    "get_buyers": 10,
+
+    # Minute-level snapshots
+    "get_all_positions": 60,       # updates every 60s
+    "get_position_snapshots": 60,  # 1-minute snapshots
+    "get_position_snapshot_stats": 60,
+    "get_hlp_positions": 60,
+    "get_hlp_position_history": 60,
+    "get_hlp_deltas": 60,
+    "get_candles": 60,
+    "get_ticks": 30,
+
+    # Slow-moving aggregates and registries
+    "get_smart_money_rankings": 300,
+    "get_smart_money_leaderboard": 300,
+    "get_hlp_trade_stats": 300,
+    "get_hlp_timing": 300,
+    "get_hlp_correlation": 300,
+    "get_hlp_flip_stats": 300,
+    "get_hlp_flips": 300,
+    "get_candle_symbols": 3600,
+    "get_contracts": 3600,
+    "get_depositors": 3600,
+    "get_whale_addresses": 3600,
+    "get_hip3_meta": 300,
+}
+
+# ============================================
+
+
+class SessionCache:
+    """
+    🌙 Moon Dev's Session Cache
+
+    In-memory store of API results for one Director session, with
+    per-endpoint freshness.
+    """
+
+    def __init__(self, ttls=None, default_ttl=DEFAULT_TTL):
+        """
+        Args:
+            ttls: Optional {method_name: seconds} overrides
+            default_ttl: Freshness for methods without an entry
+        """
+        self.ttls = dict(ENDPOINT_TTL, **(ttls or {}))
+        self.default_ttl = default_ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries = {}  # label -> (method_name, result, fetched_at)
+
+    def ttl_for(self, method_name):
+        """Freshness window in seconds for a method"""
+        return self.ttls.get(method_name, self.default_ttl)
+
+    def age(self, label):
+        """Seconds since `label` was fetched, or None if never fetched"""
+        entry = self._entries.get(label)
+        return None if entry is None else time.monotonic() - entry[2]
+
+    def is_fresh(self, label):
+        """True if `label` was fetched within its method's freshness window"""
+        entry = self._entries.get(label)
+        return entry is not None and time.monotonic() - entry[2] <= self.ttl_for(entry[0])
+
+    def get(self, label):
+        """Cached result for a call label if still fresh, else None"""
+        if self.is_fresh(label):
+            self.hits += 1
+            return self._entries[label][1]
+        self.misses += 1
+        return None
+
+    def put(self, label, method_name, result):
+        """Store a freshly fetched result"""
+        self._entries[label] = (method_name, result, time.monotonic())
+
+    def warm(self):
+        """
+        Fresh entries, most recent first.
+
+        Returns:
+            list of (label, age_seconds, seconds_left)
+        """
+        now = time.monotonic()
+        warm = []
+        for label, (method_name, _, fetched_at) in self._entries.items():
+            age = now - fetched_at
+            left = self.ttl_for(method_name) - age
+            if left > 0:
+                warm.append((label, age, left))
+        return sorted(warm, key=lambda w: w[1])
+
+    def describe(self):
+        """Planner-facing list of warm calls ('' when nothing is warm)"""
+        lines = [
+            f"• {label} - fetched {age:.0f}s ago, fresh for {left:.0f}s more"
+            for label, age, left in self.warm()
+        ]
+        return "\n".join(lines)
+
+    def clear(self):
+        """Forget everything (e.g. when the user asks for a full refresh)"""
+        self._entries.clear()
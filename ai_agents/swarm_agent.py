@@ -13,16 +13,29 @@ Usage:
     for model, data in results.items():
         if data["success"]:
             print(f"{model}: {data['response']}")
+
+    # Print each answer the moment it lands, stop after 3 models agree to answer
+    for event in swarm.query_stream("Should I buy BTC now?", quorum=3):
+        if event["type"] == "result":
+            print(event["model"], event["response"])
+
+    # Send a big data block as reusable context (provider-side prompt caching)
+    results = swarm.query("Is HLP positioned long?", context=data_summary)
 """
 
 import os
-from dotenv import load_dotenv
-from openai import OpenAI
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import re
+import sys
+import time
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from termcolor import cprint
 
-# Load environment variables
-load_dotenv()
+# Add parent directory to path so this file also runs as a script
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ai_agents.response_cache import ResponseCache
 
 # ============================================
 # 🎯 SWARM CONFIGURATION - Moon Dev
@@ -44,6 +57,15 @@ SWARM_MODELS = [
 DEFAULT_MAX_TOKENS = 2048
 DEFAULT_TEMPERATURE = 0.7
 MODEL_TIMEOUT = 120  # seconds
+DEFAULT_QUORUM = None  # None = wait for every model, k = return after k answers
+
+# Response cache (see response_cache.py) - repeated questions skip the models
+SWARM_CACHE_ENABLED = True
+
+# Providers that need an explicit cache_control marker for prompt caching on
+# OpenRouter. The rest (OpenAI, DeepSeek, ...) cache a repeated prefix on
+# their own, so the context block is just kept first and byte-identical.
+PROMPT_CACHE_PREFIXES = ("anthropic/", "google/")
 
 # ============================================
 
@@ -57,15 +79,26 @@ class SwarmAgent:
     on trading decisions.
     """
 
-    def __init__(self, custom_models=None):
+    def __init__(self, custom_models=None, cache=None):
         """
         Initialize the Swarm Agent
 
         Args:
             custom_models: Optional list of (name, model_id) tuples to override defaults
+            cache: Optional ResponseCache. None = default on-disk cache
+                   (if SWARM_CACHE_ENABLED), False = no caching
         """
         self.models = custom_models or SWARM_MODELS
 
+        if cache is None and SWARM_CACHE_ENABLED:
+            cache = ResponseCache()
+        self.cache = cache or None
+
+        # Deferred: openai alone takes ~0.5s to import
+        from dotenv import load_dotenv
+        from openai import OpenAI
+        load_dotenv()
+
         api_key = os.getenv("OPENROUTER_API_KEY")
         if not api_key:
             raise ValueError("OPENROUTER_API_KEY not found in environment!")
@@ -80,23 +113,64 @@ class SwarmAgent:
         for name, model_id in self.models:
             cprint(f"      • {name}", "white")
 
-    def _query_model(self, model_name, model_id, prompt, system_prompt):
-        """Query a single model via OpenRouter"""
+    @staticmethod
+    def _build_messages(model_id, prompt, system_prompt, context=None):
+        """
+        Chat messages for one model
+
+        With a `context` block the user message is split into two parts:
+        the context first (marked cacheable where the provider needs it),
+        then the prompt. Follow-up questions about the same data then reuse
+        the provider's cached prefix instead of paying for it again.
+        """
+        if context is None:
+            user_content = prompt
+        else:
+            context_part = {"type": "text", "text": context}
+            if model_id.startswith(PROMPT_CACHE_PREFIXES):
+                context_part["cache_control"] = {"type": "ephemeral"}
+            user_content = [context_part, {"type": "text", "text": prompt}]
+
+        return [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_content}
+        ]
+
+    def _query_model(self, model_name, model_id, prompt, system_prompt,
+                     on_token=None, stop_event=None, context=None):
+        """
+        Query a single model via OpenRouter
+
+        The response is always streamed so a set `stop_event` can abandon
+        the request between chunks. `on_token(model_name, text)` is called
+        for every content delta when given.
+        """
+        stream = None
         try:
-            response = self.client.chat.completions.create(
+            stream = self.client.chat.completions.create(
                 model=model_id,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": prompt}
-                ],
+                messages=self._build_messages(model_id, prompt, system_prompt, context),
                 max_tokens=DEFAULT_MAX_TOKENS,
-                temperature=DEFAULT_TEMPERATURE
+                temperature=DEFAULT_TEMPERATURE,
+                timeout=MODEL_TIMEOUT,
+                stream=True
             )
 
-            content = response.choices[0].message.content
+            parts = []
+            for chunk in stream:
+                if stop_event is not None and stop_event.is_set():
+                    return model_name, "Cancelled", False
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    parts.append(delta)
+                    if on_token is not None:
+                        on_token(model_name, delta)
+
+            content = "".join(parts)
 
             # Strip <think> tags from reasoning models
-            import re
             content = re.sub(r'<think>.*?</think>', '', content, flags=re.DOTALL).strip()
 
             return model_name, content, True
@@ -104,13 +178,123 @@ class SwarmAgent:
         except Exception as e:
             return model_name, str(e), False
 
-    def query(self, prompt, system_prompt="You are a helpful trading analyst."):
+        finally:
+            if stream is not None and hasattr(stream, "close"):
+                stream.close()
+
+    def query_stream(self, prompt, system_prompt="You are a helpful trading analyst.",
+                     stream_tokens=False, quorum=DEFAULT_QUORUM, timeout=MODEL_TIMEOUT,
+                     context=None, use_cache=True):
+        """
+        Query all models in parallel, yielding events as they happen
+
+        Args:
+            prompt: The question/prompt to send to all models
+            system_prompt: System prompt for context
+            stream_tokens: Also yield each model's tokens as they arrive
+            quorum: Stop after this many successful answers (None = all models)
+            timeout: Seconds to wait overall before giving up on laggards
+            context: Optional data block sent ahead of the prompt so providers
+                     can cache it across follow-up questions
+            use_cache: Serve/store answers from the response cache
+
+        Yields:
+            {"type": "token", "model": name, "text": "..."}             (stream_tokens only)
+            {"type": "result", "model": name, "response": "...", "success": bool,
+             "cached": bool}
+
+        Cached answers are yielded first, without touching the network.
+
+        Once the quorum is met, the timeout passes or the caller stops
+        iterating, the remaining models are cancelled and reported as
+        failed "Cancelled"/"Timeout" results.
+        """
+        events = queue.Queue()
+        stop_event = threading.Event()
+        on_token = (lambda name, text: events.put({"type": "token", "model": name, "text": text})) \
+            if stream_tokens else None
+        cache = self.cache if use_cache else None
+
+        def run(name, model_id, cache_key):
+            name, response, success = self._query_model(
+                name, model_id, prompt, system_prompt, on_token, stop_event, context
+            )
+            if success and cache is not None:
+                cache.put(cache_key, model_id, response)
+            events.put({"type": "result", "model": name, "response": response,
+                        "success": success, "cached": False})
+
+        # Answer what we can from the cache before starting any request
+        to_query = []
+        cached_events = []
+        for name, model_id in self.models:
+            cache_key = cache.make_key(model_id, system_prompt, prompt, context) if cache else None
+            response = cache.get(cache_key) if cache else None
+            if response is None:
+                to_query.append((name, model_id, cache_key))
+                continue
+            if stream_tokens:
+                cached_events.append({"type": "token", "model": name, "text": response})
+            cached_events.append({"type": "result", "model": name, "response": response,
+                                  "success": True, "cached": True})
+
+        executor = ThreadPoolExecutor(max_workers=max(1, len(to_query)))
+        pending = {name for name, _, _ in to_query}
+        successful = 0
+        deadline = time.monotonic() + timeout
+
+        def quorum_met():
+            return bool(quorum) and successful >= quorum
+
+        try:
+            for event in cached_events:
+                yield event
+                successful += event["type"] == "result"
+
+            if not quorum_met():
+                for name, model_id, cache_key in to_query:
+                    executor.submit(run, name, model_id, cache_key)
+
+            while pending and not quorum_met():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    event = events.get(timeout=remaining)
+                except queue.Empty:
+                    break
+
+                if event["type"] == "result":
+                    if event["model"] not in pending:
+                        continue
+                    pending.discard(event["model"])
+                    successful += event["success"]
+                yield event
+
+            # Laggards: report them and let their threads wind down
+            reason = "Cancelled (quorum reached)" if quorum_met() else "Timeout"
+            for name, _ in self.models:
+                if name in pending:
+                    pending.discard(name)
+                    yield {"type": "result", "model": name, "response": reason,
+                           "success": False, "cached": False}
+
+        finally:
+            stop_event.set()
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def query(self, prompt, system_prompt="You are a helpful trading analyst.",
+              quorum=DEFAULT_QUORUM, timeout=MODEL_TIMEOUT, context=None, use_cache=True):
         """
         Query all models in parallel
 
         Args:
             prompt: The question/prompt to send to all models
             system_prompt: System prompt for context
+            quorum: Return once this many models answered (None = wait for all)
+            timeout: Seconds to wait before giving up on slow models
+            context: Optional data block to send ahead of the prompt (prompt caching)
+            use_cache: Serve/store answers from the response cache
 
         Returns:
             Dict mapping model names to response dicts:
@@ -123,32 +307,16 @@ class SwarmAgent:
         cprint(f"\n🌊 Querying {len(self.models)} AI models in parallel...", "cyan", attrs=['bold'])
 
         results = {}
-
-        with ThreadPoolExecutor(max_workers=len(self.models)) as executor:
-            # Submit all queries in parallel
-            futures = {
-                executor.submit(
-                    self._query_model, name, model_id, prompt, system_prompt
-                ): name
-                for name, model_id in self.models
-            }
-
-            # Collect results as they complete
-            try:
-                for future in as_completed(futures, timeout=MODEL_TIMEOUT):
-                    name, response, success = future.result()
-                    results[name] = {"response": response, "success": success}
-
-                    status = "✅" if success else "❌"
-                    color = "green" if success else "red"
-                    cprint(f"   {status} {name}", color)
-
-            except TimeoutError:
-                cprint("   ⏰ Some models timed out", "yellow")
-                # Mark remaining as failed
-                for future, name in futures.items():
-                    if name not in results:
-                        results[name] = {"response": "Timeout", "success": False}
+        for event in self.query_stream(prompt, system_prompt, quorum=quorum, timeout=timeout,
+                                       context=context, use_cache=use_cache):
+            if event["type"] != "result":
+                continue
+            name, success = event["model"], event["success"]
+            results[name] = {"response": event["response"], "success": success}
+
+            status = "💾" if event["cached"] else "✅" if success else "❌"
+            color = "green" if success else "red"
+            cprint(f"   {status} {name}", color)
 
         successful = sum(1 for r in results.values() if r["success"])
         cprint(f"\n✨ {successful}/{len(self.models)} models responded - Moon Dev", "cyan")
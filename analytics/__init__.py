@@ -0,0 +1,38 @@
+"""
+🌙 Moon Dev's Analytics
+Local, incremental analytics on top of the MoonDevAPI responses
+
+Built with love by Moon Dev 🚀
+"""
+
+# Loaded on first access so importing one tool doesn't pull in the others
+_EXPORTS = {
+    "PositionIndex": "analytics.positions",
+    "RISK_BUCKETS": "analytics.positions",
+    "CascadeSimulator": "analytics.cascade",
+    "SnapshotStore": "analytics.snapshot_store",
+    "OrderBook": "analytics.orderbook",
+    "OrderBooks": "analytics.orderbook",
+    "BookRecorder": "analytics.book_recorder",
+    "MarketSnapshot": "analytics.market",
+    "MarketHistory": "analytics.market",
+    "FundingHistory": "analytics.funding_history",
+    "HLPDeltaEngine": "analytics.hlp_signals",
+    "HLPExposureStore": "analytics.hlp_exposure",
+    "HLPCorrelationEngine": "analytics.hlp_correlation",
+    "HLPTradeStore": "analytics.hlp_trades",
+    "CandleCache": "analytics.smart_money_backtest",
+    "SignalBacktester": "analytics.smart_money_backtest",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module 'analytics' has no attribute {name!r}")
+    from importlib import import_module
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
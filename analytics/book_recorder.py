@@ -0,0 +1,409 @@
+"""
+🌙 Moon Dev's Order Book Recorder
+Minute-level book history for every coin, stored as deltas
+
+Built with love by Moon Dev 🚀
+
+Usage:
+    from api import MoonDevAPI
+    from analytics.book_recorder import BookRecorder
+
+    api = MoonDevAPI()
+    recorder = BookRecorder()              # ~/.cache/moondev/books/<COIN>.mdbook
+    recorder.poll(api)                     # one snapshot of all 80 coins
+    recorder.run(api, every=60)            # keep recording until Ctrl+C
+
+    recorder.state_at("BTC", ts_ms)        # get_orderbook()-shaped dict at that time
+    recorder.book_at("BTC", ts_ms)         # same, as an analytics.orderbook.OrderBook
+    for book in recorder.replay("BTC", start_ms, end_ms):
+        ...                                # every recorded state, in order
+
+    python -m analytics.book_recorder record --every 60
+    python -m analytics.book_recorder stats
+
+File format (one append-only file per coin, little-endian):
+
+    record  = header, levels
+    header  = kind u8 (0 keyframe, 1 delta), timestamp i64 ms,
+              bid level count u16, ask level count u16          13 bytes
+    level   = px f64, sz f64, n u16                             18 bytes
+
+A keyframe holds the whole book. A delta holds only the levels that
+appeared or changed since the previous record, plus removed levels with
+sz = 0. Snapshots identical to the previous one are not written. A
+keyframe is forced every `keyframe_every` records and on the first write
+after opening, so reconstructing any time applies at most that many deltas.
+"""
+
+import os
+import sys
+import threading
+
+import numpy as np
+
+# ============================================
+# 🎯 RECORDER CONFIGURATION - Moon Dev
+# ============================================
+
+DEFAULT_BOOK_DIR = os.path.join(os.path.expanduser("~"), ".cache", "moondev", "books")
+KEYFRAME_EVERY = 60           # records between keyframes (1 hour at 1-minute polls)
+FILE_SUFFIX = ".mdbook"
+
+# ============================================
+
+KEYFRAME, DELTA = 0, 1
+
+HEADER = np.dtype([("kind", "u1"), ("ts", "<i8"), ("bids", "<u2"), ("asks", "<u2")])
+LEVEL = np.dtype([("px", "<f8"), ("sz", "<f8"), ("n", "<u2")])
+
+
+def _side(levels):
+    """API level dicts -> {px: (sz, n)}"""
+    return {float(level["px"]): (float(level["sz"]), int(level.get("n", 0))) for level in levels or []}
+
+
+def _diff(old, new):
+    """Levels of new that differ from old, plus old levels gone from new as sz=0"""
+    changed = [(px, sz, n) for px, (sz, n) in new.items() if old.get(px) != (sz, n)]
+    changed += [(px, 0.0, 0) for px in old if px not in new]
+    return changed
+
+
+def _pack(kind, ts, bids, asks):
+    header = np.array([(kind, ts, len(bids), len(asks))], dtype=HEADER)
+    levels = np.array(bids + asks, dtype=LEVEL)
+    return header.tobytes() + levels.tobytes()
+
+
+class _CoinLog:
+    """One coin's file: record offsets in memory, last state for diffing"""
+
+    def __init__(self, path):
+        self.path = path
+        self.times = []           # timestamp of each record
+        self.offsets = []         # byte offset of each record
+        self.keyframes = []       # record numbers of keyframes
+        self.last = None          # (bids, asks) as {px: (sz, n)} after the last write
+        self.since_keyframe = 0
+        self.size = 0
+        self._scan()
+        self._file = None
+
+    def _scan(self):
+        """Rebuild the offsets from the headers; a torn last record is cut off"""
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, "rb") as f:
+            data = f.read()
+        offset = 0
+        while offset + HEADER.itemsize <= len(data):
+            header = np.frombuffer(data, HEADER, count=1, offset=offset)[0]
+            end = offset + HEADER.itemsize + (int(header["bids"]) + int(header["asks"])) * LEVEL.itemsize
+            if end > len(data):
+                break
+            if header["kind"] == KEYFRAME:
+                self.keyframes.append(len(self.offsets))
+            self.times.append(int(header["ts"]))
+            self.offsets.append(offset)
+            offset = end
+        self.size = offset
+        if offset != len(data):
+            with open(self.path, "r+b") as f:
+                f.truncate(offset)
+
+    def append(self, ts, bids, asks, keyframe_every):
+        if self.times and ts <= self.times[-1]:
+            return 0
+        if self.last is None or self.since_keyframe >= keyframe_every:
+            kind, bid_levels, ask_levels = KEYFRAME, [(px, *v) for px, v in bids.items()], \
+                [(px, *v) for px, v in asks.items()]
+        else:
+            kind, bid_levels, ask_levels = DELTA, _diff(self.last[0], bids), _diff(self.last[1], asks)
+            if not bid_levels and not ask_levels:
+                return 0
+        record = _pack(kind, ts, bid_levels, ask_levels)
+        if self._file is None:
+            self._file = open(self.path, "ab")
+        self._file.write(record)
+        if kind == KEYFRAME:
+            self.keyframes.append(len(self.offsets))
+            self.since_keyframe = 0
+        else:
+            self.since_keyframe += 1
+        self.times.append(ts)
+        self.offsets.append(self.size)
+        self.size += len(record)
+        self.last = (bids, asks)
+        return len(record)
+
+    def flush(self):
+        if self._file is not None:
+            self._file.flush()
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def read(self, first, last):
+        """Records first..last (inclusive) as (kind, ts, bid levels, ask levels)"""
+        self.flush()
+        start = self.offsets[first]
+        end = self.offsets[last + 1] if last + 1 < len(self.offsets) else self.size
+        with open(self.path, "rb") as f:
+            f.seek(start)
+            data = f.read(end - start)
+        offset = 0
+        while offset < len(data):
+            header = np.frombuffer(data, HEADER, count=1, offset=offset)[0]
+            offset += HEADER.itemsize
+            nb, na = int(header["bids"]), int(header["asks"])
+            levels = np.frombuffer(data, LEVEL, count=nb + na, offset=offset)
+            offset += (nb + na) * LEVEL.itemsize
+            yield int(header["kind"]), int(header["ts"]), levels[:nb], levels[nb:]
+
+
+def _apply(side, levels):
+    for px, sz, n in levels.tolist():
+        if sz == 0:
+            side.pop(px, None)
+        else:
+            side[px] = (sz, n)
+
+
+def _as_response(coin, ts, bids, asks):
+    """State -> get_orderbook()-shaped dict"""
+    bid_levels = [{"px": repr(px), "sz": repr(sz), "n": n} for px, (sz, n) in sorted(bids.items(), reverse=True)]
+    ask_levels = [{"px": repr(px), "sz": repr(sz), "n": n} for px, (sz, n) in sorted(asks.items())]
+    book = {"coin": coin, "timestamp": ts, "levels": [bid_levels, ask_levels],
+            "bid_depth": len(bid_levels), "ask_depth": len(ask_levels)}
+    if bid_levels and ask_levels:
+        best_bid, best_ask = float(bid_levels[0]["px"]), float(ask_levels[0]["px"])
+        mid = (best_bid + best_ask) / 2
+        book.update({"best_bid": best_bid, "best_ask": best_ask, "mid_price": mid,
+                     "spread": best_ask - best_bid, "spread_bps": (best_ask - best_bid) / mid * 10000})
+    return book
+
+
+class BookRecorder:
+    """
+    🌙 Moon Dev's Order Book Recorder
+
+    Append-only delta log per coin with keyframes for fast seeks.
+    """
+
+    def __init__(self, directory=DEFAULT_BOOK_DIR, keyframe_every=KEYFRAME_EVERY):
+        """
+        Args:
+            directory: Where the per-coin files live
+            keyframe_every: Deltas between keyframes (fewer = smaller, more = faster seeks)
+        """
+        self.directory = directory
+        self.keyframe_every = keyframe_every
+        os.makedirs(directory, exist_ok=True)
+        self._logs = {}
+        self._lock = threading.Lock()
+        self.written_bytes = 0    # this session
+
+    def _log(self, coin):
+        log = self._logs.get(coin)
+        if log is None:
+            log = self._logs[coin] = _CoinLog(os.path.join(self.directory, f"{coin}{FILE_SUFFIX}"))
+        return log
+
+    def coins(self):
+        """Every coin with a file in the directory"""
+        return sorted(name[:-len(FILE_SUFFIX)] for name in os.listdir(self.directory) if name.endswith(FILE_SUFFIX))
+
+    # ---------- recording ----------
+
+    def record(self, book):
+        """
+        Append one get_orderbook() response.
+
+        Returns:
+            Bytes written (0 when unchanged or not newer than the last record)
+        """
+        coin = book.get("coin")
+        levels = book.get("levels") or [[], []]
+        if not coin:
+            return 0
+        with self._lock:
+            written = self._log(coin).append(int(book.get("timestamp") or 0), _side(levels[0]),
+                                              _side(levels[1]), self.keyframe_every)
+            self.written_bytes += written
+        return written
+
+    def poll(self, api, coins=None, workers=None):
+        """
+        Fetch and record every coin's book once (concurrently).
+
+        Returns:
+            {"recorded": books, "bytes": written, "errors": {coin: message}}
+        """
+        from analytics.orderbook import fetch_orderbooks, FETCH_WORKERS
+        books, errors = fetch_orderbooks(api, coins, workers or FETCH_WORKERS)
+        written = sum(self.record(book) for book in books)
+        self.flush()
+        return {"recorded": len(books), "bytes": written, "errors": errors}
+
+    def run(self, api, coins=None, every=60, duration=None):
+        """Poll on a fixed-rate schedule until Ctrl+C (or `duration` seconds)"""
+        from api.scheduler import PollingScheduler
+        if coins is None:
+            coins = api.get_candle_symbols().get("symbols", [])
+        scheduler = PollingScheduler()
+        scheduler.every(every, lambda: self.poll(api, coins), name="book_recorder")
+        try:
+            scheduler.run(duration)
+        finally:
+            self.close()
+
+    def flush(self):
+        with self._lock:
+            for log in self._logs.values():
+                log.flush()
+
+    def close(self):
+        with self._lock:
+            for log in self._logs.values():
+                log.close()
+
+    # ---------- reading ----------
+
+    def times(self, coin):
+        """Timestamps (ms) of every stored record"""
+        return list(self._log(coin).times)
+
+    def _seek(self, log, ts):
+        """Record index of the last record at or before ts (-1 if none)"""
+        return int(np.searchsorted(np.asarray(log.times, dtype=np.int64), ts, side="right")) - 1
+
+    def state_at(self, coin, ts):
+        """
+        The book as it was at ts (ms): last keyframe at or before it plus
+        the deltas after it.
+
+        Returns:
+            get_orderbook()-shaped dict (timestamp = the record used), or None
+        """
+        with self._lock:
+            log = self._log(coin)
+            last = self._seek(log, ts)
+            if last < 0:
+                return None
+            i = int(np.searchsorted(log.keyframes, last, side="right")) - 1
+            records = list(log.read(log.keyframes[i], last))
+        bids, asks = {}, {}
+        for kind, record_ts, bid_levels, ask_levels in records:
+            if kind == KEYFRAME:
+                bids, asks = {}, {}
+            _apply(bids, bid_levels)
+            _apply(asks, ask_levels)
+        return _as_response(coin, record_ts, bids, asks)
+
+    def book_at(self, coin, ts):
+        """state_at() as an analytics.orderbook.OrderBook (None if nothing recorded)"""
+        from analytics.orderbook import OrderBook
+        state = self.state_at(coin, ts)
+        return OrderBook.from_api(state) if state else None
+
+    def replay(self, coin, start=None, end=None):
+        """
+        Yield every recorded state between start and end (ms), oldest first.
+
+        Deltas are applied in sequence, so a full replay costs one pass
+        over the file section.
+        """
+        with self._lock:
+            log = self._log(coin)
+            if not log.times:
+                return
+            first = max(self._seek(log, start), 0) if start is not None else 0
+            last = self._seek(log, end) if end is not None else len(log.times) - 1
+            if last < first:
+                return
+            # Start from the keyframe before the first wanted record
+            k = int(np.searchsorted(log.keyframes, first, side="right")) - 1
+            begin = log.keyframes[k]
+            records = list(log.read(begin, last))
+        bids, asks = {}, {}
+        for i, (kind, ts, bid_levels, ask_levels) in enumerate(records, start=begin):
+            if kind == KEYFRAME:
+                bids, asks = {}, {}
+            _apply(bids, bid_levels)
+            _apply(asks, ask_levels)
+            if i >= first and (start is None or ts >= start):
+                yield _as_response(coin, ts, bids, asks)
+
+    def stats(self):
+        """Per-coin records, keyframes, bytes and time span"""
+        coins = {}
+        for coin in self.coins():
+            log = self._log(coin)
+            coins[coin] = {
+                "records": len(log.times),
+                "keyframes": len(log.keyframes),
+                "bytes": log.size,
+                "first": log.times[0] if log.times else None,
+                "last": log.times[-1] if log.times else None,
+            }
+        return {
+            "coins": coins,
+            "bytes": sum(c["bytes"] for c in coins.values()),
+            "session_written": self.written_bytes,
+        }
+
+
+# ==================== CLI ====================
+def main(argv=None):
+    """python -m analytics.book_recorder record|stats|show"""
+    import argparse
+    from datetime import datetime
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+    parser = argparse.ArgumentParser(description="🌙 Moon Dev's order book recorder")
+    parser.add_argument("--dir", default=DEFAULT_BOOK_DIR)
+    sub = parser.add_subparsers(dest="command", required=True)
+    p = sub.add_parser("record", help="Poll books and record them")
+    p.add_argument("coins", nargs="*", help="Default: all candle symbols")
+    p.add_argument("--every", type=float, default=60)
+    sub.add_parser("stats", help="What's recorded")
+    p = sub.add_parser("show", help="A coin's book at a point in time")
+    p.add_argument("coin")
+    p.add_argument("--minutes-ago", type=float, default=0)
+    args = parser.parse_args(argv)
+
+    recorder = BookRecorder(args.dir)
+    fmt = lambda ms: datetime.fromtimestamp(ms / 1000).strftime("%m-%d %H:%M:%S")
+
+    if args.command == "record":
+        from api import MoonDevAPI
+        print(f"🌙 Moon Dev: recording books every {args.every:g}s into {args.dir} (Ctrl+C to stop)")
+        recorder.run(MoonDevAPI(), args.coins or None, every=args.every)
+    elif args.command == "stats":
+        stats = recorder.stats()
+        for coin, c in stats["coins"].items():
+            span = f"{fmt(c['first'])} → {fmt(c['last'])}" if c["records"] else "empty"
+            print(f"🌙 {coin:<10} {c['records']:>6} records  {c['keyframes']:>4} keyframes  "
+                  f"{c['bytes'] / 1024:>9,.1f} KB  {span}")
+        print(f"📦 {stats['bytes'] / 1024 / 1024:,.2f} MB total")
+    elif args.command == "show":
+        times = recorder.times(args.coin)
+        if not times:
+            print(f"⚠️ Nothing recorded for {args.coin}")
+            return 1
+        book = recorder.state_at(args.coin, int(times[-1] - args.minutes_ago * 60_000))
+        if book is None:
+            print(f"⚠️ No {args.coin} book that far back")
+            return 1
+        print(f"🌙 {args.coin} @ {fmt(book['timestamp'])}  spread {book.get('spread_bps', 0):.2f} bps")
+        bids, asks = book["levels"]
+        for bid, ask in zip(bids[:10], asks[:10]):
+            print(f"  {float(bid['sz']):>14,.4f} @ {float(bid['px']):<14,.6g} │ "
+                  f"{float(ask['px']):>14,.6g} @ {float(ask['sz']):<14,.4f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
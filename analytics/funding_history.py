@@ -0,0 +1,471 @@
+"""
+🌙 Moon Dev's Funding & OI History
+Our own funding-rate and open-interest history for all 224 coins, from get_prices
+
+Built with love by Moon Dev 🚀
+
+Usage:
+    from api import MoonDevAPI
+    from analytics.funding_history import FundingHistory
+
+    api = MoonDevAPI()
+    history = FundingHistory()                  # ~/.cache/moondev/funding_oi/
+    history.run(api, every=10)                  # sample until Ctrl+C (or run_in_thread)
+
+    ts, funding = history.read("funding", start_ms, end_ms, tier="1h")
+    ts, oi = history.read("oi", start_ms, end_ms, tier="1m", coins=["BTC", "ETH"])
+    history.funding_carry(start_ms, end_ms)     # {coin: funding paid over the range}
+    history.oi_delta(start_ms, end_ms, usd=True)
+
+    python -m analytics.funding_history sample --every 10
+    python -m analytics.funding_history carry --hours 24
+
+There's no historical funding/OI endpoint, so this samples get_prices()
+and keeps three tiers:
+
+    raw   every sample
+    1m    one row per minute    funding = mean of the samples, oi/price = last
+    1h    one row per hour      same
+
+Each tier is a list of append-only segments. A segment is one file per
+column - timestamps (int64 ms) and funding / oi / price (float32, one
+value per coin per row) - so a range read memory-maps the timestamps,
+binary-searches the range and slices only the column asked for. A new
+segment starts when a coin is listed (rows get wider) or the segment's
+time span is full; raw segments are one day so old raw data can be
+dropped per file (raw_days).
+
+The 1m/1h rows for the bucket in progress are rebuilt from the raw tier
+on startup, so a restart doesn't leave a hole in the downsampled tiers.
+"""
+
+import os
+import sys
+import json
+import time
+import threading
+
+import numpy as np
+
+from analytics.market import CoinIndex, MarketSnapshot
+
+# ============================================
+# 🎯 HISTORY CONFIGURATION - Moon Dev
+# ============================================
+
+DEFAULT_HISTORY_DIR = os.path.join(os.path.expanduser("~"), ".cache", "moondev", "funding_oi")
+SAMPLE_EVERY = 10                 # seconds between get_prices() samples
+RAW_DAYS = 7                      # raw segments older than this are deleted (None = keep)
+
+# tier -> (bucket ms, segment span ms)
+TIERS = {
+    "raw": (None, 86_400_000),
+    "1m": (60_000, 30 * 86_400_000),
+    "1h": (3_600_000, 365 * 86_400_000),
+}
+
+# ============================================
+
+COLUMNS = ("funding", "oi", "price")
+VALUE_DTYPE = np.float32
+
+
+class _Segment:
+    """One run of rows with a fixed coin width"""
+
+    def __init__(self, base, first_ts, width):
+        self.base = base              # path prefix, files are <base>.ts, <base>.funding...
+        self.first_ts = first_ts
+        self.width = width
+        self.rows = 0
+        self.last_ts = None
+        self._files = None
+
+    def path(self, column):
+        return f"{self.base}.{column}"
+
+    def recover(self):
+        """Row count from the files on disk, cutting any torn row"""
+        sizes = [os.path.getsize(self.path("ts")) // 8] if os.path.exists(self.path("ts")) else [0]
+        for column in COLUMNS:
+            path = self.path(column)
+            sizes.append(os.path.getsize(path) // (self.width * 4) if os.path.exists(path) else 0)
+        self.rows = min(sizes)
+        for column, itemsize in [("ts", 8)] + [(c, self.width * 4) for c in COLUMNS]:
+            path = self.path(column)
+            if os.path.exists(path) and os.path.getsize(path) != self.rows * itemsize:
+                with open(path, "r+b") as f:
+                    f.truncate(self.rows * itemsize)
+        self.last_ts = int(self.timestamps()[-1]) if self.rows else None
+
+    def append(self, ts, values):
+        if self._files is None:
+            self._files = {column: open(self.path(column), "ab") for column in ("ts",) + COLUMNS}
+        self._files["ts"].write(np.int64(ts).tobytes())
+        for column in COLUMNS:
+            self._files[column].write(values[column][:self.width].astype(VALUE_DTYPE).tobytes())
+        for f in self._files.values():
+            f.flush()
+        self.rows += 1
+        self.last_ts = ts
+
+    def close(self):
+        if self._files:
+            for f in self._files.values():
+                f.close()
+        self._files = None
+
+    def timestamps(self):
+        if not self.rows:
+            return np.zeros(0, dtype=np.int64)
+        return np.memmap(self.path("ts"), dtype=np.int64, mode="r", shape=(self.rows,))
+
+    def column(self, name):
+        return np.memmap(self.path(name), dtype=VALUE_DTYPE, mode="r", shape=(self.rows, self.width))
+
+    def delete(self):
+        self.close()
+        for column in ("ts",) + COLUMNS:
+            if os.path.exists(self.path(column)):
+                os.remove(self.path(column))
+
+
+class _Bucket:
+    """Downsampling accumulator for the 1m/1h row in progress"""
+
+    def __init__(self, start, width):
+        self.start = start
+        self.funding_sum = np.zeros(width)
+        self.funding_n = np.zeros(width)
+        self.last = {column: np.full(width, np.nan) for column in ("oi", "price")}
+
+    def add(self, values):
+        width = len(values["funding"])
+        if width > len(self.funding_sum):
+            grow = width - len(self.funding_sum)
+            self.funding_sum = np.concatenate([self.funding_sum, np.zeros(grow)])
+            self.funding_n = np.concatenate([self.funding_n, np.zeros(grow)])
+            for column in self.last:
+                self.last[column] = np.concatenate([self.last[column], np.full(grow, np.nan)])
+        funding = values["funding"]
+        ok = ~np.isnan(funding)
+        self.funding_sum[ok] += funding[ok]
+        self.funding_n[ok] += 1
+        for column in self.last:
+            seen = ~np.isnan(values[column])
+            self.last[column][seen] = values[column][seen]
+
+    def row(self):
+        with np.errstate(invalid="ignore", divide="ignore"):
+            funding = np.where(self.funding_n > 0, self.funding_sum / self.funding_n, np.nan)
+        return {"funding": funding, **self.last}
+
+
+class _Tier:
+    """All segments of one tier plus the bucket being filled"""
+
+    def __init__(self, directory, name, bucket_ms, segment_ms):
+        self.directory = os.path.join(directory, name)
+        self.name = name
+        self.bucket_ms = bucket_ms
+        self.segment_ms = segment_ms
+        self.bucket = None
+        os.makedirs(self.directory, exist_ok=True)
+        self.segments = []
+        names = sorted({f.rsplit(".", 1)[0] for f in os.listdir(self.directory) if f.endswith(".ts")},
+                       key=lambda n: int(n.split("-")[0]))
+        for base in names:
+            first_ts, width = (int(part) for part in base.split("-"))
+            segment = _Segment(os.path.join(self.directory, base), first_ts, width)
+            segment.recover()
+            if segment.rows:
+                self.segments.append(segment)
+            else:
+                segment.delete()
+
+    @property
+    def last_ts(self):
+        return self.segments[-1].last_ts if self.segments else None
+
+    def write(self, ts, values):
+        width = len(values["funding"])
+        segment = self.segments[-1] if self.segments else None
+        if segment is None or width > segment.width or ts - segment.first_ts >= self.segment_ms:
+            if segment is not None:
+                segment.close()
+            segment = _Segment(os.path.join(self.directory, f"{ts}-{width}"), ts, width)
+            self.segments.append(segment)
+        segment.append(ts, values)
+
+    def add(self, ts, values):
+        """Feed one raw sample; writes the previous bucket when a new one starts"""
+        if self.bucket_ms is None:
+            self.write(ts, values)
+            return
+        start = ts - ts % self.bucket_ms
+        if self.bucket is not None and start != self.bucket.start:
+            self.write(self.bucket.start, self.bucket.row())
+            self.bucket = None
+        if self.bucket is None:
+            self.bucket = _Bucket(start, len(values["funding"]))
+        self.bucket.add(values)
+
+    def read(self, column, start, end):
+        """(timestamps, rows) for start <= ts < end, rows padded to the widest segment"""
+        parts = []
+        for segment in self.segments:
+            if segment.last_ts is None or segment.last_ts < start or segment.first_ts >= end:
+                continue
+            ts = segment.timestamps()
+            lo, hi = np.searchsorted(ts, start), np.searchsorted(ts, end)
+            if hi > lo:
+                parts.append((np.array(ts[lo:hi]), segment.column(column)[lo:hi]))
+        if self.bucket is not None and start <= self.bucket.start < end:
+            row = self.bucket.row()[column]
+            parts.append((np.array([self.bucket.start], dtype=np.int64), row[None, :]))
+        if not parts:
+            return np.zeros(0, dtype=np.int64), np.zeros((0, 0))
+        width = max(values.shape[1] for _, values in parts)
+        out = np.full((sum(len(ts) for ts, _ in parts), width), np.nan)
+        row = 0
+        for ts, values in parts:
+            out[row:row + len(ts), :values.shape[1]] = values
+            row += len(ts)
+        return np.concatenate([ts for ts, _ in parts]), out
+
+    def close(self):
+        for segment in self.segments:
+            segment.close()
+
+
+class FundingHistory:
+    """
+    🌙 Moon Dev's Funding & OI History
+
+    Samples get_prices() into append-only columnar tiers.
+    """
+
+    def __init__(self, directory=DEFAULT_HISTORY_DIR, raw_days=RAW_DAYS):
+        """
+        Args:
+            directory: Where the tiers live
+            raw_days: Keep this many days of raw samples (None = forever)
+        """
+        self.directory = directory
+        self.raw_days = raw_days
+        os.makedirs(directory, exist_ok=True)
+        self._coins_path = os.path.join(directory, "coins.json")
+        coins = []
+        if os.path.exists(self._coins_path):
+            with open(self._coins_path) as f:
+                coins = json.load(f)
+        self.index = CoinIndex(coins)
+        self._saved_coins = len(coins)
+        self._lock = threading.Lock()
+        self.tiers = {name: _Tier(directory, name, bucket_ms, segment_ms)
+                      for name, (bucket_ms, segment_ms) in TIERS.items()}
+        self._resume()
+        self.samples = 0
+        self.errors = 0
+
+    def _resume(self):
+        """Refill the in-progress 1m/1h buckets from raw samples newer than their last row"""
+        raw = self.tiers["raw"]
+        for tier in self.tiers.values():
+            if tier.bucket_ms is None or raw.last_ts is None:
+                continue
+            since = tier.last_ts + tier.bucket_ms if tier.last_ts is not None else 0
+            ts, _ = raw.read("funding", since, raw.last_ts + 1)
+            if not len(ts):
+                continue
+            columns = {column: raw.read(column, since, raw.last_ts + 1)[1] for column in COLUMNS}
+            for i, sample_ts in enumerate(ts.tolist()):
+                tier.add(sample_ts, {column: values[i].astype(float) for column, values in columns.items()})
+
+    # ---------- writing ----------
+
+    def append(self, data):
+        """Store one get_prices() response; returns its timestamp (None if skipped)"""
+        with self._lock:
+            snap = MarketSnapshot.from_api(data, self.index)
+            ts = int(snap.timestamp or time.time() * 1000)
+            raw = self.tiers["raw"]
+            if raw.last_ts is not None and ts <= raw.last_ts:
+                return None
+            if len(self.index) != self._saved_coins:
+                self._save_coins()
+            values = {"funding": snap.funding, "oi": snap.oi, "price": snap.price}
+            for tier in self.tiers.values():
+                tier.add(ts, values)
+            self.samples += 1
+            if self.raw_days is not None:
+                self._prune_raw(ts - self.raw_days * 86_400_000)
+            return ts
+
+    def _save_coins(self):
+        tmp = self._coins_path + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump(self.index.coins, f)
+        os.replace(tmp, self._coins_path)
+        self._saved_coins = len(self.index)
+
+    def _prune_raw(self, cutoff):
+        raw = self.tiers["raw"]
+        while len(raw.segments) > 1 and raw.segments[0].last_ts < cutoff:
+            raw.segments.pop(0).delete()
+
+    def sample(self, api):
+        """One get_prices() call into the history"""
+        return self.append(api.get_prices())
+
+    def run(self, api, every=SAMPLE_EVERY, duration=None):
+        """Sample on a fixed-rate schedule until Ctrl+C (or `duration` seconds)"""
+        from api.scheduler import PollingScheduler
+        scheduler = PollingScheduler(on_error=self._on_error)
+        scheduler.every(every, lambda: self.sample(api), name="funding_history")
+        try:
+            scheduler.run(duration)
+        finally:
+            self.close()
+
+    def run_in_thread(self, api, every=SAMPLE_EVERY):
+        """Background sampler; returns the scheduler (call .stop() to end it)"""
+        from api.scheduler import PollingScheduler
+        scheduler = PollingScheduler(on_error=self._on_error)
+        scheduler.every(every, lambda: self.sample(api), name="funding_history")
+        scheduler.run_in_thread()
+        return scheduler
+
+    def _on_error(self, job, error):
+        self.errors += 1
+        print(f"⚠️ Moon Dev funding history: sample failed: {error}")
+
+    def close(self):
+        with self._lock:
+            for tier in self.tiers.values():
+                tier.close()
+
+    # ---------- reading ----------
+
+    @property
+    def coins(self):
+        return list(self.index.coins)
+
+    def read(self, column, start=0, end=None, tier="1m", coins=None):
+        """
+        Rows of one column in [start, end) ms.
+
+        Args:
+            column: "funding", "oi" or "price"
+            tier: "raw", "1m" or "1h" (1m/1h include the bucket in progress)
+            coins: Only these coins, in this order (default: every coin)
+
+        Returns:
+            (timestamps int64 array, values float array (rows, coins))
+        """
+        if column not in COLUMNS:
+            raise ValueError(f"column must be one of {', '.join(COLUMNS)}")
+        with self._lock:
+            ts, values = self.tiers[tier].read(column, start, end if end is not None else 2 ** 62)
+        width = len(self.index)
+        if values.shape[1] < width:
+            values = np.concatenate([values, np.full((len(values), width - values.shape[1]), np.nan)], axis=1)
+        if coins is not None:
+            values = values[:, [self.index[coin] for coin in coins]]
+        return ts, values
+
+    def funding_carry(self, start, end=None, tier="1m", coins=None):
+        """
+        Funding paid by a long over [start, end), per coin (0.001 = 0.1%).
+
+        Each row's hourly rate is charged for the time until the next row.
+        """
+        ts, funding = self.read("funding", start, end, tier, coins)
+        if len(ts) < 2:
+            carry = np.zeros(funding.shape[1])
+        else:
+            hours = np.diff(ts) / 3_600_000
+            carry = np.nansum(funding[:-1] * hours[:, None], axis=0)
+        names = coins if coins is not None else self.coins
+        return dict(zip(names, carry.tolist()))
+
+    def oi_delta(self, start, end=None, tier="1m", coins=None, usd=False):
+        """{coin: last OI in the range - first OI in the range} (coins, or USD at each time's price)"""
+        _, oi = self.read("oi", start, end, tier, coins)
+        if usd:
+            oi = oi * self.read("price", start, end, tier, coins)[1]
+        names = coins if coins is not None else self.coins
+        if not len(oi):
+            return dict.fromkeys(names, float("nan"))
+        return dict(zip(names, (_last_valid(oi) - _first_valid(oi)).tolist()))
+
+    def stats(self):
+        """Rows, segments and bytes per tier"""
+        out = {}
+        for name, tier in self.tiers.items():
+            size = sum(os.path.getsize(seg.path(c)) for seg in tier.segments for c in ("ts",) + COLUMNS
+                       if os.path.exists(seg.path(c)))
+            out[name] = {
+                "rows": sum(seg.rows for seg in tier.segments),
+                "segments": len(tier.segments),
+                "bytes": size,
+                "first": tier.segments[0].first_ts if tier.segments else None,
+                "last": tier.last_ts,
+            }
+        return out
+
+
+def _first_valid(values):
+    ok = ~np.isnan(values)
+    first = ok.argmax(axis=0)
+    out = values[first, np.arange(values.shape[1])]
+    return np.where(ok.any(axis=0), out, np.nan)
+
+
+def _last_valid(values):
+    return _first_valid(values[::-1])
+
+
+# ==================== CLI ====================
+def main(argv=None):
+    """python -m analytics.funding_history sample|stats|carry"""
+    import argparse
+    from datetime import datetime
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+    parser = argparse.ArgumentParser(description="🌙 Moon Dev's funding & OI history")
+    parser.add_argument("--dir", default=DEFAULT_HISTORY_DIR)
+    sub = parser.add_subparsers(dest="command", required=True)
+    p = sub.add_parser("sample", help="Sample get_prices() until Ctrl+C")
+    p.add_argument("--every", type=float, default=SAMPLE_EVERY)
+    sub.add_parser("stats", help="What's stored")
+    p = sub.add_parser("carry", help="Funding carry and OI change over the last N hours")
+    p.add_argument("--hours", type=float, default=24)
+    p.add_argument("--top", type=int, default=15)
+    args = parser.parse_args(argv)
+
+    history = FundingHistory(args.dir)
+    fmt = lambda ms: datetime.fromtimestamp(ms / 1000).strftime("%m-%d %H:%M:%S") if ms else "-"
+
+    if args.command == "sample":
+        from api import MoonDevAPI
+        print(f"🌙 Moon Dev: sampling get_prices() every {args.every:g}s into {args.dir} (Ctrl+C to stop)")
+        history.run(MoonDevAPI(), every=args.every)
+    elif args.command == "stats":
+        for name, s in history.stats().items():
+            print(f"🌙 {name:<4} {s['rows']:>8} rows  {s['segments']:>3} segments  "
+                  f"{s['bytes'] / 1024 / 1024:>8.2f} MB  {fmt(s['first'])} → {fmt(s['last'])}")
+    elif args.command == "carry":
+        end = int(time.time() * 1000)
+        start = end - int(args.hours * 3_600_000)
+        carry = history.funding_carry(start, end)
+        oi = history.oi_delta(start, end, usd=True)
+        ranked = sorted(carry.items(), key=lambda item: abs(item[1]), reverse=True)[:args.top]
+        print(f"🌙 Moon Dev: funding carry over the last {args.hours:g}h (paid by longs)")
+        for coin, value in ranked:
+            print(f"   {coin:<10} {value * 100:>+8.4f}%   OI Δ ${oi.get(coin, float('nan')):>+16,.0f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
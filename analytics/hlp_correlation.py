@@ -0,0 +1,396 @@
+"""
+🌙 Moon Dev's HLP Correlation Engine
+HLP delta vs price for every coin: rolling, lagged and lead/lag correlation plus betas
+
+Built with love by Moon Dev 🚀
+
+Usage:
+    from api import MoonDevAPI
+    from analytics.hlp_correlation import HLPCorrelationEngine
+
+    api = MoonDevAPI()
+    engine = HLPCorrelationEngine(["BTC", "ETH", "SOL"], interval="5m", window=288)
+    engine.load_history(api, hours=24)         # get_hlp_deltas + get_candles on one 5m grid
+
+    engine.correlation()                       # (coins,) over everything loaded
+    engine.cross_correlation()                 # (lags, coins) - lag > 0 means HLP moves first
+    engine.lead_lag()                          # {coin: (best_lag, corr)}
+    engine.rolling_correlation(lag=0)          # (bars, coins), NaN until the window fills
+    engine.beta()                              # bps of price move per $1M of HLP delta change
+    engine.latest()                            # last `window` bars, every lag, kept incrementally
+
+    engine.update(api)                         # new candles + live delta -> new bars, O(lags x coins) each
+
+    python -m analytics.hlp_correlation --hours 24 --interval 5m
+
+Each bar pairs the change in HLP net delta over the bar (the last delta
+sample at or before the bar close, minus the previous bar's, in $M) with
+each coin's log return over the bar. A coin without a candle for a bar is
+NaN there and drops out of every statistic that touches it.
+
+Lag k pairs the delta change of bar i with the coin return of bar i + k,
+so k > 0 asks whether HLP repositions before price moves and k < 0
+whether it follows price. Every statistic is computed for all lags and
+coins in one pass of masked sums; latest() keeps those sums for the last
+`window` bars and only adds the new pair and drops the oldest per bar,
+rebuilding them exactly once per window to shed rounding drift.
+"""
+
+import os
+import sys
+import time
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+# ============================================
+# 🎯 CORRELATION DEFAULTS - Moon Dev
+# ============================================
+
+DEFAULT_INTERVAL = "5m"
+DEFAULT_WINDOW = 288          # bars in latest() / rolling_correlation() (24h of 5m)
+DEFAULT_MAX_LAG = 12          # bars each way (1h of 5m)
+FETCH_WORKERS = 10            # matches the session's connection pool size
+
+# ============================================
+
+INTERVAL_MS = {"1m": 60_000, "5m": 300_000, "15m": 900_000, "1h": 3_600_000,
+               "4h": 14_400_000, "1d": 86_400_000}
+
+
+def _ms(value):
+    """Timestamp (ms, s or ISO string) -> epoch ms"""
+    if isinstance(value, (int, float)):
+        return int(value * 1000) if value < 1e12 else int(value)
+    if value:
+        try:
+            return int(datetime.fromisoformat(str(value).replace("Z", "+00:00")).timestamp() * 1000)
+        except ValueError:
+            pass
+    return None
+
+
+def _float(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+def _stats(sums):
+    """(n, sx, sy, sxx, syy, sxy) sums -> (corr, beta) with NaN where undefined"""
+    n, sx, sy, sxx, syy, sxy = sums
+    with np.errstate(invalid="ignore", divide="ignore"):
+        cov = sxy - sx * sy / n
+        var_x = sxx - sx * sx / n
+        var_y = syy - sy * sy / n
+        corr = cov / np.sqrt(var_x * var_y)
+        beta = cov / var_x
+    ok = (n >= 3) & (var_x > 0) & (var_y > 0)
+    return np.where(ok, np.clip(corr, -1, 1), np.nan), np.where(ok, beta, np.nan)
+
+
+class HLPCorrelationEngine:
+    """
+    🌙 Moon Dev's HLP Correlation Engine
+
+    x = HLP delta change per bar ($M), returns = (bars, coins) log returns,
+    times = bar open times (ms). Arrays grow as bars are added.
+    """
+
+    def __init__(self, coins, interval=DEFAULT_INTERVAL, window=DEFAULT_WINDOW, max_lag=DEFAULT_MAX_LAG):
+        if interval not in INTERVAL_MS:
+            raise ValueError(f"interval must be one of {', '.join(INTERVAL_MS)}")
+        self.coins = coins.split(",") if isinstance(coins, str) else list(coins)
+        self._col = {coin: j for j, coin in enumerate(self.coins)}
+        self.interval, self.step = interval, INTERVAL_MS[interval]
+        self.window, self.max_lag = window, max_lag
+        self.lags = np.arange(-max_lag, max_lag + 1)
+
+        self._len = 0
+        self._times = np.zeros(1024, dtype=np.int64)
+        self._x = np.zeros(1024)
+        self._r = np.zeros((1024, len(self.coins)))
+
+        self._delta_ts, self._delta_val = [], []
+        self._closes = [dict() for _ in self.coins]   # per coin: bar open time -> close
+        self._last_bar = None                          # open time of the last bar on the grid
+        self._last_level = None
+        self._last_close = np.full(len(self.coins), np.nan)
+        self._candle_end = None                        # latest complete candle close time seen
+
+        self._sums = np.zeros((6, len(self.lags), len(self.coins)))
+        self._since_rebuild = 0
+        self.errors = {}
+
+    def __len__(self):
+        return self._len
+
+    @property
+    def times(self):
+        return self._times[:self._len]
+
+    @property
+    def x(self):
+        return self._x[:self._len]
+
+    @property
+    def returns(self):
+        return self._r[:self._len]
+
+    # ---------- feeding ----------
+
+    def add_deltas(self, data):
+        """get_hlp_deltas() / get_hlp_delta() response or [{timestamp, net_delta}]; newer samples only"""
+        if isinstance(data, dict):
+            data = data.get("deltas", [data] if "net_delta" in data else [])
+        points = []
+        for d in data or []:
+            if isinstance(d, dict):
+                ts = _ms(d.get("timestamp", d.get("datetime", d.get("time"))))
+                value = _float(d.get("net_delta", d.get("delta")))
+                if ts is not None and value == value:
+                    points.append((ts, value))
+        points.sort()
+        for ts, value in points:
+            if not self._delta_ts or ts > self._delta_ts[-1]:
+                self._delta_ts.append(ts)
+                self._delta_val.append(value / 1e6)
+
+    def add_candles(self, coin, candles, now_ms=None):
+        """get_candles() response for one coin; the still-open candle is ignored"""
+        j = self._col.get(coin)
+        if j is None:
+            return
+        now_ms = now_ms if now_ms is not None else int(time.time() * 1000)
+        for c in candles if isinstance(candles, list) else (candles or {}).get("candles", []):
+            t, close_t = _ms(c.get("t")), _ms(c.get("T"))
+            if t is None or (close_t if close_t is not None else t + self.step) >= now_ms:
+                continue
+            if self._last_bar is None or t > self._last_bar:
+                self._closes[j][t - t % self.step] = _float(c.get("c"))
+                end = t - t % self.step + self.step
+                self._candle_end = end if self._candle_end is None else max(self._candle_end, end)
+
+    def advance(self):
+        """
+        Put every bar that is complete for both delta and candles on the grid.
+
+        Returns:
+            Bars added
+        """
+        if not self._delta_ts or self._candle_end is None:
+            return 0
+        delta_ts = np.asarray(self._delta_ts)
+        end = min(self._candle_end, self._delta_ts[-1] + 1)
+        if self._last_bar is None:
+            # First bar both sources cover; it only seeds the previous level/close
+            first = max(self._delta_ts[0], min(min(c) for c in self._closes if c))
+            start = -(-first // self.step) * self.step
+        else:
+            start = self._last_bar + self.step
+        bars = np.arange(start, end - self.step + 1, self.step, dtype=np.int64)
+        added = 0
+        for t in bars.tolist():
+            i = np.searchsorted(delta_ts, t + self.step - 1, side="right") - 1
+            level = self._delta_val[i] if i >= 0 else np.nan
+            close = np.array([c.pop(t, np.nan) for c in self._closes])
+            if self._last_bar is not None:
+                with np.errstate(invalid="ignore", divide="ignore"):
+                    self._append(t, level - self._last_level, np.log(close / self._last_close))
+                added += 1
+            self._last_bar, self._last_level, self._last_close = t, level, close
+        for c in self._closes:
+            for t in [t for t in c if t <= (self._last_bar or 0)]:
+                del c[t]
+        return added
+
+    def _append(self, t, x, r):
+        if self._len == len(self._times):
+            grow = len(self._times)
+            self._times = np.concatenate([self._times, np.zeros(grow, dtype=np.int64)])
+            self._x = np.concatenate([self._x, np.zeros(grow)])
+            self._r = np.concatenate([self._r, np.zeros((grow, len(self.coins)))])
+        i = self._len
+        self._times[i], self._x[i], self._r[i] = t, x, r
+        self._len += 1
+        self._since_rebuild += 1
+        if self._since_rebuild >= self.window:
+            self._sums = self._pair_sums(np.arange(i - self.window + 1, i + 1))
+            self._since_rebuild = 0
+        else:
+            self._sums += self._pair_sums(np.array([i]))
+            if i >= self.window:
+                self._sums -= self._pair_sums(np.array([i - self.window]))
+
+    def load(self, deltas, candles_by_coin, now_ms=None):
+        """Feed a get_hlp_deltas() response and {coin: get_candles()} then advance; returns bars added"""
+        self.add_deltas(deltas)
+        for coin, candles in candles_by_coin.items():
+            self.add_candles(coin, candles, now_ms)
+        return self.advance()
+
+    def _fetch_candles(self, api, start_time, workers):
+        def load(coin):
+            try:
+                return coin, api.get_candles(coin, self.interval, start_time=start_time), None
+            except Exception as e:
+                return coin, None, str(e) or type(e).__name__
+
+        with ThreadPoolExecutor(max_workers=max(1, min(workers, len(self.coins)))) as pool:
+            results = list(pool.map(load, self.coins))
+        candles = {}
+        for coin, data, error in results:
+            if error is None:
+                candles[coin] = data
+                self.errors.pop(coin, None)
+            else:
+                self.errors[coin] = error
+        return candles
+
+    def load_history(self, api, hours=24, workers=FETCH_WORKERS):
+        """get_hlp_deltas(hours) plus every coin's candles over the same span, concurrently"""
+        start = int(time.time() * 1000) - int(hours * 3_600_000)
+        return self.load(api.get_hlp_deltas(hours=hours), self._fetch_candles(api, start, workers))
+
+    def update(self, api, workers=FETCH_WORKERS):
+        """Live delta + candles since the last bar; returns bars added"""
+        start = self._last_bar if self._last_bar is not None else int(time.time() * 1000) - self.window * self.step
+        return self.load(api.get_hlp_delta(), self._fetch_candles(api, start, workers))
+
+    # ---------- statistics ----------
+
+    def _pair_sums(self, s):
+        """
+        Masked (n, sx, sy, sxx, syy, sxy) over the pairs completed at bars s, per lag and coin.
+
+        The lag-k pair completed at bar s is (x[s - k], r[s]) for k >= 0 and
+        (x[s], r[s + k]) for k < 0.
+        """
+        lags = self.lags[:, None]
+        xi = s[None, :] - np.maximum(lags, 0)                       # (lags, bars)
+        ri = s[None, :] + np.minimum(lags, 0)
+        valid = (xi >= 0) & (ri >= 0) & (s[None, :] < self._len)
+        x = np.where(valid, self._x[np.clip(xi, 0, None)], np.nan)
+        r = self._r[np.clip(ri, 0, None)]                           # (lags, bars, coins)
+        mask = ~np.isnan(x)[..., None] & ~np.isnan(r)
+        x = np.where(mask, x[..., None], 0.0)
+        r = np.where(mask, r, 0.0)
+        return np.stack([mask.sum(1), x.sum(1), r.sum(1), (x * x).sum(1), (r * r).sum(1), (x * r).sum(1)])
+
+    def _lag_row(self, lag):
+        if abs(lag) > self.max_lag:
+            raise ValueError(f"lag must be within ±{self.max_lag}")
+        return lag + self.max_lag
+
+    def _all(self, since=None):
+        lo = np.searchsorted(self.times, since) if since is not None else 0
+        return _stats(self._pair_sums(np.arange(lo, self._len)))
+
+    def correlation(self, lag=0, since=None):
+        """(coins,) correlation over every bar since `since` (ms)"""
+        return self._all(since)[0][self._lag_row(lag)]
+
+    def beta(self, lag=0, since=None):
+        """(coins,) price move in bps per $1M HLP delta change"""
+        return self._all(since)[1][self._lag_row(lag)] * 1e4
+
+    def cross_correlation(self, since=None):
+        """(lags, coins) correlation at every lag from -max_lag to +max_lag (see .lags)"""
+        return self._all(since)[0]
+
+    def lead_lag(self, since=None, corr=None):
+        """{coin: (lag, corr)} at the lag with the largest |corr|"""
+        corr = self.cross_correlation(since) if corr is None else corr
+        filled = np.where(np.isnan(corr), -1, np.abs(corr))
+        best = filled.argmax(0)
+        return {coin: (int(self.lags[best[j]]), float(corr[best[j], j]))
+                for j, coin in enumerate(self.coins) if filled[best[j], j] >= 0}
+
+    def rolling_correlation(self, lag=0, window=None, beta=False):
+        """
+        (bars, coins) correlation (or beta in bps per $1M) over the trailing
+        `window` bars at each bar; NaN until enough pairs.
+        """
+        window = window or self.window
+        self._lag_row(lag)
+        n = self._len
+        x = np.full(n, np.nan)
+        r = np.full((n, len(self.coins)), np.nan)
+        if lag >= 0:
+            x[lag:], r[lag:] = self.x[:n - lag], self.returns[lag:]
+        else:
+            x[-lag:], r[-lag:] = self.x[-lag:], self.returns[:n + lag]
+        mask = ~np.isnan(x)[:, None] & ~np.isnan(r)
+        x = np.where(mask, x[:, None], 0.0)
+        r = np.where(mask, r, 0.0)
+        cum = np.zeros((6, n + 1, len(self.coins)))
+        np.cumsum(np.stack([mask, x, r, x * x, r * r, x * r]), axis=1, out=cum[:, 1:])
+        lo = np.maximum(np.arange(1, n + 1) - window, 0)
+        sums = cum[:, 1:] - cum[:, lo]
+        corr, b = _stats(sums)
+        return b * 1e4 if beta else corr
+
+    def latest(self):
+        """
+        Last `window` bars from the incremental sums.
+
+        Returns:
+            {"corr": (lags, coins), "beta_bps": (lags, coins), "pairs": (lags, coins)}
+        """
+        corr, beta = _stats(self._sums)
+        return {"corr": corr, "beta_bps": beta * 1e4, "pairs": self._sums[0].astype(int)}
+
+    def summary(self):
+        """Per-coin rows from latest(), strongest lag-0 correlation first"""
+        latest = self.latest()
+        zero = self._lag_row(0)
+        best = self.lead_lag(corr=latest["corr"])
+        rows = []
+        for j, coin in enumerate(self.coins):
+            corr = latest["corr"][zero, j]
+            if corr != corr:
+                continue
+            lag, lag_corr = best.get(coin, (0, corr))
+            rows.append({"coin": coin, "corr": float(corr), "beta_bps_per_1m": float(latest["beta_bps"][zero, j]),
+                         "best_lag": lag, "best_lag_corr": lag_corr, "pairs": int(latest["pairs"][zero, j])})
+        rows.sort(key=lambda row: abs(row["corr"]), reverse=True)
+        return rows
+
+
+# ==================== CLI ====================
+def main(argv=None):
+    """python -m analytics.hlp_correlation [--coins BTC,ETH] [--hours 24] [--interval 5m]"""
+    import argparse
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from api import MoonDevAPI
+
+    parser = argparse.ArgumentParser(description="🌙 Moon Dev's HLP delta vs price correlation")
+    parser.add_argument("--coins", help="Comma-separated (default: every candle symbol)")
+    parser.add_argument("--hours", type=float, default=24)
+    parser.add_argument("--interval", default=DEFAULT_INTERVAL, choices=list(INTERVAL_MS))
+    parser.add_argument("--max-lag", type=int, default=DEFAULT_MAX_LAG)
+    parser.add_argument("--top", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    api = MoonDevAPI()
+    coins = args.coins.upper().split(",") if args.coins else api.get_candle_symbols().get("symbols", [])
+    window = int(args.hours * 3_600_000 // INTERVAL_MS[args.interval])
+    engine = HLPCorrelationEngine(coins, args.interval, window=window, max_lag=args.max_lag)
+    started = time.time()
+    bars = engine.load_history(api, hours=args.hours)
+    print(f"🌙 Moon Dev: {bars} {args.interval} bars x {len(coins)} coins in {time.time() - started:.2f}s"
+          + (f" ({len(engine.errors)} coins failed)" if engine.errors else ""))
+
+    step_min = INTERVAL_MS[args.interval] // 60_000
+    print(f"\n{'Coin':<10} {'Corr':>7} {'Beta bps/$1M':>13} {'Best lag':>9} {'Corr':>7}")
+    for row in engine.summary()[:args.top]:
+        print(f"{row['coin']:<10} {row['corr']:>+7.3f} {row['beta_bps_per_1m']:>+13.2f} "
+              f"{row['best_lag'] * step_min:>+7}m {row['best_lag_corr']:>+7.3f}")
+    print("\n   lag > 0: HLP delta moved first, lag < 0: price moved first")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,380 @@
+"""
+🌙 Moon Dev's HLP Exposure Store
+Every HLP strategy's position in every coin over time, stored locally
+
+Built with love by Moon Dev 🚀
+
+Usage:
+    from api import MoonDevAPI
+    from analytics.hlp_exposure import HLPExposureStore
+
+    api = MoonDevAPI()
+    store = HLPExposureStore()                  # ~/.cache/moondev/hlp_exposure/
+    store.sync(api)                             # position history since the last sync + live snapshot
+
+    ts, value = store.series("HLP Strategy A", "BTC", since=week_ago_ms)   # net USD exposure
+    times, coins, grid = store.matrix("combined", since=day_ago_ms)       # (times, coins) array
+    store.at(ts_ms, "combined")                 # {coin: net exposure} at that time
+    store.rotation(since=day_ago_ms)            # which coins HLP rotated into / out of
+
+    python -m analytics.hlp_exposure sync
+    python -m analytics.hlp_exposure rotation --hours 24
+
+Rows are (timestamp, series, size, value) where a series is one
+(strategy, coin) pair, value is the signed USD exposure (short < 0) and
+"combined" is the sum over strategies at that timestamp. Each field is an
+append-only column file; in memory they're numpy arrays in time order,
+so a time range is a binary search and a (strategy, coin) series is one
+mask over that slice. A coin missing from a snapshot means no position:
+matrix() and at() read it as 0.
+
+Snapshots are only appended if newer than the last one stored - sync()
+pulls history before the live snapshot for that reason.
+"""
+
+import os
+import sys
+import json
+import time
+import threading
+
+import numpy as np
+
+# ============================================
+# 🎯 STORE CONFIGURATION - Moon Dev
+# ============================================
+
+DEFAULT_EXPOSURE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "moondev", "hlp_exposure")
+COMBINED = "combined"
+MAX_SYNC_HOURS = 168
+
+# ============================================
+
+_COLUMNS = (("ts", np.int64), ("series", np.int32), ("size", np.float64), ("value", np.float64))
+
+
+def _ms(value):
+    """Timestamp (ms, s or ISO string) -> epoch ms"""
+    from datetime import datetime
+    if isinstance(value, (int, float)):
+        return int(value * 1000) if value < 1e12 else int(value)
+    if value:
+        try:
+            return int(datetime.fromisoformat(str(value).replace("Z", "+00:00")).timestamp() * 1000)
+        except ValueError:
+            pass
+    return None
+
+
+def _float(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def _strategy_positions(strategies):
+    """{name: {positions: [...]}} or [{name, positions}] -> [(name, positions)]"""
+    if isinstance(strategies, dict):
+        return [(name, (s or {}).get("positions") or []) for name, s in strategies.items()]
+    if isinstance(strategies, list):
+        return [(s.get("name") or s.get("strategy", "?"), s.get("positions") or [])
+                for s in strategies if isinstance(s, dict)]
+    return []
+
+
+def snapshot_rows(snapshot):
+    """
+    One snapshot (a get_hlp_positions() response or one get_hlp_position_history()
+    entry) -> [(strategy, coin, size, value)] including the combined rows.
+    """
+    rows = []
+    combined = {}
+    for name, positions in _strategy_positions(snapshot.get("strategies")):
+        for pos in positions:
+            coin = pos.get("coin")
+            if not coin:
+                continue
+            size = _float(pos.get("size", pos.get("szi")))
+            value = abs(_float(pos.get("position_value", pos.get("positionValue"))))
+            value = value if size >= 0 else -value
+            rows.append((name, coin, size, value))
+            total = combined.setdefault(coin, [0.0, 0.0])
+            total[0] += size
+            total[1] += value
+    if not rows:
+        # include_strategies=False: only the API's net positions
+        for pos in snapshot.get("combined_positions") or []:
+            if pos.get("coin"):
+                combined[pos["coin"]] = [_float(pos.get("net_size")), _float(pos.get("net_value"))]
+    rows += [(COMBINED, coin, size, value) for coin, (size, value) in combined.items()]
+    return rows
+
+
+class HLPExposureStore:
+    """
+    🌙 Moon Dev's HLP Exposure Store
+
+    Append-only columnar store of HLP positions keyed by (strategy, coin, time).
+    """
+
+    def __init__(self, directory=DEFAULT_EXPOSURE_DIR):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._series_path = os.path.join(directory, "series.json")
+        self.series_keys = []                 # series id -> (strategy, coin)
+        if os.path.exists(self._series_path):
+            with open(self._series_path) as f:
+                self.series_keys = [tuple(key) for key in json.load(f)]
+        self._series = {key: i for i, key in enumerate(self.series_keys)}
+        self._load()
+
+    def _path(self, column):
+        return os.path.join(self.directory, f"{column}.col")
+
+    def _load(self):
+        arrays = {}
+        for column, dtype in _COLUMNS:
+            path = self._path(column)
+            arrays[column] = np.fromfile(path, dtype=dtype) if os.path.exists(path) else np.zeros(0, dtype)
+        # A crash mid-append leaves the columns at different lengths - keep the complete rows
+        rows = min(len(a) for a in arrays.values())
+        for column, dtype in _COLUMNS:
+            if len(arrays[column]) != rows:
+                arrays[column] = arrays[column][:rows]
+                with open(self._path(column), "r+b") as f:
+                    f.truncate(rows * np.dtype(dtype).itemsize)
+        self.ts, self.series_ids = arrays["ts"], arrays["series"]
+        self.size, self.value = arrays["size"], arrays["value"]
+
+    def __len__(self):
+        return len(self.ts)
+
+    @property
+    def last_timestamp(self):
+        return int(self.ts[-1]) if len(self.ts) else None
+
+    def strategies(self):
+        return sorted({strategy for strategy, _ in self.series_keys})
+
+    def coins(self, strategy=None):
+        return sorted({coin for s, coin in self.series_keys if strategy is None or s == strategy})
+
+    # ---------- writing ----------
+
+    def _series_id(self, strategy, coin):
+        key = (strategy, coin)
+        sid = self._series.get(key)
+        if sid is None:
+            sid = self._series[key] = len(self.series_keys)
+            self.series_keys.append(key)
+        return sid
+
+    def ingest_snapshot(self, snapshot, timestamp=None):
+        """
+        Append one snapshot if it's newer than everything stored.
+
+        Returns:
+            Rows added
+        """
+        ts = _ms(timestamp if timestamp is not None else
+                 snapshot.get("timestamp", snapshot.get("updated_at", snapshot.get("datetime"))))
+        if ts is None:
+            ts = int(time.time() * 1000)
+        with self._lock:
+            if self.last_timestamp is not None and ts <= self.last_timestamp:
+                return 0
+            rows = snapshot_rows(snapshot)
+            if not rows:
+                return 0
+            known = len(self.series_keys)
+            new = {
+                "ts": np.full(len(rows), ts, dtype=np.int64),
+                "series": np.array([self._series_id(s, c) for s, c, _, _ in rows], dtype=np.int32),
+                "size": np.array([r[2] for r in rows], dtype=np.float64),
+                "value": np.array([r[3] for r in rows], dtype=np.float64),
+            }
+            if len(self.series_keys) != known:
+                tmp = self._series_path + ".tmp"
+                with open(tmp, "w") as f:
+                    json.dump(self.series_keys, f)
+                os.replace(tmp, self._series_path)
+            for column, _ in _COLUMNS:
+                with open(self._path(column), "ab") as f:
+                    f.write(new[column].tobytes())
+            self.ts = np.concatenate([self.ts, new["ts"]])
+            self.series_ids = np.concatenate([self.series_ids, new["series"]])
+            self.size = np.concatenate([self.size, new["size"]])
+            self.value = np.concatenate([self.value, new["value"]])
+            return len(rows)
+
+    def ingest_history(self, data):
+        """Append the new snapshots of a get_hlp_position_history() response; returns snapshots added"""
+        snapshots = data.get("snapshots", []) if isinstance(data, dict) else data or []
+        snapshots = sorted((s for s in snapshots if isinstance(s, dict)),
+                           key=lambda s: _ms(s.get("timestamp", s.get("datetime"))) or 0)
+        return sum(1 for s in snapshots if self.ingest_snapshot(s))
+
+    def sync(self, api, max_hours=MAX_SYNC_HOURS):
+        """
+        Pull history since the last stored snapshot, then the live positions.
+
+        Returns:
+            {"history_snapshots": n, "live_rows": n}
+        """
+        last = self.last_timestamp
+        hours = max_hours if last is None else \
+            min(max_hours, max(1, int((time.time() * 1000 - last) // 3_600_000) + 1))
+        added = self.ingest_history(api.get_hlp_position_history(hours=hours))
+        live = self.ingest_snapshot(api.get_hlp_positions())
+        return {"hours": hours, "history_snapshots": added, "live_rows": live}
+
+    # ---------- reading ----------
+
+    def _range(self, since, until):
+        lo = np.searchsorted(self.ts, since, side="left") if since is not None else 0
+        hi = np.searchsorted(self.ts, until, side="right") if until is not None else len(self.ts)
+        return lo, hi
+
+    def series(self, strategy, coin, since=None, until=None, field="value"):
+        """
+        One (strategy, coin) over time.
+
+        Returns:
+            (timestamps, values) arrays - only snapshots where it had a position
+        """
+        sid = self._series.get((strategy, coin))
+        if sid is None:
+            return np.zeros(0, dtype=np.int64), np.zeros(0)
+        lo, hi = self._range(since, until)
+        mask = self.series_ids[lo:hi] == sid
+        return self.ts[lo:hi][mask], getattr(self, field)[lo:hi][mask]
+
+    def times(self, since=None, until=None):
+        lo, hi = self._range(since, until)
+        return np.unique(self.ts[lo:hi])
+
+    def matrix(self, strategy=COMBINED, since=None, until=None, field="value", coins=None):
+        """
+        Dense (times, coins) grid for one strategy; 0 where it held nothing.
+
+        Returns:
+            (timestamps, coins, grid)
+        """
+        lo, hi = self._range(since, until)
+        ts, sids, values = self.ts[lo:hi], self.series_ids[lo:hi], getattr(self, field)[lo:hi]
+        coins = coins or self.coins(strategy)
+        column = np.full(len(self.series_keys), -1, dtype=np.int64)
+        for j, coin in enumerate(coins):
+            sid = self._series.get((strategy, coin))
+            if sid is not None:
+                column[sid] = j
+        times, row = np.unique(ts, return_inverse=True)
+        grid = np.zeros((len(times), len(coins)))
+        cols = column[sids] if len(sids) else np.zeros(0, dtype=np.int64)
+        keep = cols >= 0
+        grid[row[keep], cols[keep]] = values[keep]
+        return times, coins, grid
+
+    def at(self, ts, strategy=COMBINED, field="value"):
+        """{coin: value} in the last snapshot at or before ts"""
+        hi = np.searchsorted(self.ts, ts, side="right")
+        if hi == 0:
+            return {}
+        snap_ts = self.ts[hi - 1]
+        lo = np.searchsorted(self.ts, snap_ts, side="left")
+        values = getattr(self, field)
+        out = {}
+        for sid, value in zip(self.series_ids[lo:hi].tolist(), values[lo:hi].tolist()):
+            s, coin = self.series_keys[sid]
+            if s == strategy:
+                out[coin] = value
+        return out
+
+    def rotation(self, since, until=None, strategy=COMBINED, top=10):
+        """
+        Exposure change per coin between the first and last snapshot in the range.
+
+        Returns:
+            {"into": [...], "out_of": [...]} each {coin, start, end, change},
+            largest absolute increase / decrease first
+        """
+        times = self.times(since, until)
+        if len(times) < 2:
+            return {"into": [], "out_of": []}
+        start, end = self.at(times[0], strategy), self.at(times[-1], strategy)
+        changes = []
+        for coin in set(start) | set(end):
+            a, b = start.get(coin, 0.0), end.get(coin, 0.0)
+            changes.append({"coin": coin, "start": a, "end": b, "change": abs(b) - abs(a)})
+        changes.sort(key=lambda c: c["change"], reverse=True)
+        return {
+            "start": int(times[0]),
+            "end": int(times[-1]),
+            "into": [c for c in changes if c["change"] > 0][:top],
+            "out_of": [c for c in reversed(changes) if c["change"] < 0][:top],
+        }
+
+    def stats(self):
+        return {
+            "rows": len(self.ts),
+            "snapshots": len(np.unique(self.ts)),
+            "series": len(self.series_keys),
+            "strategies": self.strategies(),
+            "first": int(self.ts[0]) if len(self.ts) else None,
+            "last": self.last_timestamp,
+            "bytes": sum(os.path.getsize(self._path(c)) for c, _ in _COLUMNS if os.path.exists(self._path(c))),
+        }
+
+
+# ==================== CLI ====================
+def main(argv=None):
+    """python -m analytics.hlp_exposure sync|stats|series|rotation"""
+    import argparse
+    from datetime import datetime
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+    parser = argparse.ArgumentParser(description="🌙 Moon Dev's HLP exposure store")
+    parser.add_argument("--dir", default=DEFAULT_EXPOSURE_DIR)
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("sync", help="Fetch new HLP snapshots")
+    sub.add_parser("stats", help="What's stored")
+    p = sub.add_parser("series", help="One strategy/coin exposure over time")
+    p.add_argument("coin")
+    p.add_argument("--strategy", default=COMBINED)
+    p.add_argument("--hours", type=float, default=24)
+    p = sub.add_parser("rotation", help="Coins HLP rotated into / out of")
+    p.add_argument("--strategy", default=COMBINED)
+    p.add_argument("--hours", type=float, default=24)
+    args = parser.parse_args(argv)
+
+    store = HLPExposureStore(args.dir)
+    fmt = lambda ms: datetime.fromtimestamp(ms / 1000).strftime("%m-%d %H:%M") if ms else "-"
+    since = int(time.time() * 1000 - getattr(args, "hours", 0) * 3_600_000)
+
+    if args.command == "sync":
+        from api import MoonDevAPI
+        r = store.sync(MoonDevAPI())
+        print(f"🌙 Moon Dev: {r['history_snapshots']} history snapshots ({r['hours']}h window), "
+              f"{r['live_rows']} live rows")
+    elif args.command == "stats":
+        s = store.stats()
+        print(f"🌙 {s['rows']:,} rows, {s['snapshots']:,} snapshots, {s['series']} series, "
+              f"{s['bytes'] / 1024:,.0f} KB  {fmt(s['first'])} → {fmt(s['last'])}")
+        print(f"   strategies: {', '.join(s['strategies'])}")
+    elif args.command == "series":
+        ts, values = store.series(args.strategy, args.coin.upper(), since=since)
+        for t, v in zip(ts.tolist(), values.tolist()):
+            print(f"{fmt(t)}  ${v:>+16,.0f}")
+    elif args.command == "rotation":
+        r = store.rotation(since, strategy=args.strategy)
+        for title, rows in (("📈 Rotated into", r["into"]), ("📉 Rotated out of", r["out_of"])):
+            print(f"\n{title} ({args.strategy}, last {args.hours:g}h)")
+            for c in rows:
+                print(f"   {c['coin']:<10} ${c['start']:>+15,.0f} → ${c['end']:>+15,.0f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
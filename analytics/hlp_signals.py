@@ -0,0 +1,386 @@
+"""
+🌙 Moon Dev's HLP Delta Signals
+Rolling z-scores, percentile and flip detection for HLP's net delta, computed locally
+
+Built with love by Moon Dev 🚀
+
+Usage:
+    from api import MoonDevAPI
+    from analytics.hlp_signals import HLPDeltaEngine
+
+    api = MoonDevAPI()
+    engine = HLPDeltaEngine()                 # windows: 1h, 4h, 24h, 7d
+    engine.load_history(api.get_hlp_deltas(hours=168))
+    engine.update(api.get_hlp_delta())        # every 30s poll - O(1) per window
+
+    engine.zscore("1h")                       # intraday sensitivity
+    engine.zscore("24h")                      # ~ what get_hlp_sentiment() reports
+    engine.percentile()                       # where the current delta sits historically
+    engine.direction, engine.flips[-1]        # hysteresis-filtered long/short state
+    engine.state()                            # everything above as one dict
+
+    engine.run(api, every=30, on_update=print)  # poll until Ctrl+C
+
+    python -m analytics.hlp_signals --watch 30
+
+How it stays O(1) per poll:
+    - Each window is a time-based Welford accumulator: a new sample is
+      added and samples older than the window are removed with the
+      inverse Welford update, so mean/std never rescan history.
+    - The percentile comes from a DDSketch-style log-bucket sketch
+      (relative accuracy 1%), so ranking the current value never sorts.
+    - A flip needs the delta to cross zero by more than a band
+      (band_sigma x the 24h std, at least min_band_usd) - a delta
+      wobbling around zero doesn't flip back and forth every poll.
+"""
+
+import os
+import sys
+import math
+from collections import deque
+from datetime import datetime, timezone
+
+# ============================================
+# 🎯 SIGNAL DEFAULTS - Moon Dev
+# ============================================
+
+DEFAULT_WINDOWS = {"1h": 3_600_000, "4h": 14_400_000, "24h": 86_400_000, "7d": 604_800_000}
+BAND_WINDOW = "24h"           # std used for the flip band
+BAND_SIGMA = 0.25             # band = BAND_SIGMA x std(BAND_WINDOW) ...
+MIN_BAND_USD = 250_000        # ... but never narrower than this
+SKETCH_ACCURACY = 0.01
+MAX_FLIPS = 500
+
+# ============================================
+
+
+def _ms(value):
+    """Timestamp (ms, s or ISO string) -> epoch ms"""
+    if isinstance(value, (int, float)):
+        return int(value * 1000) if value < 1e12 else int(value)
+    try:
+        return int(datetime.fromisoformat(str(value).replace("Z", "+00:00")).timestamp() * 1000)
+    except ValueError:
+        return None
+
+
+def _iso(ms):
+    return datetime.fromtimestamp(ms / 1000, tz=timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+class RollingStats:
+    """Mean / std over the last `window_ms` of samples, O(1) amortized per update"""
+
+    REBUILD_EVERY = 100_000       # removals between exact recomputes (keeps float drift away)
+
+    def __init__(self, window_ms):
+        self.window_ms = window_ms
+        self.samples = deque()    # (ts, value)
+        self.n = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self._removed = 0
+
+    def add(self, ts, value):
+        self.samples.append((ts, value))
+        self.n += 1
+        d = value - self.mean
+        self.mean += d / self.n
+        self._m2 += d * (value - self.mean)
+        cutoff = ts - self.window_ms
+        while self.samples and self.samples[0][0] <= cutoff:
+            self._remove(self.samples.popleft()[1])
+
+    def _remove(self, value):
+        if self.n == 1:
+            self.n, self.mean, self._m2 = 0, 0.0, 0.0
+            return
+        old_mean = self.mean
+        self.n -= 1
+        self.mean = (old_mean * (self.n + 1) - value) / self.n
+        self._m2 -= (value - old_mean) * (value - self.mean)
+        self._removed += 1
+        if self._removed >= self.REBUILD_EVERY:
+            self._rebuild()
+
+    def _rebuild(self):
+        values = [v for _, v in self.samples]
+        self.n = len(values)
+        self.mean = sum(values) / self.n if values else 0.0
+        self._m2 = sum((v - self.mean) ** 2 for v in values)
+        self._removed = 0
+
+    @property
+    def std(self):
+        return math.sqrt(max(self._m2, 0.0) / self.n) if self.n > 1 else 0.0
+
+    def zscore(self, value):
+        std = self.std
+        return (value - self.mean) / std if std else 0.0
+
+
+class QuantileSketch:
+    """
+    DDSketch-style quantile sketch: values go into log-spaced buckets, so
+    rank and quantile queries are within `accuracy` (relative) of exact.
+    """
+
+    MIN_VALUE = 1e-9
+
+    def __init__(self, accuracy=SKETCH_ACCURACY):
+        self.accuracy = accuracy
+        self._log_gamma = math.log((1 + accuracy) / (1 - accuracy))
+        self.positive = {}
+        self.negative = {}        # keyed by |value|
+        self.zero = 0
+        self.count = 0
+
+    def _key(self, magnitude):
+        return math.ceil(math.log(magnitude) / self._log_gamma)
+
+    def _value(self, key):
+        return 2 * math.exp(key * self._log_gamma) / (1 + math.exp(self._log_gamma))
+
+    def add(self, value):
+        self.count += 1
+        if value > self.MIN_VALUE:
+            key = self._key(value)
+            self.positive[key] = self.positive.get(key, 0) + 1
+        elif value < -self.MIN_VALUE:
+            key = self._key(-value)
+            self.negative[key] = self.negative.get(key, 0) + 1
+        else:
+            self.zero += 1
+
+    def rank(self, value):
+        """Fraction of values <= value (0..1)"""
+        if not self.count:
+            return float("nan")
+        negatives = sum(self.negative.values())
+        if value > self.MIN_VALUE:
+            key = self._key(value)
+            below = negatives + self.zero + sum(c for k, c in self.positive.items() if k <= key)
+        elif value < -self.MIN_VALUE:
+            key = self._key(-value)
+            below = sum(c for k, c in self.negative.items() if k >= key)
+        else:
+            below = negatives + self.zero
+        return below / self.count
+
+    def quantile(self, q):
+        """Approximate value at quantile q (0..1)"""
+        if not self.count:
+            return float("nan")
+        target = q * (self.count - 1)
+        seen = 0
+        for key in sorted(self.negative, reverse=True):
+            seen += self.negative[key]
+            if seen > target:
+                return -self._value(key)
+        seen += self.zero
+        if seen > target:
+            return 0.0
+        for key in sorted(self.positive):
+            seen += self.positive[key]
+            if seen > target:
+                return self._value(key)
+        return self._value(max(self.positive)) if self.positive else 0.0
+
+
+class HLPDeltaEngine:
+    """
+    🌙 Moon Dev's HLP Delta Engine
+
+    Feed it HLP net-delta samples (history once, then live polls); every
+    statistic updates incrementally.
+    """
+
+    def __init__(self, windows=None, band_sigma=BAND_SIGMA, min_band_usd=MIN_BAND_USD,
+                 band_window=BAND_WINDOW, accuracy=SKETCH_ACCURACY):
+        """
+        Args:
+            windows: {name: window in ms} for the rolling z-scores
+            band_sigma / min_band_usd: flip hysteresis band (see module docstring)
+            band_window: Which window's std sets the band
+            accuracy: Relative accuracy of the percentile sketch
+        """
+        self.windows = {name: RollingStats(ms) for name, ms in (windows or DEFAULT_WINDOWS).items()}
+        if band_window not in self.windows:
+            raise ValueError(f"band_window {band_window!r} is not one of the windows")
+        self.band_sigma = band_sigma
+        self.min_band_usd = min_band_usd
+        self.band_window = band_window
+        self.sketch = QuantileSketch(accuracy)
+        self.flips = deque(maxlen=MAX_FLIPS)
+        self.direction = None         # "long" / "short" once the delta clears the band
+        self.direction_since = None
+        self.net_delta = None
+        self.timestamp = None
+        self.samples = 0
+
+    # ---------- feeding ----------
+
+    def add(self, ts, net_delta):
+        """
+        One sample. Samples not newer than the last one are ignored.
+
+        Returns:
+            The flip event if this sample flipped the direction, else None
+        """
+        ts = _ms(ts)
+        if ts is None or net_delta is None or (self.timestamp is not None and ts <= self.timestamp):
+            return None
+        net_delta = float(net_delta)
+        previous = self.net_delta
+        for stats in self.windows.values():
+            stats.add(ts, net_delta)
+        self.sketch.add(net_delta)
+        self.net_delta = net_delta
+        self.timestamp = ts
+        self.samples += 1
+        return self._check_flip(ts, net_delta, previous)
+
+    def band(self):
+        """Current hysteresis band in USD"""
+        return max(self.min_band_usd, self.band_sigma * self.windows[self.band_window].std)
+
+    def _check_flip(self, ts, net_delta, previous):
+        band = self.band()
+        new = "long" if net_delta > band else "short" if net_delta < -band else None
+        if new is None or new == self.direction:
+            return None
+        if self.direction is None:
+            self.direction, self.direction_since = new, ts
+            return None
+        flip = {
+            "datetime": _iso(ts),
+            "timestamp": ts,
+            "from_direction": self.direction,
+            "to_direction": new,
+            "from_delta": previous,
+            "to_delta": net_delta,
+            "hold_duration_hours": round((ts - self.direction_since) / 3_600_000, 2),
+            "band_usd": band,
+        }
+        self.flips.append(flip)
+        self.direction, self.direction_since = new, ts
+        return flip
+
+    def load_history(self, data):
+        """
+        Feed a get_hlp_deltas() response (oldest first; already-seen samples skipped).
+
+        Returns:
+            Flip events found in the history
+        """
+        deltas = data.get("deltas", []) if isinstance(data, dict) else data or []
+        points = []
+        for d in deltas:
+            if isinstance(d, dict):
+                ts = d.get("timestamp", d.get("datetime", d.get("time")))
+                value = d.get("net_delta", d.get("delta"))
+                if ts is not None and value is not None:
+                    points.append((_ms(ts), value))
+        points.sort(key=lambda p: p[0] or 0)
+        flips = [self.add(ts, value) for ts, value in points]
+        return [f for f in flips if f]
+
+    def update(self, data):
+        """Feed a get_hlp_delta() response; returns a flip event or None"""
+        return self.add(data.get("timestamp"), data.get("net_delta"))
+
+    def poll(self, api, history_hours=168):
+        """Load history on the first call, then one get_hlp_delta() per call"""
+        if not self.samples:
+            self.load_history(api.get_hlp_deltas(hours=history_hours))
+        return self.update(api.get_hlp_delta())
+
+    def run(self, api, every=30, on_update=None, duration=None, history_hours=168):
+        """
+        Poll on a fixed-rate schedule until Ctrl+C (or `duration` seconds).
+
+        on_update(state, flip) is called after every poll.
+        """
+        from api.scheduler import PollingScheduler
+
+        def tick():
+            flip = self.poll(api, history_hours)
+            if on_update is not None:
+                on_update(self.state(), flip)
+
+        scheduler = PollingScheduler()
+        scheduler.every(every, tick, name="hlp_signals")
+        scheduler.run(duration)
+
+    # ---------- reading ----------
+
+    def zscore(self, window="24h"):
+        if self.net_delta is None:
+            return float("nan")
+        return self.windows[window].zscore(self.net_delta)
+
+    def percentile(self, value=None):
+        """Percentile (0-100) of value (default: the current delta) among every sample seen"""
+        value = self.net_delta if value is None else value
+        return self.sketch.rank(value) * 100 if value is not None else float("nan")
+
+    def quantile(self, q):
+        return self.sketch.quantile(q)
+
+    def state(self):
+        """Current delta, per-window stats, percentile, direction and the last flip"""
+        return {
+            "timestamp": self.timestamp,
+            "net_delta": self.net_delta,
+            "windows": {name: {"mean": s.mean, "std": s.std, "z_score": self.zscore(name), "samples": s.n}
+                        for name, s in self.windows.items()},
+            "percentile": self.percentile(),
+            "direction": self.direction,
+            "direction_since": self.direction_since,
+            "band_usd": self.band(),
+            "last_flip": self.flips[-1] if self.flips else None,
+            "samples": self.samples,
+        }
+
+
+# ==================== CLI ====================
+def _print_state(state, flip=None):
+    when = datetime.fromtimestamp(state["timestamp"] / 1000).strftime("%H:%M:%S") if state["timestamp"] else "-"
+    zs = "  ".join(f"z{name} {w['z_score']:+.2f}" for name, w in state["windows"].items())
+    print(f"🌙 {when}  delta ${state['net_delta'] or 0:>+15,.0f}  {zs}  "
+          f"p{state['percentile']:.0f}  {(state['direction'] or '-').upper()}")
+    if flip:
+        print(f"🔄 FLIP {flip['from_direction'].upper()} → {flip['to_direction'].upper()} "
+              f"after {flip['hold_duration_hours']:.1f}h (band ${flip['band_usd']:,.0f})")
+
+
+def main(argv=None):
+    """python -m analytics.hlp_signals [--hours 168] [--watch 30]"""
+    import argparse
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from api import MoonDevAPI
+
+    parser = argparse.ArgumentParser(description="🌙 Moon Dev's HLP delta signals")
+    parser.add_argument("--hours", type=int, default=168, help="History to warm up from")
+    parser.add_argument("--watch", type=float, metavar="SECONDS", help="Keep polling get_hlp_delta")
+    args = parser.parse_args(argv)
+
+    api = MoonDevAPI()
+    engine = HLPDeltaEngine()
+    flips = engine.load_history(api.get_hlp_deltas(hours=args.hours))
+    engine.update(api.get_hlp_delta())
+    print(f"🌙 Moon Dev: {engine.samples} samples, {len(flips)} flips in the last {args.hours}h")
+    for flip in flips[-5:]:
+        print(f"   {flip['datetime']}  {flip['from_direction']} → {flip['to_direction']}  "
+              f"held {flip['hold_duration_hours']:.1f}h")
+    _print_state(engine.state())
+    if args.watch:
+        try:
+            engine.run(api, every=args.watch, on_update=_print_state)
+        except KeyboardInterrupt:
+            pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
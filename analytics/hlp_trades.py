@@ -0,0 +1,420 @@
+"""
+🌙 Moon Dev's HLP Trade Store
+Every HLP fill synced locally, deduplicated, with a pre-aggregated hourly cube
+
+Built with love by Moon Dev 🚀
+
+Usage:
+    from api import MoonDevAPI
+    from analytics.hlp_trades import HLPTradeStore
+
+    api = MoonDevAPI()
+    store = HLPTradeStore()                     # ~/.cache/moondev/hlp_trades/
+    store.sync(api)                             # only fills we haven't seen
+
+    store.timing("hour_of_day")                 # {0: {trades, volume, pnl, fees, net_pnl}, ...}
+    store.timing("session", strategy="HLP Strategy A", coin="BTC")
+    store.timing({"open": [13, 14], "close": [19, 20]})     # your own hour-of-day buckets
+    store.timing(lambda hours: hours // 4 % 6)              # or any function of epoch hours
+    store.totals("coin", since=day_ago_ms)      # same metrics per coin / strategy / side
+    store.trades(since=hour_ago_ms)             # the fills themselves as arrays
+
+    python -m analytics.hlp_trades sync
+    python -m analytics.hlp_trades timing --by session
+
+get_hlp_trades(limit) returns the latest N fills with no cursor, so sync()
+asks for `limit` and keeps doubling it (up to max_limit) until the batch
+overlaps what's already stored - a longer gap between syncs just costs a
+bigger request. Fills are keyed by strategy + tid (hash/time/coin/px/sz
+when there's no tid) and each key is stored once.
+
+Fills live in append-only column files (the source of truth). The cube
+is a memory-mapped float64 array of shape
+
+    (hours, strategies, coins, side, metric)    metric = trades, volume, pnl, fees
+
+with one row per epoch hour, so any timing question is a group-by over
+the hour axis - a few thousand cells, not a pass over every fill. New
+fills are added into it in place; a new strategy, coin or an hour outside
+the cube's range rebuilds it from the fills in one vectorized pass, as
+does a cube that doesn't match the fill count after a crash.
+"""
+
+import os
+import sys
+import json
+import time
+import hashlib
+import threading
+from datetime import datetime
+
+import numpy as np
+
+# ============================================
+# 🎯 TRADE STORE CONFIGURATION - Moon Dev
+# ============================================
+
+DEFAULT_TRADES_DIR = os.path.join(os.path.expanduser("~"), ".cache", "moondev", "hlp_trades")
+SYNC_LIMIT = 2000             # first request size per sync
+MAX_SYNC_LIMIT = 50000        # stop doubling here even without overlap
+
+# UTC hours of day
+SESSIONS = {
+    "asia": range(0, 7),
+    "europe": range(7, 13),
+    "us": range(13, 21),
+    "late_us": range(21, 24),
+}
+
+# ============================================
+
+HOUR_MS = 3_600_000
+SIDES = ("B", "A")            # buy, sell - the cube's side axis
+METRICS = ("trades", "volume", "pnl", "fees")
+_COLUMNS = (("time", np.int64), ("key", np.int64), ("strategy", np.int16), ("coin", np.int16),
+            ("side", np.int8), ("px", np.float64), ("sz", np.float64), ("pnl", np.float64), ("fee", np.float64))
+
+
+def _ms(value):
+    """Timestamp (ms, s or ISO string) -> epoch ms"""
+    if isinstance(value, (int, float)):
+        return int(value * 1000) if value < 1e12 else int(value)
+    if value:
+        try:
+            return int(datetime.fromisoformat(str(value).replace("Z", "+00:00")).timestamp() * 1000)
+        except ValueError:
+            pass
+    return None
+
+
+def _float(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def _strategy(fill):
+    return fill.get("strategy") or fill.get("vault") or "HLP"
+
+
+def fill_key(fill, strategy):
+    """Stable int64 identity of one strategy's fill"""
+    ident = fill.get("tid")
+    if ident is None:
+        ident = "|".join(str(fill.get(k)) for k in ("hash", "time", "coin", "px", "sz", "side"))
+    digest = hashlib.blake2b(f"{strategy}|{ident}".encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "little", signed=True)
+
+
+class HLPTradeStore:
+    """
+    🌙 Moon Dev's HLP Trade Store
+
+    Deduplicated HLP fills plus a (hour x strategy x coin x side) cube.
+    """
+
+    def __init__(self, directory=DEFAULT_TRADES_DIR):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._names_path = os.path.join(directory, "names.json")
+        self._cube_path = os.path.join(directory, "cube.f8")
+        self._cube_meta_path = os.path.join(directory, "cube.json")
+        names = {}
+        if os.path.exists(self._names_path):
+            with open(self._names_path) as f:
+                names = json.load(f)
+        self.strategies = names.get("strategies", [])
+        self.coins = names.get("coins", [])
+        self._load_trades()
+        self._keys = set(self._cols["key"].tolist())
+        self._open_cube()
+
+    def _path(self, column):
+        return os.path.join(self.directory, f"{column}.col")
+
+    def _load_trades(self):
+        cols = {}
+        for column, dtype in _COLUMNS:
+            path = self._path(column)
+            cols[column] = np.fromfile(path, dtype=dtype) if os.path.exists(path) else np.zeros(0, dtype)
+        # A crash mid-append leaves the columns at different lengths - keep the complete rows
+        rows = min(len(a) for a in cols.values())
+        for column, dtype in _COLUMNS:
+            if len(cols[column]) != rows:
+                cols[column] = cols[column][:rows]
+                with open(self._path(column), "r+b") as f:
+                    f.truncate(rows * np.dtype(dtype).itemsize)
+        self._cols = cols
+
+    def __len__(self):
+        return len(self._cols["time"])
+
+    # ---------- cube ----------
+
+    def _open_cube(self):
+        meta = {}
+        if os.path.exists(self._cube_meta_path):
+            with open(self._cube_meta_path) as f:
+                meta = json.load(f)
+        shape = meta.get("shape")
+        size = os.path.getsize(self._cube_path) if os.path.exists(self._cube_path) else 0
+        if (meta.get("trades") != len(self) or not shape or size != int(np.prod(shape)) * 8
+                or shape[1] < len(self.strategies) or shape[2] < len(self.coins)):
+            self._rebuild_cube()
+            return
+        self.base_hour = meta["base_hour"]
+        self.cube = np.memmap(self._cube_path, dtype=np.float64, mode="r+", shape=tuple(shape))
+
+    def _rebuild_cube(self, extra_hours=()):
+        """Size the cube for every stored fill (plus extra_hours) and re-aggregate from scratch"""
+        hours = self._cols["time"] // HOUR_MS
+        span = np.concatenate([hours, np.asarray(extra_hours, dtype=np.int64)])
+        base = int(span.min()) if len(span) else int(time.time() * 1000) // HOUR_MS
+        n_hours = int(span.max()) - base + 1 + 24 if len(span) else 24
+        shape = (n_hours, max(len(self.strategies), 1), max(len(self.coins), 1), len(SIDES), len(METRICS))
+        self.cube = None
+        with open(self._cube_path, "wb") as f:
+            f.truncate(int(np.prod(shape)) * 8)
+        self.base_hour = base
+        self.cube = np.memmap(self._cube_path, dtype=np.float64, mode="r+", shape=shape)
+        self._add_to_cube(np.arange(len(self)))
+
+    def _add_to_cube(self, rows):
+        c = self._cols
+        idx = (c["time"][rows] // HOUR_MS - self.base_hour, c["strategy"][rows], c["coin"][rows], c["side"][rows])
+        values = np.stack([np.ones(len(rows)), c["px"][rows] * c["sz"][rows], c["pnl"][rows], c["fee"][rows]], axis=1)
+        np.add.at(self.cube, idx, values)
+        self.cube.flush()
+        with open(self._cube_meta_path + ".tmp", "w") as f:
+            json.dump({"base_hour": self.base_hour, "shape": list(self.cube.shape), "trades": len(self)}, f)
+        os.replace(self._cube_meta_path + ".tmp", self._cube_meta_path)
+
+    # ---------- writing ----------
+
+    def _id(self, names, name):
+        try:
+            return names.index(name)
+        except ValueError:
+            names.append(name)
+            return len(names) - 1
+
+    def ingest(self, data):
+        """
+        Store the fills of a get_hlp_trades() response that aren't stored yet.
+
+        Returns:
+            (new fills, fills already known)
+        """
+        trades = data.get("trades", []) if isinstance(data, dict) else data or []
+        with self._lock:
+            rows, known, batch = [], 0, set()
+            n_strategies, n_coins = len(self.strategies), len(self.coins)
+            for t in trades:
+                ts = _ms(t.get("time", t.get("timestamp"))) if isinstance(t, dict) else None
+                if ts is None or not t.get("coin"):
+                    continue
+                strategy = _strategy(t)
+                key = fill_key(t, strategy)
+                if key in self._keys or key in batch:
+                    known += 1
+                    continue
+                batch.add(key)
+                rows.append((ts, key, self._id(self.strategies, strategy), self._id(self.coins, t["coin"]),
+                             0 if t.get("side") in ("B", "buy", "Buy") else 1, _float(t.get("px")),
+                             abs(_float(t.get("sz"))), _float(t.get("closedPnl", t.get("closed_pnl"))),
+                             _float(t.get("fee"))))
+            if not rows:
+                return 0, known
+
+            if (len(self.strategies), len(self.coins)) != (n_strategies, n_coins):
+                with open(self._names_path + ".tmp", "w") as f:
+                    json.dump({"strategies": self.strategies, "coins": self.coins}, f)
+                os.replace(self._names_path + ".tmp", self._names_path)
+            start = len(self)
+            for j, (column, dtype) in enumerate(_COLUMNS):
+                values = np.array([r[j] for r in rows], dtype=dtype)
+                with open(self._path(column), "ab") as f:
+                    f.write(values.tobytes())
+                self._cols[column] = np.concatenate([self._cols[column], values])
+            self._keys |= batch
+
+            new = np.arange(start, len(self))
+            hours = self._cols["time"][new] // HOUR_MS - self.base_hour
+            if (hours.min() < 0 or hours.max() >= self.cube.shape[0]
+                    or len(self.strategies) > self.cube.shape[1] or len(self.coins) > self.cube.shape[2]):
+                self._rebuild_cube()
+            else:
+                self._add_to_cube(new)
+            return len(rows), known
+
+    def sync(self, api, limit=SYNC_LIMIT, max_limit=MAX_SYNC_LIMIT):
+        """
+        Pull get_hlp_trades() until the batch overlaps the stored fills.
+
+        Returns:
+            {"new": n (all requests), "known": n (last request), "limit": last
+             limit asked, "gap": True if even max_limit didn't reach fills
+             stored before this sync}
+        """
+        stored = set(self._keys)              # fills we had before this sync
+        new = known = 0
+        while True:
+            data = api.get_hlp_trades(limit=limit)
+            trades = [t for t in (data.get("trades", []) if isinstance(data, dict) else data or [])
+                      if isinstance(t, dict)]
+            added, known = self.ingest(trades)
+            new += added
+            # Only fills from before this sync count - the previous, smaller batch is stored too
+            overlap = any(fill_key(t, _strategy(t)) in stored for t in trades)
+            if overlap or not stored or limit >= max_limit or len(trades) < limit:
+                break
+            limit = min(limit * 2, max_limit)
+        gap = bool(stored) and not overlap and len(trades) >= limit
+        return {"new": new, "known": known, "limit": limit, "gap": gap}
+
+    # ---------- reading ----------
+
+    def trades(self, since=None, until=None):
+        """Stored fills as {column: array} (plus strategy/coin name lists), in stored order"""
+        t = self._cols["time"]
+        mask = np.ones(len(t), dtype=bool)
+        if since is not None:
+            mask &= t >= since
+        if until is not None:
+            mask &= t <= until
+        out = {column: values[mask] for column, values in self._cols.items()}
+        out.update(strategies=list(self.strategies), coins=list(self.coins))
+        return out
+
+    def _select(self, strategy=None, coin=None, side=None, since=None, until=None):
+        """Cube slice for the filters: (epoch hours, (hours, strategies, coins, sides, metrics))"""
+        lo = 0 if since is None else max(0, since // HOUR_MS - self.base_hour)
+        hi = self.cube.shape[0] if until is None else max(lo, until // HOUR_MS - self.base_hour + 1)
+        cube = self.cube[lo:hi]
+        if strategy is not None:
+            cube = cube[:, [self.strategies.index(strategy)] if strategy in self.strategies else []]
+        if coin is not None:
+            cube = cube[:, :, [self.coins.index(coin)] if coin in self.coins else []]
+        if side is not None:
+            cube = cube[:, :, :, [SIDES.index(side)]]
+        return np.arange(lo, lo + len(cube)) + self.base_hour, cube
+
+    def _rows(self, labels, sums):
+        rows = {}
+        for label, (trades, volume, pnl, fees) in zip(labels, sums.tolist()):
+            if trades:
+                rows[label] = {"trades": int(trades), "volume": volume, "pnl": pnl, "fees": fees,
+                               "net_pnl": pnl - fees, "pnl_per_trade": (pnl - fees) / trades}
+        return rows
+
+    def timing(self, buckets="hour_of_day", **filters):
+        """
+        Metrics grouped by time bucket.
+
+        Args:
+            buckets: "hour_of_day", "weekday" (0 = Monday), "session", "day"
+                     (epoch day), {name: [hours of day]} or a function
+                     mapping an array of epoch hours to bucket labels
+            **filters: strategy, coin, side ("B"/"A"), since, until (ms)
+
+        Returns:
+            {bucket: {trades, volume, pnl, fees, net_pnl, pnl_per_trade}}
+        """
+        hours, cube = self._select(**filters)
+        per_hour = cube.sum(axis=(1, 2, 3))                     # (hours, metrics)
+        if buckets == "session":
+            buckets = SESSIONS
+        if isinstance(buckets, dict):
+            hour_of_day = hours % 24
+            return self._rows(list(buckets), np.array(
+                [per_hour[np.isin(hour_of_day, list(h))].sum(0) for h in buckets.values()]).reshape(-1, len(METRICS)))
+        if buckets == "hour_of_day":
+            labels = hours % 24
+        elif buckets == "weekday":
+            labels = (hours // 24 + 3) % 7                      # epoch day 0 was a Thursday
+        elif buckets == "day":
+            labels = hours // 24
+        elif callable(buckets):
+            labels = np.asarray(buckets(hours))
+        else:
+            raise ValueError("buckets must be hour_of_day, weekday, session, day, a dict or a function")
+        keys, inverse = np.unique(labels, return_inverse=True)
+        sums = np.zeros((len(keys), len(METRICS)))
+        np.add.at(sums, inverse, per_hour)
+        return self._rows(keys.tolist(), sums)
+
+    def totals(self, by="strategy", **filters):
+        """Metrics per "strategy", "coin" or "side" (same filters as timing)"""
+        axis = {"strategy": 1, "coin": 2, "side": 3}[by]
+        _, cube = self._select(**filters)
+        sums = cube.sum(axis=tuple(a for a in (0, 1, 2, 3) if a != axis))
+        labels = {"strategy": self.strategies, "coin": self.coins, "side": list(SIDES)}[by]
+        if filters.get(by) is not None:
+            labels = [filters[by]]
+        return self._rows(labels, sums[:len(labels)])
+
+    def stats(self):
+        t = self._cols["time"]
+        return {
+            "trades": len(self),
+            "strategies": list(self.strategies),
+            "coins": len(self.coins),
+            "first": int(t.min()) if len(t) else None,
+            "last": int(t.max()) if len(t) else None,
+            "cube_shape": tuple(self.cube.shape),
+            "bytes": sum(os.path.getsize(p) for p in [self._cube_path] + [self._path(c) for c, _ in _COLUMNS]
+                         if os.path.exists(p)),
+        }
+
+
+# ==================== CLI ====================
+def main(argv=None):
+    """python -m analytics.hlp_trades sync|stats|timing|totals"""
+    import argparse
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+    parser = argparse.ArgumentParser(description="🌙 Moon Dev's HLP trade store")
+    parser.add_argument("--dir", default=DEFAULT_TRADES_DIR)
+    sub = parser.add_subparsers(dest="command", required=True)
+    p = sub.add_parser("sync", help="Fetch fills we haven't seen")
+    p.add_argument("--limit", type=int, default=SYNC_LIMIT)
+    sub.add_parser("stats", help="What's stored")
+    for name, choices, default in (("timing", ("hour_of_day", "weekday", "session", "day"), "hour_of_day"),
+                                   ("totals", ("strategy", "coin", "side"), "strategy")):
+        p = sub.add_parser(name)
+        p.add_argument("--by", choices=choices, default=default)
+        p.add_argument("--strategy")
+        p.add_argument("--coin")
+        p.add_argument("--hours", type=float, help="Only the last N hours")
+    args = parser.parse_args(argv)
+
+    store = HLPTradeStore(args.dir)
+    fmt = lambda ms: datetime.fromtimestamp(ms / 1000).strftime("%m-%d %H:%M") if ms else "-"
+
+    if args.command == "sync":
+        from api import MoonDevAPI
+        r = store.sync(MoonDevAPI(), limit=args.limit)
+        print(f"🌙 Moon Dev: {r['new']} new fills, {r['known']} already stored (limit {r['limit']})"
+              + ("  ⚠️ didn't reach stored fills - there may be a gap" if r["gap"] else ""))
+    elif args.command == "stats":
+        s = store.stats()
+        print(f"🌙 {s['trades']:,} fills, {len(s['strategies'])} strategies, {s['coins']} coins, "
+              f"{s['bytes'] / 1024:,.0f} KB  {fmt(s['first'])} → {fmt(s['last'])}")
+    else:
+        since = int(time.time() * 1000 - args.hours * HOUR_MS) if args.hours else None
+        filters = {"strategy": args.strategy, "coin": args.coin.upper() if args.coin else None, "since": since}
+        started = time.perf_counter()
+        rows = store.timing(args.by, **filters) if args.command == "timing" else store.totals(args.by, **filters)
+        elapsed = (time.perf_counter() - started) * 1000
+        print(f"\n{args.by:<16} {'Trades':>8} {'Volume':>16} {'Net PnL':>14} {'Per trade':>11}")
+        for label, m in rows.items():
+            print(f"{str(label):<16} {m['trades']:>8,} ${m['volume']:>15,.0f} ${m['net_pnl']:>+13,.2f} "
+                  f"${m['pnl_per_trade']:>+10,.2f}")
+        print(f"\n   {elapsed:.2f} ms from the hourly cube")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
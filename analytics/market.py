@@ -0,0 +1,364 @@
+"""
+🌙 Moon Dev's Market Snapshot
+All 224 coins from get_prices as aligned NumPy columns, plus a rolling history
+
+Built with love by Moon Dev 🚀
+
+Usage:
+    from api import MoonDevAPI
+    from analytics.market import MarketSnapshot, MarketHistory
+
+    api = MoonDevAPI()
+    snap = MarketSnapshot.from_api(api.get_prices())
+    snap.price, snap.funding, snap.oi_usd  # arrays, one slot per coin
+    snap.funding_rank()                    # 0 = highest funding
+    snap.zscore("funding")                 # cross-sectional z-score
+    snap.top("funding", 10)                # [(coin, value)]
+
+    history = MarketHistory(capacity=720)  # last 720 snapshots (12h of 1-minute polls)
+    history.update(api.get_prices())       # every tick
+    history.returns(lag=5)                 # per-coin move over the last 5 snapshots
+    history.oi_weighted_return(lag=5)      # one number: the OI-weighted market move
+    history.zscore("funding")              # each coin vs its own rolling history
+    history.window("price", 60)            # (60, coins) array, oldest first
+
+Every snapshot shares one CoinIndex, so column i is always the same coin;
+a coin that shows up later gets the next column and older rows read NaN
+for it. MarketHistory is a ring buffer with running per-coin sums of every
+field, so returns() and zscore() cost O(coins) - tens of microseconds -
+no matter how long the window is; update() is mostly parsing the strings.
+
+open_interest is in coins as the API sends it; oi_usd = oi * price.
+Funding is the hourly rate.
+"""
+
+import sys
+import os
+
+import numpy as np
+
+# ============================================
+# 🎯 MARKET DEFAULTS - Moon Dev
+# ============================================
+
+DEFAULT_CAPACITY = 720        # snapshots kept by MarketHistory
+HOURS_PER_YEAR = 24 * 365
+
+# ============================================
+
+FIELDS = ("price", "funding", "oi")
+_API_FIELDS = {"price": "prices", "funding": "funding_rates", "oi": "open_interest"}
+
+
+class CoinIndex:
+    """Stable coin -> column mapping; new coins are appended, never reordered"""
+
+    def __init__(self, coins=()):
+        self.coins = []
+        self._pos = {}
+        self._cached_keys = None
+        self._cached_idx = None
+        for coin in coins:
+            self.add(coin)
+
+    def __len__(self):
+        return len(self.coins)
+
+    def __contains__(self, coin):
+        return coin in self._pos
+
+    def __getitem__(self, coin):
+        return self._pos[coin]
+
+    def add(self, coin):
+        pos = self._pos.get(coin)
+        if pos is None:
+            pos = self._pos[coin] = len(self.coins)
+            self.coins.append(coin)
+        return pos
+
+    def column(self, values):
+        """{coin: "1.23"} -> float array over the index (NaN for coins not in values)"""
+        keys = tuple(values)
+        # get_prices sends the same coins in the same order every time
+        if keys != self._cached_keys:
+            self._cached_idx = np.array([self.add(coin) for coin in keys], dtype=np.intp)
+            self._cached_keys = keys
+        out = np.full(len(self.coins), np.nan)
+        try:
+            out[self._cached_idx] = np.array(list(values.values()), dtype=float)
+        except (TypeError, ValueError):
+            out[self._cached_idx] = [_float(v) for v in values.values()]
+        return out
+
+
+def _float(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+def _pad(values, size):
+    if len(values) >= size:
+        return values
+    return np.concatenate([values, np.full(size - len(values), np.nan)])
+
+
+def rank(values, descending=True):
+    """0-based rank of every entry (NaN stays NaN)"""
+    values = np.asarray(values, dtype=float)
+    ok = ~np.isnan(values)
+    out = np.full(len(values), np.nan)
+    order = np.argsort(-values[ok] if descending else values[ok], kind="stable")
+    ranks = np.empty(len(order))
+    ranks[order] = np.arange(len(order))
+    out[ok] = ranks
+    return out
+
+
+def zscore(values):
+    """Cross-sectional z-score, ignoring NaN"""
+    values = np.asarray(values, dtype=float)
+    std = np.nanstd(values)
+    if not std:
+        return np.zeros_like(values)
+    return (values - np.nanmean(values)) / std
+
+
+class MarketSnapshot:
+    """
+    🌙 Moon Dev's Market Snapshot
+
+    One get_prices() response as aligned price / funding / oi arrays.
+    """
+
+    def __init__(self, index, timestamp, price, funding, oi):
+        self.index = index
+        self.timestamp = timestamp
+        self.price = price
+        self.funding = funding
+        self.oi = oi
+
+    @classmethod
+    def from_api(cls, data, index=None):
+        """Build from get_prices(); pass the same index every tick to keep columns stable"""
+        index = index if index is not None else CoinIndex()
+        columns = [index.column(data.get(_API_FIELDS[field]) or {}) for field in FIELDS]
+        size = len(index)
+        # A coin only present in a later dict widens the index - pad the earlier columns
+        price, funding, oi = (_pad(column, size) for column in columns)
+        return cls(index, data.get("timestamp"), price, funding, oi)
+
+    @property
+    def coins(self):
+        return self.index.coins[:len(self.price)]
+
+    def __len__(self):
+        return len(self.price)
+
+    def column(self, field):
+        """price / funding / oi / oi_usd / funding_apr by name"""
+        return getattr(self, field)
+
+    @property
+    def oi_usd(self):
+        return self.oi * self.price
+
+    @property
+    def funding_apr(self):
+        """Hourly funding annualized (0.0001 -> 0.876 = 87.6%)"""
+        return self.funding * HOURS_PER_YEAR
+
+    def funding_rank(self, descending=True):
+        return rank(self.funding, descending)
+
+    def zscore(self, field):
+        return zscore(self.column(field))
+
+    def top(self, field, n=10, descending=True):
+        """[(coin, value)] with the largest (or smallest) values of field"""
+        values = self.column(field)
+        ok = np.flatnonzero(~np.isnan(values))
+        order = ok[np.argsort(-values[ok] if descending else values[ok], kind="stable")[:n]]
+        coins = self.coins
+        return [(coins[i], float(values[i])) for i in order]
+
+    def returns(self, previous):
+        """Per-coin price change since an earlier snapshot on the same index"""
+        return self.price / _pad(previous.price, len(self.price)) - 1
+
+    def oi_weighted_move(self, previous):
+        """Market move since `previous`, each coin weighted by its OI in USD"""
+        return _weighted(self.returns(previous), self.oi_usd)
+
+    def get(self, coin):
+        i = self.index[coin]
+        return {"coin": coin, **{field: float(self.column(field)[i]) for field in FIELDS + ("oi_usd",)}}
+
+
+def _weighted(values, weights):
+    ok = ~(np.isnan(values) | np.isnan(weights))
+    total = weights[ok].sum()
+    return float((values[ok] * weights[ok]).sum() / total) if total else float("nan")
+
+
+class MarketHistory:
+    """
+    🌙 Moon Dev's Market History
+
+    Ring buffer of the last `capacity` snapshots with running per-coin
+    sums, so rolling means and z-scores never rescan the window.
+    """
+
+    def __init__(self, capacity=DEFAULT_CAPACITY, index=None):
+        self.capacity = capacity
+        self.index = index if index is not None else CoinIndex()
+        self.count = 0                        # snapshots appended in total
+        self.timestamps = np.zeros(capacity, dtype=np.int64)
+        self._data = np.full((len(FIELDS), capacity, 0), np.nan)
+        width = (len(FIELDS), 0)
+        self._shift = np.zeros(width)         # per-coin reference value the sums are taken around
+        self._s1 = np.zeros(width)
+        self._s2 = np.zeros(width)
+        self._n = np.zeros(width)
+
+    def __len__(self):
+        return min(self.count, self.capacity)
+
+    @property
+    def coins(self):
+        return self.index.coins[:self._data.shape[2]]
+
+    # ---------- writing ----------
+
+    def update(self, data):
+        """Add a get_prices() response; returns its MarketSnapshot"""
+        snap = MarketSnapshot.from_api(data, self.index)
+        self.append(snap)
+        return snap
+
+    def append(self, snap):
+        self._widen(len(snap))
+        row = self.count % self.capacity
+        new = np.stack([_pad(snap.column(field), self._data.shape[2]) for field in FIELDS])
+        if self.count >= self.capacity:
+            self._account(self._data[:, row, :], -1)
+        self._data[:, row, :] = new
+        self.timestamps[row] = snap.timestamp or 0
+        self.count += 1
+        # Re-center the running sums once per lap so they never drift
+        if self.count % self.capacity == 0:
+            self._rebuild()
+        else:
+            self._account(new, 1)
+
+    def _widen(self, size):
+        extra = size - self._data.shape[2]
+        if extra <= 0:
+            return
+        fields = len(FIELDS)
+        self._data = np.concatenate([self._data, np.full((fields, self.capacity, extra), np.nan)], axis=2)
+        self._shift = np.concatenate([self._shift, np.full((fields, extra), np.nan)], axis=1)
+        for name in ("_s1", "_s2", "_n"):
+            setattr(self, name, np.concatenate([getattr(self, name), np.zeros((fields, extra))], axis=1))
+
+    def _account(self, values, sign):
+        unset = np.isnan(self._shift) & ~np.isnan(values)
+        self._shift[unset] = values[unset]
+        centered = values - self._shift
+        ok = ~np.isnan(centered)
+        centered = np.where(ok, centered, 0.0)
+        self._s1 += sign * centered
+        self._s2 += sign * centered * centered
+        self._n += sign * ok
+
+    def _rebuild(self):
+        window = self._data[:, :len(self), :]
+        self._shift = self._data[:, (self.count - 1) % self.capacity, :].copy()
+        self._s1[:] = 0
+        self._s2[:] = 0
+        self._n[:] = 0
+        for row in range(window.shape[1]):
+            self._account(window[:, row, :], 1)
+
+    # ---------- reading ----------
+
+    def _row(self, back=0):
+        """Buffer row of the snapshot `back` steps before the latest"""
+        if back >= len(self):
+            raise IndexError(f"only {len(self)} snapshots in history")
+        return (self.count - 1 - back) % self.capacity
+
+    def latest(self, field="price", back=0):
+        return self._data[FIELDS.index(field), self._row(back)]
+
+    def window(self, field, k=None):
+        """Last k rows of field, oldest first: (k, coins)"""
+        k = len(self) if k is None else min(k, len(self))
+        rows = (np.arange(self.count - k, self.count)) % self.capacity
+        return self._data[FIELDS.index(field)][rows]
+
+    def window_timestamps(self, k=None):
+        k = len(self) if k is None else min(k, len(self))
+        return self.timestamps[(np.arange(self.count - k, self.count)) % self.capacity]
+
+    def returns(self, lag=1):
+        """Per-coin price change over the last `lag` snapshots"""
+        return self.latest("price") / self.latest("price", lag) - 1
+
+    def oi_change(self, lag=1, usd=True):
+        """Per-coin OI change over `lag` snapshots (USD by default)"""
+        now, then = self.latest("oi"), self.latest("oi", lag)
+        if usd:
+            now, then = now * self.latest("price"), then * self.latest("price", lag)
+        return now - then
+
+    def oi_weighted_return(self, lag=1):
+        """Market move over `lag` snapshots, each coin weighted by its current OI in USD"""
+        return _weighted(self.returns(lag), self.latest("oi") * self.latest("price"))
+
+    def mean(self, field):
+        i = FIELDS.index(field)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return self._shift[i] + self._s1[i] / self._n[i]
+
+    def std(self, field):
+        i = FIELDS.index(field)
+        n = self._n[i]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            var = (self._s2[i] - self._s1[i] ** 2 / n) / n
+        return np.sqrt(np.maximum(var, 0))
+
+    def zscore(self, field):
+        """Latest value of each coin vs its own rolling mean/std (NaN where flat)"""
+        std = self.std(field)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(std > 0, (self.latest(field) - self.mean(field)) / std, np.nan)
+
+
+# ==================== CLI ====================
+def main(argv=None):
+    """python -m analytics.market [--top N]"""
+    import argparse
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from api import MoonDevAPI
+
+    parser = argparse.ArgumentParser(description="🌙 Moon Dev's market snapshot")
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args(argv)
+
+    snap = MarketSnapshot.from_api(MoonDevAPI().get_prices())
+    print(f"🌙 Moon Dev: {len(snap)} coins, ${np.nansum(snap.oi_usd):,.0f} open interest")
+    for title, field, descending in (("💰 Highest funding (APR)", "funding_apr", True),
+                                     ("🧊 Most negative funding (APR)", "funding_apr", False),
+                                     ("🏦 Largest OI (USD)", "oi_usd", True)):
+        print(f"\n{title}")
+        for coin, value in snap.top(field, args.top, descending):
+            shown = f"{value * 100:+.2f}%" if field == "funding_apr" else f"${value:,.0f}"
+            print(f"   {coin:<10} {shown}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,403 @@
+"""
+🌙 Moon Dev's Order Book Analytics
+Depth, slippage, imbalance and microprice from get_orderbook, one coin or all 80
+
+Built with love by Moon Dev 🚀
+
+Usage:
+    from api import MoonDevAPI
+    from analytics.orderbook import OrderBook, OrderBooks
+
+    api = MoonDevAPI()
+    book = OrderBook.from_api(api.get_orderbook("BTC"))
+    book.spread_bps, book.microprice
+    book.depth(10)                        # USD resting within 10 bps of mid, per side
+    book.vwap(250_000, "buy")             # fill price, slippage_bps, levels walked
+    book.slippage_bps(1_000_000, "sell")
+    book.imbalance(5)                     # top-5-level size imbalance, -1..1
+    book.depth_curve([5, 10, 25, 50])     # cumulative USD depth at each distance
+
+    books = OrderBooks.fetch(api)         # all 80 candle symbols, fetched concurrently
+    books.spread_bps                      # one array, one entry per coin
+    books.slippage_bps(100_000, "buy")    # every coin in one vectorized pass
+    books.summary()                       # {coin: {spread_bps, depth_10bps, ...}}
+
+    python -m analytics.orderbook         # table of every coin
+
+Books are held as (coins, levels) float arrays - prices padded with NaN,
+sizes with 0 - so every metric is a handful of array ops regardless of how
+many coins are loaded. A single OrderBook is the one-row case of the same
+code, with its methods returning plain floats.
+"""
+
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+# ============================================
+# 🎯 BOOK DEFAULTS - Moon Dev
+# ============================================
+
+FETCH_WORKERS = 10                      # matches the session's connection pool size
+SUMMARY_NOTIONALS = (10_000, 100_000, 1_000_000)
+SUMMARY_DEPTH_BPS = (10, 50, 100)
+DEFAULT_CURVE_BPS = (1, 2, 5, 10, 25, 50, 100, 250)
+
+# ============================================
+
+BUY, SELL = "buy", "sell"
+
+
+def _side_arrays(sides, width):
+    """[[level dicts], ...] -> (px, sz, n) arrays padded to width"""
+    px = np.full((len(sides), width), np.nan)
+    sz = np.zeros((len(sides), width))
+    n = np.zeros((len(sides), width), dtype=np.int32)
+    for row, levels in enumerate(sides):
+        if levels:
+            k = len(levels)
+            px[row, :k] = [level["px"] for level in levels]
+            sz[row, :k] = [level["sz"] for level in levels]
+            n[row, :k] = [level.get("n", 0) for level in levels]
+    return px, sz, n
+
+
+def fetch_orderbooks(api, coins=None, workers=FETCH_WORKERS):
+    """
+    get_orderbook() for many coins at once.
+
+    Args:
+        api: MoonDevAPI
+        coins: Symbols (default: all get_candle_symbols())
+        workers: Concurrent requests
+
+    Returns:
+        ([responses in coin order], {coin: error message})
+    """
+    if coins is None:
+        coins = api.get_candle_symbols().get("symbols", [])
+
+    def load(coin):
+        try:
+            return coin, api.get_orderbook(coin), None
+        except Exception as e:
+            return coin, None, str(e) or type(e).__name__
+
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(coins)))) as pool:
+        results = list(pool.map(load, coins))
+    books, errors = [], {}
+    for coin, book, error in results:
+        if error is not None or not isinstance(book, dict):
+            errors[coin] = error or "empty response"
+        else:
+            books.append({**book, "coin": book.get("coin") or coin})
+    return books, errors
+
+
+class OrderBooks:
+    """
+    🌙 Moon Dev's Order Books
+
+    Many books stacked into (coins, levels) arrays. Bids are best-first
+    (high -> low), asks best-first (low -> high), as get_orderbook sends them.
+    Every metric returns one value per coin (NaN where a side is empty).
+    """
+
+    def __init__(self, coins, bid_px, bid_sz, ask_px, ask_sz, bid_n=None, ask_n=None, timestamps=None, errors=None):
+        self.coins = list(coins)
+        self.bid_px, self.bid_sz = bid_px, bid_sz
+        self.ask_px, self.ask_sz = ask_px, ask_sz
+        self.bid_n, self.ask_n = bid_n, ask_n
+        self.timestamps = timestamps if timestamps is not None else np.zeros(len(self.coins), dtype=np.int64)
+        self.errors = errors or {}          # coin -> error message for books that failed to load
+        self._row = {coin: i for i, coin in enumerate(self.coins)}
+        self._bid_usd = np.nan_to_num(bid_px) * bid_sz
+        self._ask_usd = np.nan_to_num(ask_px) * ask_sz
+        self._bid_cum = np.cumsum(self._bid_usd, axis=1)
+        self._ask_cum = np.cumsum(self._ask_usd, axis=1)
+
+    # ---------- building ----------
+
+    @classmethod
+    def from_api(cls, books, errors=None):
+        """Stack get_orderbook() responses (a list, or {coin: response})"""
+        if isinstance(books, dict):
+            books = list(books.values())
+        books = [b for b in books if isinstance(b, dict)]
+        bids = [(b.get("levels") or [[], []])[0] for b in books]
+        asks = [(b.get("levels") or [[], []])[1] for b in books]
+        width = max([len(side) for side in bids + asks] or [0])
+        bid_px, bid_sz, bid_n = _side_arrays(bids, width)
+        ask_px, ask_sz, ask_n = _side_arrays(asks, width)
+        timestamps = np.array([b.get("timestamp") or 0 for b in books], dtype=np.int64)
+        coins = [str(b.get("coin", "")) for b in books]
+        return cls(coins, bid_px, bid_sz, ask_px, ask_sz, bid_n, ask_n, timestamps, errors)
+
+    @classmethod
+    def fetch(cls, api, coins=None, workers=FETCH_WORKERS):
+        """
+        Fetch books concurrently and stack them (see fetch_orderbooks).
+
+        Books that fail are left out and listed in .errors.
+        """
+        books, errors = fetch_orderbooks(api, coins, workers)
+        return cls.from_api(books, errors)
+
+    def __len__(self):
+        return len(self.coins)
+
+    def __getitem__(self, coin):
+        """One coin as an OrderBook"""
+        i = self._row[coin]
+        s = slice(i, i + 1)
+        return OrderBook(OrderBooks([coin], self.bid_px[s], self.bid_sz[s], self.ask_px[s], self.ask_sz[s],
+                                    None if self.bid_n is None else self.bid_n[s],
+                                    None if self.ask_n is None else self.ask_n[s], self.timestamps[s]))
+
+    def __contains__(self, coin):
+        return coin in self._row
+
+    # ---------- top of book ----------
+
+    @property
+    def best_bid(self):
+        return self.bid_px[:, 0] if self.bid_px.shape[1] else np.full(len(self), np.nan)
+
+    @property
+    def best_ask(self):
+        return self.ask_px[:, 0] if self.ask_px.shape[1] else np.full(len(self), np.nan)
+
+    @property
+    def mid(self):
+        return (self.best_bid + self.best_ask) / 2
+
+    @property
+    def spread(self):
+        return self.best_ask - self.best_bid
+
+    @property
+    def spread_bps(self):
+        return self.spread / self.mid * 10000
+
+    @property
+    def microprice(self):
+        """Top-of-book price weighted toward the thinner side"""
+        if not self.bid_px.shape[1] or not self.ask_px.shape[1]:
+            return np.full(len(self), np.nan)
+        bid_sz, ask_sz = self.bid_sz[:, 0], self.ask_sz[:, 0]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return (self.best_bid * ask_sz + self.best_ask * bid_sz) / (bid_sz + ask_sz)
+
+    # ---------- depth ----------
+
+    def depth(self, bps):
+        """
+        USD resting within `bps` of mid.
+
+        Returns:
+            {"bid": array, "ask": array, "total": array}
+        """
+        mid = self.mid[:, None]
+        with np.errstate(invalid="ignore"):
+            bid_in = self.bid_px >= mid * (1 - bps / 10000)
+            ask_in = self.ask_px <= mid * (1 + bps / 10000)
+        bid = (self._bid_usd * bid_in).sum(axis=1)
+        ask = (self._ask_usd * ask_in).sum(axis=1)
+        return {"bid": bid, "ask": ask, "total": bid + ask}
+
+    def depth_curve(self, bps=DEFAULT_CURVE_BPS):
+        """
+        Cumulative USD depth at each distance from mid.
+
+        Returns:
+            (bps array, bid (coins, len(bps)), ask (coins, len(bps)))
+        """
+        grid = np.asarray(bps, dtype=float)
+        mid = self.mid[:, None, None]
+        with np.errstate(invalid="ignore"):
+            bid_in = self.bid_px[:, :, None] >= mid * (1 - grid / 10000)
+            ask_in = self.ask_px[:, :, None] <= mid * (1 + grid / 10000)
+        bid = np.einsum("cl,clg->cg", self._bid_usd, bid_in)
+        ask = np.einsum("cl,clg->cg", self._ask_usd, ask_in)
+        return grid, bid, ask
+
+    def imbalance(self, levels=None):
+        """(bid size - ask size) / total over the top `levels` (all if None), -1..1"""
+        bid = self.bid_sz[:, :levels].sum(axis=1)
+        ask = self.ask_sz[:, :levels].sum(axis=1)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return (bid - ask) / (bid + ask)
+
+    # ---------- execution ----------
+
+    def vwap(self, notional, side=BUY):
+        """
+        Walk the book for a market order of `notional` USD.
+
+        Args:
+            notional: USD to fill
+            side: "buy" walks the asks, "sell" walks the bids
+
+        Returns:
+            dict of arrays: vwap, slippage_bps (vs mid, positive = cost),
+            filled_usd, filled_size, levels (levels touched), complete
+            (False where the visible book is too thin)
+        """
+        if side == BUY:
+            px, usd, cum = self.ask_px, self._ask_usd, self._ask_cum
+        elif side == SELL:
+            px, usd, cum = self.bid_px, self._bid_usd, self._bid_cum
+        else:
+            raise ValueError(f"side must be 'buy' or 'sell', got {side!r}")
+        # USD taken from each level: whatever is left of the order when it gets there
+        taken = np.clip(notional - (cum - usd), 0, usd)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            size = np.where(taken > 0, taken / px, 0.0).sum(axis=1)
+            filled = taken.sum(axis=1)
+            vwap = filled / size
+            mid = self.mid
+            slippage = (vwap / mid - 1) * 10000 if side == BUY else (1 - vwap / mid) * 10000
+        return {
+            "vwap": vwap,
+            "slippage_bps": slippage,
+            "filled_usd": filled,
+            "filled_size": size,
+            "levels": (taken > 0).sum(axis=1),
+            "complete": cum[:, -1] >= notional if cum.shape[1] else np.zeros(len(self), dtype=bool),
+        }
+
+    def slippage_bps(self, notional, side=BUY):
+        """Cost vs mid in bps of a market order for `notional` USD"""
+        return self.vwap(notional, side)["slippage_bps"]
+
+    # ---------- reporting ----------
+
+    def summary(self, notionals=SUMMARY_NOTIONALS, depth_bps=SUMMARY_DEPTH_BPS):
+        """
+        Per-coin metrics table.
+
+        Returns:
+            {coin: {mid, spread_bps, microprice, imbalance, depth_<n>bps,
+                    buy_slip_<usd>, sell_slip_<usd>}}
+        """
+        columns = {
+            "mid": self.mid,
+            "spread_bps": self.spread_bps,
+            "microprice": self.microprice,
+            "imbalance": self.imbalance(),
+        }
+        for bps in depth_bps:
+            columns[f"depth_{bps:g}bps"] = self.depth(bps)["total"]
+        for notional in notionals:
+            columns[f"buy_slip_{notional:g}"] = self.slippage_bps(notional, BUY)
+            columns[f"sell_slip_{notional:g}"] = self.slippage_bps(notional, SELL)
+        return {coin: {name: float(values[i]) for name, values in columns.items()}
+                for i, coin in enumerate(self.coins)}
+
+
+class OrderBook:
+    """
+    🌙 Moon Dev's Order Book
+
+    One coin's book: a one-row OrderBooks whose metrics come back as floats.
+    """
+
+    def __init__(self, books):
+        self.books = books
+        self.coin = books.coins[0]
+        self.timestamp = int(books.timestamps[0])
+
+    @classmethod
+    def from_api(cls, book):
+        """Build from one get_orderbook() response"""
+        return cls(OrderBooks.from_api([book]))
+
+    @classmethod
+    def fetch(cls, api, coin):
+        return cls.from_api(api.get_orderbook(coin))
+
+    @property
+    def bids(self):
+        """(price, size) arrays, best first"""
+        keep = ~np.isnan(self.books.bid_px[0])
+        return self.books.bid_px[0][keep], self.books.bid_sz[0][keep]
+
+    @property
+    def asks(self):
+        keep = ~np.isnan(self.books.ask_px[0])
+        return self.books.ask_px[0][keep], self.books.ask_sz[0][keep]
+
+    best_bid = property(lambda self: float(self.books.best_bid[0]))
+    best_ask = property(lambda self: float(self.books.best_ask[0]))
+    mid = property(lambda self: float(self.books.mid[0]))
+    spread = property(lambda self: float(self.books.spread[0]))
+    spread_bps = property(lambda self: float(self.books.spread_bps[0]))
+    microprice = property(lambda self: float(self.books.microprice[0]))
+
+    def depth(self, bps):
+        """USD within `bps` of mid: {"bid", "ask", "total"}"""
+        return {side: float(values[0]) for side, values in self.books.depth(bps).items()}
+
+    def depth_curve(self, bps=DEFAULT_CURVE_BPS):
+        """(bps, bid USD, ask USD) arrays"""
+        grid, bid, ask = self.books.depth_curve(bps)
+        return grid, bid[0], ask[0]
+
+    def imbalance(self, levels=None):
+        return float(self.books.imbalance(levels)[0])
+
+    def vwap(self, notional, side=BUY):
+        """See OrderBooks.vwap"""
+        return {name: values[0].item() for name, values in self.books.vwap(notional, side).items()}
+
+    def slippage_bps(self, notional, side=BUY):
+        return self.vwap(notional, side)["slippage_bps"]
+
+    def summary(self, notionals=SUMMARY_NOTIONALS, depth_bps=SUMMARY_DEPTH_BPS):
+        return self.books.summary(notionals, depth_bps)[self.coin]
+
+    def __repr__(self):
+        return f"OrderBook({self.coin} {self.best_bid:.10g}/{self.best_ask:.10g} {self.spread_bps:.2f}bps)"
+
+
+# ==================== CLI ====================
+def main(argv=None):
+    """python -m analytics.orderbook [COIN ...] [--notional USD]"""
+    import argparse
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from api import MoonDevAPI
+
+    parser = argparse.ArgumentParser(description="🌙 Moon Dev's order book analytics")
+    parser.add_argument("coins", nargs="*", help="Default: all candle symbols")
+    parser.add_argument("--notional", type=float, default=100_000, help="Order size for slippage (USD)")
+    parser.add_argument("--bps", type=float, default=10, help="Depth band around mid")
+    args = parser.parse_args(argv)
+
+    api = MoonDevAPI()
+    start = time.perf_counter()
+    books = OrderBooks.fetch(api, args.coins or None)
+    fetched = time.perf_counter() - start
+    start = time.perf_counter()
+    depth = books.depth(args.bps)["total"]
+    buy = books.slippage_bps(args.notional, BUY)
+    sell = books.slippage_bps(args.notional, SELL)
+    imbalance = books.imbalance(5)
+    spread = books.spread_bps
+    computed = time.perf_counter() - start
+
+    print(f"🌙 Moon Dev: {len(books)} books in {fetched * 1000:.0f}ms, metrics in {computed * 1000:.2f}ms")
+    print(f"{'COIN':<10}{'SPREAD':>9}{f'DEPTH {args.bps:g}bps':>16}"
+          f"{f'BUY ${args.notional:,.0f}':>16}{f'SELL ${args.notional:,.0f}':>16}{'IMB5':>8}")
+    for i in np.argsort(-np.nan_to_num(depth)):
+        print(f"{books.coins[i]:<10}{spread[i]:>8.2f} ${depth[i]:>14,.0f}"
+              f"{buy[i]:>14.2f}bp{sell[i]:>14.2f}bp{imbalance[i]:>+8.2f}")
+    for coin, error in books.errors.items():
+        print(f"⚠️ {coin}: {error}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
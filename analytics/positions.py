@@ -0,0 +1,305 @@
+"""
+🌙 Moon Dev's Position Index
+Liquidation-risk view of the big positions, kept up to date between snapshots
+
+Built with love by Moon Dev 🚀
+
+Usage:
+    from api import MoonDevAPI
+    from analytics.positions import PositionIndex
+
+    api = MoonDevAPI()
+    index = PositionIndex.from_positions(api.get_positions())
+    # or every symbol: PositionIndex.from_all_positions(api.get_all_positions())
+
+    index.riskiest(25)              # closest to liquidation first
+    index.largest(5)                # biggest whales
+    index.within(2.0)               # every position < 2% from liquidation
+    index.count_within(5.0)         # O(log n)
+    index.buckets()                 # critical / high / medium / moderate / low
+    index.top_coins(10)             # per-coin count, value, longs, shorts
+
+    index.sync(api.get_positions()) # next poll: only changed positions move
+
+One pass builds everything. After that, sync() diffs the new snapshot
+against the index: unchanged positions cost a dict lookup, changed ones
+an O(log n) re-insert in the two sorted orders plus a constant-time
+update of their coin and risk-bucket totals.
+"""
+
+import bisect
+import math
+
+from api.views import SortedView
+
+# (upper bound of distance_pct, name) - same cut-offs as examples/02_positions.py
+RISK_BUCKETS = [
+    (2.0, "critical"),
+    (5.0, "high"),
+    (10.0, "medium"),
+    (20.0, "moderate"),
+    (math.inf, "low"),
+]
+
+_BUCKET_BOUNDS = [bound for bound, _ in RISK_BUCKETS]
+
+
+def risk_bucket(distance_pct):
+    """Bucket name for a distance to liquidation in %"""
+    return RISK_BUCKETS[min(bisect.bisect_right(_BUCKET_BOUNDS, distance_pct), len(RISK_BUCKETS) - 1)][1]
+
+
+def _number(value):
+    if value is None or value == "":
+        return 0.0
+    if isinstance(value, str):
+        return float(value.replace(",", "").replace("$", "").replace("%", ""))
+    return float(value)
+
+
+class IndexedPosition:
+    """One position as stored in the index (raw API dict in .raw)"""
+
+    __slots__ = ("key", "side", "address", "coin", "value", "distance_pct", "pnl", "leverage", "raw")
+
+    def __init__(self, raw, side, coin=None):
+        """
+        Args:
+            raw: Position dict from the API
+            side: "LONG" or "SHORT" (which list it came from)
+            coin: Fallback coin when the dict has none (get_all_positions symbol key)
+        """
+        self.raw = raw
+        self.side = side
+        self.address = raw.get("address", "")
+        self.coin = (raw.get("coin") or coin or "UNKNOWN").upper()
+        self.value = _number(raw.get("value"))
+        distance = raw.get("distance_pct")
+        self.distance_pct = math.inf if distance is None else _number(distance)
+        self.pnl = _number(raw.get("pnl"))
+        self.leverage = _number(raw.get("leverage"))
+        self.key = (self.address, self.coin, side)
+
+    def __eq__(self, other):
+        return isinstance(other, IndexedPosition) and self.side == other.side and self.raw == other.raw
+
+    def __repr__(self):
+        return (f"IndexedPosition({self.side} {self.coin} {self.address[:10]} "
+                f"${self.value:,.0f} {self.distance_pct:.2f}%)")
+
+
+class _Totals:
+    """Running sums for a coin or a risk bucket"""
+
+    __slots__ = ("count", "value", "longs", "shorts", "long_value", "short_value", "pnl")
+
+    def __init__(self):
+        self.count = 0
+        self.value = 0.0
+        self.longs = 0
+        self.shorts = 0
+        self.long_value = 0.0
+        self.short_value = 0.0
+        self.pnl = 0.0
+
+    def add(self, pos, sign):
+        self.count += sign
+        self.value += sign * pos.value
+        self.pnl += sign * pos.pnl
+        if pos.side == "LONG":
+            self.longs += sign
+            self.long_value += sign * pos.value
+        else:
+            self.shorts += sign
+            self.short_value += sign * pos.value
+
+    def as_dict(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+class PositionIndex:
+    """
+    🌙 Moon Dev's Position Index
+
+    Positions sorted by distance to liquidation and by value, with per-coin
+    and per-risk-bucket totals, all maintained incrementally.
+    """
+
+    def __init__(self):
+        self._positions = {}        # key -> IndexedPosition
+        self._by_distance = SortedView(sort_key=lambda p: p.distance_pct, item_key=lambda p: p.key)
+        self._by_value = SortedView(sort_key=lambda p: p.value, item_key=lambda p: p.key, reverse=True)
+        self._coins = {}            # coin -> _Totals
+        self._buckets = {name: _Totals() for _, name in RISK_BUCKETS}
+        self.totals = _Totals()
+        self.meta = {}              # non-position fields of the last snapshot (updated_at, totals...)
+
+    # ---------- building ----------
+
+    @classmethod
+    def from_positions(cls, data):
+        """Index a get_positions() response (or one symbol block of get_all_positions)"""
+        index = cls()
+        index.sync(data)
+        return index
+
+    @classmethod
+    def from_all_positions(cls, data, symbols=None):
+        """Index a get_all_positions() response (optionally only some symbols)"""
+        index = cls()
+        index.sync_all(data, symbols)
+        return index
+
+    @staticmethod
+    def _raw_entries(block, coin=None):
+        if not isinstance(block, dict):
+            return
+        for pos in block.get("longs") or []:
+            yield pos, "LONG", coin
+        for pos in block.get("shorts") or []:
+            yield pos, "SHORT", coin
+
+    def sync(self, data):
+        """
+        Make the index match a get_positions()-shaped snapshot.
+
+        Returns:
+            (changed, removed) position counts
+        """
+        if isinstance(data, dict):
+            self.meta = {k: v for k, v in data.items() if k not in ("longs", "shorts")}
+        return self._sync(self._raw_entries(data))
+
+    def sync_all(self, data, symbols=None):
+        """Make the index match a get_all_positions() snapshot"""
+        blocks = data.get("symbols", {}) if isinstance(data, dict) else {}
+        if symbols is not None:
+            wanted = {s.upper() for s in symbols}
+            blocks = {s: b for s, b in blocks.items() if s.upper() in wanted}
+        if isinstance(data, dict):
+            self.meta = {k: v for k, v in data.items() if k != "symbols"}
+        return self._sync(entry for symbol, block in blocks.items() for entry in self._raw_entries(block, symbol))
+
+    def _sync(self, entries):
+        if not self._positions:
+            return self._load(entries)
+        positions = self._positions
+        seen = set()
+        changed = 0
+        for raw, side, coin in entries:
+            key = (raw.get("address", ""), (raw.get("coin") or coin or "UNKNOWN").upper(), side)
+            seen.add(key)
+            old = positions.get(key)
+            # Most positions don't move between polls - skip them before building anything
+            if old is not None and old.raw == raw:
+                continue
+            if self.upsert(IndexedPosition(raw, side, coin)):
+                changed += 1
+        gone = [key for key in positions if key not in seen] if len(seen) != len(positions) else []
+        for key in gone:
+            self.remove(key)
+        return changed, len(gone)
+
+    def _load(self, entries):
+        """First snapshot: build everything in one pass and one sort per order"""
+        for raw, side, coin in entries:
+            pos = IndexedPosition(raw, side, coin)
+            if pos.key in self._positions:
+                self._account(self._positions[pos.key], -1)
+            self._positions[pos.key] = pos
+            self._account(pos, 1)
+        self._by_distance.load(self._positions.values())
+        self._by_value.load(self._positions.values())
+        return len(self._positions), 0
+
+    def upsert(self, pos, side=None):
+        """
+        Add or update one position.
+
+        Args:
+            pos: IndexedPosition, or a raw API dict together with side
+            side: "LONG"/"SHORT" when pos is a raw dict
+
+        Returns:
+            True if the index changed
+        """
+        if not isinstance(pos, IndexedPosition):
+            pos = IndexedPosition(pos, side.upper())
+        old = self._positions.get(pos.key)
+        if old is not None:
+            if old == pos:
+                return False
+            self._account(old, -1)
+        self._positions[pos.key] = pos
+        self._account(pos, 1)
+        self._by_distance.upsert(pos)
+        self._by_value.upsert(pos)
+        return True
+
+    def remove(self, key):
+        """Drop a position by (address, coin, side); True if it was there"""
+        old = self._positions.pop(key, None)
+        if old is None:
+            return False
+        self._account(old, -1)
+        self._by_distance.remove(key)
+        self._by_value.remove(key)
+        return True
+
+    def _account(self, pos, sign):
+        self.totals.add(pos, sign)
+        self._buckets[risk_bucket(pos.distance_pct)].add(pos, sign)
+        coin = self._coins.get(pos.coin)
+        if coin is None:
+            coin = self._coins[pos.coin] = _Totals()
+        coin.add(pos, sign)
+        if coin.count == 0:
+            del self._coins[pos.coin]
+
+    # ---------- queries ----------
+
+    def __len__(self):
+        return len(self._positions)
+
+    def __iter__(self):
+        return iter(self._by_distance)
+
+    def get(self, address, coin, side):
+        return self._positions.get((address, coin.upper(), side.upper()))
+
+    def riskiest(self, n=25):
+        """n positions closest to liquidation"""
+        return self._by_distance.top(n)
+
+    def largest(self, n=5):
+        """n biggest positions by value"""
+        return self._by_value.top(n)
+
+    def within(self, pct, min_pct=None):
+        """Positions with min_pct <= distance_pct < pct, closest first - O(log n + k)"""
+        return self._by_distance.between(min_pct, pct)
+
+    def count_within(self, pct, min_pct=None):
+        """How many positions are < pct from liquidation - O(log n)"""
+        return self._by_distance.count_between(min_pct, pct)
+
+    def buckets(self):
+        """{bucket: {count, value, longs, shorts, long_value, short_value, pnl}} in risk order"""
+        return {name: self._buckets[name].as_dict() for _, name in RISK_BUCKETS}
+
+    def bucket(self, name):
+        return self._buckets[name].as_dict()
+
+    def coin(self, coin):
+        """Totals for one coin (None if it has no positions)"""
+        totals = self._coins.get(coin.upper())
+        return totals.as_dict() if totals else None
+
+    def coins(self):
+        """{coin: totals} for every coin in the index"""
+        return {coin: totals.as_dict() for coin, totals in self._coins.items()}
+
+    def top_coins(self, n=10, by="value"):
+        """[(coin, totals)] with the largest `by` (value, count, long_value...)"""
+        ranked = sorted(self._coins.items(), key=lambda item: getattr(item[1], by), reverse=True)
+        return [(coin, totals.as_dict()) for coin, totals in ranked[:n]]
@@ -0,0 +1,498 @@
+"""
+🌙 Moon Dev's Smart Money Backtester
+Do smart money signals actually lead price? Forward returns for every signal, vectorized
+
+Built with love by Moon Dev 🚀
+
+Usage:
+    from api import MoonDevAPI
+    from analytics.smart_money_backtest import SignalBacktester
+
+    api = MoonDevAPI()
+    bt = SignalBacktester()                     # ~/.cache/moondev/smart_money/
+    bt.snapshot(api)                            # signals for 10m/1h/24h + rankings, new ones only
+    bt.run(api, every=600)                      # ...or keep snapshotting until Ctrl+C
+
+    bt.load_candles(api)                        # cache candles covering every signal's coin
+    result = bt.backtest(horizons=("1h", "4h", "24h"))
+    result.returns                              # (signals, horizons) direction-adjusted returns
+    result.summary()                            # per horizon: count, mean/median bps, hit rate, t-stat
+    result.summary(by="timeframe")              # or "direction", "group" (smart/dumb/other), "coin"
+    result.summary(min_strength=0.7)
+
+    python -m analytics.smart_money_backtest snapshot
+    python -m analytics.smart_money_backtest backtest --horizons 1h,4h,24h --by group
+
+The signal endpoints only show what's live, so a history exists only as
+long as we've been snapshotting: every snapshot appends the signals we
+haven't seen (keyed by timeframe, address, coin, direction and time) to
+append-only column files, tagged with whether the address was in the
+smart or dumb money ranking at the time.
+
+Candles come from CandleCache - close prices per coin and interval in
+local files, topped up from get_candles(start_time=last cached bar).
+
+backtest() puts every coin's closes in one flat array sorted by (coin,
+time) so entry and exit for all signals and all horizons are one
+searchsorted and one gather: entry is the close of the bar the signal
+landed in, exit the close of the bar opening `horizon` later, and a
+short signal's return is flipped. An exit past the last cached bar, or
+in a hole in the candles, is NaN.
+"""
+
+import os
+import sys
+import json
+import time
+import hashlib
+import warnings
+import threading
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+# ============================================
+# 🎯 BACKTEST CONFIGURATION - Moon Dev
+# ============================================
+
+DEFAULT_SIGNALS_DIR = os.path.join(os.path.expanduser("~"), ".cache", "moondev", "smart_money")
+DEFAULT_CANDLES_DIR = os.path.join(os.path.expanduser("~"), ".cache", "moondev", "candles")
+SIGNAL_TIMEFRAMES = ("10m", "1h", "24h")
+DEFAULT_INTERVAL = "5m"
+DEFAULT_HORIZONS = ("15m", "1h", "4h", "24h")
+SNAPSHOT_EVERY = 600          # seconds between signal snapshots in run()
+FETCH_WORKERS = 10            # matches the session's connection pool size
+
+# ============================================
+
+INTERVAL_MS = {"1m": 60_000, "5m": 300_000, "15m": 900_000, "1h": 3_600_000,
+               "4h": 14_400_000, "1d": 86_400_000}
+_UNIT_MS = {"m": 60_000, "h": 3_600_000, "d": 86_400_000}
+GROUPS = ("other", "smart", "dumb")
+_DIRECTIONS = {"long": 1, "buy": 1, "bullish": 1, "short": -1, "sell": -1, "bearish": -1}
+_COLUMNS = (("time", np.int64), ("key", np.int64), ("coin", np.int16), ("direction", np.int8),
+            ("timeframe", np.int8), ("group", np.int8), ("strength", np.float64))
+
+
+def _ms(value):
+    """Timestamp (ms, s or ISO string) -> epoch ms"""
+    if isinstance(value, (int, float)):
+        return int(value * 1000) if value < 1e12 else int(value)
+    if value:
+        try:
+            return int(datetime.fromisoformat(str(value).replace("Z", "+00:00")).timestamp() * 1000)
+        except ValueError:
+            pass
+    return None
+
+
+def _float(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+def duration_ms(value):
+    """"15m" / "4h" / "1d" (or ms) -> ms"""
+    if isinstance(value, (int, float)):
+        return int(value)
+    return int(float(value[:-1]) * _UNIT_MS[value[-1]])
+
+
+class CandleCache:
+    """
+    🌙 Moon Dev's Candle Cache
+
+    Close prices per (coin, interval) as two append-only files: <coin>_<interval>.t
+    (int64 open time) and .c (float64 close).
+    """
+
+    def __init__(self, directory=DEFAULT_CANDLES_DIR):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+
+    def _paths(self, coin, interval):
+        base = os.path.join(self.directory, f"{coin}_{interval}")
+        return base + ".t", base + ".c"
+
+    def read(self, coin, interval=DEFAULT_INTERVAL):
+        """(open times, closes) cached for coin, oldest first"""
+        t_path, c_path = self._paths(coin, interval)
+        if not os.path.exists(t_path):
+            return np.zeros(0, dtype=np.int64), np.zeros(0)
+        t, c = np.fromfile(t_path, dtype=np.int64), np.fromfile(c_path, dtype=np.float64)
+        rows = min(len(t), len(c))
+        return t[:rows], c[:rows]
+
+    def update(self, api, coin, interval=DEFAULT_INTERVAL, start=None):
+        """
+        Fetch candles after the last cached bar (or from `start` if that's
+        earlier than the cache). The still-open candle isn't stored.
+
+        Returns:
+            Bars added
+        """
+        t, c = self.read(coin, interval)
+        t_path, c_path = self._paths(coin, interval)
+        # Fetching before the cache (or a torn last write) rewrites the coin's files
+        rewrite = (start is not None and (not len(t) or start < t[0])) or \
+            (os.path.exists(t_path) and os.path.getsize(t_path) != os.path.getsize(c_path))
+        since = int(t[-1]) if len(t) and not rewrite else start
+        candles = api.get_candles(coin, interval, start_time=since)
+        candles = candles if isinstance(candles, list) else (candles or {}).get("candles", [])
+        now_ms = int(time.time() * 1000)
+        step = INTERVAL_MS[interval]
+        rows = {}
+        for candle in candles:
+            open_t, close_t = _ms(candle.get("t")), _ms(candle.get("T"))
+            if candle.get("i", interval) != interval:
+                continue                      # another interval's candles - would fake the bar spacing
+            if open_t is not None and (close_t if close_t is not None else open_t + step) < now_ms:
+                rows[open_t] = _float(candle.get("c"))
+        if rewrite:
+            rows.update({a: b for a, b in zip(t.tolist(), c.tolist()) if a not in rows})
+            keep = sorted(rows)
+        else:
+            keep = sorted(ts for ts in rows if not len(t) or ts > t[-1])
+        with self._lock:
+            for path, values in ((t_path, np.array(keep, dtype=np.int64)),
+                                 (c_path, np.array([rows[ts] for ts in keep], dtype=np.float64))):
+                with open(path, "wb" if rewrite else "ab") as f:
+                    f.write(values.tobytes())
+        return len(keep) - (len(t) if rewrite else 0)
+
+
+class BacktestResult:
+    """
+    🌙 Moon Dev's Backtest Result
+
+    returns is (signals, horizons): direction-adjusted simple returns, NaN
+    where the candles don't reach the exit. events holds the signal columns.
+    """
+
+    def __init__(self, events, horizons, entry, returns, coins):
+        self.events, self.horizons = events, list(horizons)
+        self.entry, self.returns = entry, returns
+        self.coins = coins
+
+    def __len__(self):
+        return len(self.returns)
+
+    def _labels(self, by):
+        e = self.events
+        if by == "timeframe":
+            return np.array(SIGNAL_TIMEFRAMES)[e["timeframe"]]
+        if by == "direction":
+            return np.where(e["direction"] > 0, "long", "short")
+        if by == "group":
+            return np.array(GROUPS)[e["group"]]
+        if by == "coin":
+            return np.array(self.coins)[e["coin"]]
+        raise ValueError("by must be None, timeframe, direction, group or coin")
+
+    @staticmethod
+    def _stats(returns):
+        """Per-horizon stats over the rows of a (n, horizons) block"""
+        ok = ~np.isnan(returns)
+        n = ok.sum(0)
+        # A horizon no signal reached yet is all NaN - report NaN quietly
+        with warnings.catch_warnings(), np.errstate(invalid="ignore", divide="ignore"):
+            warnings.simplefilter("ignore", RuntimeWarning)
+            mean = np.nanmean(returns, 0)
+            std = np.nanstd(returns, 0, ddof=1)
+            median = np.nanmedian(returns, 0)
+            hit = (returns > 0).sum(0) / n
+            t_stat = mean / std * np.sqrt(n)
+        return n, mean, median, hit, t_stat
+
+    def summary(self, by=None, min_strength=None):
+        """
+        Returns:
+            {horizon: {signals, mean_bps, median_bps, hit_rate, t_stat}} or,
+            with `by`, {label: {horizon: ...}}
+        """
+        returns = self.returns
+        keep = np.ones(len(returns), dtype=bool)
+        if min_strength is not None:
+            keep &= self.events["strength"] >= min_strength
+        groups = {None: keep} if by is None else \
+            {label: keep & (labels == label) for labels in [self._labels(by)] for label in np.unique(labels[keep]).tolist()}
+        out = {}
+        for label, mask in groups.items():
+            if not mask.any():
+                continue
+            n, mean, median, hit, t_stat = self._stats(returns[mask])
+            out[label] = {h: {"signals": int(n[k]), "mean_bps": float(mean[k] * 1e4),
+                              "median_bps": float(median[k] * 1e4), "hit_rate": float(hit[k]),
+                              "t_stat": float(t_stat[k])} for k, h in enumerate(self.horizons)}
+        return out[None] if by is None else out
+
+
+class SignalBacktester:
+    """
+    🌙 Moon Dev's Smart Money Signal Backtester
+
+    Snapshots get_smart_money_signals() into a local event log and
+    measures forward returns against cached candles.
+    """
+
+    def __init__(self, directory=DEFAULT_SIGNALS_DIR, candles=None, interval=DEFAULT_INTERVAL):
+        if interval not in INTERVAL_MS:
+            raise ValueError(f"interval must be one of {', '.join(INTERVAL_MS)}")
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+        self.candles = candles if candles is not None else CandleCache()
+        self.interval = interval
+        self.errors = 0
+        self._lock = threading.Lock()
+        self._coins_path = os.path.join(directory, "coins.json")
+        self.coins = []
+        if os.path.exists(self._coins_path):
+            with open(self._coins_path) as f:
+                self.coins = json.load(f)
+        cols = {}
+        for column, dtype in _COLUMNS:
+            path = self._path(column)
+            cols[column] = np.fromfile(path, dtype=dtype) if os.path.exists(path) else np.zeros(0, dtype)
+        # A crash mid-append leaves the columns at different lengths - keep the complete rows
+        rows = min(len(a) for a in cols.values())
+        for column, dtype in _COLUMNS:
+            if len(cols[column]) != rows:
+                cols[column] = cols[column][:rows]
+                with open(self._path(column), "r+b") as f:
+                    f.truncate(rows * np.dtype(dtype).itemsize)
+        self._cols = cols
+        self._keys = set(cols["key"].tolist())
+
+    def _path(self, column):
+        return os.path.join(self.directory, f"{column}.col")
+
+    def __len__(self):
+        return len(self._cols["time"])
+
+    # ---------- snapshotting ----------
+
+    def ingest(self, data, timeframe="1h", rankings=None, now_ms=None):
+        """
+        Append the signals of a get_smart_money_signals() response we haven't seen.
+
+        Args:
+            data: get_smart_money_signals(timeframe) response
+            timeframe: The timeframe it was fetched with
+            rankings: get_smart_money_rankings() response to tag addresses with
+            now_ms: Time for signals without a timestamp (default: now)
+
+        Returns:
+            New signals stored
+        """
+        if timeframe not in SIGNAL_TIMEFRAMES:
+            raise ValueError(f"timeframe must be one of {', '.join(SIGNAL_TIMEFRAMES)}")
+        signals = data.get("signals", []) if isinstance(data, dict) else data or []
+        groups = {}
+        for g, name in ((1, "smart_money"), (2, "dumb_money")):
+            for row in (rankings or {}).get(name, []) or []:
+                address = row.get("address") if isinstance(row, dict) else row
+                if address:
+                    groups[str(address).lower()] = g
+        now_ms = now_ms if now_ms is not None else int(time.time() * 1000)
+
+        with self._lock:
+            rows, known_coins = [], len(self.coins)
+            for s in signals:
+                if not isinstance(s, dict) or not s.get("coin"):
+                    continue
+                direction = _DIRECTIONS.get(str(s.get("direction", s.get("side", ""))).lower())
+                if direction is None:
+                    continue
+                address = str(s.get("address", s.get("user", ""))).lower()
+                ts = _ms(s.get("timestamp", s.get("time", s.get("datetime"))))
+                ident = f"{timeframe}|{address}|{s['coin']}|{direction}|{ts}"
+                key = int.from_bytes(hashlib.blake2b(ident.encode(), digest_size=8).digest(), "little", signed=True)
+                if key in self._keys:
+                    continue
+                self._keys.add(key)
+                if s["coin"] not in self.coins:
+                    self.coins.append(s["coin"])
+                rows.append((ts if ts is not None else now_ms, key, self.coins.index(s["coin"]), direction,
+                             SIGNAL_TIMEFRAMES.index(timeframe), groups.get(address, 0),
+                             _float(s.get("strength", s.get("score")))))
+            if not rows:
+                return 0
+            if len(self.coins) != known_coins:
+                with open(self._coins_path + ".tmp", "w") as f:
+                    json.dump(self.coins, f)
+                os.replace(self._coins_path + ".tmp", self._coins_path)
+            for j, (column, dtype) in enumerate(_COLUMNS):
+                values = np.array([r[j] for r in rows], dtype=dtype)
+                with open(self._path(column), "ab") as f:
+                    f.write(values.tobytes())
+                self._cols[column] = np.concatenate([self._cols[column], values])
+            return len(rows)
+
+    def snapshot(self, api, timeframes=SIGNAL_TIMEFRAMES):
+        """Rankings once, then every timeframe's signals; returns {timeframe: new signals}"""
+        rankings = api.get_smart_money_rankings()
+        return {tf: self.ingest(api.get_smart_money_signals(tf), tf, rankings) for tf in timeframes}
+
+    def run(self, api, every=SNAPSHOT_EVERY, duration=None, timeframes=SIGNAL_TIMEFRAMES):
+        """Snapshot on a fixed-rate schedule until Ctrl+C (or `duration` seconds)"""
+        from api.scheduler import PollingScheduler
+        scheduler = PollingScheduler(on_error=self._on_error)
+        scheduler.every(every, lambda: self.snapshot(api, timeframes), name="smart_money_signals")
+        scheduler.run(duration)
+
+    def _on_error(self, job, error):
+        self.errors += 1
+        print(f"⚠️ Moon Dev smart money backtest: snapshot failed: {error}")
+
+    # ---------- backtesting ----------
+
+    def events(self, since=None, until=None):
+        """Stored signals as {column: array}"""
+        t = self._cols["time"]
+        mask = np.ones(len(t), dtype=bool)
+        if since is not None:
+            mask &= t >= since
+        if until is not None:
+            mask &= t <= until
+        return {column: values[mask] for column, values in self._cols.items()}
+
+    def load_candles(self, api, since=None, workers=FETCH_WORKERS):
+        """
+        Bring the candle cache up to date for every coin with signals, from
+        the first signal (or `since`) on, concurrently.
+
+        Returns:
+            {coin: bars added or error message}
+        """
+        coins = [self.coins[i] for i in np.unique(self._cols["coin"])]
+        if not coins:
+            return {}
+        start = since if since is not None else int(self._cols["time"].min())
+        start -= start % INTERVAL_MS[self.interval]
+
+        def load(coin):
+            try:
+                return coin, self.candles.update(api, coin, self.interval, start=start)
+            except Exception as e:
+                return coin, str(e) or type(e).__name__
+
+        with ThreadPoolExecutor(max_workers=max(1, min(workers, len(coins)))) as pool:
+            return dict(pool.map(load, coins))
+
+    def backtest(self, horizons=DEFAULT_HORIZONS, since=None, until=None):
+        """
+        Forward returns for every stored signal at every horizon.
+
+        Returns:
+            BacktestResult
+        """
+        step = INTERVAL_MS[self.interval]
+        horizon_ms = np.array([max(1, duration_ms(h) // step) * step for h in horizons], dtype=np.int64)
+        events = self.events(since, until)
+
+        # Every coin's candles in one flat array, ordered by (coin, time)
+        span = np.int64(1) << 44                      # > any ms timestamp, keeps coins apart
+        times, closes = [np.zeros(0, dtype=np.int64)], [np.zeros(0)]
+        for j, coin in enumerate(self.coins):
+            t, c = self.candles.read(coin, self.interval)
+            times.append(t + j * span)
+            closes.append(c)
+        flat_t, flat_c = np.concatenate(times), np.concatenate(closes)
+        ends = np.cumsum([len(t) for t in times])[1:]
+        starts = ends - [len(t) for t in times[1:]]
+
+        coin = events["coin"].astype(np.int64)
+        entry = np.full(len(coin), np.nan)
+        returns = np.full((len(coin), len(horizon_ms)), np.nan)
+        if len(flat_t) and len(coin):
+            # Bar the signal landed in: the last open time <= signal time, same coin, still open
+            key = events["time"] + coin * span
+            entry_i = np.searchsorted(flat_t, key, side="right") - 1
+            valid = (entry_i >= starts[coin]) & (key < flat_t[np.maximum(entry_i, 0)] + step)
+            # Exit is the bar opening exactly `horizon` after the entry bar - a hole in
+            # the candles means no exit rather than a longer holding period
+            exit_t = flat_t[np.maximum(entry_i, 0)][:, None] + horizon_ms[None, :]
+            exit_i = np.minimum(np.searchsorted(flat_t, exit_t), len(flat_t) - 1)
+            ok = valid[:, None] & (flat_t[exit_i] == exit_t)
+            entry[valid] = flat_c[entry_i[valid]]
+            exit_px = np.where(ok, flat_c[np.where(ok, exit_i, 0)], np.nan)
+            with np.errstate(invalid="ignore", divide="ignore"):
+                returns = (exit_px / entry[:, None] - 1) * events["direction"][:, None]
+        return BacktestResult(events, horizons, entry, returns, list(self.coins))
+
+    def stats(self):
+        t = self._cols["time"]
+        return {
+            "signals": len(self),
+            "coins": len(self.coins),
+            "by_timeframe": {tf: int((self._cols["timeframe"] == i).sum()) for i, tf in enumerate(SIGNAL_TIMEFRAMES)},
+            "first": int(t.min()) if len(t) else None,
+            "last": int(t.max()) if len(t) else None,
+        }
+
+
+# ==================== CLI ====================
+def main(argv=None):
+    """python -m analytics.smart_money_backtest snapshot|run|stats|backtest"""
+    import argparse
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+    parser = argparse.ArgumentParser(description="🌙 Moon Dev's smart money signal backtester")
+    parser.add_argument("--dir", default=DEFAULT_SIGNALS_DIR)
+    parser.add_argument("--candles-dir", default=DEFAULT_CANDLES_DIR)
+    parser.add_argument("--interval", default=DEFAULT_INTERVAL, choices=list(INTERVAL_MS))
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("snapshot", help="Store the current signals")
+    p = sub.add_parser("run", help="Snapshot until Ctrl+C")
+    p.add_argument("--every", type=float, default=SNAPSHOT_EVERY)
+    sub.add_parser("stats", help="What's stored")
+    p = sub.add_parser("backtest", help="Forward returns per horizon")
+    p.add_argument("--horizons", default=",".join(DEFAULT_HORIZONS))
+    p.add_argument("--by", choices=("timeframe", "direction", "group", "coin"))
+    p.add_argument("--min-strength", type=float)
+    p.add_argument("--no-fetch", action="store_true", help="Use cached candles as they are")
+    args = parser.parse_args(argv)
+
+    bt = SignalBacktester(args.dir, CandleCache(args.candles_dir), args.interval)
+    fmt = lambda ms: datetime.fromtimestamp(ms / 1000).strftime("%m-%d %H:%M") if ms else "-"
+
+    if args.command in ("snapshot", "run"):
+        from api import MoonDevAPI
+        api = MoonDevAPI()
+        if args.command == "run":
+            print(f"🌙 Moon Dev: snapshotting smart money signals every {args.every:g}s (Ctrl+C to stop)")
+            bt.run(api, every=args.every)
+        else:
+            added = bt.snapshot(api)
+            print("🌙 Moon Dev: new signals " + ", ".join(f"{tf}: {n}" for tf, n in added.items()))
+    elif args.command == "stats":
+        s = bt.stats()
+        print(f"🌙 {s['signals']:,} signals over {s['coins']} coins  {fmt(s['first'])} → {fmt(s['last'])}")
+        print("   " + ", ".join(f"{tf}: {n:,}" for tf, n in s["by_timeframe"].items()))
+    elif args.command == "backtest":
+        if not args.no_fetch:
+            from api import MoonDevAPI
+            failed = {c: r for c, r in bt.load_candles(MoonDevAPI()).items() if isinstance(r, str)}
+            if failed:
+                print(f"⚠️ candles failed for {', '.join(sorted(failed))}")
+        horizons = args.horizons.split(",")
+        started = time.perf_counter()
+        result = bt.backtest(horizons)
+        summary = result.summary(by=args.by, min_strength=args.min_strength)
+        elapsed = (time.perf_counter() - started) * 1000
+        for label, per_horizon in (summary.items() if args.by else [("all signals", summary)]):
+            print(f"\n📊 {label}")
+            print(f"   {'Horizon':<8} {'Signals':>8} {'Mean bps':>9} {'Median':>8} {'Hit':>6} {'t':>6}")
+            for h, s in per_horizon.items():
+                print(f"   {h:<8} {s['signals']:>8,} {s['mean_bps']:>+9.1f} {s['median_bps']:>+8.1f} "
+                      f"{s['hit_rate']:>6.1%} {s['t_stat']:>+6.2f}")
+        print(f"\n   {len(result):,} signals x {len(horizons)} horizons in {elapsed:.1f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,379 @@
+"""
+🌙 Moon Dev's Position Snapshot Store
+Keep the 1-minute position snapshots locally and query history in milliseconds
+
+Built with love by Moon Dev 🚀
+
+Usage:
+    from api import MoonDevAPI
+    from analytics.snapshot_store import SnapshotStore
+
+    api = MoonDevAPI()
+    store = SnapshotStore()                 # ~/.cache/moondev/position_snapshots.sqlite3
+    store.sync(api)                         # BTC/ETH/SOL/XRP/HYPE, only what's new
+
+    store.state_at("BTC", ts_ms)            # every tracked position at that minute
+    store.state_at("BTC", ts_ms, max_distance_pct=2)
+    store.trajectory("0xabc...", "BTC")     # one user's path toward liquidation
+    store.closing_in("ETH", hours=1)        # who got closer to liquidation fastest
+    store.bucket_series("SOL")              # critical/high/... counts per minute
+
+    python -m analytics.snapshot_store sync
+    python -m analytics.snapshot_store state BTC
+    python -m analytics.snapshot_store trajectory 0xabc... BTC
+
+get_position_snapshots() only takes a lookback in hours, so every call
+re-downloads the whole window. sync() remembers the newest snapshot per
+symbol and asks only for the hours since then (plus one for overlap);
+rows that are already stored are skipped by the primary key.
+
+Rows are keyed (symbol, timestamp, user, side) and indexed by
+(user, symbol, timestamp) and (symbol, distance bucket, timestamp), so
+each query above is an index range scan.
+"""
+
+import os
+import sys
+import math
+import time
+import sqlite3
+import threading
+
+from analytics.positions import RISK_BUCKETS, risk_bucket
+
+# ============================================
+# 🎯 STORE CONFIGURATION - Moon Dev
+# ============================================
+
+DEFAULT_STORE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "moondev", "position_snapshots.sqlite3")
+SNAPSHOT_SYMBOLS = ["BTC", "ETH", "SOL", "XRP", "HYPE"]   # symbols the snapshot API tracks
+MAX_SYNC_HOURS = 24           # first sync / long gaps: how far back to fetch
+SYNC_LIMIT = 10000            # rows per request
+SNAPSHOT_INTERVAL_MS = 60_000
+
+# ============================================
+
+BUCKET_NAMES = [name for _, name in RISK_BUCKETS]
+
+COLUMNS = ["symbol", "timestamp", "user", "side", "position_value", "size", "entry_price",
+           "liquidation_price", "mark_price", "distance_pct", "leverage"]
+
+
+class SnapshotStore:
+    """
+    🌙 Moon Dev's Position Snapshot Store
+
+    Thread-safe SQLite store of get_position_snapshots() rows.
+    """
+
+    def __init__(self, path=DEFAULT_STORE_PATH):
+        """
+        Args:
+            path: SQLite file (":memory:" for a throwaway store)
+        """
+        self.path = path
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        with self._lock, self._conn:
+            if path != ":memory:":
+                self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS snapshots ("
+                " symbol TEXT NOT NULL, timestamp INTEGER NOT NULL, user TEXT NOT NULL, side TEXT NOT NULL,"
+                " position_value REAL, size REAL, entry_price REAL, liquidation_price REAL,"
+                " mark_price REAL, distance_pct REAL, leverage REAL, bucket INTEGER,"
+                " PRIMARY KEY (symbol, timestamp, user, side)) WITHOUT ROWID"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_user ON snapshots (user, symbol, timestamp)")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_bucket ON snapshots (symbol, bucket, timestamp)")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS sync_state ("
+                " symbol TEXT PRIMARY KEY, last_timestamp INTEGER, last_sync REAL)"
+            )
+
+    def close(self):
+        self._conn.close()
+
+    # ---------- writing ----------
+
+    @staticmethod
+    def _row(snap, symbol=None):
+        distance = snap.get("distance_pct")
+        distance = float(distance) if distance is not None else None
+        bucket = BUCKET_NAMES.index(risk_bucket(distance)) if distance is not None else None
+        return (
+            str(snap.get("symbol") or symbol or "").upper(),
+            int(snap.get("timestamp", 0)),
+            snap.get("user", ""),
+            str(snap.get("side", "")).lower(),
+            snap.get("position_value"),
+            snap.get("size"),
+            snap.get("entry_price"),
+            snap.get("liquidation_price"),
+            snap.get("mark_price"),
+            distance,
+            snap.get("leverage"),
+            bucket,
+        )
+
+    def ingest(self, response, symbol=None):
+        """
+        Store a get_position_snapshots() response (or a list of snapshot dicts).
+
+        Returns:
+            Number of new rows
+        """
+        snapshots = response.get("snapshots", []) if isinstance(response, dict) else response or []
+        symbol = symbol or (response.get("symbol") if isinstance(response, dict) else None)
+        rows = [self._row(s, symbol) for s in snapshots]
+        if not rows:
+            return 0
+        with self._lock, self._conn:
+            before = self._conn.total_changes
+            self._conn.executemany("INSERT OR IGNORE INTO snapshots VALUES (?,?,?,?,?,?,?,?,?,?,?,?)", rows)
+            added = self._conn.total_changes - before
+            for sym in {r[0] for r in rows}:
+                newest = max(r[1] for r in rows if r[0] == sym)
+                self._conn.execute(
+                    "INSERT INTO sync_state (symbol, last_timestamp, last_sync) VALUES (?, ?, ?)"
+                    " ON CONFLICT(symbol) DO UPDATE SET"
+                    " last_timestamp = MAX(last_timestamp, excluded.last_timestamp), last_sync = excluded.last_sync",
+                    (sym, newest, time.time()),
+                )
+        return added
+
+    def sync(self, api, symbols=SNAPSHOT_SYMBOLS, max_hours=MAX_SYNC_HOURS, limit=SYNC_LIMIT):
+        """
+        Fetch only what's new since the last sync, per symbol.
+
+        Returns:
+            {symbol: {hours, fetched, added, truncated}} - truncated means the
+            response hit `limit`, so older rows in that window may be missing
+        """
+        report = {}
+        now_ms = time.time() * 1000
+        for symbol in symbols:
+            last = self.last_timestamp(symbol)
+            if last is None:
+                hours = max_hours
+            else:
+                # Whole hours since the newest stored snapshot, plus one for overlap
+                hours = min(max_hours, max(1, math.ceil((now_ms - last) / 3_600_000) + 1))
+            response = api.get_position_snapshots(symbol, hours=hours, limit=limit)
+            snapshots = response.get("snapshots", []) if isinstance(response, dict) else []
+            added = self.ingest(snapshots, symbol)
+            report[symbol] = {
+                "hours": hours,
+                "fetched": len(snapshots),
+                "added": added,
+                "truncated": len(snapshots) >= limit,
+            }
+        return report
+
+    def prune(self, older_than_hours):
+        """Delete snapshots older than N hours; returns rows removed"""
+        cutoff = int((time.time() - older_than_hours * 3600) * 1000)
+        with self._lock, self._conn:
+            return self._conn.execute("DELETE FROM snapshots WHERE timestamp < ?", (cutoff,)).rowcount
+
+    # ---------- queries ----------
+
+    def _query(self, sql, params=()):
+        with self._lock:
+            return [dict(row) for row in self._conn.execute(sql, params)]
+
+    def _scalar(self, sql, params=()):
+        with self._lock:
+            row = self._conn.execute(sql, params).fetchone()
+        return row[0] if row else None
+
+    def last_timestamp(self, symbol):
+        return self._scalar("SELECT last_timestamp FROM sync_state WHERE symbol = ?", (symbol.upper(),))
+
+    def timestamps(self, symbol, since=None, until=None):
+        """Snapshot times (ms) stored for a symbol"""
+        rows = self._query(
+            "SELECT DISTINCT timestamp FROM snapshots WHERE symbol = ? AND timestamp >= ? AND timestamp <= ?"
+            " ORDER BY timestamp",
+            (symbol.upper(), since or 0, until or 2 ** 62),
+        )
+        return [r["timestamp"] for r in rows]
+
+    def state_at(self, symbol, ts=None, max_distance_pct=None, side=None, max_age_ms=5 * SNAPSHOT_INTERVAL_MS):
+        """
+        Every tracked position at time ts (ms) - the last snapshot at or before it.
+
+        Args:
+            ts: Time in ms (None = newest stored)
+            max_distance_pct: Only positions closer than this to liquidation
+            side: 'long' or 'short'
+            max_age_ms: Return nothing if the nearest snapshot is older than this
+
+        Returns:
+            list of snapshot dicts (API field names), closest to liquidation first
+        """
+        symbol = symbol.upper()
+        at = self._scalar("SELECT MAX(timestamp) FROM snapshots WHERE symbol = ? AND timestamp <= ?",
+                          (symbol, ts if ts is not None else 2 ** 62))
+        if at is None or (ts is not None and ts - at > max_age_ms):
+            return []
+        sql = f"SELECT {', '.join(COLUMNS)} FROM snapshots WHERE symbol = ? AND timestamp = ?"
+        params = [symbol, at]
+        if max_distance_pct is not None:
+            sql += " AND distance_pct < ?"
+            params.append(max_distance_pct)
+        if side:
+            sql += " AND side = ?"
+            params.append(side.lower())
+        return self._query(sql + " ORDER BY distance_pct", params)
+
+    def trajectory(self, user, symbol=None, since=None, until=None):
+        """
+        One user's snapshots over time, oldest first.
+
+        Returns:
+            {user, points: [snapshot dicts], start_distance_pct, end_distance_pct,
+             min_distance_pct, pct_per_hour (negative = heading toward liquidation)}
+        """
+        sql = f"SELECT {', '.join(COLUMNS)} FROM snapshots WHERE user = ?"
+        params = [user]
+        if symbol:
+            sql += " AND symbol = ?"
+            params.append(symbol.upper())
+        if since is not None:
+            sql += " AND timestamp >= ?"
+            params.append(since)
+        if until is not None:
+            sql += " AND timestamp <= ?"
+            params.append(until)
+        points = self._query(sql + " ORDER BY timestamp", params)
+        summary = {"user": user, "points": points}
+        distances = [(p["timestamp"], p["distance_pct"]) for p in points if p["distance_pct"] is not None]
+        if distances:
+            (t0, d0), (t1, d1) = distances[0], distances[-1]
+            summary.update({
+                "start_distance_pct": d0,
+                "end_distance_pct": d1,
+                "min_distance_pct": min(d for _, d in distances),
+                "pct_per_hour": (d1 - d0) / ((t1 - t0) / 3_600_000) if t1 > t0 else 0.0,
+            })
+        return summary
+
+    def closing_in(self, symbol, hours=1, until=None, limit=20):
+        """
+        Positions whose distance to liquidation shrank the most over the window.
+
+        Returns:
+            [{user, side, start_distance_pct, end_distance_pct, change, position_value}]
+        """
+        symbol = symbol.upper()
+        end = until if until is not None else self._scalar(
+            "SELECT MAX(timestamp) FROM snapshots WHERE symbol = ?", (symbol,))
+        if end is None:
+            return []
+        start = end - int(hours * 3_600_000)
+        return self._query(
+            "WITH w AS (SELECT user, side, timestamp, distance_pct, position_value FROM snapshots"
+            "  WHERE symbol = ? AND timestamp BETWEEN ? AND ?),"
+            " span AS (SELECT user, side, MIN(timestamp) AS t0, MAX(timestamp) AS t1 FROM w GROUP BY user, side)"
+            " SELECT s.user, s.side, a.distance_pct AS start_distance_pct, b.distance_pct AS end_distance_pct,"
+            "  b.distance_pct - a.distance_pct AS change, b.position_value"
+            " FROM span s"
+            " JOIN w a ON a.user = s.user AND a.side = s.side AND a.timestamp = s.t0"
+            " JOIN w b ON b.user = s.user AND b.side = s.side AND b.timestamp = s.t1"
+            " WHERE s.t1 > s.t0 ORDER BY change LIMIT ?",
+            (symbol, start, end, limit),
+        )
+
+    def bucket_series(self, symbol, since=None, until=None):
+        """
+        Positions per risk bucket at every snapshot.
+
+        Returns:
+            [{timestamp, critical, high, medium, moderate, low, value_at_risk}]
+            (value_at_risk = USD in the critical bucket)
+        """
+        rows = self._query(
+            "SELECT timestamp, bucket, COUNT(*) AS n, SUM(position_value) AS usd FROM snapshots"
+            " WHERE symbol = ? AND timestamp >= ? AND timestamp <= ? GROUP BY timestamp, bucket ORDER BY timestamp",
+            (symbol.upper(), since or 0, until or 2 ** 62),
+        )
+        series = {}
+        for row in rows:
+            point = series.get(row["timestamp"])
+            if point is None:
+                point = series[row["timestamp"]] = {"timestamp": row["timestamp"], **{n: 0 for n in BUCKET_NAMES},
+                                                    "value_at_risk": 0.0}
+            if row["bucket"] is not None:
+                name = BUCKET_NAMES[row["bucket"]]
+                point[name] = row["n"]
+                if name == "critical":
+                    point["value_at_risk"] = row["usd"] or 0.0
+        return list(series.values())
+
+    def stats(self):
+        """Rows and time span per symbol"""
+        return self._query(
+            "SELECT symbol, COUNT(*) AS rows, COUNT(DISTINCT user) AS users,"
+            " MIN(timestamp) AS first, MAX(timestamp) AS last FROM snapshots GROUP BY symbol ORDER BY symbol"
+        )
+
+
+# ==================== CLI ====================
+def main(argv=None):
+    """python -m analytics.snapshot_store sync|stats|state|trajectory"""
+    import argparse
+    from datetime import datetime
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+    parser = argparse.ArgumentParser(description="🌙 Moon Dev's position snapshot store")
+    parser.add_argument("--db", default=DEFAULT_STORE_PATH)
+    sub = parser.add_subparsers(dest="command", required=True)
+    p = sub.add_parser("sync", help="Fetch new snapshots")
+    p.add_argument("symbols", nargs="*", default=SNAPSHOT_SYMBOLS)
+    sub.add_parser("stats", help="What's stored")
+    p = sub.add_parser("state", help="Positions at a point in time")
+    p.add_argument("symbol")
+    p.add_argument("--minutes-ago", type=float, default=0)
+    p.add_argument("--max-distance", type=float)
+    p = sub.add_parser("trajectory", help="One user's path toward liquidation")
+    p.add_argument("user")
+    p.add_argument("symbol", nargs="?")
+    args = parser.parse_args(argv)
+
+    store = SnapshotStore(args.db)
+    fmt = lambda ms: datetime.fromtimestamp(ms / 1000).strftime("%m-%d %H:%M")
+
+    if args.command == "sync":
+        from api import MoonDevAPI
+        for symbol, r in store.sync(MoonDevAPI(), [s.upper() for s in args.symbols]).items():
+            note = "  ⚠️ hit the row limit" if r["truncated"] else ""
+            print(f"🌙 {symbol:<5} {r['hours']:>3}h window: {r['fetched']:>6} fetched, {r['added']:>6} new{note}")
+    elif args.command == "stats":
+        for r in store.stats():
+            print(f"🌙 {r['symbol']:<5} {r['rows']:>8} rows  {r['users']:>5} users  {fmt(r['first'])} → {fmt(r['last'])}")
+    elif args.command == "state":
+        newest = store.last_timestamp(args.symbol)
+        ts = None if not args.minutes_ago or newest is None else int(newest - args.minutes_ago * 60_000)
+        for r in store.state_at(args.symbol, ts, args.max_distance):
+            print(f"{fmt(r['timestamp'])}  {r['user']}  {r['side']:<5}  ${r['position_value'] or 0:>14,.0f}"
+                  f"  {r['distance_pct']:>6.2f}%  liq ${r['liquidation_price'] or 0:,.2f}")
+    elif args.command == "trajectory":
+        t = store.trajectory(args.user, args.symbol)
+        for r in t["points"]:
+            distance = f"{r['distance_pct']:>6.2f}%" if r["distance_pct"] is not None else f"{'-':>7}"
+            print(f"{fmt(r['timestamp'])}  {r['symbol']:<5} {r['side']:<5}  {distance}"
+                  f"  mark ${r['mark_price'] or 0:,.2f}")
+        if "start_distance_pct" in t:
+            print(f"📉 {t['start_distance_pct']:.2f}% → {t['end_distance_pct']:.2f}% "
+                  f"({t['pct_per_hour']:+.2f}%/h, closest {t['min_distance_pct']:.2f}%)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,142 @@
+"""
+🌙 Moon Dev's API Handler
+Built with love by Moon Dev 🚀
+
+API Documentation: https://moondev.com/docs
+
+Available Endpoints:
+-------------------
+CORE:
+- /health                               - Service health check (no auth)
+- /api/liquidations/{timeframe}.json    - Liquidation data (10m, 1h, 4h, 12h, 24h, 2d, 7d, 14d, 30d)
+- /api/liquidations/stats.json          - Aggregated liquidation stats
+- /api/positions.json                   - Top 50 longs/shorts across ALL symbols (updates every 1s)
+- /api/positions/all.json               - All 148 symbols with top 50 positions each (500KB, updates every 60s)
+- /api/whales.json                      - Recent whale trades ($25k+)
+- /api/whale_addresses.txt              - Plain text whale address list
+- /api/events.json                      - Real-time blockchain events
+- /api/contracts.json                   - Contract registry with metadata
+
+TICK DATA:
+- /api/ticks/stats.json                 - Collection stats and summary
+- /api/ticks/latest.json                - Current prices for all symbols
+- /api/ticks/{symbol}_{timeframe}.json  - Historical ticks (symbols: btc, eth, hype, sol, xrp)
+                                          (timeframes: 10m, 1h, 4h, 24h, 7d)
+
+ORDER FLOW & TRADES (tracking: BTC, ETH, HYPE, SOL, XRP):
+- /api/trades.json                      - Recent 500 trades (real-time)
+- /api/large_trades.json                - Large trades >$100k (24h)
+- /api/orderflow.json                   - Order flow imbalance by timeframe + per coin
+- /api/orderflow/stats.json             - Service stats (uptime, trades/sec)
+- /api/imbalance/5m.json                - 5-min buy/sell imbalance
+- /api/imbalance/15m.json               - 15-min imbalance
+- /api/imbalance/1h.json                - 1-hour imbalance
+- /api/imbalance/4h.json                - 4-hour imbalance
+- /api/imbalance/24h.json               - 24-hour imbalance
+
+SMART MONEY:
+- /api/smart_money/rankings.json        - Top 100 smart + Bottom 100 dumb money
+- /api/smart_money/leaderboard.json     - Top 50 performers with details
+- /api/smart_money/signals_10m.json     - Trading signals (10 min)
+- /api/smart_money/signals_1h.json      - Trading signals (1 hour)
+- /api/smart_money/signals_24h.json     - Trading signals (24 hour)
+
+MULTI-EXCHANGE LIQUIDATIONS:
+- /api/all_liquidations/{timeframe}.json     - Combined liquidations from ALL exchanges
+- /api/all_liquidations/stats.json           - Combined stats across all exchanges
+- /api/binance_liquidations/{timeframe}.json - Binance Futures liquidations
+- /api/bybit_liquidations/{timeframe}.json   - Bybit liquidations
+- /api/okx_liquidations/{timeframe}.json     - OKX liquidations
+  (timeframes: 10m, 1h, 4h, 12h, 24h, 2d, 7d, 14d, 30d)
+
+HIP3 LIQUIDATIONS (Stocks, Commodities, Indices, FX):
+- /api/hip3_liquidations/{timeframe}.json    - HIP3 liquidations (10m, 1h, 24h, 7d)
+- /api/hip3_liquidations/stats.json          - HIP3 liquidation statistics
+  Categories: Stocks (TSLA, NVDA, AAPL, etc.), Commodities (GOLD, SILVER, OIL),
+              Indices (XYZ100), FX (EUR, JPY)
+
+HIP3 MARKET DATA (Multi-Dex: Stocks, Commodities, Indices, FX, Crypto):
+- /api/hip3/meta                             - All 51 symbols from all 4 dexes with current prices
+- /api/hip3_ticks/stats.json                 - Tick collector stats with dex breakdown
+- /api/hip3_ticks/{dex}_{ticker}.json        - Individual tick data (e.g., xyz_tsla.json, hyna_btc.json)
+  Dexes: xyz (27 stocks/commodities/FX), flx (7), hyna (12 crypto), km (5 US indices)
+
+HYPERLIQUID USER DATA:
+- get_user_positions(address)           - Get positions via Hyperliquid API (direct)
+
+MOON DEV USER API (from local node - FAST!):
+- /api/user/{address}/positions         - Get positions via Moon Dev API
+- /api/user/{address}/fills             - Get historical fills (limit: 100-2000, -1 for all)
+
+MARKET DATA (replaces Hyperliquid rate-limited calls!):
+- /api/prices                           - All 224 coin prices + funding rates + open interest
+- /api/price/{coin}                     - Quick price for single coin (best bid/ask/mid/spread)
+- get_prices_bbo(coins)                 - Best bid/ask for many coins at once, as arrays (concurrent)
+- /api/orderbook/{coin}                 - Full L2 orderbook (~20 levels each side)
+- /api/account/{address}                - Full account state (positions, margin, withdrawable)
+- /api/fills/{address}                  - Trade fills in Hyperliquid-compatible format
+- /api/candles/{coin}                   - OHLCV candles (1m, 5m, 15m, 1h, 4h, 1d)
+
+HLP (HYPERLIQUIDITY PROVIDER) DATA:
+- /api/hlp/positions                    - All 7 HLP strategy positions + combined net exposure
+                                          (optional: ?include_strategies=false for summary only)
+- /api/hlp/trades                       - Historical HLP trade fills (5,000+ collected)
+- /api/hlp/trades/stats                 - Trade volume/fee statistics
+- /api/hlp/positions/history            - Position snapshots over time
+- /api/hlp/liquidators                  - Liquidator activation events
+- /api/hlp/deltas                       - Net exposure changes over time
+- /api/hlp/sentiment                    - THE BIG ONE! Net delta with z-scores and signals
+- /api/hlp/liquidators/status           - Real-time liquidator status (active/idle + PnL)
+- /api/hlp/market-maker                 - Strategy B tracker for BTC/ETH/SOL
+- /api/hlp/timing                       - Hourly/session profitability analysis
+- /api/hlp/correlation                  - Delta-price correlation by coin
+
+Authentication:
+--------------
+- Header (recommended): X-API-Key: YOUR_API_KEY
+- Query param: ?api_key=YOUR_API_KEY
+
+Rate Limits: 3,600 requests/min | Data updates every 30 seconds | 60-day retention
+
+Need an API key? https://moondev.com
+"""
+
+# ============================================
+# 📦 LAZY EXPORTS - Moon Dev
+# ============================================
+# `from api import MoonDevAPI` only loads what it needs: no requests, no
+# dotenv, no urllib3 until the first client makes its first call.
+
+_EXPORTS = {
+    "MoonDevAPI": "api.client",
+    "DEFAULT_BASE_URL": "api.client",
+    "HYPERLIQUID_INFO_URL": "api.client",
+    "DEFAULT_RETRIES": "api.client",
+    "RequestMetrics": "api.metrics",
+    "endpoint_template": "api.metrics",
+    "serve_metrics": "api.metrics",
+    "HOOK_EVENTS": "api.tracing",
+    "RequestContext": "api.tracing",
+    "TraceProfiler": "api.tracing",
+    "OpenTelemetryHooks": "api.tracing",
+    "LiveDashboard": "api.live",
+    "SortedView": "api.views",
+    "BBOSnapshot": "api.bbo",
+    "test_all": "api.selftest",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module 'api' has no attribute {name!r}")
+    from importlib import import_module
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
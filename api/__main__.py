@@ -0,0 +1,9 @@
+"""
+🌙 Moon Dev API - `python -m api` runs the mass test suite
+Built with love by Moon Dev 🚀
+"""
+
+from api.selftest import test_all
+
+if __name__ == "__main__":
+    test_all()
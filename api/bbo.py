@@ -0,0 +1,213 @@
+"""
+🌙 Moon Dev's Batched BBO
+Best bid/ask for many coins in one call, as dense arrays with per-coin staleness
+
+Built with love by Moon Dev 🚀
+
+Usage:
+    from api import MoonDevAPI
+
+    api = MoonDevAPI()
+    bbo = api.get_prices_bbo(["BTC", "ETH", "SOL"])
+    bbo.mid, bbo.spread_bps               # numpy arrays in the order asked for
+    bbo["ETH"]                            # one coin as a dict
+    bbo.to_dict()                         # JSON-ready, one record per coin
+    bbo.stale(max_age_ms=3000)            # True where the quote is old, missing or failed
+
+    prev = bbo
+    bbo = api.get_prices_bbo(coins)
+    bbo.stale(previous=prev)              # also flags quotes whose timestamp didn't move
+
+Sources:
+    "price"      one /api/price/{coin} per coin, fetched concurrently
+    "orderbook"  top of /api/orderbook/{coin}, concurrently (bigger payloads)
+    "prices"     a single /api/prices call - mid only, bid/ask are NaN
+    "auto"       "price", and any coin that fails is filled from one
+                 /api/prices call (mid only) instead of being left empty
+
+.source[i] says where each coin's quote came from.
+"""
+
+import time
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+# ============================================
+# 🎯 BBO DEFAULTS - Moon Dev
+# ============================================
+
+BBO_WORKERS = 10              # matches the session's connection pool size
+DEFAULT_MAX_AGE_MS = 5_000    # older quotes count as stale
+
+# ============================================
+
+SOURCES = ("auto", "price", "orderbook", "prices")
+_FIELDS = ("bid", "ask", "bid_size", "ask_size", "mid", "spread_bps")
+
+
+def _ms(value):
+    """API timestamp (ms, s or ISO string) -> epoch ms (0 if unknown)"""
+    if value is None or value == "":
+        return 0
+    if isinstance(value, (int, float)):
+        return int(value * 1000) if value < 1e12 else int(value)
+    try:
+        return int(datetime.fromisoformat(str(value).replace("Z", "+00:00")).timestamp() * 1000)
+    except ValueError:
+        return 0
+
+
+def _float(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+class BBOSnapshot:
+    """
+    🌙 Moon Dev's BBO Snapshot
+
+    bid / ask / bid_size / ask_size / mid / spread_bps are float arrays and
+    timestamp an int64 array (ms, 0 = unknown), all in `coins` order.
+    """
+
+    def __init__(self, coins, fetched_at=None):
+        self.coins = list(coins)
+        n = len(self.coins)
+        for field in _FIELDS:
+            setattr(self, field, np.full(n, np.nan))
+        self.timestamp = np.zeros(n, dtype=np.int64)
+        self.source = [None] * n
+        self.errors = {}                  # coin -> error message
+        self.fetched_at = fetched_at if fetched_at is not None else int(time.time() * 1000)
+        self._row = {coin: i for i, coin in enumerate(self.coins)}
+
+    def __len__(self):
+        return len(self.coins)
+
+    def __getitem__(self, coin):
+        i = self._row[coin]
+        quote = {"coin": coin, **{field: float(getattr(self, field)[i]) for field in _FIELDS}}
+        age = int(self.age_ms[i]) if self.timestamp[i] else None
+        quote.update({"timestamp": int(self.timestamp[i]), "age_ms": age, "source": self.source[i]})
+        return quote
+
+    def to_dict(self, max_age_ms=DEFAULT_MAX_AGE_MS):
+        """JSON-ready form (NaN -> None), as the CLI prints it"""
+        stale = self.stale(max_age_ms)
+        quotes = []
+        for i, coin in enumerate(self.coins):
+            quote = {k: (None if isinstance(v, float) and v != v else v) for k, v in self[coin].items()}
+            quote["stale"] = bool(stale[i])
+            quotes.append(quote)
+        return {"fetched_at": self.fetched_at, "count": len(quotes), "quotes": quotes, "errors": self.errors}
+
+    # ---------- filling ----------
+
+    def _set(self, i, bid, ask, bid_size, ask_size, timestamp, source, mid=None):
+        bid, ask = _float(bid), _float(ask)
+        mid = (bid + ask) / 2 if mid is None else _float(mid)
+        self.bid[i], self.ask[i] = bid, ask
+        self.bid_size[i], self.ask_size[i] = _float(bid_size), _float(ask_size)
+        self.mid[i] = mid
+        self.spread_bps[i] = (ask - bid) / mid * 10000 if mid else np.nan
+        self.timestamp[i] = _ms(timestamp)
+        self.source[i] = source
+        self.errors.pop(self.coins[i], None)
+
+    def fill_price(self, i, data):
+        """From a get_price() response"""
+        self._set(i, data.get("best_bid"), data.get("best_ask"), data.get("best_bid_size"),
+                  data.get("best_ask_size"), data.get("timestamp"), "price")
+
+    def fill_orderbook(self, i, data):
+        """From the top level of a get_orderbook() response"""
+        bids, asks = (data.get("levels") or [[], []])[:2]
+        best_bid, best_ask = (bids[0] if bids else {}), (asks[0] if asks else {})
+        self._set(i, best_bid.get("px", data.get("best_bid")), best_ask.get("px", data.get("best_ask")),
+                  best_bid.get("sz"), best_ask.get("sz"), data.get("timestamp"), "orderbook")
+
+    def fill_prices(self, data, only=None):
+        """Mid from one get_prices() response for every coin (or the rows in `only`)"""
+        prices = data.get("prices") or {}
+        for i in (range(len(self.coins)) if only is None else only):
+            if self.coins[i] in prices:
+                self._set(i, None, None, None, None, data.get("timestamp"), "prices", mid=prices[self.coins[i]])
+
+    # ---------- staleness ----------
+
+    @property
+    def age_ms(self):
+        """fetched_at - quote timestamp (huge where the timestamp is unknown)"""
+        return np.where(self.timestamp > 0, self.fetched_at - self.timestamp, np.iinfo(np.int64).max)
+
+    def stale(self, max_age_ms=DEFAULT_MAX_AGE_MS, previous=None):
+        """
+        Per-coin stale flags.
+
+        A quote is stale when it failed, has no mid, is older than max_age_ms,
+        or - given the previous snapshot - its timestamp hasn't advanced.
+        """
+        stale = np.isnan(self.mid) | (self.age_ms > max_age_ms)
+        if previous is not None:
+            for i, coin in enumerate(self.coins):
+                j = previous._row.get(coin)
+                if j is not None and self.timestamp[i] and self.timestamp[i] <= previous.timestamp[j]:
+                    stale[i] = True
+        return stale
+
+    def fresh_coins(self, max_age_ms=DEFAULT_MAX_AGE_MS, previous=None):
+        stale = self.stale(max_age_ms, previous)
+        return [coin for coin, s in zip(self.coins, stale) if not s]
+
+
+def fetch_bbo(api, coins, source="auto", workers=BBO_WORKERS):
+    """
+    Fetch a BBOSnapshot for coins.
+
+    Args:
+        api: MoonDevAPI
+        coins: Symbols in the order the arrays should have (list or "BTC,ETH")
+        source: "auto", "price", "orderbook" or "prices" (see module docstring)
+        workers: Concurrent requests for the per-coin sources
+    """
+    if source not in SOURCES:
+        raise ValueError(f"source must be one of {', '.join(SOURCES)}")
+    coins = coins.split(",") if isinstance(coins, str) else list(coins)
+    snap = BBOSnapshot(coins)
+
+    if source == "prices":
+        snap.fill_prices(api.get_prices())
+    elif coins:
+        fetch, fill = ((api.get_orderbook, snap.fill_orderbook) if source == "orderbook"
+                       else (api.get_price, snap.fill_price))
+
+        def load(coin):
+            try:
+                return fetch(coin), None
+            except Exception as e:
+                return None, str(e) or type(e).__name__
+
+        with ThreadPoolExecutor(max_workers=max(1, min(workers, len(coins)))) as pool:
+            results = list(pool.map(load, coins))
+        for i, (data, error) in enumerate(results):
+            if error is None and isinstance(data, dict):
+                fill(i, data)
+            else:
+                snap.errors[coins[i]] = error or "empty response"
+
+        if source == "auto" and snap.errors:
+            failed = [snap._row[coin] for coin in snap.errors]
+            try:
+                snap.fill_prices(api.get_prices(), only=failed)
+            except Exception:
+                pass
+
+    snap.fetched_at = int(time.time() * 1000)
+    for coin in coins:
+        if snap.source[snap._row[coin]] is None and coin not in snap.errors:
+            snap.errors[coin] = "not found"
+    return snap
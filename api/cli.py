@@ -0,0 +1,325 @@
+"""
+🌙 Moon Dev's CLI
+Every MoonDevAPI method on the command line, with machine-friendly output
+
+Built with love by Moon Dev 🚀
+
+Usage:
+    python -m api.cli --help                      # list every command
+    python -m api.cli liquidations 1h             # JSON (default)
+    python -m api.cli positions -f ndjson         # one record per line
+    python -m api.cli user-fills 0x... --limit -1 -f csv > fills.csv
+    python -m api.cli prices -f arrow > prices.arrows     # needs pyarrow
+    python -m api.cli hlp-sentiment --watch 10 -f ndjson  # poll every 10s
+
+Commands are the MoonDevAPI method names without `get_`, with dashes:
+get_user_fills(address, limit=100) -> `user-fills ADDRESS --limit N`.
+
+Tabular formats (ndjson, csv, arrow) need rows. By default the biggest
+list of records in the response is used (fills, longs, snapshots...);
+pick another with --path (e.g. --path shorts, --path symbols). Nested
+objects are flattened to dotted columns for csv/arrow. In --watch mode
+every row gets a `_ts` column (ms) so polls can be told apart.
+
+API chatter goes to stderr, so stdout is always clean data.
+"""
+
+import sys
+import csv
+import json
+import time
+import inspect
+import argparse
+import contextlib
+
+from api.client import MoonDevAPI
+from api.scheduler import PollingScheduler
+
+FORMATS = ("json", "ndjson", "csv", "arrow")
+
+
+# ============================================
+# 🧰 COMMANDS FROM METHOD SIGNATURES
+# ============================================
+
+def command_name(method_name):
+    return method_name[4:].replace("_", "-") if method_name.startswith("get_") else method_name.replace("_", "-")
+
+
+def api_methods():
+    """{command: method_name} for every public data method"""
+    commands = {}
+    for name, fn in inspect.getmembers(MoonDevAPI, inspect.isfunction):
+        if name.startswith("get_") or name == "health":
+            commands[command_name(name)] = name
+    return commands
+
+
+def parse_value(text):
+    """CLI string -> int/float/str (for params whose default is None)"""
+    for cast in (int, float):
+        try:
+            return cast(text)
+        except ValueError:
+            pass
+    return text
+
+
+def add_method_arguments(parser, fn):
+    """Required params (and a leading str option) -> positionals, the rest -> --options typed by their default"""
+    params = list(inspect.signature(fn).parameters.values())[1:]
+    for i, param in enumerate(params):
+        flag = "--" + param.name.replace("_", "-")
+        if param.default is inspect.Parameter.empty:
+            parser.add_argument(param.name)
+        elif i == 0 and isinstance(param.default, str):
+            # Leading timeframe/symbol: `liquidations 4h`, `ticks ETH`
+            parser.add_argument(param.name, nargs="?", default=param.default,
+                                help=f"default: {param.default}")
+        elif isinstance(param.default, bool):
+            parser.add_argument(flag, dest=param.name, default=param.default,
+                                action=argparse.BooleanOptionalAction)
+        elif param.default is None:
+            parser.add_argument(flag, dest=param.name, type=parse_value, default=None)
+        else:
+            parser.add_argument(flag, dest=param.name, type=type(param.default), default=param.default,
+                                help=f"default: {param.default}")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="moondev", description="🌙 Moon Dev's Hyperliquid Data Layer CLI")
+    parser.add_argument("--api-key", help="Default: MOONDEV_API_KEY")
+    parser.add_argument("--base-url", help="Default: MOONDEV_BASE_URL or api.moondev.com")
+    sub = parser.add_subparsers(dest="command", required=True, metavar="COMMAND")
+
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("-f", "--format", choices=FORMATS, default="json")
+    common.add_argument("--path", help="Dotted key of the record list to output (tabular formats)")
+    common.add_argument("--fields", help="Comma-separated columns to keep")
+    common.add_argument("--watch", type=float, metavar="SECONDS", help="Poll every N seconds")
+    common.add_argument("--count", type=int, help="With --watch: stop after N polls")
+    common.add_argument("--pretty", action="store_true", help="Indented JSON")
+
+    for command, method_name in sorted(api_methods().items()):
+        fn = getattr(MoonDevAPI, method_name)
+        doc = (inspect.getdoc(fn) or "").split("\n")[0]
+        p = sub.add_parser(command, parents=[common], help=doc, description=doc)
+        add_method_arguments(p, fn)
+        p.set_defaults(method=method_name)
+    return parser
+
+
+# ============================================
+# 📄 RECORDS
+# ============================================
+
+def _lookup(data, path):
+    for key in path.split("."):
+        data = data[int(key)] if isinstance(data, list) else data[key]
+    return data
+
+
+def _is_records(value):
+    return isinstance(value, list) and value and all(isinstance(v, dict) for v in value[:5])
+
+
+def find_records(data):
+    """Biggest list of dicts anywhere (2 levels deep) in a response"""
+    if _is_records(data):
+        return data
+    if not isinstance(data, dict):
+        return None
+    best = None
+    for value in data.values():
+        candidates = [value] + (list(value.values()) if isinstance(value, dict) else [])
+        for candidate in candidates:
+            if _is_records(candidate) and (best is None or len(candidate) > len(best)):
+                best = candidate
+    return best
+
+
+def to_records(data, path=None):
+    """List of row dicts for tabular output"""
+    if path:
+        data = _lookup(data, path)
+        if isinstance(data, dict) and data and all(isinstance(v, dict) for v in data.values()):
+            return [{"key": k, **v} for k, v in data.items()]
+    records = find_records(data)
+    if records is not None:
+        return records
+    if isinstance(data, list):
+        return [{"value": v} for v in data]
+    if isinstance(data, dict):
+        return [data]
+    return [{"value": data}]
+
+
+def flatten(record, prefix=""):
+    """{'a': {'b': 1}} -> {'a.b': 1}; lists become JSON strings"""
+    flat = {}
+    for key, value in record.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, dict):
+            flat.update(flatten(value, name + "."))
+        elif isinstance(value, list):
+            flat[name] = json.dumps(value, separators=(",", ":"))
+        else:
+            flat[name] = value
+    return flat
+
+
+def select_fields(records, fields):
+    return [{f: r.get(f) for f in fields} for r in records]
+
+
+# ============================================
+# 🖨️ WRITERS
+# ============================================
+
+class JsonWriter:
+    def __init__(self, out, pretty=False, watch=False):
+        self.out = out
+        self.indent = 2 if pretty and not watch else None
+
+    def write(self, data, records=None):
+        self.out.write(json.dumps(data, indent=self.indent, separators=None if self.indent else (",", ":")))
+        self.out.write("\n")
+        self.out.flush()
+
+    def close(self):
+        pass
+
+
+class NdjsonWriter:
+    def __init__(self, out):
+        self.out = out
+
+    def write(self, data, records):
+        dumps = json.dumps
+        self.out.write("".join(dumps(r, separators=(",", ":")) + "\n" for r in records))
+        self.out.flush()
+
+    def close(self):
+        pass
+
+
+class CsvWriter:
+    def __init__(self, out):
+        self.out = out
+        self.writer = None
+
+    def write(self, data, records):
+        rows = [flatten(r) for r in records]
+        if self.writer is None:
+            # Header from the first batch, in first-seen column order
+            columns = list(dict.fromkeys(k for row in rows for k in row))
+            self.writer = csv.DictWriter(self.out, fieldnames=columns, extrasaction="ignore")
+            self.writer.writeheader()
+        self.writer.writerows(rows)
+        self.out.flush()
+
+    def close(self):
+        pass
+
+
+class ArrowWriter:
+    """Arrow IPC stream (one record batch per poll) - needs pyarrow"""
+
+    def __init__(self, out):
+        try:
+            import pyarrow
+        except ImportError:
+            raise SystemExit("❌ Arrow output needs pyarrow (pip install pyarrow)")
+        self.pa = pyarrow
+        self.out = out.buffer if hasattr(out, "buffer") else out
+        self.schema = None
+        self.stream = None
+
+    def write(self, data, records):
+        rows = [flatten(r) for r in records]
+        if self.stream is None:
+            table = self.pa.Table.from_pylist(rows)
+            self.schema = table.schema
+            self.stream = self.pa.ipc.new_stream(self.out, self.schema)
+        else:
+            table = self.pa.Table.from_pylist(rows, schema=self.schema)
+        self.stream.write_table(table)
+        self.out.flush()
+
+    def close(self):
+        if self.stream is not None:
+            self.stream.close()
+
+
+def make_writer(fmt, out, pretty=False, watch=False):
+    if fmt == "json":
+        return JsonWriter(out, pretty, watch)
+    if fmt == "ndjson":
+        return NdjsonWriter(out)
+    if fmt == "csv":
+        return CsvWriter(out)
+    return ArrowWriter(out)
+
+
+# ============================================
+# 🚀 MAIN
+# ============================================
+
+def call_kwargs(args, method_name):
+    params = list(inspect.signature(getattr(MoonDevAPI, method_name)).parameters)[1:]
+    return {name: getattr(args, name) for name in params}
+
+
+def main(argv=None, out=None):
+    args = build_parser().parse_args(argv)
+    out = out or sys.stdout
+    api = MoonDevAPI(api_key=args.api_key, base_url=args.base_url)
+    method = getattr(api, args.method)
+    kwargs = call_kwargs(args, args.method)
+    fields = args.fields.split(",") if args.fields else None
+    writer = make_writer(args.format, out, args.pretty, watch=args.watch is not None)
+
+    def poll():
+        # The client narrates some calls - keep stdout for data only
+        with contextlib.redirect_stdout(sys.stderr):
+            data = method(**kwargs)
+        if hasattr(data, "to_dict"):
+            # Array results (get_prices_bbo) print as plain records
+            data = data.to_dict()
+        records = None
+        if args.format != "json":
+            records = to_records(data, args.path)
+            if args.watch is not None:
+                ts = int(time.time() * 1000)
+                records = [{"_ts": ts, **r} for r in records]
+            if fields:
+                records = select_fields(records, (["_ts"] if args.watch is not None else []) + fields)
+        writer.write(data, records)
+
+    try:
+        if args.watch is None:
+            poll()
+            return 0
+        def on_error(job, error):
+            # The scheduler keeps polling through errors - not once the reader is gone
+            if isinstance(error, BrokenPipeError):
+                raise error
+            print(f"⚠️ Moon Dev: {job.name} failed: {error}", file=sys.stderr)
+
+        scheduler = PollingScheduler(on_error=on_error)
+        scheduler.every(args.watch, poll, name=args.command, max_runs=args.count)
+        scheduler.run()
+        return 0
+    except BrokenPipeError:
+        # `moondev ... | head` - the reader went away
+        sys.stderr.close()
+        return 0
+    except Exception as e:
+        print(f"❌ Moon Dev: {args.command} failed: {e}", file=sys.stderr)
+        return 1
+    finally:
+        writer.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,1044 @@
+"""
+🌙 Moon Dev's API Client
+Built with love by Moon Dev 🚀
+
+Endpoint reference: see the `api` package docstring (python -c "import api; help(api)").
+Nothing heavy happens at import time: .env is read when the first client is
+created and requests is imported on the first call.
+"""
+
+import os
+import sys
+import time
+import threading
+
+from api.metrics import RequestMetrics, endpoint_template, phase_local
+from api.tracing import RequestContext, HOOK_EVENTS
+
+DEFAULT_BASE_URL = "https://api.moondev.com"
+HYPERLIQUID_INFO_URL = "https://api.hyperliquid.xyz/info"
+DEFAULT_RETRIES = 0  # urllib3 retries on connect errors / 502-504
+
+_env_loaded = False
+
+
+def _load_env():
+    """Read .env once, the first time a client is created"""
+    global _env_loaded
+    if not _env_loaded:
+        from dotenv import load_dotenv
+        load_dotenv()
+        _env_loaded = True
+
+
+def _caller_method():
+    """Name of the public MoonDevAPI method that issued the current request"""
+    frame = sys._getframe(2)
+    while frame is not None and frame.f_code.co_name.startswith("_"):
+        frame = frame.f_back
+    return frame.f_code.co_name if frame is not None else None
+
+
+
+class MoonDevAPI:
+    """🌙 Moon Dev's API Client"""
+
+    def __init__(self, api_key=None, base_url=None, info_url=None, retries=DEFAULT_RETRIES):
+        """
+        Args:
+            api_key: Moon Dev API key (default: MOONDEV_API_KEY from .env)
+            base_url: API root (default: MOONDEV_BASE_URL from .env, else api.moondev.com)
+                      Point it at a replay server to run offline (see replay/)
+            info_url: Hyperliquid info endpoint used by get_user_positions
+                      (default: HYPERLIQUID_INFO_URL from .env, else api.hyperliquid.xyz)
+            retries: Automatic retries on connection errors and 502/503/504
+        """
+        _load_env()
+        self.api_key = api_key or os.getenv('MOONDEV_API_KEY')
+        self.base_url = (base_url or os.getenv('MOONDEV_BASE_URL') or DEFAULT_BASE_URL).rstrip('/')
+        self.info_url = info_url or os.getenv('HYPERLIQUID_INFO_URL') or HYPERLIQUID_INFO_URL
+        self.headers = {'X-API-Key': self.api_key} if self.api_key else {}
+        self.retries = retries
+        self._session = None
+        self._session_lock = threading.Lock()
+        self._metrics = RequestMetrics()
+        self.hooks = {event: [] for event in HOOK_EVENTS}
+
+    @property
+    def session(self):
+        """requests.Session, created on first use so `import api` stays cheap"""
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    from api.transport import new_session
+                    self._session = new_session(self.retries)
+        return self._session
+
+    def _request(self, method, url, endpoint, expects_json=False, **kwargs):
+        """Send a request, record its phase timings under `endpoint` and fire hooks"""
+        import requests
+        phase_local.dns = phase_local.connect = 0.0
+        ctx = RequestContext(_caller_method(), method, url, endpoint, expects_json)
+        phase_local.context = ctx
+        if self.hooks["before_request"]:
+            self._fire("before_request", ctx)
+        try:
+            response = self.session.request(method, url, timeout=30, **kwargs)
+        except requests.RequestException as e:
+            ctx.phases["total"] = ctx.elapsed_ms()
+            self._metrics.observe(endpoint, ctx.phases, error=type(e).__name__, method=ctx.api_method)
+            self._fail(ctx, e)
+            raise
+        total = time.perf_counter() - ctx.start
+
+        # requests reads the body before returning: elapsed covers send -> headers
+        dns, connect = phase_local.dns, phase_local.connect
+        headers_at = response.elapsed.total_seconds()
+        if dns or connect:
+            ctx.phases["dns"] = dns * 1000
+            ctx.phases["connect"] = connect * 1000
+        ctx.phases["ttfb"] = max(headers_at - dns - connect, 0.0) * 1000
+        ctx.phases["download"] = max(total - headers_at, 0.0) * 1000
+        ctx.phases["total"] = total * 1000
+        ctx.status = response.status_code
+        ctx.bytes = len(response.content)
+        retries = getattr(response.raw, "retries", None)
+        ctx.retries = len(retries.history) if retries is not None else 0
+        self._metrics.observe(endpoint, ctx.phases, status=ctx.status, nbytes=ctx.bytes,
+                              retries=ctx.retries, method=ctx.api_method)
+        if self.hooks["after_response"]:
+            self._fire("after_response", ctx)
+        try:
+            response.raise_for_status()
+        except requests.HTTPError as e:
+            self._fail(ctx, e)
+            raise
+        return response
+
+    def _get(self, endpoint, auth_required=True, expects_json=False):
+        """Make GET request to API"""
+        url = f"{self.base_url}{endpoint}"
+        headers = self.headers if auth_required else {}
+        return self._request("GET", url, endpoint_template(endpoint), expects_json, headers=headers)
+
+    def _decode(self, response):
+        """response.json(), timed as the decode phase of the current request"""
+        ctx = phase_local.context
+        start = time.perf_counter()
+        try:
+            data = response.json()
+        except ValueError as e:
+            self._fail(ctx, e)
+            raise
+        ctx.decode_ms = (time.perf_counter() - start) * 1000
+        self._metrics.observe_decode(ctx.endpoint, ctx.decode_ms)
+        if self.hooks["on_decode"]:
+            self._fire("on_decode", ctx)
+        return data
+
+    def _get_json(self, endpoint, auth_required=True):
+        """GET an endpoint and decode its JSON body"""
+        return self._decode(self._get(endpoint, auth_required, expects_json=True))
+
+    # ==================== HOOKS ====================
+    def add_hook(self, event, fn):
+        """
+        Call fn(ctx) on a request lifecycle event.
+
+        Events:
+            before_request  - ctx has api_method, http_method, url, endpoint, start
+            after_response  - + status, bytes, retries, phases (dns/connect/ttfb/download/total ms)
+            on_error        - + error (connection error, HTTP error status or bad JSON)
+            on_decode       - + decode_ms (JSON endpoints only)
+
+        ctx.data is a free dict for hooks to keep per-request state (spans etc).
+        A hook that raises is reported and skipped - it never breaks the call.
+        """
+        if event not in self.hooks:
+            raise ValueError(f"Unknown hook event {event!r} (expected one of {', '.join(HOOK_EVENTS)})")
+        self.hooks[event].append(fn)
+        return fn
+
+    def remove_hook(self, event, fn):
+        if fn in self.hooks.get(event, []):
+            self.hooks[event].remove(fn)
+
+    def _fire(self, event, ctx):
+        for fn in list(self.hooks[event]):
+            try:
+                fn(ctx)
+            except Exception as e:
+                print(f"⚠️ Moon Dev: {event} hook {getattr(fn, '__qualname__', fn)} failed: {e}")
+
+    def _fail(self, ctx, error):
+        ctx.error = error
+        if self.hooks["on_error"]:
+            self._fire("on_error", ctx)
+
+    # ==================== METRICS ====================
+    def metrics(self):
+        """
+        Per-endpoint request metrics since this client was created.
+
+        Returns:
+            dict: {endpoint_template: {requests, bytes, avg_bytes, statuses, errors,
+                   retries, cache_hits, phases: {dns|connect|ttfb|download|decode|total:
+                   {count, mean_ms, p50_ms, p95_ms, max_ms}}}} - biggest time sink first
+        """
+        return self._metrics.snapshot()
+
+    def metrics_text(self):
+        """Metrics in Prometheus text format (see serve_metrics to expose them)"""
+        return self._metrics.prometheus()
+
+    def record_cache_hit(self, name):
+        """Count a call answered from a caller-side cache (method name or endpoint path)"""
+        self._metrics.record_cache_hit(name)
+
+    def reset_metrics(self):
+        self._metrics.reset()
+
+    # ==================== HEALTH ====================
+    def health(self):
+        """Check API health status (no auth required)"""
+        return self._get_json("/health", auth_required=False)
+
+    # ==================== LIQUIDATIONS ====================
+    def get_liquidations(self, timeframe="1h"):
+        """Get liquidation data for specified timeframe (10m, 1h, 4h, 12h, 24h, 2d, 7d, 14d, 30d)"""
+        return self._get_json(f"/api/liquidations/{timeframe}.json")
+
+    def get_liquidation_stats(self):
+        """Get aggregated liquidation stats across all timeframes"""
+        return self._get_json("/api/liquidations/stats.json")
+
+    # ==================== POSITIONS ====================
+    def get_positions(self):
+        """Get large positions near liquidation ($200k+) - top 50 across ALL symbols"""
+        return self._get_json("/api/positions.json")
+
+    def get_all_positions(self):
+        """Get ALL positions for all 148 symbols - top 50 longs/shorts per symbol
+
+        Returns dict with symbols key containing all symbol data.
+        Access specific symbol: data['symbols']['BTC'], data['symbols']['HYPE'], etc.
+        """
+        return self._get_json("/api/positions/all.json")
+
+    # ==================== WHALES ====================
+    def get_whales(self):
+        """Get recent whale trades ($25k+)"""
+        return self._get_json("/api/whales.json")
+
+    def get_whale_addresses(self):
+        """Get plain text list of known whale addresses"""
+        response = self._get("/api/whale_addresses.txt")
+        addresses = response.text.strip().split('\n')
+        return [addr.strip() for addr in addresses if addr.strip()]
+
+    def get_buyers(self):
+        """Get recent $5k+ buyers on HYPE/SOL/XRP/ETH (buyers only, no sells)"""
+        return self._get_json("/api/buyers.json")
+
+    def get_depositors(self):
+        """Get all Hyperliquid depositors - canonical list of every address that bridged USDC"""
+        return self._get_json("/api/depositors.json")
+
+    # ==================== EVENTS ====================
+    def get_events(self):
+        """Get real-time blockchain events (Transfers, Swaps, Deposits, etc.)"""
+        return self._get_json("/api/events.json")
+
+    # ==================== CONTRACTS ====================
+    def get_contracts(self):
+        """Get contract registry with metadata and activity tracking"""
+        return self._get_json("/api/contracts.json")
+
+    # ==================== TICK DATA ====================
+    def get_tick_stats(self):
+        """Get tick data collection stats and summary"""
+        return self._get_json("/api/ticks/stats.json")
+
+    def get_tick_latest(self):
+        """Get latest prices for all symbols"""
+        return self._get_json("/api/ticks/latest.json")
+
+    def get_ticks(self, symbol="BTC", duration="1h", limit=10000, start_time=None, end_time=None):
+        """
+        Get historical tick data for any of 80 tracked symbols.
+
+        Args:
+            symbol: Any tracked symbol (BTC, ETH, SOL, DOGE, FARTCOIN, TRUMP, etc.)
+                   Use get_candle_symbols() to see all 80 available symbols
+            duration: Time window - 10m, 1h, 4h, 24h, 7d (default: 1h)
+            limit: Max ticks to return (default: 10000)
+            start_time: Start time in Unix ms (optional, overrides duration)
+            end_time: End time in Unix ms (optional)
+
+        Returns:
+            dict with:
+                - symbol: Symbol queried
+                - duration: Time window
+                - tick_count: Number of ticks returned
+                - latest_price: Most recent price
+                - ticks: List of tick objects [{t, p, dt}, ...]
+        """
+        params = [f"duration={duration}", f"limit={limit}"]
+        if start_time is not None:
+            params.append(f"startTime={start_time}")
+        if end_time is not None:
+            params.append(f"endTime={end_time}")
+        query = "?" + "&".join(params)
+        return self._get_json(f"/api/ticks/{symbol.upper()}{query}")
+
+    # ==================== ORDER FLOW & TRADES ====================
+    def get_trades(self):
+        """Get recent 500 trades (real-time)"""
+        return self._get_json("/api/trades.json")
+
+    def get_large_trades(self):
+        """Get large trades >$100k (24h)"""
+        return self._get_json("/api/large_trades.json")
+
+    def get_orderflow(self):
+        """Get order flow imbalance by timeframe + per coin"""
+        return self._get_json("/api/orderflow.json")
+
+    def get_orderflow_stats(self):
+        """Get order flow service stats (uptime, trades/sec)"""
+        return self._get_json("/api/orderflow/stats.json")
+
+    def get_imbalance(self, timeframe="1h"):
+        """Get buy/sell imbalance (5m, 15m, 1h, 4h, 24h)"""
+        return self._get_json(f"/api/imbalance/{timeframe}.json")
+
+    # ==================== USER POSITIONS (HYPERLIQUID) ====================
+    def get_user_positions(self, address):
+        """
+        Get all open positions for a specific Hyperliquid wallet address.
+
+        Args:
+            address: Hyperliquid wallet address (e.g., "0x...")
+
+        Returns:
+            dict with 'assetPositions' list and 'marginSummary'
+
+        Example response structure:
+            {
+                'assetPositions': [
+                    {
+                        'position': {
+                            'coin': 'BTC',
+                            'szi': '0.5',  # size (positive=long, negative=short)
+                            'entryPx': '45000.0',
+                            'positionValue': '22500.0',
+                            'unrealizedPnl': '500.0',
+                            'liquidationPx': '40000.0',
+                            'leverage': {'value': 10}
+                        }
+                    }
+                ],
+                'marginSummary': {
+                    'accountValue': '50000.0',
+                    'totalNtlPos': '22500.0'
+                }
+            }
+        """
+        payload = {"type": "clearinghouseState", "user": address}
+
+        print(f"📡 Moon Dev: Fetching positions for {address[:6]}...{address[-4:]}")
+        response = self._request("POST", self.info_url, "hyperliquid/info", expects_json=True, json=payload)
+        return self._decode(response)
+
+    # ==================== MOON DEV USER API (LOCAL NODE) ====================
+    def get_user_positions_api(self, address):
+        """
+        Get all open positions for a Hyperliquid wallet via Moon Dev's API.
+
+        This uses Moon Dev's local node data - faster and includes additional processing.
+
+        Args:
+            address: Hyperliquid wallet address (e.g., "0x...")
+
+        Returns:
+            dict with positions, margin summary, and account details
+        """
+        return self._get_json(f"/api/user/{address}/positions")
+
+    def get_user_fills(self, address, limit=100):
+        """
+        Get historical fills/trades for a Hyperliquid wallet via Moon Dev's API.
+
+        This uses Moon Dev's local node data - scans hourly fill archives.
+        Extremely fast: ~300ms even for 32,000+ fills!
+
+        Args:
+            address: Hyperliquid wallet address (e.g., "0x...")
+            limit: Number of fills to return (default: 100, max: 2000, use -1 for ALL fills)
+
+        Returns:
+            dict with:
+                - fills: list of fill objects with trade details
+                - total: total number of fills found
+                - limit: limit that was applied
+                - address: wallet address queried
+
+        Example fill object:
+            {
+                'coin': 'BTC',
+                'px': '45000.0',           # execution price
+                'sz': '0.1',               # size
+                'side': 'B',               # B=Buy, S=Sell
+                'time': 1704067200000,     # timestamp ms
+                'startPosition': '0.5',    # position before
+                'dir': 'Open Long',        # direction description
+                'closedPnl': '0',          # realized PnL if closing
+                'hash': 'abc123...',       # transaction hash
+                'tid': 12345,              # trade ID
+                'fee': '1.5'               # fee paid
+            }
+        """
+        params = f"?limit={limit}" if limit != 100 else ""
+        return self._get_json(f"/api/user/{address}/fills{params}")
+
+    # ==================== POSITION SNAPSHOTS ====================
+    def get_position_snapshots(self, symbol, hours=24, limit=1000, min_distance_pct=None, max_distance_pct=None, side=None):
+        """
+        Get historical position snapshots for positions near liquidation.
+
+        Tracks positions within 15% of liquidation price with minimum $10k value.
+        Snapshots are taken every 1 minute.
+
+        Args:
+            symbol: Symbol to query (BTC, ETH, SOL, XRP, HYPE)
+            hours: Lookback period in hours (default: 24)
+            limit: Max records to return (default: 1000)
+            min_distance_pct: Filter by minimum distance to liquidation %
+            max_distance_pct: Filter by maximum distance to liquidation %
+            side: Filter by position side ('long' or 'short')
+
+        Returns:
+            dict with snapshots and metadata
+        """
+        params = f"?hours={hours}&limit={limit}"
+        if min_distance_pct is not None:
+            params += f"&min_distance_pct={min_distance_pct}"
+        if max_distance_pct is not None:
+            params += f"&max_distance_pct={max_distance_pct}"
+        if side is not None:
+            params += f"&side={side}"
+        return self._get_json(f"/api/position_snapshots/symbol/{symbol}{params}")
+
+    def get_position_snapshot_stats(self, hours=24):
+        """
+        Get aggregate statistics for position snapshots across all tracked symbols.
+
+        Args:
+            hours: Lookback period in hours (default: 24)
+
+        Returns:
+            dict with:
+                - overall: total snapshots, unique users, avg distance
+                - by_symbol: per-symbol breakdown
+                - top_10_closest: positions closest to liquidation
+                - scan_metadata: recent scan info
+        """
+        params = f"?hours={hours}"
+        return self._get_json(f"/api/position_snapshots/stats{params}")
+
+    # ==================== MARKET DATA (NO RATE LIMITS!) ====================
+    def get_prices(self):
+        """
+        Get all coin prices, funding rates, and open interest.
+
+        This replaces Hyperliquid's rate-limited metaAndAssetCtxs call.
+        No rate limits - goes through Moon Dev's node!
+
+        Returns:
+            dict with:
+                - timestamp: When data was fetched
+                - count: Number of coins (224)
+                - prices: Dict of coin -> price (e.g., {"BTC": "93200.0", "ETH": "3175.0"})
+                - funding_rates: Dict of coin -> funding rate
+                - open_interest: Dict of coin -> open interest
+        """
+        return self._get_json("/api/prices")
+
+    def get_price(self, coin):
+        """
+        Get quick price for a single coin.
+
+        Args:
+            coin: Coin symbol (e.g., "BTC", "ETH", "SOL")
+
+        Returns:
+            dict with:
+                - coin: Symbol
+                - timestamp: When data was fetched
+                - best_bid: Best bid price
+                - best_ask: Best ask price
+                - best_bid_size: Size at best bid
+                - best_ask_size: Size at best ask
+                - mid_price: (bid + ask) / 2
+                - spread: ask - bid
+                - spread_bps: Spread in basis points
+        """
+        return self._get_json(f"/api/price/{coin}")
+
+    def get_prices_bbo(self, coins, source="auto", workers=None):
+        """
+        Get best bid/ask for many coins in one call (fetched concurrently).
+
+        Args:
+            coins: Coin symbols (e.g., ["BTC", "ETH", "SOL"] or "BTC,ETH,SOL")
+            source: "auto" (get_price per coin, failures filled from one get_prices),
+                    "price", "orderbook", or "prices" (one request, mid only)
+            workers: Concurrent requests (default: 10)
+
+        Returns:
+            BBOSnapshot with numpy arrays in `coins` order:
+                - bid, ask, bid_size, ask_size, mid, spread_bps
+                - timestamp: Quote time per coin (ms)
+                - source: Where each quote came from
+                - errors: coin -> error for quotes that failed
+                - stale(max_age_ms, previous): per-coin staleness flags
+                - to_dict(): JSON-ready records
+        """
+        from api.bbo import fetch_bbo, BBO_WORKERS
+        return fetch_bbo(self, coins, source, workers or BBO_WORKERS)
+
+    def get_orderbook(self, coin):
+        """
+        Get full L2 orderbook for a coin (~20 levels each side).
+
+        This replaces Hyperliquid's rate-limited l2Book call.
+        No rate limits - goes through Moon Dev's node!
+
+        Args:
+            coin: Coin symbol (e.g., "BTC", "ETH", "SOL")
+
+        Returns:
+            dict with:
+                - coin: Symbol
+                - timestamp: When data was fetched
+                - levels: [[bids], [asks]] - bids sorted high->low, asks sorted low->high
+                  Each level: {"px": price, "sz": size, "n": order_count}
+                - best_bid: Best bid price
+                - best_ask: Best ask price
+                - mid_price: (bid + ask) / 2
+                - spread: ask - bid
+                - spread_bps: Spread in basis points
+                - bid_depth: Number of bid levels
+                - ask_depth: Number of ask levels
+        """
+        return self._get_json(f"/api/orderbook/{coin}")
+
+    def get_account(self, address):
+        """
+        Get full account state for any Hyperliquid wallet.
+
+        This replaces Hyperliquid's rate-limited clearinghouseState call.
+        No rate limits - goes through Moon Dev's node!
+
+        Args:
+            address: Wallet address (e.g., "0x...")
+
+        Returns:
+            dict with:
+                - address: Wallet address
+                - timestamp: When data was fetched
+                - marginSummary: Account value, total position, margin used
+                - crossMarginSummary: Cross margin details
+                - assetPositions: List of all open positions with full details
+                - withdrawable: Available to withdraw
+        """
+        return self._get_json(f"/api/account/{address}")
+
+    def get_fills(self, address, limit=100):
+        """
+        Get trade fills for any wallet in Hyperliquid-compatible format.
+
+        This is the DROP-IN REPLACEMENT for Hyperliquid's userFills call.
+        Uses Moon Dev's local node - faster and no rate limits!
+
+        Args:
+            address: Wallet address (e.g., "0x...")
+            limit: Number of fills to return (default: 100)
+
+        Returns:
+            list of fill objects in Hyperliquid format:
+            [
+                {
+                    "tid": 293951512222,      # Trade ID
+                    "time": 1768392000752,    # Timestamp (ms)
+                    "coin": "BTC",            # Symbol
+                    "side": "B" or "A",       # B=Buy, A=Sell (Ask)
+                    "px": "94000.0",          # Price
+                    "sz": "0.1",              # Size
+                    "closedPnl": "100.50",    # Realized PnL
+                    "dir": "Open Long",       # Direction description
+                    "crossed": false,         # Whether crossed the spread
+                    "fee": "1.5",             # Fee paid
+                    "oid": 293951512222       # Order ID
+                }
+            ]
+        """
+        params = f"?limit={limit}" if limit != 100 else ""
+        return self._get_json(f"/api/fills/{address}{params}")
+
+    def get_candle_symbols(self):
+        """
+        Get list of all 80 tracked symbols available for candles/ticks.
+
+        Symbols are selected based on $750k+ daily volume.
+
+        Returns:
+            dict with:
+                - symbols: List of symbol strings (e.g., ["AAVE", "BTC", "DOGE", ...])
+                - count: Number of tracked symbols (80)
+                - volume_threshold: Minimum daily volume for inclusion ($750k)
+                - intervals: Available candle intervals (1m, 5m, 15m, 1h, 4h, 1d)
+                - symbol_details: Dict with per-symbol metadata
+        """
+        return self._get_json("/api/candles/symbols")
+
+    def get_candles(self, coin, interval="5m", start_time=None, end_time=None):
+        """
+        Get OHLCV candles for any of 80 tracked symbols in Hyperliquid-compatible format.
+
+        80 symbols tracked including majors, DeFi, L2s, and memes.
+        Use get_candle_symbols() to see full list.
+
+        Categories:
+            - Major: BTC, ETH, SOL, XRP, DOGE, LTC, ADA, DOT, LINK, AVAX, BNB...
+            - DeFi: AAVE, UNI, CRV, LDO, PENDLE, JUP, MORPHO, ONDO, ENA...
+            - L2/Alt L1: ARB, OP, SUI, SEI, APT, NEAR, TON, TIA, MOVE, BERA...
+            - Memes: HYPE, FARTCOIN, PUMP, WIF, POPCAT, PENGU, TRUMP...
+
+        Args:
+            coin: Any tracked symbol (use get_candle_symbols() for full list)
+            interval: Candle interval - 1m, 5m, 15m, 1h, 4h, 1d (default: 5m)
+            start_time: Start timestamp in ms (optional)
+            end_time: End timestamp in ms (optional)
+
+        Returns:
+            list of candle objects:
+            [
+                {
+                    "t": 1767787200000,    # Open time (ms)
+                    "T": 1767790799999,    # Close time (ms)
+                    "s": "BTC",            # Symbol
+                    "i": "5m",             # Interval
+                    "o": "92194.5",        # Open price
+                    "h": "92232.5",        # High price
+                    "l": "92049.5",        # Low price
+                    "c": "92056.5",        # Close price
+                    "v": "0",              # Volume (from ticks, may be 0)
+                    "n": 239               # Number of price updates
+                }
+            ]
+        """
+        params = [f"interval={interval}"]
+        if start_time is not None:
+            params.append(f"startTime={start_time}")
+        if end_time is not None:
+            params.append(f"endTime={end_time}")
+        query = "?" + "&".join(params) if params else ""
+        return self._get_json(f"/api/candles/{coin}{query}")
+
+    # ==================== HLP (HYPERLIQUIDITY PROVIDER) ====================
+    def get_hlp_positions(self, include_strategies=True):
+        """
+        Get all HLP (HyperLiquidity Provider) positions across all 7 strategies.
+
+        This endpoint provides a comprehensive view of Hyperliquid's market-making
+        strategies including combined net exposure calculations.
+
+        Args:
+            include_strategies: If True, include individual strategy breakdowns.
+                              If False, return summary only (faster response).
+
+        Returns:
+            dict with:
+                - summary: Total account value (~$210M), position counts, net exposure
+                - combined_positions: NET positions across all strategies (longs - shorts)
+                - strategies: Individual HLP strategy details (if include_strategies=True)
+
+        HLP Strategies tracked:
+            - HLP Strategy A (main market maker)
+            - HLP Strategy B (secondary market maker)
+            - HLP Liquidator 1-4 (liquidation bots)
+            - HLP Strategy X (experimental)
+
+        Example combined_position:
+            {
+                'coin': 'BTC',
+                'net_size': 10.5,           # positive=net long, negative=net short
+                'net_value': 500000.0,      # USD value of net position
+                'long_strategies': ['HLP Strategy A'],
+                'short_strategies': ['HLP Strategy B'],
+                'total_long': 15.0,
+                'total_short': 4.5
+            }
+        """
+        params = "" if include_strategies else "?include_strategies=false"
+        return self._get_json(f"/api/hlp/positions{params}")
+
+    def get_hlp_trades(self, limit=100):
+        """
+        Get historical HLP trade fills across all strategies.
+
+        Args:
+            limit: Number of trades to return (default: 100)
+
+        Returns:
+            dict with:
+                - trades: List of trade fill objects
+                - total: Total trades available
+                - strategies: Which strategies have trades
+        """
+        params = f"?limit={limit}" if limit != 100 else ""
+        return self._get_json(f"/api/hlp/trades{params}")
+
+    def get_hlp_trade_stats(self):
+        """
+        Get HLP trade volume and fee statistics.
+
+        Returns:
+            dict with:
+                - total_trades: Total number of trades collected
+                - total_volume: Total USD volume traded
+                - total_fees: Total fees paid
+                - date_range: First and last trade timestamps
+                - by_strategy: Volume breakdown by strategy
+                - by_coin: Volume breakdown by coin
+        """
+        return self._get_json("/api/hlp/trades/stats")
+
+    def get_hlp_position_history(self, hours=24):
+        """
+        Get historical position snapshots over time.
+
+        Args:
+            hours: Number of hours of history (default: 24)
+
+        Returns:
+            dict with:
+                - snapshots: List of position snapshots with timestamps
+                - interval: Time between snapshots
+        """
+        params = f"?hours={hours}" if hours != 24 else ""
+        return self._get_json(f"/api/hlp/positions/history{params}")
+
+    def get_hlp_liquidators(self):
+        """
+        Get HLP liquidator activation events.
+
+        Monitors when liquidator accounts become active (non-idle).
+
+        Returns:
+            dict with:
+                - events: List of liquidator activation events
+                - liquidators: Current status of each liquidator account
+        """
+        return self._get_json("/api/hlp/liquidators")
+
+    def get_hlp_deltas(self, hours=24):
+        """
+        Get HLP net exposure (delta) changes over time.
+
+        Args:
+            hours: Number of hours of history (default: 24)
+
+        Returns:
+            dict with:
+                - deltas: Time series of net exposure values
+                - current: Current net exposure
+                - change_24h: 24-hour change in exposure
+        """
+        params = f"?hours={hours}" if hours != 24 else ""
+        return self._get_json(f"/api/hlp/deltas{params}")
+
+    def get_hlp_sentiment(self):
+        """
+        Get HLP sentiment indicator - THE BIG ONE!
+
+        Returns z-scores showing how positioned HLP is vs historical norms.
+        Z-score of 2.2 = HLP is 2.2σ more long than usual = retail heavily SHORT.
+
+        Returns:
+            dict with:
+                - net_delta: Current net exposure
+                - z_score: Standard deviations from mean
+                - signal: Human readable signal (e.g., "Retail heavily SHORT")
+                - percentile: Where current delta falls historically
+        """
+        return self._get_json("/api/hlp/sentiment")
+
+    def get_hlp_liquidator_status(self):
+        """
+        Get real-time HLP liquidator status.
+
+        Shows which liquidators are active/idle and their PnL.
+
+        Returns:
+            dict with liquidator addresses, status (active/idle), and PnL data
+        """
+        return self._get_json("/api/hlp/liquidators/status")
+
+    def get_hlp_market_maker(self):
+        """
+        Get HLP Strategy B market maker tracker for BTC/ETH/SOL.
+
+        Returns:
+            dict with market maker positions and activity for major coins
+        """
+        return self._get_json("/api/hlp/market-maker")
+
+    def get_hlp_timing(self):
+        """
+        Get HLP timing analysis - hourly/session profitability.
+
+        Returns:
+            dict with profitability breakdown by hour and trading session
+        """
+        return self._get_json("/api/hlp/timing")
+
+    def get_hlp_correlation(self):
+        """
+        Get HLP delta-price correlation analysis by coin.
+
+        Returns:
+            dict with correlation data showing how HLP delta relates to price moves
+        """
+        return self._get_json("/api/hlp/correlation")
+
+    def get_hlp_delta(self):
+        """
+        Get live HLP net delta calculation.
+
+        Shows real-time HLP positioning across all vaults.
+        Polls every 30 seconds, snapshots every 60 seconds.
+
+        Returns:
+            dict with:
+                - net_delta: Current net exposure (positive=LONG, negative=SHORT)
+                - long_exposure: Total long exposure in USD
+                - short_exposure: Total short exposure in USD
+                - position_count: Number of positions across vaults
+                - timestamp: Last update time
+        """
+        return self._get_json("/api/hlp/delta")
+
+    def get_hlp_flips(self):
+        """
+        Get historical HLP flip events (when delta crosses zero).
+
+        A flip occurs when HLP's net delta crosses from long to short
+        or vice versa. Each flip is recorded with BTC/ETH price context.
+
+        Returns:
+            list of flip events:
+            [
+                {
+                    "datetime": "2026-01-14T15:30:00Z",
+                    "from_direction": "long",
+                    "to_direction": "short",
+                    "from_delta": 500000,
+                    "to_delta": -200000,
+                    "hold_duration_hours": 4.5,
+                    "btc_price": 95000,
+                    "eth_price": 3300
+                }
+            ]
+        """
+        return self._get_json("/api/hlp/flips")
+
+    def get_hlp_flip_stats(self):
+        """
+        Get aggregated HLP flip statistics.
+
+        Provides analysis of historical flip patterns including
+        average hold durations, flip frequency, and performance metrics.
+
+        Returns:
+            dict with:
+                - total_flips: Number of recorded flips
+                - avg_hold_duration_hours: Average time between flips
+                - long_to_short_count: Number of long→short flips
+                - short_to_long_count: Number of short→long flips
+                - current_direction: Current HLP direction (long/short)
+                - current_hold_hours: Hours in current direction
+        """
+        return self._get_json("/api/hlp/flip-stats")
+
+    # ==================== SMART MONEY ====================
+    def get_smart_money_rankings(self):
+        """Get Top 100 smart money + Bottom 100 dumb money rankings"""
+        return self._get_json("/api/smart_money/rankings.json")
+
+    def get_smart_money_leaderboard(self):
+        """Get Top 50 performers with details"""
+        return self._get_json("/api/smart_money/leaderboard.json")
+
+    def get_smart_money_signals(self, timeframe="1h"):
+        """Get smart money trading signals (10m, 1h, 24h)"""
+        return self._get_json(f"/api/smart_money/signals_{timeframe}.json")
+
+    # ==================== MULTI-EXCHANGE LIQUIDATIONS ====================
+    def get_all_liquidations(self, timeframe="1h"):
+        """
+        Get COMBINED liquidation data from ALL exchanges (Hyperliquid, Binance, Bybit, OKX).
+
+        Args:
+            timeframe: 10m, 1h, 4h, 12h, 24h, 2d, 7d, 14d, 30d
+
+        Returns:
+            dict with liquidation events from all exchanges, sorted by USD value
+        """
+        return self._get_json(f"/api/all_liquidations/{timeframe}.json")
+
+    def get_all_liquidation_stats(self):
+        """
+        Get combined liquidation stats across ALL exchanges.
+
+        Returns:
+            dict with:
+                - total_count: Total liquidations across all exchanges
+                - total_volume: Combined USD volume
+                - by_exchange: Breakdown by exchange (hyperliquid, binance, bybit, okx)
+                - by_side: Long vs short breakdown
+        """
+        return self._get_json("/api/all_liquidations/stats.json")
+
+    def get_binance_liquidations(self, timeframe="1h"):
+        """
+        Get Binance Futures liquidation data.
+
+        Args:
+            timeframe: 10m, 1h, 4h, 12h, 24h, 2d, 7d, 14d, 30d
+        """
+        return self._get_json(f"/api/binance_liquidations/{timeframe}.json")
+
+    def get_bybit_liquidations(self, timeframe="1h"):
+        """
+        Get Bybit liquidation data.
+
+        Args:
+            timeframe: 10m, 1h, 4h, 12h, 24h, 2d, 7d, 14d, 30d
+        """
+        return self._get_json(f"/api/bybit_liquidations/{timeframe}.json")
+
+    def get_okx_liquidations(self, timeframe="1h"):
+        """
+        Get OKX liquidation data.
+
+        Args:
+            timeframe: 10m, 1h, 4h, 12h, 24h, 2d, 7d, 14d, 30d
+        """
+        return self._get_json(f"/api/okx_liquidations/{timeframe}.json")
+
+    # ==================== HIP3 LIQUIDATIONS ====================
+    def get_hip3_liquidations(self, timeframe="1h"):
+        """
+        Get HIP3 liquidation data (Stocks, Commodities, Indices, FX).
+
+        HIP3 covers traditional finance assets on Hyperliquid:
+        - Stocks: TSLA, NVDA, AAPL, META, MSFT, GOOGL, AMZN, AMD, INTC, PLTR,
+                  COIN, HOOD, MSTR, ORCL, MU, NFLX, RIVN, BABA
+        - Commodities: GOLD, SILVER, COPPER, CL (Oil), NATGAS, URANIUM
+        - Indices: XYZ100 (Nasdaq proxy)
+        - FX: EUR, JPY
+
+        Args:
+            timeframe: 10m, 1h, 24h, 7d
+
+        Returns:
+            list of liquidation events with:
+                - symbol: Asset symbol (TSLA, GOLD, etc.)
+                - side: 'long' or 'short'
+                - size: Position size
+                - price: Liquidation price
+                - value_usd: USD value of liquidation
+                - category: 'stocks', 'commodities', 'indices', or 'fx'
+                - timestamp: Event timestamp
+        """
+        return self._get_json(f"/api/hip3_liquidations/{timeframe}.json")
+
+    def get_hip3_liquidation_stats(self):
+        """
+        Get HIP3 liquidation statistics.
+
+        Returns:
+            dict with:
+                - total_count: Total liquidations
+                - total_volume: Total USD volume liquidated
+                - long_count: Number of long liquidations
+                - short_count: Number of short liquidations
+                - long_volume: USD volume of long liquidations
+                - short_volume: USD volume of short liquidations
+                - by_category: Breakdown by category (stocks, commodities, indices, fx)
+                - by_symbol: Breakdown by individual symbol
+                - top_symbols: Top symbols by liquidation volume
+        """
+        return self._get_json("/api/hip3_liquidations/stats.json")
+
+    # ==================== HIP3 MARKET DATA (Multi-Dex) ====================
+    def get_hip3_meta(self, include_delisted=False):
+        """
+        Get all HIP3 symbols from all 4 dexes with current prices.
+
+        51 symbols across 4 dexes:
+            - xyz (27): Stocks, commodities, FX, indices (TSLA, NVDA, GOLD, EUR, XYZ100)
+            - flx (7): Stocks, commodities, XMR (XMR, GOLD, SILVER, OIL)
+            - hyna (12): Crypto (BTC, ETH, HYPE, SOL, FARTCOIN, PUMP)
+            - km (5): US indices (US500, USTECH, SMALL2000)
+
+        Args:
+            include_delisted: If True, includes delisted symbols (default: False)
+
+        Returns:
+            dict with:
+                - count: Total number of symbols
+                - dexes: Dict organized by dex prefix
+                - symbols: List of all symbol objects with prices
+                - categories: Breakdown by category (stocks, indices, commodities, fx, crypto)
+
+        Symbol format: {dex}:{ticker} (e.g., xyz:TSLA, hyna:BTC, km:US500)
+        """
+        params = "?include_delisted=true" if include_delisted else ""
+        return self._get_json(f"/api/hip3/meta{params}")
+
+    def get_hip3_tick_stats(self):
+        """
+        Get HIP3 tick collector statistics with dex breakdown.
+
+        Returns:
+            dict with:
+                - total_symbols: Total symbols being tracked
+                - total_ticks: Total ticks collected
+                - by_dex: Breakdown by dex (xyz, flx, hyna, km)
+                - by_category: Breakdown by category
+                - last_update: Last collection timestamp
+        """
+        return self._get_json("/api/hip3_ticks/stats.json")
+
+    def get_hip3_ticks(self, dex, ticker):
+        """
+        Get raw tick data for a specific HIP3 symbol.
+
+        Args:
+            dex: Dex prefix (xyz, flx, hyna, km)
+            ticker: Symbol ticker (tsla, btc, gold, us500, etc.) - case insensitive
+
+        Returns:
+            dict/list with tick data for the symbol
+
+        Examples:
+            get_hip3_ticks("xyz", "tsla")   # Tesla stock
+            get_hip3_ticks("xyz", "gold")   # Gold commodity
+            get_hip3_ticks("hyna", "btc")   # Bitcoin
+            get_hip3_ticks("km", "us500")   # S&P 500 index
+        """
+        return self._get_json(f"/api/hip3_ticks/{dex.lower()}_{ticker.lower()}.json")
+
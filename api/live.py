@@ -0,0 +1,368 @@
+"""
+🌙 Moon Dev's Live Dashboards
+Always-on Rich dashboards that only redraw what actually changed
+
+Built with love by Moon Dev 🚀
+
+Usage:
+    from api import MoonDevAPI
+    from api.live import LiveDashboard
+
+    api = MoonDevAPI()
+    dash = LiveDashboard(max_fps=4)
+    dash.source("positions", api.get_positions, every=5)
+    dash.source("stats", api.get_liquidation_stats, every=30)
+    dash.panel("risk", create_risk_analysis, "positions")
+    dash.panel("liqs", render_liq_stats, "stats")
+    dash.panel("combo", lambda p, s: render_both(p, s), "positions", "stats")
+    dash.layout(["risk", "liqs"], "combo", "status")
+    dash.run()
+
+How it stays cheap:
+    - Sources are polled on the shared PollingScheduler (api/scheduler.py)
+      in a background thread. A poll that returns the same data as last
+      time is dropped - nothing downstream runs.
+    - A panel's render function only runs when one of its sources changed.
+      Its output is laid out once per terminal width and the lines are
+      reused on every later frame, so unchanged Tables are never re-measured.
+    - Frames are drawn on change only, capped at max_fps, independent of
+      how often the sources poll. An idle dashboard draws nothing.
+    - SortedView keeps "top N by X" lists sorted across polls with bisect,
+      touching only the rows that moved instead of re-sorting everything.
+
+Render functions run on the main thread and must not mutate the data
+they are given (it is kept to detect changes on the next poll).
+"""
+
+import time
+import threading
+from datetime import datetime
+
+from rich.console import Console, Group
+from rich.live import Live
+from rich.measure import Measurement
+from rich.segment import Segment
+from rich.table import Table
+from rich.text import Text
+
+from api.scheduler import PollingScheduler
+from api.views import SortedView  # noqa: F401 - re-exported for dashboards
+
+DEFAULT_MAX_FPS = 4
+
+
+# ============================================
+# 🧱 CACHED RENDERING
+# ============================================
+
+class CachedRenderable:
+    """
+    A renderable laid out once per width.
+
+    Rich re-measures and re-wraps a whole Table every time the screen is
+    drawn; wrapping it here turns later frames into a copy of the lines.
+    """
+
+    MAX_LAYOUTS = 4
+
+    def __init__(self, renderable):
+        self.renderable = renderable
+        self._lines = {}
+        self._measurements = {}
+
+    def __rich_console__(self, console, options):
+        key = (options.max_width, options.height, options.justify, options.no_wrap)
+        lines = self._lines.get(key)
+        if lines is None:
+            if len(self._lines) >= self.MAX_LAYOUTS:
+                self._lines.clear()
+            lines = self._lines[key] = console.render_lines(self.renderable, options, pad=False)
+        new_line = Segment.line()
+        for line in lines:
+            yield from line
+            yield new_line
+
+    def __rich_measure__(self, console, options):
+        measurement = self._measurements.get(options.max_width)
+        if measurement is None:
+            if len(self._measurements) >= self.MAX_LAYOUTS:
+                self._measurements.clear()
+            measurement = Measurement.get(console, options, self.renderable)
+            self._measurements[options.max_width] = measurement
+        return measurement
+
+
+class PanelBuffer:
+    """
+    Stand-in for a Console in print-style display functions.
+
+    `display_x(data, out=PanelBuffer())` collects what would have been
+    printed; .renderable() turns it into one Group for a live panel.
+    """
+
+    def __init__(self):
+        self.items = []
+
+    def print(self, *objects, **kwargs):
+        if not objects:
+            self.items.append(Text(""))
+        elif len(objects) == 1:
+            self.items.append(objects[0])
+        else:
+            self.items.append(" ".join(str(o) for o in objects))
+
+    def renderable(self):
+        return Group(*self.items)
+
+
+def printed(display, *args, **kwargs):
+    """Renderable of whatever display(*args, out=...) prints"""
+    buffer = PanelBuffer()
+    display(*args, out=buffer, **kwargs)
+    return buffer.renderable()
+
+
+# ============================================
+# 📡 SOURCES & PANELS
+# ============================================
+
+class Source:
+    """One polled endpoint"""
+
+    def __init__(self, name, fetch, every):
+        self.name = name
+        self.fetch = fetch
+        self.every = every
+        self.data = None
+        self.version = 0          # bumped when the data changes
+        self.polls = 0
+        self.unchanged = 0
+        self.error = None
+        self.changed_at = None    # wall time of the last change
+        self.job = None
+
+
+class LivePanel:
+    """One region of the screen, rendered from one or more sources"""
+
+    def __init__(self, name, render, sources, key=None):
+        self.name = name
+        self.render = render
+        self.sources = sources
+        self.key = key or (lambda: tuple(s.version for s in self.sources))
+        self.versions = None      # source versions the cache was built from
+        self.cached = None
+        self.renders = 0
+        self.render_ms = 0.0
+
+    def refresh(self):
+        """Re-render if a source changed; returns True if it did"""
+        versions = self.key()
+        if versions == self.versions and self.cached is not None:
+            return False
+        start = time.perf_counter()
+        if self.sources and any(s.version == 0 for s in self.sources):
+            renderable = Text(f"⏳ Loading {', '.join(s.name for s in self.sources if s.version == 0)}...",
+                              style="dim")
+        else:
+            try:
+                renderable = self.render(*(s.data for s in self.sources))
+            except Exception as e:
+                renderable = Text(f"⚠️ {self.name}: {e}", style="red")
+        self.cached = CachedRenderable(renderable if renderable is not None else Text(""))
+        self.versions = versions
+        self.renders += 1
+        self.render_ms += (time.perf_counter() - start) * 1000
+        return True
+
+
+# ============================================
+# 🖥️ DASHBOARD
+# ============================================
+
+class LiveDashboard:
+    """
+    🌙 Moon Dev's Live Dashboard
+
+    Polls sources on a schedule, re-renders only the panels whose data
+    changed and draws at most max_fps frames a second.
+    """
+
+    def __init__(self, console=None, max_fps=DEFAULT_MAX_FPS, title=None, screen=False):
+        """
+        Args:
+            console: Rich Console to draw on
+            max_fps: Frame-rate cap (polling intervals are separate)
+            title: Shown in the built-in "status" panel
+            screen: Use the alternate screen (full-screen wallboard)
+        """
+        self.console = console or Console()
+        self.max_fps = max_fps
+        self.title = title or "🌙 Moon Dev"
+        self.screen = screen
+        self.sources = {}
+        self.panels = {}
+        self.rows = []
+        self.frames = 0
+        self.scheduler = PollingScheduler(on_error=self._on_error)
+        self._dirty = threading.Event()
+        self._lock = threading.Lock()
+        self.panels["status"] = LivePanel("status", self._render_status, [], key=self._status_key)
+
+    # ---------- setup ----------
+
+    def source(self, name, fetch, every):
+        """Poll fetch() every `every` seconds"""
+        src = Source(name, fetch, every)
+        self.sources[name] = src
+        return src
+
+    def panel(self, name, render, *sources):
+        """
+        Add a panel.
+
+        Args:
+            name: Used in layout()
+            render: fn(*source_data) -> Rich renderable, called only on change
+            sources: Names of the sources it is drawn from (none = static)
+        """
+        missing = [s for s in sources if s not in self.sources]
+        if missing:
+            raise ValueError(f"Unknown source(s) for panel {name}: {', '.join(missing)}")
+        panel = LivePanel(name, render, [self.sources[s] for s in sources])
+        self.panels[name] = panel
+        return panel
+
+    def layout(self, *rows):
+        """Rows top to bottom: a panel name, or a list of names shown side by side"""
+        for row in rows:
+            for name in ([row] if isinstance(row, str) else row):
+                if name not in self.panels:
+                    raise ValueError(f"Unknown panel: {name}")
+        self.rows = [[row] if isinstance(row, str) else list(row) for row in rows]
+
+    # ---------- polling (scheduler thread) ----------
+
+    def _poll(self, src):
+        data = src.fetch()
+        with self._lock:
+            src.polls += 1
+            src.error = None
+            if src.version and data == src.data:
+                src.unchanged += 1
+                return
+            src.data = data
+            src.version += 1
+            src.changed_at = time.time()
+        self._dirty.set()
+
+    def _on_error(self, job, error):
+        src = self.sources.get(job.name)
+        if src is not None:
+            message = str(error) or type(error).__name__
+            with self._lock:
+                src.polls += 1
+                if message == src.error:
+                    src.unchanged += 1
+                    return
+                src.error = message
+            self._dirty.set()
+
+    # ---------- rendering (main thread) ----------
+
+    def _render_status(self):
+        now = datetime.now().strftime("%H:%M:%S")
+        parts = []
+        for src in self.sources.values():
+            if src.error:
+                parts.append(f"[red]⚠️ {src.name}: {src.error[:60]}[/red]")
+            elif src.changed_at:
+                parts.append(f"[dim]{src.name} {datetime.fromtimestamp(src.changed_at).strftime('%H:%M:%S')}[/dim]")
+            else:
+                parts.append(f"[dim]{src.name} ⏳[/dim]")
+        return Text.from_markup(f"[dim]─── {self.title} │ {now} │[/dim] " + " │ ".join(parts))
+
+    def _status_key(self):
+        return tuple((s.version, s.error) for s in self.sources.values())
+
+    def _frame(self):
+        """Compose the screen from cached panels"""
+        for row in self.rows:
+            for name in row:
+                self.panels[name].refresh()
+
+        parts = []
+        for row in self.rows:
+            cells = [self.panels[name].cached for name in row]
+            if len(cells) == 1:
+                parts.append(cells[0])
+            else:
+                grid = Table.grid(expand=True, padding=(0, 1))
+                for _ in cells:
+                    grid.add_column(ratio=1)
+                grid.add_row(*cells)
+                parts.append(grid)
+        return Group(*parts)
+
+    def run(self, duration=None):
+        """
+        Draw until Ctrl+C (or `duration` seconds).
+
+        Returns:
+            stats() at exit
+        """
+        if not self.rows:
+            self.layout(*[name for name in self.panels if name != "status"], "status")
+        for src in self.sources.values():
+            src.job = self.scheduler.every(src.every, lambda src=src: self._poll(src), name=src.name)
+
+        min_frame = 1.0 / self.max_fps
+        deadline = None if duration is None else time.monotonic() + duration
+        self.scheduler.run_in_thread()
+        last_frame = 0.0
+        size = self.console.size
+        try:
+            with Live(self._frame(), console=self.console, auto_refresh=False,
+                      screen=self.screen, redirect_stdout=False, redirect_stderr=False) as live:
+                self.frames += 1
+                while True:
+                    timeout = None if deadline is None else max(deadline - time.monotonic(), 0)
+                    # Wake up at least once per frame slot to notice resizes
+                    self._dirty.wait(min_frame if timeout is None else min(timeout, min_frame))
+                    if deadline is not None and time.monotonic() >= deadline:
+                        break
+                    resized = self.console.size != size
+                    if not self._dirty.is_set() and not resized:
+                        continue
+                    wait = last_frame + min_frame - time.monotonic()
+                    if wait > 0:
+                        time.sleep(wait)
+                    self._dirty.clear()
+                    size = self.console.size
+                    live.update(self._frame(), refresh=True)
+                    self.frames += 1
+                    last_frame = time.monotonic()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.scheduler.stop()
+        return self.stats()
+
+    def stats(self):
+        """Frames drawn, panel renders and how many polls changed nothing"""
+        polls = sum(s.polls for s in self.sources.values())
+        unchanged = sum(s.unchanged for s in self.sources.values())
+        return {
+            "frames": self.frames,
+            "polls": polls,
+            "unchanged_polls": unchanged,
+            "panels": {name: {"renders": p.renders, "render_ms": round(p.render_ms, 2)}
+                       for name, p in self.panels.items()},
+        }
+
+    def print_stats(self):
+        stats = self.stats()
+        renders = sum(p["renders"] for p in stats["panels"].values())
+        skipped = stats["unchanged_polls"] / stats["polls"] * 100 if stats["polls"] else 0
+        self.console.print(f"[dim]🌙 Moon Dev: {stats['frames']} frames, {renders} panel renders, "
+                           f"{stats['polls']} polls ({skipped:.0f}% unchanged)[/dim]")
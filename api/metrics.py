@@ -0,0 +1,243 @@
+"""
+🌙 Moon Dev's Request Metrics
+Per-endpoint latency histograms, sizes, statuses, errors, retries and cache hits
+
+Built with love by Moon Dev 🚀
+
+Stdlib only, so importing it costs nothing - the timed connection classes
+that fill in DNS/connect time live in api.transport (they need requests).
+"""
+
+import re
+import time
+import threading
+from functools import lru_cache
+
+# ============================================
+# 📊 REQUEST METRICS - Moon Dev
+# ============================================
+
+PHASES = ("dns", "connect", "ttfb", "download", "decode", "total")
+
+# Histogram buckets in milliseconds (Prometheus style, +Inf implied)
+LATENCY_BUCKETS_MS = (1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+# Concrete paths -> endpoint templates, so /api/price/BTC and /api/price/ETH
+# share one series
+ENDPOINT_TEMPLATES = [
+    (re.compile(r"0x[0-9a-fA-F]{40}"), "{address}"),
+    (re.compile(r"^/api/(ticks|price|orderbook|candles|position_snapshots/symbol)/(?!stats|latest|symbols)[^/]+$"),
+     r"/api/\1/{coin}"),
+    (re.compile(r"^/api/(\w*liquidations|imbalance)/(?!stats\.)[^/]+\.json$"), r"/api/\1/{timeframe}.json"),
+    (re.compile(r"^/api/smart_money/signals_\w+\.json$"), "/api/smart_money/signals_{timeframe}.json"),
+    (re.compile(r"^/api/hip3_ticks/(?!stats\.)[^/]+\.json$"), "/api/hip3_ticks/{dex}_{ticker}.json"),
+]
+
+# Per-thread phase timings, filled in by api.transport's timed connections
+phase_local = threading.local()
+
+# ============================================
+
+
+@lru_cache(maxsize=1024)
+def endpoint_template(path):
+    """Metrics key for a request path: query dropped, coins/addresses/timeframes templated"""
+    path = path.split("?")[0]
+    for pattern, replacement in ENDPOINT_TEMPLATES:
+        path = pattern.sub(replacement, path)
+    return path
+
+
+
+class _Histogram:
+    """Fixed-bucket latency histogram (milliseconds)"""
+
+    __slots__ = ("counts", "count", "sum", "max")
+
+    def __init__(self):
+        self.counts = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, ms):
+        i = 0
+        while i < len(LATENCY_BUCKETS_MS) and ms > LATENCY_BUCKETS_MS[i]:
+            i += 1
+        self.counts[i] += 1
+        self.count += 1
+        self.sum += ms
+        if ms > self.max:
+            self.max = ms
+
+    def quantile(self, q):
+        """Upper bound of the bucket holding the q-th observation"""
+        if not self.count:
+            return 0.0
+        target, seen = q * self.count, 0
+        for i, n in enumerate(self.counts):
+            seen += n
+            if seen >= target:
+                return min(LATENCY_BUCKETS_MS[i], self.max) if i < len(LATENCY_BUCKETS_MS) else self.max
+        return self.max
+
+    def snapshot(self):
+        return {
+            "count": self.count,
+            "mean_ms": self.sum / self.count if self.count else 0.0,
+            "p50_ms": self.quantile(0.5),
+            "p95_ms": self.quantile(0.95),
+            "max_ms": self.max,
+        }
+
+
+class _EndpointStats:
+    __slots__ = ("phases", "requests", "bytes", "statuses", "errors", "retries", "cache_hits")
+
+    def __init__(self):
+        self.phases = {phase: _Histogram() for phase in PHASES}
+        self.requests = 0
+        self.bytes = 0
+        self.statuses = {}
+        self.errors = {}
+        self.retries = 0
+        self.cache_hits = 0
+
+
+class RequestMetrics:
+    """
+    🌙 Moon Dev's Request Metrics
+
+    Thread-safe per-endpoint latency histograms (dns/connect/ttfb/download/
+    decode/total), response bytes, status codes, errors, retries and cache hits.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._endpoints = {}
+        self._methods = {}  # API method name -> endpoint template (for cache hits)
+        self.started = time.time()
+
+    def _stats(self, endpoint):
+        stats = self._endpoints.get(endpoint)
+        if stats is None:
+            stats = self._endpoints[endpoint] = _EndpointStats()
+        return stats
+
+    def observe(self, endpoint, phases_ms, status=None, nbytes=0, retries=0, error=None, method=None):
+        """Record one request"""
+        with self._lock:
+            stats = self._stats(endpoint)
+            stats.requests += 1
+            stats.bytes += nbytes
+            stats.retries += retries
+            if status is not None:
+                stats.statuses[status] = stats.statuses.get(status, 0) + 1
+            if error is not None:
+                stats.errors[error] = stats.errors.get(error, 0) + 1
+            for phase, ms in phases_ms.items():
+                stats.phases[phase].observe(ms)
+            if method:
+                self._methods[method] = endpoint
+
+    def observe_decode(self, endpoint, ms):
+        with self._lock:
+            self._stats(endpoint).phases["decode"].observe(ms)
+
+    def record_cache_hit(self, name):
+        """Count a cache hit by API method name (e.g. 'get_positions') or endpoint path"""
+        with self._lock:
+            endpoint = self._methods.get(name) or (endpoint_template(name) if name.startswith("/") else name)
+            self._stats(endpoint).cache_hits += 1
+
+    def reset(self):
+        with self._lock:
+            self._endpoints.clear()
+            self.started = time.time()
+
+    def snapshot(self):
+        """Plain-dict view: {endpoint: {...}}, most time spent (request + decode) first"""
+        with self._lock:
+            out = {}
+            for endpoint, stats in self._endpoints.items():
+                out[endpoint] = {
+                    "requests": stats.requests,
+                    "bytes": stats.bytes,
+                    "avg_bytes": stats.bytes // stats.requests if stats.requests else 0,
+                    "statuses": dict(stats.statuses),
+                    "errors": dict(stats.errors),
+                    "retries": stats.retries,
+                    "cache_hits": stats.cache_hits,
+                    "phases": {phase: h.snapshot() for phase, h in stats.phases.items() if h.count},
+                }
+        def time_spent(item):
+            phases = item[1]["phases"]
+            return -sum(phases[p]["mean_ms"] * phases[p]["count"] for p in ("total", "decode") if p in phases)
+        return dict(sorted(out.items(), key=time_spent))
+
+    def prometheus(self, prefix="moondev"):
+        """Prometheus text exposition format"""
+        lines = [
+            f"# HELP {prefix}_request_phase_seconds Request time by phase",
+            f"# TYPE {prefix}_request_phase_seconds histogram",
+        ]
+        counters = {"responses": [], "errors": [], "bytes": [], "retries": [], "cache_hits": []}
+        with self._lock:
+            for endpoint, stats in sorted(self._endpoints.items()):
+                ep = endpoint.replace("\\", "\\\\").replace('"', '\\"')
+                for phase, h in stats.phases.items():
+                    if not h.count:
+                        continue
+                    labels = f'endpoint="{ep}",phase="{phase}"'
+                    cumulative = 0
+                    for bound, n in zip(LATENCY_BUCKETS_MS, h.counts):
+                        cumulative += n
+                        lines.append(f'{prefix}_request_phase_seconds_bucket{{{labels},le="{bound / 1000:g}"}} {cumulative}')
+                    lines.append(f'{prefix}_request_phase_seconds_bucket{{{labels},le="+Inf"}} {h.count}')
+                    lines.append(f"{prefix}_request_phase_seconds_sum{{{labels}}} {h.sum / 1000:.6f}")
+                    lines.append(f"{prefix}_request_phase_seconds_count{{{labels}}} {h.count}")
+                for status, n in sorted(stats.statuses.items()):
+                    counters["responses"].append(f'{{endpoint="{ep}",status="{status}"}} {n}')
+                for error, n in sorted(stats.errors.items()):
+                    counters["errors"].append(f'{{endpoint="{ep}",error="{error}"}} {n}')
+                counters["bytes"].append(f'{{endpoint="{ep}"}} {stats.bytes}')
+                counters["retries"].append(f'{{endpoint="{ep}"}} {stats.retries}')
+                counters["cache_hits"].append(f'{{endpoint="{ep}"}} {stats.cache_hits}')
+
+        helps = {
+            "responses": "HTTP responses by status code",
+            "errors": "Requests that failed without a response",
+            "bytes": "Response body bytes received",
+            "retries": "Automatic retries performed",
+            "cache_hits": "Calls answered from a client-side cache",
+        }
+        for name, samples in counters.items():
+            lines.append(f"# HELP {prefix}_{name}_total {helps[name]}")
+            lines.append(f"# TYPE {prefix}_{name}_total counter")
+            lines += [f"{prefix}_{name}_total{sample}" for sample in samples]
+        return "\n".join(lines) + "\n"
+
+
+def serve_metrics(api, port=9464, host="0.0.0.0"):
+    """
+    Expose api.metrics_text() on http://host:port/metrics for Prometheus.
+    Runs in a daemon thread; returns the server (call .shutdown() to stop).
+    """
+    from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            body = api.metrics_text().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    print(f"📊 Moon Dev: metrics on http://{host}:{port}/metrics")
+    return server
@@ -0,0 +1,168 @@
+"""
+🌙 Moon Dev's Polling Scheduler
+One thread, many jobs, each on its own fixed-rate interval
+
+Built with love by Moon Dev 🚀
+
+Usage:
+    from api.scheduler import PollingScheduler
+
+    scheduler = PollingScheduler()
+    scheduler.every(1, lambda: print(api.get_positions()["total_positions"]))
+    scheduler.every(60, refresh_all_positions, name="all_positions")
+    scheduler.run()                  # until Ctrl+C / scheduler.stop()
+
+Jobs run at fixed rate (t0, t0+i, t0+2i...) rather than "sleep i after
+each run", so a slow call doesn't push every later poll back. If a job
+overruns whole intervals the missed ticks are skipped, not queued up.
+A job that raises is reported through on_error and keeps its schedule.
+"""
+
+import sys
+import time
+import heapq
+import itertools
+import threading
+
+
+class Job:
+    """One scheduled callable"""
+
+    __slots__ = ("name", "fn", "interval", "next_run", "runs", "errors", "max_runs", "last_duration")
+
+    def __init__(self, fn, interval, name=None, max_runs=None):
+        self.fn = fn
+        self.interval = float(interval)
+        self.name = name or getattr(fn, "__name__", "job")
+        self.next_run = 0.0
+        self.runs = 0
+        self.errors = 0
+        self.max_runs = max_runs
+        self.last_duration = 0.0
+
+    @property
+    def done(self):
+        return self.max_runs is not None and self.runs >= self.max_runs
+
+
+class PollingScheduler:
+    """
+    🌙 Moon Dev's Polling Scheduler
+
+    Shared by the CLI's --watch mode and the live dashboards.
+    """
+
+    def __init__(self, on_error=None, clock=time.monotonic, sleep=None):
+        """
+        Args:
+            on_error: fn(job, exception) - default prints to stderr
+            clock: Monotonic time source (swappable for replays)
+            sleep: fn(seconds) used between jobs - default waits on the stop event
+        """
+        self.on_error = on_error or self._print_error
+        self.clock = clock
+        self._stop = threading.Event()
+        self._sleep = sleep or self._stop.wait
+        self._queue = []                # (next_run, seq, job)
+        self._seq = itertools.count()
+        self._lock = threading.Lock()
+        self.jobs = []
+
+    @staticmethod
+    def _print_error(job, error):
+        print(f"⚠️ Moon Dev: {job.name} failed: {error}", file=sys.stderr)
+
+    def every(self, interval, fn, name=None, max_runs=None, start_in=0.0):
+        """
+        Run fn() every `interval` seconds.
+
+        Args:
+            interval: Seconds between runs (fixed rate)
+            fn: Callable taking no arguments
+            name: Label used in error messages
+            max_runs: Stop this job after N runs
+            start_in: Delay before the first run
+        """
+        job = Job(fn, interval, name, max_runs)
+        job.next_run = self.clock() + start_in
+        with self._lock:
+            self.jobs.append(job)
+            heapq.heappush(self._queue, (job.next_run, next(self._seq), job))
+        return job
+
+    def cancel(self, job):
+        """Stop running a job (takes effect before its next run)"""
+        job.max_runs = job.runs
+
+    def stop(self):
+        """Make run() return after the current job"""
+        self._stop.set()
+
+    @property
+    def stopped(self):
+        return self._stop.is_set()
+
+    def run_pending(self):
+        """Run every job that is due now; returns seconds until the next one (None if idle)"""
+        now = self.clock()
+        while True:
+            with self._lock:
+                if not self._queue:
+                    return None
+                due, _, job = self._queue[0]
+                if job.done:
+                    heapq.heappop(self._queue)
+                    continue
+                if due > now:
+                    return due - now
+                heapq.heappop(self._queue)
+
+            start = self.clock()
+            try:
+                job.fn()
+            except Exception as e:
+                job.errors += 1
+                self.on_error(job, e)
+            finally:
+                job.runs += 1
+                now = self.clock()
+                job.last_duration = now - start
+
+            # Fixed rate: next slot after `now`, skipping any we overran
+            next_run = job.next_run + job.interval
+            if next_run <= now:
+                missed = int((now - next_run) // job.interval) + 1
+                next_run += missed * job.interval
+            job.next_run = next_run
+            if not job.done:
+                with self._lock:
+                    heapq.heappush(self._queue, (next_run, next(self._seq), job))
+            if self._stop.is_set():
+                return None
+
+    def run(self, duration=None):
+        """
+        Run jobs until stop(), Ctrl+C, every job hitting max_runs, or `duration` seconds.
+        """
+        self._stop.clear()
+        deadline = None if duration is None else self.clock() + duration
+        try:
+            while not self._stop.is_set():
+                wait = self.run_pending()
+                if wait is None and not self._queue:
+                    break
+                if deadline is not None:
+                    left = deadline - self.clock()
+                    if left <= 0:
+                        break
+                    wait = min(wait, left) if wait is not None else left
+                if wait and wait > 0:
+                    self._sleep(wait)
+        except KeyboardInterrupt:
+            pass
+
+    def run_in_thread(self, duration=None):
+        """run() on a daemon thread; returns the thread"""
+        thread = threading.Thread(target=self.run, args=(duration,), daemon=True, name="moondev-scheduler")
+        thread.start()
+        return thread
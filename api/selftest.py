@@ -0,0 +1,549 @@
+"""
+🌙 Moon Dev API Mass Test Suite
+Hits every endpoint once and prints what came back
+
+Built with love by Moon Dev 🚀
+
+Usage:
+    python -m api
+    MOONDEV_TRACE=trace.json python -m api       # plus a flame-graph trace
+    MOONDEV_BASE_URL=http://127.0.0.1:8765 python -m api   # against the replay server
+"""
+
+import time
+
+from api.client import MoonDevAPI
+from api.tracing import TraceProfiler
+
+
+def test_all():
+    """🌙 Moon Dev API Mass Test Suite"""
+
+    print("=" * 60)
+    print("🌙 Moon Dev API Mass Test Suite 🚀")
+    print("=" * 60)
+
+    api = MoonDevAPI()
+
+    if not api.api_key:
+        print("❌ No API key found! Set MOONDEV_API_KEY in .env")
+        return
+
+    print(f"✅ API Key loaded (ends with ...{api.api_key[-4:]})")
+    print()
+
+    # MOONDEV_TRACE=trace.json records a flame-graph trace of the whole run
+    profiler = TraceProfiler.from_env(api)
+    run_start = time.perf_counter()
+
+    # ==================== 1. HEALTH CHECK ====================
+    print("=" * 60)
+    print("🏥 1. HEALTH CHECK")
+    print("=" * 60)
+    try:
+        health = api.health()
+        print(f"✅ Health: {health}")
+    except Exception as e:
+        print(f"❌ Health check failed: {e}")
+    print()
+
+    # ==================== 2. LIQUIDATIONS ====================
+    print("=" * 60)
+    print("💥 2. LIQUIDATION DATA")
+    print("=" * 60)
+    timeframes = ["10m", "1h", "4h", "24h"]
+    for tf in timeframes:
+        try:
+            data = api.get_liquidations(tf)
+            if isinstance(data, dict):
+                stats = data.get('stats', data)
+                total_count = stats.get('total_count', 'N/A')
+                total_usd = stats.get('total_value_usd', stats.get('total_usd', 'N/A'))
+                if isinstance(total_usd, (int, float)):
+                    print(f"✅ {tf}: {total_count:,} liqs | ${total_usd:,.0f}")
+                else:
+                    print(f"✅ {tf}: {total_count} liquidations")
+        except Exception as e:
+            print(f"❌ {tf} failed: {e}")
+    print()
+
+    # ==================== 3. POSITIONS ====================
+    print("=" * 60)
+    print("💰 3. LARGE POSITIONS ($200k+)")
+    print("=" * 60)
+    try:
+        positions = api.get_positions()
+        if isinstance(positions, dict):
+            total = positions.get('total_positions', 0)
+            print(f"✅ Found {total} positions tracked")
+    except Exception as e:
+        print(f"❌ Positions failed: {e}")
+    print()
+
+    # ==================== 4. WHALE ADDRESSES ====================
+    print("=" * 60)
+    print("🐋 4. WHALE ADDRESSES")
+    print("=" * 60)
+    try:
+        addresses = api.get_whale_addresses()
+        print(f"✅ Found {len(addresses)} whale addresses")
+    except Exception as e:
+        print(f"❌ Whale addresses failed: {e}")
+    print()
+
+    # ==================== 5. EVENTS ====================
+    print("=" * 60)
+    print("⚡ 5. BLOCKCHAIN EVENTS")
+    print("=" * 60)
+    try:
+        events = api.get_events()
+        if isinstance(events, dict):
+            stats = events.get('stats', {})
+            total = stats.get('total_events', 0)
+            by_type = stats.get('events_by_type', {})
+            print(f"✅ Found {total:,} total events")
+            print(f"   📊 By type: {', '.join(f'{k}:{v}' for k,v in list(by_type.items())[:5])}")
+    except Exception as e:
+        print(f"❌ Events failed: {e}")
+    print()
+
+    # ==================== 6. CONTRACTS ====================
+    print("=" * 60)
+    print("📜 6. CONTRACT REGISTRY")
+    print("=" * 60)
+    try:
+        contracts = api.get_contracts()
+        if isinstance(contracts, dict):
+            contract_list = contracts.get('contracts', [])
+            high_value = contracts.get('high_value_count', 0)
+            print(f"✅ Found {len(contract_list)} contracts ({high_value} high-value)")
+    except Exception as e:
+        print(f"❌ Contracts failed: {e}")
+    print()
+
+    # ==================== 7. TICK DATA ====================
+    print("=" * 60)
+    print("📈 7. TICK DATA")
+    print("=" * 60)
+    try:
+        stats = api.get_tick_stats()
+        symbols = stats.get('symbols', [])
+        collector = stats.get('collector_stats', {})
+        ticks = collector.get('ticks_collected', 0)
+        print(f"✅ Tick Stats: {ticks:,} ticks collected for {symbols}")
+    except Exception as e:
+        print(f"⚠️  Tick stats: {e}")
+
+    try:
+        latest = api.get_tick_latest()
+        print(f"✅ Latest prices:")
+        for symbol, price in list(latest.items())[:5]:
+            if isinstance(price, (int, float)):
+                print(f"   {symbol}: ${price:,.2f}")
+            elif isinstance(price, dict):
+                p = price.get('price', price.get('last_price', 'N/A'))
+                print(f"   {symbol}: ${p:,.2f}" if isinstance(p, (int, float)) else f"   {symbol}: {price}")
+    except Exception as e:
+        print(f"⚠️  Latest prices: {e}")
+
+    for symbol in ["btc", "eth"]:
+        try:
+            ticks = api.get_ticks(symbol, "1h")
+            if isinstance(ticks, list):
+                print(f"✅ {symbol.upper()} 1h ticks: {len(ticks)} records")
+            elif isinstance(ticks, dict):
+                count = ticks.get('count', len(ticks.get('ticks', [])))
+                print(f"✅ {symbol.upper()} 1h ticks: {count} records")
+        except Exception as e:
+            print(f"⚠️  {symbol} ticks: {e}")
+    print()
+
+    # ==================== 8. ORDER FLOW & TRADES ====================
+    print("=" * 60)
+    print("📊 8. ORDER FLOW & TRADES")
+    print("=" * 60)
+    try:
+        stats = api.get_orderflow_stats()
+        print(f"✅ Order Flow Stats: {stats}")
+    except Exception as e:
+        print(f"⚠️  Order flow stats: {e}")
+
+    try:
+        trades = api.get_trades()
+        if isinstance(trades, list):
+            print(f"✅ Recent trades: {len(trades)} trades")
+            for t in trades[:3]:
+                symbol = t.get('symbol', t.get('coin', '?'))
+                side = t.get('side', '?')
+                val = t.get('value', t.get('usd_value', t.get('sz', 0)))
+                print(f"   {symbol} {side} ${val:,.0f}" if isinstance(val, (int, float)) else f"   {t}")
+        elif isinstance(trades, dict):
+            trade_list = trades.get('trades', [])
+            print(f"✅ Recent trades: {len(trade_list)} trades")
+    except Exception as e:
+        print(f"⚠️  Recent trades: {e}")
+
+    try:
+        large = api.get_large_trades()
+        if isinstance(large, list):
+            print(f"✅ Large trades (>$100k): {len(large)} trades")
+            for t in large[:3]:
+                symbol = t.get('symbol', t.get('coin', '?'))
+                side = t.get('side', '?')
+                val = t.get('value', t.get('usd_value', 0))
+                print(f"   {symbol} {side} ${val:,.0f}" if isinstance(val, (int, float)) else f"   {t}")
+        elif isinstance(large, dict):
+            trade_list = large.get('trades', [])
+            print(f"✅ Large trades: {len(trade_list)} trades")
+    except Exception as e:
+        print(f"⚠️  Large trades: {e}")
+
+    try:
+        orderflow = api.get_orderflow()
+        print(f"✅ Order flow: {orderflow}")
+    except Exception as e:
+        print(f"⚠️  Order flow: {e}")
+
+    for tf in ["5m", "1h", "24h"]:
+        try:
+            imbalance = api.get_imbalance(tf)
+            if isinstance(imbalance, dict):
+                buy = imbalance.get('buy_volume', imbalance.get('buy', 0))
+                sell = imbalance.get('sell_volume', imbalance.get('sell', 0))
+                ratio = imbalance.get('ratio', imbalance.get('imbalance', 'N/A'))
+                print(f"✅ {tf} imbalance: Buy ${buy:,.0f} | Sell ${sell:,.0f} | Ratio: {ratio}" if isinstance(buy, (int, float)) else f"✅ {tf} imbalance: {imbalance}")
+        except Exception as e:
+            print(f"⚠️  {tf} imbalance: {e}")
+    print()
+
+    # ==================== 9. SMART MONEY ====================
+    print("=" * 60)
+    print("🧠 9. SMART MONEY")
+    print("=" * 60)
+    try:
+        rankings = api.get_smart_money_rankings()
+        if isinstance(rankings, dict):
+            smart = rankings.get('smart_money', rankings.get('top', []))
+            dumb = rankings.get('dumb_money', rankings.get('bottom', []))
+            print(f"✅ Rankings: {len(smart)} smart | {len(dumb)} dumb money wallets")
+    except Exception as e:
+        print(f"⚠️  Rankings: {e}")
+
+    try:
+        leaderboard = api.get_smart_money_leaderboard()
+        if isinstance(leaderboard, dict):
+            leaders = leaderboard.get('leaderboard', leaderboard.get('top', []))
+            print(f"✅ Leaderboard: {len(leaders)} top performers")
+            for l in leaders[:3]:
+                addr = l.get('address', '')[:10] + '...' if l.get('address') else 'N/A'
+                pnl = l.get('pnl', l.get('total_pnl', 0))
+                print(f"   {addr} | PnL: ${pnl:,.0f}" if isinstance(pnl, (int, float)) else f"   {l}")
+        elif isinstance(leaderboard, list):
+            print(f"✅ Leaderboard: {len(leaderboard)} entries")
+    except Exception as e:
+        print(f"⚠️  Leaderboard: {e}")
+
+    for tf in ["10m", "1h", "24h"]:
+        try:
+            signals = api.get_smart_money_signals(tf)
+            if isinstance(signals, dict):
+                signal_list = signals.get('signals', [])
+                print(f"✅ Signals ({tf}): {len(signal_list)} trading signals")
+            elif isinstance(signals, list):
+                print(f"✅ Signals ({tf}): {len(signals)} trading signals")
+        except Exception as e:
+            print(f"⚠️  Signals ({tf}): {e}")
+    print()
+
+    # ==================== 10. USER POSITIONS (HYPERLIQUID) ====================
+    print("=" * 60)
+    print("📊 10. USER POSITIONS (HYPERLIQUID)")
+    print("=" * 60)
+    try:
+        # Test with a known active address (HLP_LONG)
+        test_address = "0x010461c14e146ac35fe42271bdc1134ee31c703a"
+        positions = api.get_user_positions(test_address)
+        if isinstance(positions, dict):
+            asset_positions = positions.get('assetPositions', [])
+            margin = positions.get('marginSummary', {})
+            account_value = margin.get('accountValue', 'N/A')
+            print(f"✅ Found {len(asset_positions)} positions for {test_address[:10]}...")
+            if isinstance(account_value, (int, float, str)):
+                print(f"   Account Value: ${float(account_value):,.2f}" if account_value != 'N/A' else f"   Account Value: {account_value}")
+            for pos in asset_positions[:3]:
+                if 'position' in pos:
+                    p = pos['position']
+                    coin = p.get('coin', '?')
+                    size = float(p.get('szi', 0))
+                    pnl = float(p.get('unrealizedPnl', 0))
+                    direction = "LONG" if size > 0 else "SHORT"
+                    print(f"   {coin} {direction} | PnL: ${pnl:,.2f}")
+    except Exception as e:
+        print(f"⚠️  User positions: {e}")
+    print()
+
+    # ==================== 11. USER FILLS (MOON DEV API) ====================
+    print("=" * 60)
+    print("📜 11. USER FILLS (MOON DEV LOCAL NODE)")
+    print("=" * 60)
+    try:
+        test_address = "0x010461c14e146ac35fe42271bdc1134ee31c703a"
+        fills = api.get_user_fills(test_address, limit=100)
+        if isinstance(fills, dict):
+            fill_list = fills.get('fills', [])
+            total = fills.get('total', len(fill_list))
+            print(f"✅ Found {total:,} total fills for {test_address[:10]}...")
+            print(f"   Showing last {len(fill_list)} fills")
+            for fill in fill_list[:5]:
+                coin = fill.get('coin', '?')
+                side = fill.get('side', '?')
+                side_str = "BUY" if side == 'B' else "SELL"
+                px = float(fill.get('px', 0))
+                sz = float(fill.get('sz', 0))
+                pnl = float(fill.get('closedPnl', 0))
+                print(f"   {coin} {side_str} {sz:.4f} @ ${px:,.2f} | PnL: ${pnl:,.2f}")
+    except Exception as e:
+        print(f"⚠️  User fills: {e}")
+    print()
+
+    # ==================== 12. MARKET DATA (NO RATE LIMITS!) ====================
+    print("=" * 60)
+    print("📈 12. MARKET DATA (NO RATE LIMITS!)")
+    print("=" * 60)
+
+    # All Prices
+    try:
+        prices_data = api.get_prices()
+        count = prices_data.get('count', 0)
+        prices = prices_data.get('prices', {})
+        funding = prices_data.get('funding_rates', {})
+        oi = prices_data.get('open_interest', {})
+        print(f"✅ All Prices: {count} coins")
+        print(f"   BTC: ${prices.get('BTC', 'N/A')} | Funding: {funding.get('BTC', 'N/A')} | OI: {oi.get('BTC', 'N/A')}")
+        print(f"   ETH: ${prices.get('ETH', 'N/A')} | Funding: {funding.get('ETH', 'N/A')}")
+        print(f"   SOL: ${prices.get('SOL', 'N/A')} | Funding: {funding.get('SOL', 'N/A')}")
+    except Exception as e:
+        print(f"⚠️  All prices: {e}")
+
+    # Quick Price
+    try:
+        price_data = api.get_price("BTC")
+        print(f"✅ Quick Price (BTC):")
+        print(f"   Best Bid: ${price_data.get('best_bid', 'N/A')}")
+        print(f"   Best Ask: ${price_data.get('best_ask', 'N/A')}")
+        print(f"   Mid Price: ${price_data.get('mid_price', 'N/A')}")
+        print(f"   Spread: {price_data.get('spread_bps', 'N/A')} bps")
+    except Exception as e:
+        print(f"⚠️  Quick price: {e}")
+
+    # Orderbook
+    try:
+        ob_data = api.get_orderbook("ETH")
+        levels = ob_data.get('levels', [[], []])
+        print(f"✅ Orderbook (ETH):")
+        print(f"   Best Bid: ${ob_data.get('best_bid', 'N/A')} | Best Ask: ${ob_data.get('best_ask', 'N/A')}")
+        print(f"   Spread: {ob_data.get('spread_bps', 'N/A')} bps")
+        print(f"   Depth: {len(levels[0])} bids, {len(levels[1])} asks")
+        if levels[0]:
+            top_bid = levels[0][0]
+            print(f"   Top Bid Level: ${top_bid.get('px', 'N/A')} x {top_bid.get('sz', 'N/A')} ({top_bid.get('n', 'N/A')} orders)")
+    except Exception as e:
+        print(f"⚠️  Orderbook: {e}")
+
+    # Account State
+    try:
+        test_address = "0x010461c14e146ac35fe42271bdc1134ee31c703a"
+        account_data = api.get_account(test_address)
+        margin = account_data.get('marginSummary', {})
+        positions = account_data.get('assetPositions', [])
+        print(f"✅ Account State ({test_address[:10]}...):")
+        print(f"   Account Value: ${float(margin.get('accountValue', 0)):,.2f}")
+        print(f"   Total Position: ${float(margin.get('totalNtlPos', 0)):,.2f}")
+        print(f"   Margin Used: ${float(margin.get('totalMarginUsed', 0)):,.2f}")
+        print(f"   Positions: {len(positions)}")
+        print(f"   Withdrawable: ${float(account_data.get('withdrawable', 0)):,.2f}")
+    except Exception as e:
+        print(f"⚠️  Account state: {e}")
+
+    # Fills (Hyperliquid-compatible)
+    try:
+        test_address = "0x010461c14e146ac35fe42271bdc1134ee31c703a"
+        fills = api.get_fills(test_address, limit=5)
+        print(f"✅ Fills ({test_address[:10]}...): {len(fills)} fills")
+        if fills:
+            fill = fills[0]
+            side = "BUY" if fill.get('side') == 'B' else "SELL"
+            print(f"   Latest: {fill.get('coin')} {side} {fill.get('sz')} @ ${fill.get('px')} | PnL: ${fill.get('closedPnl')}")
+    except Exception as e:
+        print(f"⚠️  Fills: {e}")
+
+    # Candles (OHLCV)
+    try:
+        candles = api.get_candles("BTC", interval="1h")
+        print(f"✅ Candles (BTC 1h): {len(candles)} candles")
+        if candles:
+            latest = candles[-1]
+            print(f"   Latest: O:${latest.get('o')} H:${latest.get('h')} L:${latest.get('l')} C:${latest.get('c')}")
+    except Exception as e:
+        print(f"⚠️  Candles: {e}")
+
+    # Test all candle symbols
+    for symbol in ["ETH", "SOL", "HYPE", "XRP"]:
+        try:
+            candles = api.get_candles(symbol, interval="1h")
+            if candles:
+                print(f"   ✅ {symbol}: {len(candles)} candles, close: ${candles[-1].get('c')}")
+        except Exception as e:
+            print(f"   ⚠️  {symbol}: {e}")
+
+    print()
+
+    # ==================== 13. HLP (HYPERLIQUIDITY PROVIDER) ====================
+    print("=" * 60)
+    print("🏦 13. HLP (HYPERLIQUIDITY PROVIDER)")
+    print("=" * 60)
+
+    # HLP Positions
+    try:
+        hlp_data = api.get_hlp_positions(include_strategies=False)
+        if isinstance(hlp_data, dict):
+            summary = hlp_data.get('summary', {})
+            total_value = summary.get('total_account_value', 0)
+            total_positions = summary.get('total_positions', 0)
+            net_exposure = summary.get('net_exposure_delta', 0)
+            print(f"✅ HLP Positions:")
+            print(f"   Total Account Value: ${total_value:,.0f}")
+            print(f"   Total Positions: {total_positions}")
+            print(f"   Net Exposure Delta: ${net_exposure:,.0f}")
+
+            combined = hlp_data.get('combined_positions', [])
+            if combined:
+                print(f"   Top Combined Net Positions:")
+                for pos in combined[:3]:
+                    coin = pos.get('coin', '?')
+                    net_size = pos.get('net_size', 0)
+                    net_value = pos.get('net_value', 0)
+                    direction = "LONG" if net_size > 0 else "SHORT"
+                    print(f"      {coin} NET {direction}: {abs(net_size):.4f} (${abs(net_value):,.0f})")
+    except Exception as e:
+        print(f"⚠️  HLP positions: {e}")
+
+    # HLP Trade Stats
+    try:
+        trade_stats = api.get_hlp_trade_stats()
+        if isinstance(trade_stats, dict):
+            total_trades = trade_stats.get('total_trades', 0)
+            total_volume = trade_stats.get('total_volume', 0)
+            total_fees = trade_stats.get('total_fees', 0)
+            print(f"✅ HLP Trade Stats:")
+            print(f"   Total Trades: {total_trades:,}")
+            print(f"   Total Volume: ${total_volume:,.2f}")
+            print(f"   Total Fees: ${total_fees:,.2f}")
+    except Exception as e:
+        print(f"⚠️  HLP trade stats: {e}")
+
+    # HLP Trades
+    try:
+        trades = api.get_hlp_trades(limit=5)
+        if isinstance(trades, dict):
+            trade_list = trades.get('trades', [])
+            total = trades.get('total', len(trade_list))
+            print(f"✅ HLP Trades: {total:,} total, showing {len(trade_list)}")
+            for t in trade_list[:3]:
+                coin = t.get('coin', '?')
+                side = t.get('side', '?')
+                sz = float(t.get('sz', 0))
+                px = float(t.get('px', 0))
+                print(f"      {coin} {'BUY' if side == 'B' else 'SELL'} {sz:.4f} @ ${px:,.2f}")
+    except Exception as e:
+        print(f"⚠️  HLP trades: {e}")
+
+    # HLP Liquidators
+    try:
+        liquidators = api.get_hlp_liquidators()
+        if isinstance(liquidators, dict):
+            liq_list = liquidators.get('liquidators', [])
+            events = liquidators.get('events', [])
+            active = sum(1 for l in liq_list if l.get('status') == 'active')
+            print(f"✅ HLP Liquidators: {active}/{len(liq_list)} active, {len(events)} events")
+    except Exception as e:
+        print(f"⚠️  HLP liquidators: {e}")
+
+    # HLP Deltas
+    try:
+        deltas = api.get_hlp_deltas(hours=24)
+        if isinstance(deltas, dict):
+            current = deltas.get('current', 0)
+            change = deltas.get('change_24h', 0)
+            delta_list = deltas.get('deltas', [])
+            print(f"✅ HLP Deltas: Current ${current:,.0f}, 24h change ${change:,.0f}, {len(delta_list)} data points")
+    except Exception as e:
+        print(f"⚠️  HLP deltas: {e}")
+
+    print()
+
+    # ==================== 14. MULTI-EXCHANGE LIQUIDATIONS ====================
+    print("=" * 60)
+    print("🔥 14. MULTI-EXCHANGE LIQUIDATIONS")
+    print("=" * 60)
+
+    # Combined All Exchange Stats
+    try:
+        stats = api.get_all_liquidation_stats()
+        if isinstance(stats, dict):
+            total_count = stats.get('total_count', stats.get('count', 0))
+            total_volume = stats.get('total_volume', stats.get('total_value_usd', 0))
+            print(f"✅ Combined All Exchanges:")
+            print(f"   Total Count: {total_count:,}")
+            print(f"   Total Volume: ${total_volume:,.0f}")
+            by_exchange = stats.get('by_exchange', {})
+            if by_exchange:
+                print(f"   By Exchange:")
+                for ex, ex_stats in by_exchange.items():
+                    if isinstance(ex_stats, dict):
+                        ex_count = ex_stats.get('count', 0)
+                        ex_vol = ex_stats.get('volume', 0)
+                        print(f"      {ex}: {ex_count:,} liqs | ${ex_vol:,.0f}")
+    except Exception as e:
+        print(f"⚠️  All liquidation stats: {e}")
+
+    # Per-exchange liquidations (1h sample)
+    exchanges = [
+        ("Binance", api.get_binance_liquidations),
+        ("Bybit", api.get_bybit_liquidations),
+        ("OKX", api.get_okx_liquidations),
+    ]
+    for name, func in exchanges:
+        try:
+            data = func("1h")
+            if isinstance(data, list):
+                print(f"✅ {name} 1h: {len(data)} liquidations")
+            elif isinstance(data, dict):
+                liq_list = data.get('liquidations', data.get('data', []))
+                print(f"✅ {name} 1h: {len(liq_list)} liquidations")
+        except Exception as e:
+            print(f"⚠️  {name} 1h: {e}")
+
+    print()
+
+    # ==================== LATENCY BUDGET ====================
+    print("=" * 60)
+    print("📊 WHERE THE TIME WENT (top 10 endpoints)")
+    print("=" * 60)
+    for endpoint, m in list(api.metrics().items())[:10]:
+        total = m['phases'].get('total', {})
+        decode = m['phases'].get('decode', {})
+        print(f"   {endpoint:<45} {m['requests']:>3}x  avg {total.get('mean_ms', 0):7.1f}ms"
+              f"  p95 {total.get('p95_ms', 0):7.1f}ms  decode {decode.get('mean_ms', 0):6.1f}ms"
+              f"  {m['avg_bytes'] / 1024:8.1f}KB")
+
+    print()
+
+    if profiler:
+        profiler.complete("test_all", run_start, time.perf_counter())
+        profiler.save()
+
+    print("=" * 60)
+    print("🌙 Moon Dev API Test Complete! 🚀")
+    print("=" * 60)
+
@@ -0,0 +1,216 @@
+"""
+🌙 Moon Dev's Tracing
+Request hook context, a Chrome-trace profiler and an OpenTelemetry adapter
+
+Built with love by Moon Dev 🚀
+"""
+
+import os
+import json
+import time
+import threading
+import contextlib
+
+HOOK_EVENTS = ("before_request", "after_response", "on_error", "on_decode")
+
+
+class RequestContext:
+    """Timing context handed to every request hook"""
+
+    __slots__ = ("api_method", "http_method", "url", "endpoint", "expects_json", "start",
+                 "wall_start_ns", "thread_id", "phases", "status", "bytes", "retries",
+                 "decode_ms", "error", "data")
+
+    def __init__(self, api_method, http_method, url, endpoint, expects_json=False):
+        self.api_method = api_method      # e.g. "get_price"
+        self.http_method = http_method    # "GET" / "POST"
+        self.url = url
+        self.endpoint = endpoint          # template, e.g. "/api/price/{coin}"
+        self.expects_json = expects_json  # an on_decode will follow a good response
+        self.start = time.perf_counter()
+        self.wall_start_ns = time.time_ns()
+        self.thread_id = threading.get_ident()
+        self.phases = {}
+        self.status = None
+        self.bytes = 0
+        self.retries = 0
+        self.decode_ms = None
+        self.error = None
+        self.data = {}
+
+    def elapsed_ms(self):
+        return (time.perf_counter() - self.start) * 1000
+
+    @property
+    def name(self):
+        return self.api_method or self.endpoint
+
+
+class _SpanHooks:
+    """Base for hook sets that open something at before_request and close it once per request"""
+
+    def install(self, api):
+        api.add_hook("before_request", self.before_request)
+        api.add_hook("after_response", self.after_response)
+        api.add_hook("on_decode", self._finish)
+        api.add_hook("on_error", self._finish)
+        return self
+
+    def uninstall(self, api):
+        for event, fn in (("before_request", self.before_request), ("after_response", self.after_response),
+                          ("on_decode", self._finish), ("on_error", self._finish)):
+            api.remove_hook(event, fn)
+
+    def before_request(self, ctx):
+        ctx.data[self] = True
+
+    def after_response(self, ctx):
+        if not ctx.expects_json:
+            self._finish(ctx)
+
+    def _finish(self, ctx):
+        if ctx.data.pop(self, None) is not None:
+            self.finish(ctx)
+
+    def finish(self, ctx):
+        raise NotImplementedError
+
+
+class TraceProfiler(_SpanHooks):
+    """
+    🌙 Moon Dev's Trace Profiler
+
+    Records API calls (with dns/connect/ttfb/download/decode children) and
+    your own spans as Chrome trace events. Open the JSON in
+    https://ui.perfetto.dev, chrome://tracing or speedscope for a flame graph.
+
+        profiler = TraceProfiler().install(api)
+        with profiler.span("refresh"):
+            api.get_positions()
+        profiler.save("trace.json")
+
+    Set MOONDEV_TRACE=trace.json to get one from test_all() or the Director.
+    """
+
+    def __init__(self):
+        self.origin = time.perf_counter()
+        self.events = []
+        self._threads = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls, api=None):
+        """Installed profiler if MOONDEV_TRACE is set, else None"""
+        path = os.getenv("MOONDEV_TRACE")
+        if not path:
+            return None
+        profiler = cls()
+        profiler.path = path
+        return profiler.install(api) if api is not None else profiler
+
+    def _tid(self):
+        ident = threading.get_ident()
+        tid = self._threads.get(ident)
+        if tid is None:
+            with self._lock:
+                tid = self._threads.setdefault(ident, len(self._threads) + 1)
+            self.events.append({"ph": "M", "name": "thread_name", "pid": 1, "tid": tid,
+                                "args": {"name": threading.current_thread().name}})
+        return tid
+
+    def _us(self, t):
+        return (t - self.origin) * 1e6
+
+    def complete(self, name, start, end, cat="app", tid=None, **args):
+        """Record a finished span (perf_counter start/end)"""
+        self.events.append({"ph": "X", "name": name, "cat": cat, "pid": 1, "tid": tid or self._tid(),
+                            "ts": self._us(start), "dur": (end - start) * 1e6, "args": args})
+
+    def instant(self, name, **args):
+        """Record a point-in-time marker"""
+        self.events.append({"ph": "i", "s": "t", "name": name, "pid": 1, "tid": self._tid(),
+                            "ts": self._us(time.perf_counter()), "args": args})
+
+    @contextlib.contextmanager
+    def span(self, name, **args):
+        """Time a block of your own code"""
+        start = time.perf_counter()
+        try:
+            yield self
+        finally:
+            self.complete(name, start, time.perf_counter(), **args)
+
+    def finish(self, ctx):
+        tid = self._tid()
+        total_ms = ctx.phases.get("total", ctx.elapsed_ms())
+        decode_ms = ctx.decode_ms or 0.0
+        self.complete(ctx.name, ctx.start, ctx.start + (total_ms + decode_ms) / 1000, cat="api", tid=tid,
+                      endpoint=ctx.endpoint, status=ctx.status, bytes=ctx.bytes,
+                      error=repr(ctx.error) if ctx.error else None)
+        at = ctx.start
+        phases = [(p, ctx.phases.get(p)) for p in ("dns", "connect", "ttfb", "download")]
+        phases.append(("decode", ctx.decode_ms))
+        for phase, ms in phases:
+            if ms:
+                self.complete(phase, at, at + ms / 1000, cat="phase", tid=tid)
+                at += ms / 1000
+
+    def save(self, path=None):
+        """Write the Chrome trace JSON and return its path"""
+        path = path or getattr(self, "path", None) or "moondev_trace.json"
+        with open(path, "w") as f:
+            json.dump({"traceEvents": self.events, "displayTimeUnit": "ms"}, f)
+        print(f"🔭 Moon Dev: trace with {len(self.events)} events written to {path}")
+        return path
+
+    def reset(self):
+        self.events = [e for e in self.events if e["ph"] == "M"]
+
+
+class OpenTelemetryHooks(_SpanHooks):
+    """
+    🌙 Moon Dev's OpenTelemetry adapter
+
+    One CLIENT span per API call, parented to whatever span is current
+    (so Director/dashboard spans nest naturally). Needs opentelemetry-api:
+
+        pip install opentelemetry-api opentelemetry-sdk
+        OpenTelemetryHooks().install(api)
+    """
+
+    def __init__(self, tracer=None):
+        try:
+            from opentelemetry import trace
+        except ImportError as e:
+            raise ImportError("OpenTelemetryHooks needs opentelemetry-api (pip install opentelemetry-api)") from e
+        self._trace = trace
+        self.tracer = tracer or trace.get_tracer("moondev.api")
+
+    def before_request(self, ctx):
+        ctx.data[self] = self.tracer.start_span(
+            f"moondev {ctx.name}",
+            kind=self._trace.SpanKind.CLIENT,
+            start_time=ctx.wall_start_ns,
+            attributes={"http.request.method": ctx.http_method, "url.full": ctx.url,
+                        "moondev.endpoint": ctx.endpoint},
+        )
+
+    def _finish(self, ctx):
+        span = ctx.data.pop(self, None)
+        if span is None:
+            return
+        if ctx.status is not None:
+            span.set_attribute("http.response.status_code", ctx.status)
+            span.set_attribute("http.response.body.size", ctx.bytes)
+        for phase, ms in ctx.phases.items():
+            span.set_attribute(f"moondev.{phase}_ms", ms)
+        if ctx.decode_ms is not None:
+            span.set_attribute("moondev.decode_ms", ctx.decode_ms)
+        if ctx.retries:
+            span.set_attribute("http.request.resend_count", ctx.retries)
+        if ctx.error is not None:
+            span.record_exception(ctx.error)
+            span.set_status(self._trace.Status(self._trace.StatusCode.ERROR, str(ctx.error)))
+        total_ms = ctx.phases.get("total", ctx.elapsed_ms()) + (ctx.decode_ms or 0.0)
+        span.end(end_time=ctx.wall_start_ns + int(total_ms * 1e6))
+
@@ -0,0 +1,95 @@
+"""
+🌙 Moon Dev's HTTP Transport
+requests session whose connections time their DNS lookup and connect
+
+Built with love by Moon Dev 🚀
+
+Imported on the first request (it pulls in requests + urllib3), not when
+`api` is imported.
+"""
+
+import time
+import socket
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+from api.metrics import phase_local
+
+RETRY_STATUSES = (502, 503, 504)
+
+
+class _TimedConnectionMixin:
+    """Records DNS and connect (incl. TLS) time of new connections on the current thread"""
+
+    def _new_conn(self):
+        start = time.perf_counter()
+        host = self._dns_host
+        try:
+            infos = socket.getaddrinfo(host, self.port, 0, socket.SOCK_STREAM)
+        except OSError:
+            infos = None  # let urllib3 raise its own NameResolutionError
+        phase_local.dns = getattr(phase_local, "dns", 0.0) + time.perf_counter() - start
+        if not infos:
+            return super()._new_conn()
+        self._dns_host = infos[0][4][0]
+        try:
+            return super()._new_conn()
+        except Exception:
+            self._dns_host = host
+            return super()._new_conn()
+        finally:
+            self._dns_host = host
+
+    def connect(self):
+        start = time.perf_counter()
+        dns_before = getattr(phase_local, "dns", 0.0)
+        try:
+            super().connect()
+        finally:
+            dns = getattr(phase_local, "dns", 0.0) - dns_before
+            elapsed = time.perf_counter() - start - dns
+            phase_local.connect = getattr(phase_local, "connect", 0.0) + elapsed
+
+
+class _TimedHTTPConnection(_TimedConnectionMixin, HTTPConnection):
+    pass
+
+
+class _TimedHTTPSConnection(_TimedConnectionMixin, HTTPSConnection):
+    pass
+
+
+class _TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _TimedHTTPConnection
+
+
+class _TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _TimedHTTPSConnection
+
+
+class _TimedAdapter(HTTPAdapter):
+    """HTTPAdapter whose pools use the timed connection classes"""
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _TimedHTTPConnectionPool,
+            "https": _TimedHTTPSConnectionPool,
+        }
+
+
+
+def new_session(retries=0):
+    """requests.Session with timed connections and urllib3 retries on 502/503/504"""
+    session = requests.Session()
+    adapter = _TimedAdapter(max_retries=Retry(
+        total=retries, backoff_factor=0.3, status_forcelist=RETRY_STATUSES,
+        allowed_methods=None, raise_on_status=False,
+    ))
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
@@ -0,0 +1,137 @@
+"""
+🌙 Moon Dev's Sorted Views
+Keep "top N by X" lists ordered across polls without re-sorting
+
+Built with love by Moon Dev 🚀
+
+Used by the live dashboards (api/live.py) and the position index
+(analytics/positions.py). No third-party imports, so it is cheap to load.
+"""
+
+import bisect
+
+
+class SortedView:
+    """
+    🌙 Moon Dev's Sorted View
+
+    Items kept sorted by sort_key across snapshots. sync() applies a new
+    snapshot by diffing against the last one: unchanged items cost a dict
+    lookup, moved items a bisect remove + insert.
+
+        view = SortedView(sort_key=lambda p: p["distance_pct"],
+                          item_key=lambda p: (p["address"], p["coin"]))
+        view.sync(positions)          # every poll
+        riskiest = view.top(25)
+    """
+
+    def __init__(self, sort_key, item_key, reverse=False):
+        """
+        Args:
+            sort_key: fn(item) -> orderable value to sort by
+            item_key: fn(item) -> hashable, orderable identity (address, coin...)
+            reverse: Largest first
+        """
+        self.sort_key = sort_key
+        self.item_key = item_key
+        self.reverse = reverse
+        self._order = []        # sorted [(sort value, identity)]
+        self._items = {}        # identity -> (sort value, item)
+
+    def __len__(self):
+        return len(self._order)
+
+    def __contains__(self, ident):
+        return ident in self._items
+
+    def __iter__(self):
+        order = reversed(self._order) if self.reverse else self._order
+        items = self._items
+        return (items[ident][1] for _, ident in order)
+
+    def get(self, ident, default=None):
+        entry = self._items.get(ident)
+        return default if entry is None else entry[1]
+
+    def load(self, items):
+        """Replace the contents with items in one sort (faster than upserting into an empty view)"""
+        sort_key, item_key = self.sort_key, self.item_key
+        self._items = {item_key(item): (sort_key(item), item) for item in items}
+        self._order = sorted((value, ident) for ident, (value, _) in self._items.items())
+
+    def upsert(self, item):
+        """Add or update one item; returns True if anything changed"""
+        ident = self.item_key(item)
+        value = self.sort_key(item)
+        old = self._items.get(ident)
+        if old is not None:
+            if old[1] == item:
+                return False
+            if old[0] != value:
+                self._remove_entry(old[0], ident)
+                bisect.insort(self._order, (value, ident))
+        else:
+            bisect.insort(self._order, (value, ident))
+        self._items[ident] = (value, item)
+        return True
+
+    def remove(self, ident):
+        """Drop an item by identity; returns True if it was there"""
+        old = self._items.pop(ident, None)
+        if old is None:
+            return False
+        self._remove_entry(old[0], ident)
+        return True
+
+    def _remove_entry(self, value, ident):
+        i = bisect.bisect_left(self._order, (value, ident))
+        del self._order[i]
+
+    def sync(self, items):
+        """
+        Make the view match a full snapshot.
+
+        Returns:
+            (changed, removed) counts - (0, 0) means the order is untouched
+        """
+        seen = set()
+        changed = 0
+        for item in items:
+            seen.add(self.item_key(item))
+            if self.upsert(item):
+                changed += 1
+        gone = [ident for ident in self._items if ident not in seen] if len(seen) != len(self._items) else []
+        for ident in gone:
+            self.remove(ident)
+        return changed, len(gone)
+
+    def top(self, n):
+        """First n items in view order"""
+        items = self._items
+        if self.reverse:
+            entries = self._order[:-n - 1:-1] if n else []
+        else:
+            entries = self._order[:n]
+        return [items[ident][1] for _, ident in entries]
+
+    def _span(self, lo, hi):
+        # (value,) sorts before every (value, identity) entry with that value
+        order = self._order
+        start = 0 if lo is None else bisect.bisect_left(order, (lo,))
+        stop = len(order) if hi is None else bisect.bisect_left(order, (hi,))
+        return start, max(start, stop)
+
+    def count_between(self, lo=None, hi=None):
+        """Items with lo <= sort value < hi, in O(log n) (None = unbounded)"""
+        start, stop = self._span(lo, hi)
+        return stop - start
+
+    def between(self, lo=None, hi=None):
+        """Items with lo <= sort value < hi, smallest sort value first"""
+        start, stop = self._span(lo, hi)
+        items = self._items
+        return [items[ident][1] for _, ident in self._order[start:stop]]
+
+    def clear(self):
+        self._order.clear()
+        self._items.clear()
@@ -0,0 +1,305 @@
+"""
+🌙 Moon Dev's Client Benchmarks
+Reproducible numbers for the MoonDevAPI hot paths, run against the replay server
+
+Built with love by Moon Dev 🚀
+
+Usage:
+    python benchmarks/bench_client.py                    # run + compare to baseline
+    python benchmarks/bench_client.py --save-baseline    # make this run the baseline
+    python benchmarks/bench_client.py --only decode      # just the matching benchmarks
+    python benchmarks/bench_client.py --fail-on-regression --threshold 1.25   # for CI
+
+What gets measured:
+    get_cold/*      new client per call (fresh TCP connection + request)
+    get_warm/*      one client, keep-alive session
+    decode/*        json.loads of the big payloads (positions/all, fills -1, ticks 10k)
+    fanout/cN       get_price for every symbol with N worker threads
+    analytics/*     fill stats (examples/11) and orderbook metrics
+
+Fixtures come from replay/fixtures if you recorded any, otherwise a
+synthetic set is generated into a temp folder (fixed seed, so runs are
+comparable). Results are written as JSON to benchmarks/results/latest.json;
+each benchmark's median is compared to benchmarks/baseline.json.
+"""
+
+import os
+import io
+import sys
+import json
+import time
+import argparse
+import platform
+import shutil
+import tempfile
+import statistics
+import importlib.util
+import contextlib
+from concurrent.futures import ThreadPoolExecutor
+
+# Add parent directory to path for the api package
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from api import MoonDevAPI
+from replay.fixtures import FixtureStore, DEFAULT_FIXTURES_DIR
+from replay.server import ReplayServer
+from replay import synthetic
+
+# ============================================
+# 🎯 BENCHMARK CONFIGURATION - Moon Dev
+# ============================================
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_BASELINE = os.path.join(BENCH_DIR, "baseline.json")
+DEFAULT_RESULTS = os.path.join(BENCH_DIR, "results", "latest.json")
+
+DEFAULT_REPEAT = 30           # timed runs per benchmark
+DEFAULT_WARMUP = 3            # untimed runs first
+DEFAULT_THRESHOLD = 1.25      # median slower than baseline x this = regression
+FANOUT_CONCURRENCY = [1, 4, 16, 32]
+
+SAMPLE_ADDRESS = synthetic.SAMPLE_ADDRESS
+
+# ============================================
+
+
+def load_example(filename):
+    """Import an example script by file name (they start with digits)"""
+    path = os.path.join(ROOT, "examples", filename)
+    spec = importlib.util.spec_from_file_location(filename[:-3].lstrip("0123456789_"), path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def orderbook_metrics(book, depth=10):
+    """Spread, mid and top-of-book imbalance for an orderbook payload"""
+    bids, asks = book.get("levels", [[], []])[:2]
+    bid_px = [float(l["px"]) for l in bids[:depth]]
+    ask_px = [float(l["px"]) for l in asks[:depth]]
+    bid_sz = sum(float(l["sz"]) for l in bids[:depth])
+    ask_sz = sum(float(l["sz"]) for l in asks[:depth])
+    best_bid, best_ask = bid_px[0], ask_px[0]
+    mid = (best_bid + best_ask) / 2
+    return {
+        "mid": mid,
+        "spread_bps": (best_ask - best_bid) / mid * 10000,
+        "bid_notional": sum(p * float(l["sz"]) for p, l in zip(bid_px, bids)),
+        "ask_notional": sum(p * float(l["sz"]) for p, l in zip(ask_px, asks)),
+        "imbalance": (bid_sz - ask_sz) / (bid_sz + ask_sz) if bid_sz + ask_sz else 0.0,
+    }
+
+
+def time_it(fn, repeat=DEFAULT_REPEAT, warmup=DEFAULT_WARMUP):
+    """Run fn warmup+repeat times, return per-run seconds for the timed runs"""
+    for _ in range(warmup):
+        fn()
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def summarize(samples, items=None):
+    """ms stats for a list of run times (plus items/sec when given)"""
+    ordered = sorted(samples)
+    result = {
+        "runs": len(samples),
+        "min_ms": ordered[0] * 1000,
+        "median_ms": statistics.median(ordered) * 1000,
+        "p95_ms": ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * 1000,
+        "mean_ms": statistics.fmean(ordered) * 1000,
+    }
+    if items:
+        result["items_per_sec"] = items / statistics.median(ordered)
+    return result
+
+
+class ClientBenchmarks:
+    """
+    🌙 Moon Dev's Client Benchmarks
+
+    Every bench_* method returns {name: samples} (or {name: (samples, items)}).
+    """
+
+    def __init__(self, server, repeat=DEFAULT_REPEAT, warmup=DEFAULT_WARMUP):
+        self.server = server
+        self.repeat = repeat
+        self.warmup = warmup
+        self.api = MoonDevAPI(api_key="bench", base_url=server.url)
+
+    def _new_client(self):
+        return MoonDevAPI(api_key="bench", base_url=self.server.url)
+
+    def _raw(self, path):
+        """Raw response body for a path (for decode benchmarks)"""
+        return self.api._get(path).content
+
+    def bench_get_cold(self):
+        def cold(path):
+            def run():
+                client = self._new_client()
+                client._get(path, auth_required=False)
+                client.session.close()
+            return run
+        return {
+            "get_cold/health": time_it(cold("/health"), self.repeat, self.warmup),
+            "get_cold/price": time_it(cold("/api/price/BTC"), self.repeat, self.warmup),
+        }
+
+    def bench_get_warm(self):
+        api = self.api
+        return {
+            "get_warm/health": time_it(lambda: api._get("/health", auth_required=False), self.repeat, self.warmup),
+            "get_warm/price": time_it(lambda: api.get_price("BTC"), self.repeat, self.warmup),
+            "get_warm/positions": time_it(api.get_positions, self.repeat, self.warmup),
+            "get_warm/all_positions": time_it(api.get_all_positions, max(5, self.repeat // 3), 1),
+        }
+
+    def bench_decode(self):
+        payloads = {
+            "decode/all_positions": self._raw("/api/positions/all.json"),
+            "decode/fills_all": self._raw(f"/api/user/{SAMPLE_ADDRESS}/fills?limit=-1"),
+            "decode/ticks_10k": self._raw("/api/ticks/BTC?duration=1h&limit=10000"),
+        }
+        results = {}
+        for name, body in payloads.items():
+            results[name] = time_it(lambda body=body: json.loads(body), self.repeat, self.warmup)
+        return results
+
+    def bench_fanout(self):
+        symbols = synthetic.SYMBOLS
+        results = {}
+        for workers in FANOUT_CONCURRENCY:
+            def run(workers=workers):
+                with ThreadPoolExecutor(max_workers=workers) as pool:
+                    list(pool.map(self.api.get_price, symbols))
+            results[f"fanout/c{workers}"] = (time_it(run, max(5, self.repeat // 3), 1), len(symbols))
+        return results
+
+    def bench_analytics(self):
+        fills_module = load_example("11_user_fills.py")
+        fills = self.api.get_user_fills(SAMPLE_ADDRESS, limit=-1)["fills"]
+        book = self.api.get_orderbook("BTC")
+        return {
+            "analytics/fill_stats": (time_it(lambda: fills_module.calculate_fill_stats(fills),
+                                             self.repeat, self.warmup), len(fills)),
+            "analytics/orderbook_metrics": time_it(lambda: orderbook_metrics(book),
+                                                   self.repeat * 10, self.warmup),
+        }
+
+    def run(self, only=None):
+        """Run every benchmark group whose name contains `only` (all if None)"""
+        results = {}
+        groups = [name for name in dir(self) if name.startswith("bench_")]
+        for group in groups:
+            if only and only not in group:
+                continue
+            print(f"⏱️  {group[6:]}...")
+            # The client narrates every call - keep that out of the timings' output
+            with contextlib.redirect_stdout(io.StringIO()):
+                raw = getattr(self, group)()
+            for name, value in raw.items():
+                samples, items = value if isinstance(value, tuple) else (value, None)
+                results[name] = summarize(samples, items)
+        return results
+
+
+def compare(results, baseline, threshold=DEFAULT_THRESHOLD):
+    """
+    Compare medians to a baseline.
+
+    Returns:
+        list of (name, baseline_ms, current_ms, ratio, status)
+    """
+    rows = []
+    for name, stats in sorted(results.items()):
+        base = baseline.get("results", {}).get(name)
+        if base is None:
+            rows.append((name, None, stats["median_ms"], None, "new"))
+            continue
+        ratio = stats["median_ms"] / base["median_ms"] if base["median_ms"] else 1.0
+        status = "REGRESSION" if ratio > threshold else "faster" if ratio < 1 / threshold else "ok"
+        rows.append((name, base["median_ms"], stats["median_ms"], ratio, status))
+    return rows
+
+
+def print_report(rows):
+    print(f"\n{'benchmark':<32}{'baseline':>12}{'current':>12}{'ratio':>9}  status")
+    print("-" * 75)
+    for name, base, current, ratio, status in rows:
+        base_s = f"{base:.3f}ms" if base is not None else "-"
+        ratio_s = f"{ratio:.2f}x" if ratio is not None else "-"
+        marker = "🔴" if status == "REGRESSION" else "🟢" if status == "faster" else "  "
+        print(f"{name:<32}{base_s:>12}{current:>10.3f}ms{ratio_s:>9}  {marker}{status}")
+
+
+def fixture_dir():
+    """Recorded fixtures if present, else a fresh synthetic set"""
+    if FixtureStore(DEFAULT_FIXTURES_DIR).keys():
+        return DEFAULT_FIXTURES_DIR, "recorded"
+    path = tempfile.mkdtemp(prefix="moondev_bench_")
+    synthetic.generate(FixtureStore(path), seed=0, now_ms=1_700_000_000_000)
+    return path, "synthetic"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="🌙 Moon Dev's client benchmarks")
+    parser.add_argument("--fixtures", help="Fixtures folder (default: recorded, else synthetic)")
+    parser.add_argument("--only", help="Only run groups matching this (get_cold, get_warm, decode, fanout, analytics)")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    parser.add_argument("--latency", type=float, default=0.0, help="Replay server latency in ms")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--out", default=DEFAULT_RESULTS)
+    parser.add_argument("--save-baseline", action="store_true", help="Store this run as the baseline")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    parser.add_argument("--fail-on-regression", action="store_true", help="Exit 1 on any regression")
+    args = parser.parse_args(argv)
+
+    fixtures, source = (args.fixtures, "custom") if args.fixtures else fixture_dir()
+    print(f"🌙 Moon Dev benchmarks - {source} fixtures ({fixtures})")
+
+    try:
+        with ReplayServer(fixtures, port=0, latency_ms=args.latency, seed=0) as server:
+            results = ClientBenchmarks(server, repeat=args.repeat).run(args.only)
+    finally:
+        if source == "synthetic":
+            shutil.rmtree(fixtures, ignore_errors=True)
+
+    report = {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "machine": f"{platform.system()} {platform.machine()}",
+        "fixtures": source,
+        "latency_ms": args.latency,
+        "results": results,
+    }
+    os.makedirs(os.path.dirname(os.path.abspath(args.out)), exist_ok=True)
+    with open(args.out, "w") as f:
+        json.dump(report, f, indent=2, sort_keys=True)
+    print(f"💾 Results: {args.out}")
+
+    if args.save_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+        print(f"📌 Baseline saved: {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print("ℹ️  No baseline yet - run with --save-baseline to store one")
+        return 0
+
+    with open(args.baseline) as f:
+        rows = compare(results, json.load(f), args.threshold)
+    print_report(rows)
+    regressions = [r for r in rows if r[4] == "REGRESSION"]
+    if regressions:
+        print(f"\n🔴 {len(regressions)} regression(s) over {args.threshold:.2f}x")
+    return 1 if regressions and args.fail_on_regression else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
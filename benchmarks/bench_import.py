@@ -0,0 +1,133 @@
+"""
+🌙 Moon Dev's Import-Time Benchmark
+How long does it take before a script can make its first call?
+
+Built with love by Moon Dev 🚀
+
+Usage:
+    python benchmarks/bench_import.py              # table of scenarios
+    python benchmarks/bench_import.py --top 15     # + slowest modules per scenario
+    python benchmarks/bench_import.py --check      # exit 1 if a scenario blows its budget
+    python benchmarks/bench_import.py --json out.json
+
+Each scenario runs in a fresh interpreter under `python -X importtime`,
+several times. "imports" is the summed cumulative time of the modules the
+scenario itself imported (interpreter start-up excluded); "wall" is the
+process run time minus an empty `python -c pass`.
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import argparse
+import statistics
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# ============================================
+# 🎯 SCENARIOS - Moon Dev
+# ============================================
+
+# name -> (code, import budget in ms or None)
+SCENARIOS = {
+    "import api": ("import api", 5),
+    "client ready": ("from api import MoonDevAPI; MoonDevAPI(api_key='x')", 40),
+    "first call ready": ("from api import MoonDevAPI; MoonDevAPI(api_key='x').session", None),
+    "session cache": ("from ai_agents.session_cache import SessionCache", 5),
+    "director module": ("import ai_agents.director_agent", None),
+}
+
+DEFAULT_RUNS = 5
+
+# ============================================
+
+IMPORTTIME_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+
+def run_importtime(code):
+    """(wall_seconds, [(self_us, cumulative_us, depth, module)]) for one fresh interpreter"""
+    start = time.perf_counter()
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", code], cwd=ROOT,
+                          capture_output=True, text=True)
+    wall = time.perf_counter() - start
+    if proc.returncode != 0:
+        raise RuntimeError(f"{code!r} failed:\n{proc.stderr[-2000:]}")
+    rows = []
+    for line in proc.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            self_us, cum_us, indent, module = match.groups()
+            rows.append((int(self_us), int(cum_us), len(indent) // 2, module))
+    return wall, rows
+
+
+def measure(code, startup_modules, runs=DEFAULT_RUNS):
+    """Median import ms, wall ms and the per-module rows of the median run"""
+    samples = []
+    for _ in range(runs):
+        wall, rows = run_importtime(code)
+        imports_us = sum(cum for _, cum, depth, module in rows
+                         if depth == 0 and module not in startup_modules)
+        samples.append((imports_us / 1000, wall * 1000, rows))
+    samples.sort(key=lambda s: s[0])
+    return samples[len(samples) // 2]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="🌙 Moon Dev's import-time benchmark")
+    parser.add_argument("--runs", type=int, default=DEFAULT_RUNS)
+    parser.add_argument("--top", type=int, default=0, help="Show the N slowest modules per scenario")
+    parser.add_argument("--json", help="Write results to this file")
+    parser.add_argument("--check", action="store_true", help="Exit 1 if a scenario exceeds its budget")
+    args = parser.parse_args(argv)
+
+    empty_walls, startup_modules = [], set()
+    for _ in range(args.runs):
+        wall, rows = run_importtime("pass")
+        empty_walls.append(wall * 1000)
+        startup_modules.update(module for _, _, _, module in rows)
+    empty_wall = statistics.median(empty_walls)
+
+    print(f"🌙 Moon Dev import benchmark - python {sys.version.split()[0]}, "
+          f"empty interpreter {empty_wall:.1f}ms\n")
+    print(f"{'scenario':<20}{'imports':>10}{'wall':>10}{'budget':>9}  code")
+    print("-" * 90)
+
+    results, over = {}, []
+    for name, (code, budget) in SCENARIOS.items():
+        imports_ms, wall_ms, rows = measure(code, startup_modules, args.runs)
+        wall_ms = max(wall_ms - empty_wall, 0.0)
+        ok = budget is None or imports_ms <= budget
+        if not ok:
+            over.append(name)
+        budget_s = f"{budget}ms" if budget is not None else "-"
+        print(f"{name:<20}{imports_ms:>8.1f}ms{wall_ms:>8.1f}ms{budget_s:>9}  {'' if ok else '🔴 '}{code}")
+
+        slowest = sorted((r for r in rows if r[3] not in startup_modules), key=lambda r: -r[0])[:args.top]
+        for self_us, cum_us, _, module in slowest:
+            print(f"{'':<20}   {self_us / 1000:7.2f}ms self {cum_us / 1000:8.2f}ms cum  {module}")
+
+        results[name] = {
+            "code": code,
+            "imports_ms": imports_ms,
+            "wall_ms": wall_ms,
+            "budget_ms": budget,
+            "modules": len([r for r in rows if r[3] not in startup_modules]),
+        }
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"python": sys.version.split()[0], "empty_wall_ms": empty_wall,
+                       "results": results}, f, indent=2)
+        print(f"\n💾 Results: {args.json}")
+
+    if over:
+        print(f"\n🔴 Over budget: {', '.join(over)}")
+    return 1 if over and args.check else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -12,6 +12,8 @@ Usage:
   python 02_positions.py ETH          # ETH positions only (620 positions, $2.7B)
   python 02_positions.py HYPE         # HYPE positions only (386 positions, $528M)
   python 02_positions.py --list       # Show all 148 available symbols
+  python 02_positions.py --live       # Wallboard: keeps refreshing (every 5s)
+  python 02_positions.py BTC --live 10   # Live BTC view, refresh every 10s
 """
 
 import sys
@@ -21,6 +23,8 @@ from datetime import datetime
 # Add parent directory to path to import api.py
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from api import MoonDevAPI
+from api.live import LiveDashboard
+from analytics.positions import PositionIndex
 
 from rich.console import Console
 from rich.table import Table
@@ -115,7 +119,7 @@ def get_risk_color(distance_pct):
         return "green"
 
 
-def create_positions_table(positions_data):
+def create_positions_table(positions_data, index=None):
     """Create a beautiful table of positions"""
     table = Table(
         title="🐋 Whale Positions Near Liquidation 🐋",
@@ -136,37 +140,23 @@ def create_positions_table(positions_data):
     table.add_column("⚠️ Dist%", justify="center")
     table.add_column("📈 PnL", justify="right")
 
-    # Combine longs and shorts from the API response
-    all_positions = []
+    # Longs and shorts sorted by distance_pct (closest to liquidation first = highest risk)
+    index = index or PositionIndex.from_positions(positions_data)
+    riskiest = index.riskiest(25)  # Show top 25 riskiest positions
 
-    if isinstance(positions_data, dict):
-        longs = positions_data.get('longs', [])
-        shorts = positions_data.get('shorts', [])
-
-        # Add side info to each position
-        for pos in longs:
-            pos['side'] = 'LONG'
-            all_positions.append(pos)
-        for pos in shorts:
-            pos['side'] = 'SHORT'
-            all_positions.append(pos)
-
-    # Sort by distance_pct (closest to liquidation first = highest risk)
-    all_positions.sort(key=lambda x: x.get('distance_pct', 100))
-
-    if not all_positions:
+    if not riskiest:
         table.add_row(
             Text("No positions found", style="dim"),
             "", "", "", "", "", "", "", ""
         )
         return table
 
-    for pos in all_positions[:25]:  # Show top 25 riskiest positions
+    for entry in riskiest:
+        pos, side = entry.raw, entry.side
         address = get_full_address(pos.get('address', ''))
         coin = pos.get('coin', 'N/A').upper()
 
         # Side with color
-        side = pos.get('side', 'N/A')
         side_text = Text(side, style="green" if side == 'LONG' else "red")
 
         # Position value
@@ -211,10 +201,11 @@ def create_positions_table(positions_data):
     return table
 
 
-def create_stats_panel(positions_data, symbol=None):
+def create_stats_panel(positions_data, symbol=None, index=None):
     """Create a summary stats panel"""
     if not isinstance(positions_data, dict):
         return Panel("[dim]No data available[/dim]", title="📊 Position Statistics")
+    index = index or PositionIndex.from_positions(positions_data)
 
     total_positions = positions_data.get('total_positions', 0)
     total_longs = positions_data.get('total_longs', 0)
@@ -225,20 +216,16 @@ def create_stats_panel(positions_data, symbol=None):
     total_long_value = positions_data.get('total_long_value', 0)
     total_short_value = positions_data.get('total_short_value', 0)
 
-    longs = positions_data.get('longs', [])
-    shorts = positions_data.get('shorts', [])
-    all_positions = longs + shorts
-
     # Calculate aggregated stats
     if total_long_value or total_short_value:
         total_value = total_long_value + total_short_value
     else:
-        total_value = sum(p.get('value', 0) for p in all_positions)
-    total_pnl = sum(p.get('pnl', 0) for p in all_positions)
+        total_value = index.totals.value
+    total_pnl = index.totals.pnl
 
     # Count high risk positions
-    critical_count = sum(1 for p in all_positions if p.get('distance_pct', 100) < 2)
-    high_risk_count = sum(1 for p in all_positions if 2 <= p.get('distance_pct', 100) < 5)
+    critical_count = index.bucket('critical')['count']
+    high_risk_count = index.bucket('high')['count']
 
     # Build stats text
     pnl_color = "green" if total_pnl >= 0 else "red"
@@ -266,40 +253,22 @@ def create_stats_panel(positions_data, symbol=None):
     )
 
 
-def create_coin_distribution(positions_data):
+def create_coin_distribution(positions_data, index=None):
     """Create a coin distribution breakdown"""
     if not isinstance(positions_data, dict):
         return Panel("[dim]No data available[/dim]", title="🪙 Positions by Coin")
+    index = index or PositionIndex.from_positions(positions_data)
 
-    longs = positions_data.get('longs', [])
-    shorts = positions_data.get('shorts', [])
-    all_positions = longs + shorts
-
-    # Count by coin with values
-    coins = {}
-    for pos in all_positions:
-        coin = pos.get('coin', 'UNKNOWN').upper()
-        val = pos.get('value', 0)
-
-        if coin not in coins:
-            coins[coin] = {'count': 0, 'value': 0, 'longs': 0, 'shorts': 0}
-        coins[coin]['count'] += 1
-        coins[coin]['value'] += val
-        if pos.get('side') == 'LONG' or pos in longs:
-            coins[coin]['longs'] += 1
-        else:
-            coins[coin]['shorts'] += 1
+    # Count by coin with values, sorted by value
+    sorted_coins = index.top_coins(10)
 
-    if not coins:
+    if not sorted_coins:
         return Panel(
             "[dim]No coin data available[/dim]",
             title="🪙 Positions by Coin",
             border_style="bright_yellow"
         )
 
-    # Sort by value
-    sorted_coins = sorted(coins.items(), key=lambda x: x[1]['value'], reverse=True)
-
     # Create display
     lines = []
     max_value = max(c[1]['value'] for c in sorted_coins) if sorted_coins else 1
@@ -318,7 +287,7 @@ def create_coin_distribution(positions_data):
         'WIF': 'magenta'
     }
 
-    for coin, data in sorted_coins[:10]:  # Top 10 coins
+    for coin, data in sorted_coins:  # Top 10 coins
         bar_length = int((data['value'] / max_value) * 15) if max_value > 0 else 0
         color = coin_colors.get(coin, 'white')
         bar = "█" * bar_length + "░" * (15 - bar_length)
@@ -338,46 +307,22 @@ def create_coin_distribution(positions_data):
     )
 
 
-def create_risk_analysis(positions_data):
+def create_risk_analysis(positions_data, index=None):
     """Create a risk analysis panel"""
     if not isinstance(positions_data, dict):
         return Panel("[dim]No data available[/dim]", title="⚠️ Risk Analysis")
+    index = index or PositionIndex.from_positions(positions_data)
 
-    longs = positions_data.get('longs', [])
-    shorts = positions_data.get('shorts', [])
-    all_positions = longs + shorts
-
-    # Categorize by risk level based on distance_pct
-    critical = []  # < 2%
-    high = []      # 2-5%
-    medium = []    # 5-10%
-    moderate = []  # 10-20%
-    low = []       # > 20%
-
-    for pos in all_positions:
-        dist = pos.get('distance_pct', 100)
-        if dist < 2:
-            critical.append(pos)
-        elif dist < 5:
-            high.append(pos)
-        elif dist < 10:
-            medium.append(pos)
-        elif dist < 20:
-            moderate.append(pos)
-        else:
-            low.append(pos)
-
-    # Calculate values at risk for each category
-    critical_value = sum(p.get('value', 0) for p in critical)
-    high_value = sum(p.get('value', 0) for p in high)
-    medium_value = sum(p.get('value', 0) for p in medium)
+    # Count and value per risk level (distance_pct buckets: <2, 2-5, 5-10, 10-20, >20)
+    buckets = index.buckets()
+    critical, high, medium = buckets['critical'], buckets['high'], buckets['medium']
 
     lines = [
-        f"[bold red]🚨 CRITICAL (<2%):[/bold red] [red]{len(critical)}[/red] pos | [yellow]${critical_value/1e6:.2f}M[/yellow]",
-        f"[bold yellow]⚠️ HIGH (2-5%):[/bold yellow] [yellow]{len(high)}[/yellow] pos | [yellow]${high_value/1e6:.2f}M[/yellow]",
-        f"[bold cyan]📊 MEDIUM (5-10%):[/bold cyan] [cyan]{len(medium)}[/cyan] pos | [yellow]${medium_value/1e6:.2f}M[/yellow]",
-        f"[bold white]📉 MODERATE (10-20%):[/bold white] [white]{len(moderate)}[/white] positions",
-        f"[bold green]✅ LOW (>20%):[/bold green] [green]{len(low)}[/green] positions"
+        f"[bold red]🚨 CRITICAL (<2%):[/bold red] [red]{critical['count']}[/red] pos | [yellow]${critical['value']/1e6:.2f}M[/yellow]",
+        f"[bold yellow]⚠️ HIGH (2-5%):[/bold yellow] [yellow]{high['count']}[/yellow] pos | [yellow]${high['value']/1e6:.2f}M[/yellow]",
+        f"[bold cyan]📊 MEDIUM (5-10%):[/bold cyan] [cyan]{medium['count']}[/cyan] pos | [yellow]${medium['value']/1e6:.2f}M[/yellow]",
+        f"[bold white]📉 MODERATE (10-20%):[/bold white] [white]{buckets['moderate']['count']}[/white] positions",
+        f"[bold green]✅ LOW (>20%):[/bold green] [green]{buckets['low']['count']}[/green] positions"
     ]
     return Panel(
         "⚠️ [bold white]Risk Analysis[/bold white]  [dim cyan]GET https://api.moondev.com/api/positions.json[/dim cyan]\n\n" + "\n".join(lines),
@@ -387,24 +332,19 @@ def create_risk_analysis(positions_data):
     )
 
 
-def create_top_whales_panel(positions_data):
+def create_top_whales_panel(positions_data, index=None):
     """Create a panel showing the biggest whale positions"""
     if not isinstance(positions_data, dict):
         return Panel("[dim]No data available[/dim]", title="🐋 Top Whales")
-
-    longs = positions_data.get('longs', [])
-    shorts = positions_data.get('shorts', [])
-    all_positions = longs + shorts
-
-    # Sort by position value
-    sorted_by_value = sorted(all_positions, key=lambda x: x.get('value', 0), reverse=True)
+    index = index or PositionIndex.from_positions(positions_data)
 
     lines = []
-    for i, pos in enumerate(sorted_by_value[:5], 1):
+    for i, entry in enumerate(index.largest(5), 1):
+        pos = entry.raw
         addr = get_full_address(pos.get('address', ''))
         coin = pos.get('coin', '?')
         value = pos.get('value', 0)
-        side = 'L' if pos in longs else 'S'
+        side = 'L' if entry.side == 'LONG' else 'S'
         pnl = pos.get('pnl', 0)
         side_color = "green" if side == 'L' else "red"
         pnl_color = "green" if pnl >= 0 else "red"
@@ -480,14 +420,72 @@ def display_symbols_list(api):
     console.print(f"\n[dim]Showing top 50 of {len(symbols_data)} total symbols. Use: python 02_positions.py SYMBOL[/dim]")
 
 
+def fetch_positions(api, symbol=None):
+    """positions.json, or one symbol's block of positions/all.json (None if the symbol isn't listed)"""
+    if not symbol:
+        return api.get_positions()
+    all_data = api.get_all_positions()
+    # Filter to specific symbol client-side
+    if isinstance(all_data, dict) and 'symbols' in all_data:
+        symbol_data = all_data.get('symbols', {}).get(symbol.upper())
+        if not symbol_data:
+            return None
+        return dict(symbol_data, updated_at=all_data.get('updated_at', ''))
+    return {}
+
+
+def run_live(api, symbol, interval):
+    """Keep the dashboard on screen; panels redraw only when the positions change"""
+    dash = LiveDashboard(console=console, title=f"Moon Dev Position Tracker{' │ ' + symbol if symbol else ''}")
+    dash.source("positions", lambda: fetch_positions(api, symbol), every=interval)
+
+    # One index kept across polls - each new snapshot only moves the positions that changed
+    index = PositionIndex()
+    synced = [None]
+
+    def indexed(positions_data):
+        if positions_data is not synced[0]:
+            index.sync(positions_data)
+            synced[0] = positions_data
+        return index
+
+    def positions_table(positions_data):
+        if positions_data is None:
+            return f"[red]Symbol {symbol} not found. Use --list to see available symbols.[/red]"
+        return create_positions_table(positions_data, indexed(positions_data))
+
+    dash.panel("banner", lambda: create_banner(symbol))
+    dash.panel("stats", lambda d: create_stats_panel(d, symbol, indexed(d)), "positions")
+    dash.panel("coins", lambda d: create_coin_distribution(d, indexed(d)), "positions")
+    dash.panel("risk", lambda d: create_risk_analysis(d, indexed(d)), "positions")
+    dash.panel("whales", lambda d: create_top_whales_panel(d, indexed(d)), "positions")
+    dash.panel("table", positions_table, "positions")
+    dash.layout("banner", ["stats", "coins"], ["risk", "whales"], "table", "status")
+    dash.run()
+    dash.print_stats()
+
+
 def main():
     """Main function to run the position dashboard"""
     # Parse command-line arguments
     symbol = None
     show_list = False
-
-    if len(sys.argv) > 1:
-        arg = sys.argv[1]
+    live_interval = None
+
+    args = sys.argv[1:]
+    if "--live" in args:
+        i = args.index("--live")
+        live_interval = 5.0
+        if i + 1 < len(args) and not args[i + 1].startswith("-"):
+            try:
+                live_interval = float(args[i + 1])
+                del args[i + 1]
+            except ValueError:
+                pass
+        del args[i]
+
+    if args:
+        arg = args[0]
         if arg.lower() == '--list' or arg.lower() == '-l':
             show_list = True
         else:
@@ -517,36 +515,35 @@ def main():
         display_symbols_list(api)
         return
 
+    if live_interval:
+        console.clear()
+        run_live(api, symbol, live_interval)
+        return
+
     # Fetch positions data
     if symbol:
         console.print(f"[bold magenta]📡 Fetching {symbol} positions...[/bold magenta]")
-        all_data = api.get_all_positions()
-        # Filter to specific symbol client-side
-        if isinstance(all_data, dict) and 'symbols' in all_data:
-            symbol_data = all_data.get('symbols', {}).get(symbol.upper())
-            if symbol_data:
-                positions_data = symbol_data
-                positions_data['updated_at'] = all_data.get('updated_at', '')
-            else:
-                console.print(f"[red]Symbol {symbol} not found. Use --list to see available symbols.[/red]")
-                return
-        else:
-            positions_data = {}
     else:
         console.print("[bold magenta]📡 Fetching all positions...[/bold magenta]")
-        positions_data = api.get_positions()
+    positions_data = fetch_positions(api, symbol)
+    if positions_data is None:
+        console.print(f"[red]Symbol {symbol} not found. Use --list to see available symbols.[/red]")
+        return
+
+    # One pass over the positions feeds every panel
+    index = PositionIndex.from_positions(positions_data)
 
     # Create and display stats panels side by side
-    stats_panel = create_stats_panel(positions_data, symbol)
-    coin_panel = create_coin_distribution(positions_data)
-    risk_panel = create_risk_analysis(positions_data)
-    whale_panel = create_top_whales_panel(positions_data)
+    stats_panel = create_stats_panel(positions_data, symbol, index)
+    coin_panel = create_coin_distribution(positions_data, index)
+    risk_panel = create_risk_analysis(positions_data, index)
+    whale_panel = create_top_whales_panel(positions_data, index)
 
     console.print(Columns([stats_panel, coin_panel], equal=True))
     console.print(Columns([risk_panel, whale_panel], equal=True))
 
     # Create and display positions table
-    positions_table = create_positions_table(positions_data)
+    positions_table = create_positions_table(positions_data, index)
     console.print(positions_table)
 
     # Footer with timestamp
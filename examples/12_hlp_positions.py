@@ -13,6 +13,8 @@ Usage: python 12_hlp_positions.py [mode]
        python 12_hlp_positions.py --positions  # Positions only
        python 12_hlp_positions.py --trades     # Trade history only
        python 12_hlp_positions.py --summary    # Quick summary only
+       python 12_hlp_positions.py --live       # Wallboard: keeps refreshing (positions every 5s)
+       python 12_hlp_positions.py --positions --live 10   # Any mode, custom interval
 
 Data Source: Moon Dev's local Hyperliquid node (blazing fast!)
 """
@@ -25,6 +27,7 @@ from collections import defaultdict
 # Add parent directory to path to import api.py
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from api import MoonDevAPI
+from api.live import LiveDashboard, printed
 
 from rich.console import Console
 from rich.table import Table
@@ -105,7 +108,7 @@ def format_timestamp(ts):
 
 
 # ==================== DISPLAY FUNCTIONS ====================
-def display_summary_panels(summary, exposure=None, trade_stats=None, strategies=None):
+def display_summary_panels(summary, exposure=None, trade_stats=None, strategies=None, out=console):
     """Display HLP summary statistics"""
     total_value = summary.get('total_account_value', 0)
     total_positions = summary.get('total_positions', 0)
@@ -207,10 +210,10 @@ def display_summary_panels(summary, exposure=None, trade_stats=None, strategies=
         padding=(1, 2)
     )
 
-    console.print(Columns([panel1, panel2, panel3], equal=True, expand=True))
+    out.print(Columns([panel1, panel2, panel3], equal=True, expand=True))
 
 
-def display_combined_positions(combined_positions):
+def display_combined_positions(combined_positions, out=console):
     """Display combined NET positions in compact format"""
     if not combined_positions:
         return
@@ -268,10 +271,10 @@ def display_combined_positions(combined_positions):
     # Header with totals
     delta_color = "green" if net_delta >= 0 else "red"
     header = f"[bold cyan]TOP 15 NET POSITIONS[/bold cyan]  [dim cyan]GET https://api.moondev.com/api/hlp/positions[/dim cyan] │ [green]Long: {format_usd(total_long)}[/green] │ [red]Short: {format_usd(total_short)}[/red] │ [{delta_color}]Delta: {'+' if net_delta >= 0 else ''}{format_usd(net_delta)}[/{delta_color}]"
-    console.print(Panel(table, title=header, border_style="cyan", padding=(0, 0)))
+    out.print(Panel(table, title=header, border_style="cyan", padding=(0, 0)))
 
 
-def display_hlp_trades(trades, limit=15):
+def display_hlp_trades(trades, limit=15, out=console):
     """Display recent HLP trades - compact"""
     if not trades:
         return
@@ -307,10 +310,10 @@ def display_hlp_trades(trades, limit=15):
 
         table.add_row(time_str, strategy, coin, side_text, format_usd(value))
 
-    console.print(Panel(table, title=f"[bold yellow]RECENT TRADES[/bold yellow]  [dim cyan]GET https://api.moondev.com/api/hlp/trades[/dim cyan] ({min(len(trades), limit)})", border_style="yellow", padding=(0, 0)))
+    out.print(Panel(table, title=f"[bold yellow]RECENT TRADES[/bold yellow]  [dim cyan]GET https://api.moondev.com/api/hlp/trades[/dim cyan] ({min(len(trades), limit)})", border_style="yellow", padding=(0, 0)))
 
 
-def display_trade_stats(trade_stats):
+def display_trade_stats(trade_stats, out=console):
     """Display compact trade statistics"""
     if not trade_stats:
         return
@@ -348,10 +351,10 @@ def display_trade_stats(trade_stats):
     header = f"[bold]TRADE STATS[/bold]  [dim cyan]GET https://api.moondev.com/api/hlp/trades/stats[/dim cyan] │ {total_trades:,} trades │ {format_usd(total_volume)} volume │ {first} to {last}"
     content = " │ ".join(strat_parts) if strat_parts else "[dim]No strategy breakdown[/dim]"
 
-    console.print(Panel(content, title=header, border_style="green", padding=(0, 1)))
+    out.print(Panel(content, title=header, border_style="green", padding=(0, 1)))
 
 
-def display_liquidators(liquidators_data):
+def display_liquidators(liquidators_data, out=console):
     """Display liquidator status - compact inline"""
     if not liquidators_data:
         return
@@ -370,10 +373,10 @@ def display_liquidators(liquidators_data):
     event_count = len(events)
     event_str = f" │ [yellow]{event_count} events[/yellow]" if event_count > 0 else ""
 
-    console.print(f"[bold red]LIQUIDATORS[/bold red] {' │ '.join(liq_parts)}{event_str}")
+    out.print(f"[bold red]LIQUIDATORS[/bold red] {' │ '.join(liq_parts)}{event_str}")
 
 
-def display_deltas(deltas_data):
+def display_deltas(deltas_data, out=console):
     """Display net exposure delta - compact with sparkline"""
     if not deltas_data:
         return
@@ -405,10 +408,10 @@ def display_deltas(deltas_data):
             idx = int((v - min_val) / range_val * 8)
             sparkline += f"[{'green' if v >= 0 else 'red'}]{chars[idx]}[/]"
 
-    console.print(f"[bold magenta]24H DELTA[/bold magenta] [{current_color}]Now: {format_usd(current)}[/{current_color}] │ [{change_color}]Chg: {'+' if change_24h >= 0 else ''}{format_usd(change_24h)}[/{change_color}] │ {sparkline}")
+    out.print(f"[bold magenta]24H DELTA[/bold magenta] [{current_color}]Now: {format_usd(current)}[/{current_color}] │ [{change_color}]Chg: {'+' if change_24h >= 0 else ''}{format_usd(change_24h)}[/{change_color}] │ {sparkline}")
 
 
-def display_exposure_visualization(combined_positions):
+def display_exposure_visualization(combined_positions, out=console):
     """Display compact exposure bar"""
     if not combined_positions:
         return
@@ -438,11 +441,11 @@ def display_exposure_visualization(combined_positions):
         for p in sorted_by_value
     ])
 
-    console.print(f"[green]L {format_usd(total_long)} ({long_pct:.0f}%)[/green] {bar} [red]S {format_usd(total_short)} ({short_pct:.0f}%)[/red]")
-    console.print(f"[dim]Top 5:[/dim] {top5}")
+    out.print(f"[green]L {format_usd(total_long)} ({long_pct:.0f}%)[/green] {bar} [red]S {format_usd(total_short)} ({short_pct:.0f}%)[/red]")
+    out.print(f"[dim]Top 5:[/dim] {top5}")
 
 
-def display_strategy_details(strategies):
+def display_strategy_details(strategies, out=console):
     """Display individual strategy breakdown - compact side-by-side"""
     if not strategies:
         return
@@ -453,7 +456,7 @@ def display_strategy_details(strategies):
     elif isinstance(strategies, list):
         if all(isinstance(s, str) for s in strategies):
             names = [s.replace("HLP ", "") for s in strategies]
-            console.print(f"[dim]Strategies: {' | '.join(names)}[/dim]")
+            out.print(f"[dim]Strategies: {' | '.join(names)}[/dim]")
             return
         strategy_items = [(s.get('name', f'Strategy {i}'), s) for i, s in enumerate(strategies) if isinstance(s, dict)]
     else:
@@ -509,7 +512,7 @@ def display_strategy_details(strategies):
 
     # Show active strategies side by side
     if active_panels:
-        console.print(Columns(active_panels, equal=True, expand=True))
+        out.print(Columns(active_panels, equal=True, expand=True))
 
     # Show idle strategies in a single compact line
     if idle_strategies:
@@ -518,7 +521,7 @@ def display_strategy_details(strategies):
             short_name = name.replace("HLP ", "")
             acct_val = float(data.get('account_value', 0)) if isinstance(data, dict) else 0
             idle_parts.append(f"[dim]○ {short_name}[/dim] [yellow]{format_usd(acct_val)}[/yellow]")
-        console.print(f"[dim]Idle:[/dim] " + " │ ".join(idle_parts))
+        out.print(f"[dim]Idle:[/dim] " + " │ ".join(idle_parts))
 
 
 # ==================== FOOTER ====================
@@ -529,6 +532,56 @@ def print_footer():
     console.print(f"[dim cyan]Moon Dev's HLP Dashboard | {now} | api.moondev.com | Built with love by Moon Dev[/dim cyan]")
 
 
+# ==================== LIVE MODE ====================
+def split_hlp_data(hlp_data):
+    """(summary, combined_positions, strategies, exposure) using the API's field names"""
+    summary = hlp_data.get('hlp_summary', hlp_data.get('summary', {}))
+    combined_positions = hlp_data.get('combined_net_positions', hlp_data.get('combined_positions', []))
+    strategies = hlp_data.get('strategies', [])
+    exposure = hlp_data.get('exposure', {})
+    return summary, combined_positions, strategies, exposure
+
+
+def run_live(api, mode, interval):
+    """Keep the dashboard on screen, redrawing only the sections whose data changed"""
+    dash = LiveDashboard(console=console, title="Moon Dev's HLP Dashboard")
+    with_trades = mode in ["full", "trades"]
+
+    dash.source("hlp", lambda: api.get_hlp_positions(include_strategies=(mode in ["full", "positions"])), every=interval)
+    if with_trades:
+        dash.source("trade_stats", api.get_hlp_trade_stats, every=interval * 12)
+        dash.source("trades", lambda: (api.get_hlp_trades(limit=30) or {}).get('trades', []), every=interval * 2)
+    if mode == "full":
+        dash.source("liquidators", api.get_hlp_liquidators, every=interval * 6)
+        dash.source("deltas", lambda: api.get_hlp_deltas(hours=24), every=interval * 12)
+
+    def summary_panel(hlp_data, trade_stats=None):
+        summary, _, strategies, exposure = split_hlp_data(hlp_data)
+        return printed(display_summary_panels, summary, exposure=exposure, trade_stats=trade_stats, strategies=strategies)
+
+    dash.panel("banner", create_banner)
+    dash.panel("summary", summary_panel, "hlp", *(["trade_stats"] if with_trades else []))
+    dash.panel("combined", lambda d: printed(display_combined_positions, split_hlp_data(d)[1]), "hlp")
+    dash.panel("exposure", lambda d: printed(display_exposure_visualization, split_hlp_data(d)[1]), "hlp")
+    dash.panel("strategies", lambda d: printed(display_strategy_details, split_hlp_data(d)[2]), "hlp")
+    if with_trades:
+        dash.panel("trade_stats", lambda d: printed(display_trade_stats, d), "trade_stats")
+        dash.panel("trades", lambda d: printed(display_hlp_trades, d, limit=30 if mode == "trades" else 20), "trades")
+    if mode == "full":
+        dash.panel("liquidators", lambda d: printed(display_liquidators, d), "liquidators")
+        dash.panel("deltas", lambda d: printed(display_deltas, d), "deltas")
+
+    layouts = {
+        "summary": ["summary", "exposure"],
+        "positions": ["summary", "combined", "exposure", "strategies"],
+        "trades": ["summary", "trade_stats", "trades"],
+        "full": ["summary", "combined", "exposure", "trade_stats", "trades", "liquidators", "deltas", "strategies"],
+    }
+    dash.layout("banner", *layouts[mode], "status")
+    dash.run()
+    dash.print_stats()
+
+
 # ==================== MAIN ====================
 def main():
     """Main function - Moon Dev's HLP Dashboard"""
@@ -545,6 +598,16 @@ def main():
     elif "--summary" in args:
         mode = "summary"
 
+    live_interval = None
+    if "--live" in args:
+        i = args.index("--live")
+        live_interval = 5.0
+        if i + 1 < len(args) and not args[i + 1].startswith("-"):
+            try:
+                live_interval = float(args[i + 1])
+            except ValueError:
+                console.print(f"[yellow]Moon Dev: --live expects seconds, got '{args[i + 1]}' - using 5s[/yellow]")
+
     console.print(f"[bold cyan]Moon Dev: Fetching HLP data from local node...[/bold cyan]")
     console.print(f"[dim]Mode: {mode}[/dim]")
     console.print()
@@ -564,6 +627,11 @@ def main():
         ))
         return
 
+    if live_interval:
+        console.clear()
+        run_live(api, mode, live_interval)
+        return
+
     # Fetch data based on mode
     with console.status("[bold cyan]Moon Dev: Loading HLP data...[/bold cyan]"):
         hlp_data = api.get_hlp_positions(include_strategies=(mode in ["full", "positions"]))
@@ -599,11 +667,7 @@ def main():
         console.print("[red]Error: Invalid response from API[/red]")
         return
 
-    # Use correct field names from API
-    summary = hlp_data.get('hlp_summary', hlp_data.get('summary', {}))
-    combined_positions = hlp_data.get('combined_net_positions', hlp_data.get('combined_positions', []))
-    strategies = hlp_data.get('strategies', [])
-    exposure = hlp_data.get('exposure', {})
+    summary, combined_positions, strategies, exposure = split_hlp_data(hlp_data)
 
     console.print(f"[green]HLP data loaded successfully![/green]")
     console.print()
@@ -8,6 +8,11 @@ Beautiful terminal dashboard for liquidations across ALL exchanges:
 - OKX
 
 Built with love by Moon Dev 🚀 | Run with: python -m api_examples.14_multi_liquidations
+
+Usage:
+    python 14_multi_liquidations.py            # One-shot dashboard
+    python 14_multi_liquidations.py --live     # Wallboard: refreshes every 10s
+    python 14_multi_liquidations.py --live 30  # Custom refresh interval (seconds)
 """
 
 import sys
@@ -17,6 +22,7 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from api import MoonDevAPI
+from api.live import LiveDashboard, printed
 from datetime import datetime
 from rich.console import Console
 from rich.table import Table
@@ -24,10 +30,7 @@ from rich.panel import Panel
 from rich.text import Text
 from rich.align import Align
 from rich.columns import Columns
-from rich.layout import Layout
-from rich.live import Live
 from rich import box
-import time
 
 # Initialize Rich console
 console = Console()
@@ -41,7 +44,7 @@ EXCHANGE_STYLE = {
 }
 
 # ==================== BANNER ====================
-def print_banner():
+def print_banner(out=console):
     """Print the Moon Dev banner"""
     banner = """███╗   ███╗██╗   ██╗██╗  ████████╗██╗    ██╗     ██╗ ██████╗
 ████╗ ████║██║   ██║██║  ╚══██╔══╝██║    ██║     ██║██╔═══██╗
@@ -49,7 +52,7 @@ def print_banner():
 ██║╚██╔╝██║██║   ██║██║     ██║   ██║    ██║     ██║██║▄▄ ██║
 ██║ ╚═╝ ██║╚██████╔╝███████╗██║   ██║    ███████╗██║╚██████╔╝
 ╚═╝     ╚═╝ ╚═════╝ ╚══════╝╚═╝   ╚═╝    ╚══════╝╚═╝ ╚══▀▀═╝"""
-    console.print(Panel(
+    out.print(Panel(
         Align.center(Text(banner, style="bold red")),
         title="🔥 [bold yellow]MULTI-EXCHANGE LIQUIDATION DASHBOARD[/bold yellow] 🔥",
         subtitle="[dim]💥 Hyperliquid • Binance • Bybit • OKX | by Moon Dev 💥[/dim]",
@@ -87,19 +90,17 @@ def get_exchange_style(exchange):
     return EXCHANGE_STYLE.get(ex_lower, {'color': 'white', 'emoji': '🔹', 'name': exchange})
 
 # ==================== COMBINED STATS DASHBOARD ====================
-def display_combined_stats(api):
+def display_combined_stats(stats, out=console):
     """Display combined stats across all exchanges"""
-    console.print(Panel(
+    out.print(Panel(
         "📊 [bold white]COMBINED STATS (24H)[/bold white]  [dim cyan]GET https://api.moondev.com/api/all_liquidations/stats.json[/dim cyan]",
         border_style="bright_white",
         padding=(0, 1)
     ))
 
     try:
-        stats = api.get_all_liquidation_stats()
-
         if not isinstance(stats, dict):
-            console.print("[dim]No combined stats available[/dim]")
+            out.print("[dim]No combined stats available[/dim]")
             return
 
         # Main stats
@@ -132,25 +133,23 @@ def display_combined_stats(api):
             padding=(1, 2)
         )
 
-        console.print(Columns([main_panel, ls_panel], equal=True, expand=True))
+        out.print(Columns([main_panel, ls_panel], equal=True, expand=True))
 
     except Exception as e:
-        console.print(f"[red]🌙 Moon Dev: Error fetching combined stats: {e}[/red]")
+        out.print(f"[red]🌙 Moon Dev: Error reading combined stats: {e}[/red]")
 
 # ==================== EXCHANGE BREAKDOWN ====================
-def display_exchange_breakdown(api):
+def display_exchange_breakdown(stats, out=console):
     """Display breakdown by exchange"""
-    console.print(Panel(
+    out.print(Panel(
         "🏦 [bold cyan]EXCHANGE BREAKDOWN (24H)[/bold cyan]  [dim cyan]GET https://api.moondev.com/api/all_liquidations/stats.json[/dim cyan]",
         border_style="cyan",
         padding=(0, 1)
     ))
 
     try:
-        stats = api.get_all_liquidation_stats()
-
         if not isinstance(stats, dict):
-            console.print("[dim]No exchange breakdown available[/dim]")
+            out.print("[dim]No exchange breakdown available[/dim]")
             return
 
         by_exchange = stats.get('by_exchange', stats.get('exchanges', {}))
@@ -212,15 +211,51 @@ def display_exchange_breakdown(api):
                 bar
             )
 
-        console.print(table)
+        out.print(table)
 
     except Exception as e:
-        console.print(f"[red]🌙 Moon Dev: Error fetching exchange breakdown: {e}[/red]")
+        out.print(f"[red]🌙 Moon Dev: Error reading exchange breakdown: {e}[/red]")
 
 # ==================== TIMEFRAME COMPARISON ====================
-def display_timeframe_comparison(api):
+TIMEFRAMES = ["10m", "1h", "4h", "24h"]
+
+
+def count_liquidations(data):
+    """Number of liquidations in a per-exchange response"""
+    if isinstance(data, list):
+        return len(data)
+    if isinstance(data, dict):
+        return len(data.get('liquidations', data.get('data', [])))
+    return 0
+
+
+def fetch_timeframe_counts(api):
+    """{timeframe: [hyperliquid, binance, bybit, okx]} counts, None where a call failed"""
+    fetchers = [
+        api.get_liquidations,       # Hyperliquid returns stats, the others the raw list
+        api.get_binance_liquidations,
+        api.get_bybit_liquidations,
+        api.get_okx_liquidations,
+    ]
+    counts = {}
+    for tf in TIMEFRAMES:
+        row = []
+        for i, fetch in enumerate(fetchers):
+            try:
+                data = fetch(tf)
+                if i == 0 and isinstance(data, dict):
+                    row.append(data.get('stats', data).get('total_count', 0))
+                else:
+                    row.append(count_liquidations(data))
+            except Exception:
+                row.append(None)
+        counts[tf] = row
+    return counts
+
+
+def display_timeframe_comparison(counts, out=console):
     """Display liquidations across different timeframes"""
-    console.print(Panel(
+    out.print(Panel(
         "⏰ [bold yellow]LIQUIDATIONS BY TIMEFRAME[/bold yellow]  [dim cyan]GET https://api.moondev.com/api/all_liquidations/{timeframe}.json[/dim cyan]",
         border_style="yellow",
         padding=(0, 1)
@@ -240,73 +275,25 @@ def display_timeframe_comparison(api):
     table.add_column("⚪ OKX", style="white", justify="right", width=14)
     table.add_column("🔥 TOTAL", style="bold red", justify="right", width=14)
 
-    timeframes = ["10m", "1h", "4h", "24h"]
-
-    for tf in timeframes:
+    for tf, row_counts in (counts or {}).items():
         row = [f"[bold]{tf}[/bold]"]
-
-        total_for_tf = 0
-
-        # Hyperliquid
-        try:
-            data = api.get_liquidations(tf)
-            if isinstance(data, dict):
-                count = data.get('stats', data).get('total_count', 0)
-            elif isinstance(data, list):
-                count = len(data)
-            else:
-                count = 0
-            row.append(format_count(count))
-            total_for_tf += count
-        except:
-            row.append("[dim]--[/dim]")
-
-        # Binance
-        try:
-            data = api.get_binance_liquidations(tf)
-            count = len(data) if isinstance(data, list) else len(data.get('liquidations', data.get('data', []))) if isinstance(data, dict) else 0
-            row.append(format_count(count))
-            total_for_tf += count
-        except:
-            row.append("[dim]--[/dim]")
-
-        # Bybit
-        try:
-            data = api.get_bybit_liquidations(tf)
-            count = len(data) if isinstance(data, list) else len(data.get('liquidations', data.get('data', []))) if isinstance(data, dict) else 0
-            row.append(format_count(count))
-            total_for_tf += count
-        except:
-            row.append("[dim]--[/dim]")
-
-        # OKX
-        try:
-            data = api.get_okx_liquidations(tf)
-            count = len(data) if isinstance(data, list) else len(data.get('liquidations', data.get('data', []))) if isinstance(data, dict) else 0
-            row.append(format_count(count))
-            total_for_tf += count
-        except:
-            row.append("[dim]--[/dim]")
-
-        # Total
+        row.extend(format_count(c) if c is not None else "[dim]--[/dim]" for c in row_counts)
+        total_for_tf = sum(c for c in row_counts if c is not None)
         row.append(f"[bold red]{format_count(total_for_tf)}[/bold red]")
-
         table.add_row(*row)
 
-    console.print(table)
+    out.print(table)
 
 # ==================== TOP LIQUIDATIONS ====================
-def display_top_liquidations(api):
+def display_top_liquidations(data, out=console):
     """Display top liquidations from all exchanges combined"""
-    console.print(Panel(
+    out.print(Panel(
         "🏆 [bold red]TOP LIQUIDATIONS (1H)[/bold red]  [dim cyan]GET https://api.moondev.com/api/all_liquidations/1h.json[/dim cyan]",
         border_style="red",
         padding=(0, 1)
     ))
 
     try:
-        data = api.get_all_liquidations("1h")
-
         # Handle different response formats
         if isinstance(data, list):
             liq_list = data
@@ -316,7 +303,7 @@ def display_top_liquidations(api):
             liq_list = []
 
         if not liq_list:
-            console.print("[dim]No recent liquidations found[/dim]")
+            out.print("[dim]No recent liquidations found[/dim]")
             return
 
         # Sort by value
@@ -392,25 +379,23 @@ def display_top_liquidations(api):
                 time_str
             )
 
-        console.print(table)
+        out.print(table)
 
     except Exception as e:
-        console.print(f"[red]🌙 Moon Dev: Error fetching top liquidations: {e}[/red]")
+        out.print(f"[red]🌙 Moon Dev: Error reading top liquidations: {e}[/red]")
 
 # ==================== COIN BREAKDOWN ====================
-def display_coin_breakdown(api):
+def display_coin_breakdown(stats, out=console):
     """Display liquidations broken down by coin across all exchanges"""
-    console.print(Panel(
+    out.print(Panel(
         "🪙 [bold magenta]LIQUIDATIONS BY COIN (24H)[/bold magenta]  [dim cyan]GET https://api.moondev.com/api/all_liquidations/stats.json[/dim cyan]",
         border_style="magenta",
         padding=(0, 1)
     ))
 
     try:
-        stats = api.get_all_liquidation_stats()
-
         if not isinstance(stats, dict):
-            console.print("[dim]No coin breakdown available[/dim]")
+            out.print("[dim]No coin breakdown available[/dim]")
             return
 
         by_coin = stats.get('by_coin', stats.get('coins', {}))
@@ -421,7 +406,7 @@ def display_coin_breakdown(api):
                 by_coin = stats['stats'].get('by_coin', {})
 
         if not by_coin:
-            console.print("[dim]No coin breakdown in stats[/dim]")
+            out.print("[dim]No coin breakdown in stats[/dim]")
             return
 
         table = Table(
@@ -470,52 +455,57 @@ def display_coin_breakdown(api):
                 format_usd(short_vol)
             )
 
-        console.print(table)
+        out.print(table)
 
     except Exception as e:
-        console.print(f"[red]🌙 Moon Dev: Error fetching coin breakdown: {e}[/red]")
+        out.print(f"[red]🌙 Moon Dev: Error reading coin breakdown: {e}[/red]")
 
 # ==================== EXCHANGE STATUS ====================
-def display_exchange_status(api):
+EXCHANGES = [
+    ("Hyperliquid", "💎", "cyan", "get_liquidations"),
+    ("Binance", "🟡", "yellow", "get_binance_liquidations"),
+    ("Bybit", "🟠", "orange1", "get_bybit_liquidations"),
+    ("OKX", "⚪", "white", "get_okx_liquidations"),
+]
+
+
+def fetch_exchange_status(api):
+    """{exchange: (10m count, error message or None)}"""
+    status = {}
+    for name, _, _, method in EXCHANGES:
+        try:
+            status[name] = (count_liquidations(getattr(api, method)("10m")), None)
+        except Exception as e:
+            status[name] = (0, str(e)[:30])
+    return status
+
+
+def display_exchange_status(status, out=console):
     """Display connection status for each exchange"""
-    console.print(Panel(
+    out.print(Panel(
         "📡 [bold green]EXCHANGE STATUS[/bold green]  [dim cyan]GET https://api.moondev.com/api/all_liquidations/10m.json[/dim cyan]",
         border_style="green",
         padding=(0, 1)
     ))
 
-    exchanges = [
-        ("Hyperliquid", "💎", "cyan", api.get_liquidations),
-        ("Binance", "🟡", "yellow", api.get_binance_liquidations),
-        ("Bybit", "🟠", "orange1", api.get_bybit_liquidations),
-        ("OKX", "⚪", "white", api.get_okx_liquidations),
-    ]
-
     panels = []
-    for name, emoji, color, func in exchanges:
-        try:
-            data = func("10m")
-            if isinstance(data, list):
-                count = len(data)
-            elif isinstance(data, dict):
-                count = len(data.get('liquidations', data.get('data', [])))
-            else:
-                count = 0
-
-            status = "[green]✅ CONNECTED[/green]"
+    for name, emoji, color, _ in EXCHANGES:
+        count, error = (status or {}).get(name, (0, "no data"))
+        if error is None:
+            state = "[green]✅ CONNECTED[/green]"
             data_info = f"{count} liqs (10m)"
-        except Exception as e:
-            status = "[red]❌ ERROR[/red]"
-            data_info = str(e)[:30]
+        else:
+            state = "[red]❌ ERROR[/red]"
+            data_info = error
 
         panels.append(Panel(
-            f"[bold {color}]{emoji} {name}[/bold {color}]\n{status}\n[dim]{data_info}[/dim]",
+            f"[bold {color}]{emoji} {name}[/bold {color}]\n{state}\n[dim]{data_info}[/dim]",
             border_style=color,
             width=20,
             padding=(0, 1)
         ))
 
-    console.print(Columns(panels, equal=True, expand=True))
+    out.print(Columns(panels, equal=True, expand=True))
 
 # ==================== FOOTER ====================
 def print_footer():
@@ -524,9 +514,49 @@ def print_footer():
     console.print(f"[dim red]─────────────────────────────────────────────────────────────────────────────────────────────[/dim red]")
     console.print(f"[dim red]🌙 Moon Dev's Multi-Exchange Liquidation Dashboard | {now} | 📡 api.moondev.com | Built with 💜 by Moon Dev[/dim red]")
 
+# ==================== LIVE MODE ====================
+def run_live(api, interval):
+    """Keep the dashboard on screen, redrawing only the sections whose data changed"""
+    dash = LiveDashboard(console=console, title="Moon Dev's Multi-Exchange Liquidation Dashboard")
+
+    # One stats call feeds three sections; the 16-call timeframe grid polls slower
+    dash.source("stats", api.get_all_liquidation_stats, every=interval)
+    dash.source("top", lambda: api.get_all_liquidations("1h"), every=interval)
+    dash.source("exchanges", lambda: fetch_exchange_status(api), every=interval * 3)
+    dash.source("timeframes", lambda: fetch_timeframe_counts(api), every=interval * 6)
+
+    dash.panel("banner", lambda: printed(print_banner))
+    dash.panel("exchange_status", lambda d: printed(display_exchange_status, d), "exchanges")
+    dash.panel("combined", lambda d: printed(display_combined_stats, d), "stats")
+    dash.panel("breakdown", lambda d: printed(display_exchange_breakdown, d), "stats")
+    dash.panel("timeframes", lambda d: printed(display_timeframe_comparison, d), "timeframes")
+    dash.panel("top", lambda d: printed(display_top_liquidations, d), "top")
+    dash.panel("coins", lambda d: printed(display_coin_breakdown, d), "stats")
+
+    dash.layout("banner", "exchange_status", "combined", "breakdown", "timeframes",
+                ["top", "coins"], "status")
+    dash.run()
+    dash.print_stats()
+
+
+def fetch_section(fetch, what):
+    """Call fetch(), printing the error and returning None if it fails"""
+    try:
+        return fetch()
+    except Exception as e:
+        console.print(f"[red]🌙 Moon Dev: Error fetching {what}: {e}[/red]")
+        return None
+
+
 # ==================== MAIN ====================
 def main():
     """Main function - Moon Dev's Multi-Exchange Liquidation Dashboard"""
+    args = sys.argv[1:]
+    live_interval = None
+    if "--live" in args:
+        i = args.index("--live")
+        live_interval = float(args[i + 1]) if i + 1 < len(args) and not args[i + 1].startswith("-") else 10.0
+
     console.clear()
     print_banner()
 
@@ -548,21 +578,30 @@ def main():
     console.print(f"[green]✅ API key loaded (...{api.api_key[-4:]})[/green]")
     console.print()
 
+    if live_interval:
+        console.clear()
+        run_live(api, live_interval)
+        return
+
     with console.status("[bold red]🌙 Fetching multi-exchange liquidation data...[/bold red]"):
-        time.sleep(0.5)
+        # Stats feed three sections - fetch them once
+        stats = fetch_section(api.get_all_liquidation_stats, "combined stats")
+        exchange_status = fetch_exchange_status(api)
+        timeframe_counts = fetch_timeframe_counts(api)
+        top = fetch_section(lambda: api.get_all_liquidations("1h"), "top liquidations")
 
     # Display all sections
-    display_exchange_status(api)
+    display_exchange_status(exchange_status)
     console.print()
-    display_combined_stats(api)
+    display_combined_stats(stats)
     console.print()
-    display_exchange_breakdown(api)
+    display_exchange_breakdown(stats)
     console.print()
-    display_timeframe_comparison(api)
+    display_timeframe_comparison(timeframe_counts)
     console.print()
-    display_top_liquidations(api)
+    display_top_liquidations(top)
     console.print()
-    display_coin_breakdown(api)
+    display_coin_breakdown(stats)
 
     print_footer()
 
@@ -0,0 +1,16 @@
+"""
+🌙 Moon Dev's Replay Kit
+Record api.moondev.com once, then develop and benchmark against a local copy
+
+Built with love by Moon Dev 🚀
+
+    python -m replay record     # capture real responses (needs MOONDEV_API_KEY)
+    python -m replay synth      # or generate production-sized fake ones
+    python -m replay serve      # serve them on http://127.0.0.1:8765
+
+Point the client at the server with MOONDEV_BASE_URL or
+MoonDevAPI(base_url=...).
+"""
+
+from replay.fixtures import FixtureStore, request_key, template_key
+from replay.server import ReplayServer
@@ -0,0 +1,74 @@
+"""
+🌙 Moon Dev's Replay CLI
+
+Built with love by Moon Dev 🚀
+
+Usage:
+    python -m replay record [--out DIR]
+    python -m replay synth [--out DIR] [--seed N] [--scale X]
+    python -m replay serve [--fixtures DIR] [--port 8765] [--latency MS] [--jitter MS]
+                           [--error-rate P] [--scale X] [--require-key]
+"""
+
+import os
+import sys
+import argparse
+
+# Add parent directory to path for the api package
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from replay.fixtures import DEFAULT_FIXTURES_DIR
+from replay.server import ReplayServer, DEFAULT_HOST, DEFAULT_PORT
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m replay", description="🌙 Moon Dev's API replay kit")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    record = sub.add_parser("record", help="Record real responses from every endpoint")
+    record.add_argument("--out", default=DEFAULT_FIXTURES_DIR, help="Fixtures folder")
+
+    synth = sub.add_parser("synth", help="Generate production-sized synthetic fixtures")
+    synth.add_argument("--out", default=DEFAULT_FIXTURES_DIR, help="Fixtures folder")
+    synth.add_argument("--seed", type=int, default=0)
+    synth.add_argument("--scale", type=float, default=1.0, help="Multiply list sizes")
+
+    serve = sub.add_parser("serve", help="Serve fixtures as a stand-in for api.moondev.com")
+    serve.add_argument("--fixtures", default=DEFAULT_FIXTURES_DIR, help="Fixtures folder")
+    serve.add_argument("--host", default=DEFAULT_HOST)
+    serve.add_argument("--port", type=int, default=DEFAULT_PORT)
+    serve.add_argument("--latency", type=float, default=0.0, help="Added latency in ms")
+    serve.add_argument("--jitter", type=float, default=0.0, help="Latency jitter in ms (+/-)")
+    serve.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests answered 503")
+    serve.add_argument("--scale", type=float, default=1.0, help="Grow/shrink every JSON list")
+    serve.add_argument("--require-key", action="store_true", help="401 without an API key")
+    serve.add_argument("--seed", type=int, default=None, help="Seed for jitter/error rolls")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "record":
+        from replay.recorder import Recorder
+        ok, failed = Recorder(fixtures_dir=args.out).record()
+        print(f"\n🌙 Moon Dev: recorded {ok} calls, {len(failed)} failed -> {args.out}")
+        return 1 if failed else 0
+
+    if args.command == "synth":
+        from replay.synthetic import main as synth_main
+        synth_main(args.out, seed=args.seed, scale=args.scale)
+        return 0
+
+    server = ReplayServer(args.fixtures, host=args.host, port=args.port,
+                          latency_ms=args.latency, jitter_ms=args.jitter,
+                          error_rate=args.error_rate, payload_scale=args.scale,
+                          require_key=args.require_key, seed=args.seed)
+    if not server.store.keys():
+        print(f"⚠️ No fixtures in {args.fixtures} - run `python -m replay record` or `python -m replay synth` first")
+        return 1
+    print(f"🌙 Moon Dev replay server on {server.url} ({len(server.store.keys())} fixtures)")
+    print(f"   export MOONDEV_BASE_URL={server.url}")
+    server.serve_forever()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,125 @@
+"""
+🌙 Moon Dev's Replay Fixtures
+On-disk store of recorded API responses
+
+Built with love by Moon Dev 🚀
+
+Layout:
+    fixtures/
+        index.json              # request key -> {file, status, content_type, recorded_at}
+        0001_api_positions.json.gz
+        ...
+
+A request key is "METHOD /path?sorted_query" for GETs, and
+"POST /path {canonical json body}" for POSTs. The api_key query param is
+never part of a key (or a fixture).
+"""
+
+import os
+import re
+import gzip
+import json
+import time
+from urllib.parse import urlsplit, parse_qsl, urlencode
+
+DEFAULT_FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+ADDRESS_PATTERN = re.compile(r"0x[0-9a-fA-F]{40}")
+
+
+def request_key(method, url, body=None):
+    """Canonical fixture key for a request"""
+    parts = urlsplit(url)
+    query = sorted((k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True) if k != "api_key")
+    key = f"{method.upper()} {parts.path or '/'}"
+    if query:
+        key += "?" + urlencode(query)
+    if method.upper() == "POST" and body:
+        if isinstance(body, bytes):
+            body = body.decode("utf-8", "replace")
+        try:
+            body = json.dumps(json.loads(body), sort_keys=True, separators=(",", ":"))
+        except ValueError:
+            pass
+        key += " " + body
+    return key
+
+
+def template_key(key):
+    """
+    Looser form of a key used as a fallback match, or None.
+
+    Wallet addresses become {address}, the query is dropped and a variable
+    last path segment (coin, ticker, timeframe) becomes * - so
+    /api/orderbook/DOGE can be served from a recorded /api/orderbook/BTC.
+    Fixed endpoint names like /api/hlp/flips never match a sibling.
+    """
+    method, _, rest = key.partition(" ")
+    path = rest.split(" ")[0].split("?")[0]
+    has_address = bool(ADDRESS_PATTERN.search(path))
+    path = ADDRESS_PATTERN.sub("{address}", path)
+    head, _, last = path.rpartition("/")
+    name, ext = os.path.splitext(last)
+    variable = any(c.isdigit() or c.isupper() for c in name) or "_" in name
+    if not variable and not has_address:
+        return None
+    if not variable:
+        return f"{method} {path}"
+    return f"{method} {head}/*{ext}"
+
+
+class FixtureStore:
+    """
+    🌙 Moon Dev's Fixture Store
+
+    Reads and writes recorded responses. Bodies are gzipped on disk.
+    """
+
+    def __init__(self, root=DEFAULT_FIXTURES_DIR):
+        self.root = root
+        self.index_path = os.path.join(root, "index.json")
+        self.index = {}
+        if os.path.exists(self.index_path):
+            with open(self.index_path) as f:
+                self.index = json.load(f)
+
+    def _filename(self, key):
+        slug = re.sub(r"[^A-Za-z0-9]+", "_", key.split(" ")[1].split("?")[0]).strip("_")[:60]
+        return f"{len(self.index) + 1:04d}_{slug}.gz"
+
+    def save(self, key, status, content_type, body):
+        """Store one response body (bytes) under `key`"""
+        os.makedirs(self.root, exist_ok=True)
+        entry = self.index.get(key) or {"file": self._filename(key)}
+        entry.update({
+            "status": status,
+            "content_type": content_type,
+            "bytes": len(body),
+            "recorded_at": time.time(),
+        })
+        with gzip.open(os.path.join(self.root, entry["file"]), "wb") as f:
+            f.write(body)
+        self.index[key] = entry
+
+    def save_json(self, key, payload, status=200):
+        """Store a JSON payload (used by the synthetic generator)"""
+        body = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+        self.save(key, status, "application/json", body)
+
+    def flush(self):
+        """Write the index to disk"""
+        os.makedirs(self.root, exist_ok=True)
+        with open(self.index_path, "w") as f:
+            json.dump(self.index, f, indent=2, sort_keys=True)
+
+    def load(self, key):
+        """(entry, body_bytes) for a key, or (None, None)"""
+        entry = self.index.get(key)
+        if entry is None:
+            return None, None
+        with gzip.open(os.path.join(self.root, entry["file"]), "rb") as f:
+            return entry, f.read()
+
+    def keys(self):
+        """All recorded request keys"""
+        return list(self.index)
@@ -0,0 +1,129 @@
+"""
+🌙 Moon Dev's Response Recorder
+Capture real responses from every MoonDevAPI endpoint into fixtures
+
+Built with love by Moon Dev 🚀
+
+Usage:
+    python -m replay record                     # every endpoint, default args
+    python -m replay record --out my_fixtures   # custom fixtures folder
+
+Needs a real MOONDEV_API_KEY. Every HTTP response the client receives
+(including the Hyperliquid POST used by get_user_positions) is stored, so
+the replay server can serve exactly what production returned.
+"""
+
+import os
+import sys
+
+# Add parent directory to path for the api package
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from api import MoonDevAPI
+from replay.fixtures import FixtureStore, DEFAULT_FIXTURES_DIR, request_key
+
+# ============================================
+# 🎯 RECORDING PLAN - Moon Dev
+# ============================================
+
+# Known active address (HLP) - same one test_all() uses
+SAMPLE_ADDRESS = "0x010461c14e146ac35fe42271bdc1134ee31c703a"
+SAMPLE_COINS = ["BTC", "ETH", "SOL", "XRP", "HYPE"]
+
+LIQUIDATION_TIMEFRAMES = ["10m", "1h", "4h", "12h", "24h", "2d", "7d", "14d", "30d"]
+IMBALANCE_TIMEFRAMES = ["5m", "15m", "1h", "4h", "24h"]
+SIGNAL_TIMEFRAMES = ["10m", "1h", "24h"]
+HIP3_TIMEFRAMES = ["10m", "1h", "24h", "7d"]
+CANDLE_INTERVALS = ["1m", "5m", "15m", "1h", "4h", "1d"]
+
+
+def build_plan(address=SAMPLE_ADDRESS, coins=SAMPLE_COINS):
+    """(method_name, args, kwargs) for every endpoint worth recording"""
+    plan = [("health", (), {})]
+    plan += [("get_liquidations", (tf,), {}) for tf in LIQUIDATION_TIMEFRAMES]
+    plan += [(name, (), {}) for name in (
+        "get_liquidation_stats", "get_positions", "get_all_positions",
+        "get_whales", "get_whale_addresses", "get_buyers", "get_depositors",
+        "get_events", "get_contracts", "get_tick_stats", "get_tick_latest",
+        "get_trades", "get_large_trades", "get_orderflow", "get_orderflow_stats",
+        "get_prices", "get_candle_symbols", "get_position_snapshot_stats",
+        "get_hlp_positions", "get_hlp_trade_stats", "get_hlp_liquidators",
+        "get_hlp_sentiment", "get_hlp_liquidator_status", "get_hlp_market_maker",
+        "get_hlp_timing", "get_hlp_correlation", "get_hlp_delta", "get_hlp_flips",
+        "get_hlp_flip_stats", "get_smart_money_rankings", "get_smart_money_leaderboard",
+        "get_all_liquidation_stats", "get_hip3_liquidation_stats", "get_hip3_meta",
+        "get_hip3_tick_stats",
+    )]
+    plan += [("get_imbalance", (tf,), {}) for tf in IMBALANCE_TIMEFRAMES]
+    plan += [("get_smart_money_signals", (tf,), {}) for tf in SIGNAL_TIMEFRAMES]
+    plan += [("get_all_liquidations", (tf,), {}) for tf in LIQUIDATION_TIMEFRAMES]
+    for fn in ("get_binance_liquidations", "get_bybit_liquidations", "get_okx_liquidations"):
+        plan += [(fn, (tf,), {}) for tf in LIQUIDATION_TIMEFRAMES]
+    plan += [("get_hip3_liquidations", (tf,), {}) for tf in HIP3_TIMEFRAMES]
+    plan += [("get_hip3_ticks", ("xyz", "tsla"), {})]
+
+    plan += [
+        ("get_user_positions", (address,), {}),
+        ("get_user_positions_api", (address,), {}),
+        ("get_user_fills", (address,), {}),
+        ("get_user_fills", (address,), {"limit": -1}),
+        ("get_account", (address,), {}),
+        ("get_fills", (address,), {}),
+        ("get_hlp_positions", (), {"include_strategies": False}),
+        ("get_hlp_trades", (), {}),
+        ("get_hlp_trades", (), {"limit": 2000}),
+        ("get_hlp_position_history", (), {}),
+        ("get_hlp_deltas", (), {}),
+        ("get_hlp_deltas", (), {"hours": 168}),
+    ]
+    for coin in coins:
+        plan += [
+            ("get_ticks", (coin,), {}),
+            ("get_price", (coin,), {}),
+            ("get_orderbook", (coin,), {}),
+            ("get_position_snapshots", (coin,), {}),
+        ]
+        plan += [("get_candles", (coin,), {"interval": i}) for i in CANDLE_INTERVALS]
+    return plan
+
+
+class Recorder:
+    """
+    🌙 Moon Dev's Response Recorder
+
+    Hooks the client's requests session and saves every response it sees.
+    """
+
+    def __init__(self, api=None, fixtures_dir=DEFAULT_FIXTURES_DIR):
+        self.api = api or MoonDevAPI()
+        self.store = FixtureStore(fixtures_dir)
+        self.api.session.hooks["response"].append(self._capture)
+
+    def _capture(self, response, *args, **kwargs):
+        """requests response hook - store the raw body under its request key"""
+        request = response.request
+        key = request_key(request.method, request.url, request.body)
+        content_type = response.headers.get("Content-Type", "application/octet-stream")
+        self.store.save(key, response.status_code, content_type, response.content)
+        return response
+
+    def record(self, plan=None):
+        """
+        Call every method in the plan and save the responses.
+
+        Returns:
+            (ok_count, failed list of (call, error))
+        """
+        plan = plan or build_plan()
+        ok, failed = 0, []
+        for method_name, args, kwargs in plan:
+            call = f"{method_name}{args}{kwargs or ''}"
+            try:
+                getattr(self.api, method_name)(*args, **kwargs)
+                ok += 1
+                print(f"✅ {call}")
+            except Exception as e:
+                failed.append((call, e))
+                print(f"❌ {call}: {e}")
+        self.store.flush()
+        return ok, failed
@@ -0,0 +1,218 @@
+"""
+🌙 Moon Dev's Replay Server
+Local stand-in for api.moondev.com that serves recorded fixtures
+
+Built with love by Moon Dev 🚀
+
+Usage:
+    python -m replay serve --port 8765 --latency 40 --jitter 10 --error-rate 0.01
+
+    # then point any client at it
+    MOONDEV_BASE_URL=http://127.0.0.1:8765 python -m api
+
+    # or from code
+    with ReplayServer(latency_ms=20) as server:
+        api = MoonDevAPI(api_key="replay", base_url=server.url)
+
+Knobs:
+    latency_ms / jitter_ms  - delay before every response (uniform +/- jitter)
+    error_rate              - fraction of requests answered with a 503
+    payload_scale           - grow/shrink every JSON list by this factor
+                              (2.0 = twice the positions, fills, ticks...)
+    require_key             - answer 401 when no X-API-Key/api_key is sent
+
+Lookup goes exact key -> same path ignoring the query -> template match
+(see fixtures.template_key), so any coin or wallet gets an answer once one
+of its kind was recorded. POST /info also serves get_user_positions when
+the client's info_url points here.
+"""
+
+import json
+import time
+import random
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlsplit, parse_qsl
+
+from replay.fixtures import FixtureStore, DEFAULT_FIXTURES_DIR, request_key, template_key
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+
+def scale_payload(payload, factor):
+    """Resize every list in a JSON payload by `factor` (cycling items to grow)"""
+    if isinstance(payload, dict):
+        return {k: scale_payload(v, factor) for k, v in payload.items()}
+    if isinstance(payload, list):
+        items = [scale_payload(v, factor) for v in payload]
+        if len(items) < 2:
+            return items
+        target = max(1, round(len(items) * factor))
+        return [items[i % len(items)] for i in range(target)]
+    return payload
+
+
+class ReplayServer:
+    """
+    🌙 Moon Dev's Replay Server
+
+    Threaded HTTP server answering from a FixtureStore.
+    """
+
+    def __init__(self, fixtures_dir=DEFAULT_FIXTURES_DIR, host=DEFAULT_HOST, port=DEFAULT_PORT,
+                 latency_ms=0.0, jitter_ms=0.0, error_rate=0.0, payload_scale=1.0,
+                 require_key=False, seed=None):
+        self.store = FixtureStore(fixtures_dir)
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.payload_scale = payload_scale
+        self.require_key = require_key
+        self.random = random.Random(seed)
+        self.request_count = 0
+        self.error_count = 0
+
+        # Fallback lookups: path without query, then path template
+        self._by_path = {}
+        self._by_template = {}
+        for key in self.store.keys():
+            self._by_path.setdefault(key.split("?")[0].split(" {")[0], key)
+            template = template_key(key)
+            if template is not None:
+                self._by_template.setdefault(template, key)
+
+        self._scaled = {}  # (key, scale) -> body bytes
+        self._lock = threading.Lock()
+        self._thread = None
+
+        handler = type("ReplayHandler", (_ReplayHandler,), {"replay": self})
+        self.httpd = ThreadingHTTPServer((host, port), handler)
+        self.httpd.daemon_threads = True
+
+    @property
+    def url(self):
+        """Base URL to hand to MoonDevAPI(base_url=...)"""
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def lookup(self, key):
+        """Best fixture key for a request key, or None"""
+        if key in self.store.index:
+            return key
+        path_key = key.split("?")[0].split(" {")[0]
+        if path_key in self._by_path:
+            return self._by_path[path_key]
+        template = template_key(key)
+        return self._by_template.get(template) if template is not None else None
+
+    def body_for(self, fixture_key):
+        """(entry, body) for a fixture, scaled if payload_scale != 1"""
+        scale = self.payload_scale
+        with self._lock:
+            cached = self._scaled.get((fixture_key, scale))
+        if cached is not None:
+            return cached
+
+        entry, body = self.store.load(fixture_key)
+        if scale != 1.0 and "json" in entry.get("content_type", ""):
+            try:
+                body = json.dumps(scale_payload(json.loads(body), scale),
+                                  separators=(",", ":")).encode("utf-8")
+            except ValueError:
+                pass
+        with self._lock:
+            self._scaled[(fixture_key, scale)] = (entry, body)
+        return entry, body
+
+    def delay(self):
+        """Sleep for the configured latency +/- jitter"""
+        ms = self.latency_ms
+        if self.jitter_ms:
+            ms += self.random.uniform(-self.jitter_ms, self.jitter_ms)
+        if ms > 0:
+            time.sleep(ms / 1000.0)
+
+    def should_fail(self):
+        """Roll the dice for an injected error"""
+        return self.error_rate > 0 and self.random.random() < self.error_rate
+
+    def start(self):
+        """Serve in a background thread"""
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self):
+        """Serve in the foreground (Ctrl+C to stop)"""
+        try:
+            self.httpd.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.httpd.server_close()
+
+    def stop(self):
+        """Stop serving and release the port"""
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+class _ReplayHandler(BaseHTTPRequestHandler):
+    """Request handler - `replay` is bound to the owning ReplayServer"""
+
+    replay = None
+    protocol_version = "HTTP/1.1"  # keep-alive, like the real API
+    disable_nagle_algorithm = True  # headers + body would otherwise stall ~40ms on keep-alive
+    wbufsize = -1                   # one send per response (flushed after each request)
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status, body, content_type="application/json"):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _error(self, status, message):
+        self._send(status, json.dumps({"error": message}).encode("utf-8"))
+
+    def _handle(self, body=None):
+        replay = self.replay
+        replay.request_count += 1
+        replay.delay()
+
+        if replay.require_key and self.command == "GET" and self.path != "/health":
+            query = dict(parse_qsl(urlsplit(self.path).query))
+            if not self.headers.get("X-API-Key") and not query.get("api_key"):
+                return self._error(401, "Missing API key")
+
+        if replay.should_fail():
+            replay.error_count += 1
+            return self._error(503, "Injected replay error")
+
+        key = request_key(self.command, self.path, body)
+        fixture_key = replay.lookup(key)
+        if fixture_key is None:
+            return self._error(404, f"No fixture for {key}")
+
+        entry, payload = replay.body_for(fixture_key)
+        self._send(entry.get("status", 200), payload,
+                   entry.get("content_type", "application/json"))
+
+    def do_GET(self):
+        self._handle()
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0) or 0)
+        self._handle(self.rfile.read(length) if length else b"")
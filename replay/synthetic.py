@@ -0,0 +1,382 @@
+"""
+🌙 Moon Dev's Synthetic Fixtures
+Production-sized fake responses for when nothing has been recorded yet
+
+Built with love by Moon Dev 🚀
+
+Usage:
+    python -m replay synth                  # write fixtures/ from a fixed seed
+    python -m replay synth --scale 2        # twice the rows everywhere
+
+Payload shapes and sizes follow the endpoint docs in api/__init__.py (148 symbols x
+top 50 longs/shorts, 224 coins of prices, 10k ticks, ~20 book levels...),
+so the client, caching and dashboards behave like they do against the real
+service. Values are random but deterministic for a given seed.
+"""
+
+import math
+import random
+import time
+from datetime import datetime, timezone
+
+from replay.fixtures import FixtureStore, DEFAULT_FIXTURES_DIR
+
+# 80 tracked candle/tick symbols (see get_candle_symbols)
+SYMBOLS = [
+    "BTC", "ETH", "SOL", "XRP", "HYPE", "DOGE", "LTC", "ADA", "DOT", "LINK",
+    "AVAX", "BNB", "AAVE", "UNI", "CRV", "LDO", "PENDLE", "JUP", "MORPHO", "ONDO",
+    "ENA", "ARB", "OP", "SUI", "SEI", "APT", "NEAR", "TON", "TIA", "MOVE",
+    "BERA", "FARTCOIN", "PUMP", "WIF", "POPCAT", "PENGU", "TRUMP", "BCH", "ETC", "FIL",
+    "ATOM", "INJ", "RUNE", "STX", "IMX", "MKR", "SNX", "COMP", "GMX", "DYDX",
+    "BLUR", "WLD", "PYTH", "JTO", "STRK", "ZRO", "EIGEN", "ETHFI", "TAO", "RENDER",
+    "FET", "AR", "ORDI", "SAND", "MANA", "APE", "GALA", "kBONK", "kPEPE", "kSHIB",
+    "kFLOKI", "MEME", "NOT", "KAITO", "VIRTUAL", "AI16Z", "XLM", "HBAR", "TRX", "ALGO",
+]
+
+# 224 perp coins for get_prices, 148 with tracked positions
+ALL_COINS = SYMBOLS + [f"ALT{i:03d}" for i in range(224 - len(SYMBOLS))]
+POSITION_SYMBOLS = ALL_COINS[:148]
+
+BASE_PRICES = {"BTC": 93200.0, "ETH": 3175.0, "SOL": 142.0, "XRP": 2.1, "HYPE": 24.5, "DOGE": 0.15}
+
+HLP_STRATEGIES = [
+    "HLP Strategy A", "HLP Strategy B", "HLP Liquidator 1", "HLP Liquidator 2",
+    "HLP Liquidator 3", "HLP Liquidator 4", "HLP Strategy X",
+]
+
+SAMPLE_ADDRESS = "0x010461c14e146ac35fe42271bdc1134ee31c703a"
+
+
+def _price(coin, rng):
+    if coin not in BASE_PRICES:
+        BASE_PRICES[coin] = round(10 ** rng.uniform(-2, 3), 4)
+    return BASE_PRICES[coin]
+
+
+def _address(rng):
+    return "0x" + "".join(rng.choice("0123456789abcdef") for _ in range(40))
+
+
+def _iso(ms):
+    return datetime.fromtimestamp(ms / 1000, tz=timezone.utc).isoformat()
+
+
+def _position(coin, side, rng):
+    """One tracked position near liquidation"""
+    mark = _price(coin, rng)
+    leverage = rng.choice([2, 3, 5, 10, 20, 25, 40, 50])
+    distance = round(rng.uniform(0.2, 15.0), 3)
+    liq = mark * (1 - distance / 100) if side == "LONG" else mark * (1 + distance / 100)
+    entry = mark * (1 + rng.uniform(-0.05, 0.05))
+    value = round(10 ** rng.uniform(4.3, 7.5), 2)
+    size = value / mark
+    pnl = (mark - entry) * size if side == "LONG" else (entry - mark) * size
+    return {
+        "address": _address(rng),
+        "coin": coin,
+        "side": side,
+        "size": round(size if side == "LONG" else -size, 6),
+        "value": value,
+        "leverage": leverage,
+        "entry_price": round(entry, 6),
+        "mark_price": mark,
+        "liq_price": round(liq, 6),
+        "distance_pct": distance,
+        "pnl": round(pnl, 2),
+    }
+
+
+def _positions_block(coin_list, rng, per_side=50):
+    longs = [_position(rng.choice(coin_list), "LONG", rng) for _ in range(per_side)]
+    shorts = [_position(rng.choice(coin_list), "SHORT", rng) for _ in range(per_side)]
+    return {
+        "total_positions": len(longs) + len(shorts),
+        "total_longs": len(longs),
+        "total_shorts": len(shorts),
+        "total_long_value": round(sum(p["value"] for p in longs), 2),
+        "total_short_value": round(sum(p["value"] for p in shorts), 2),
+        "longs": sorted(longs, key=lambda p: -p["value"]),
+        "shorts": sorted(shorts, key=lambda p: -p["value"]),
+    }
+
+
+def _fill(coin, t, rng, tid):
+    px = _price(coin, rng) * (1 + rng.uniform(-0.02, 0.02))
+    side = rng.choice("BA")
+    return {
+        "tid": tid,
+        "oid": tid + 7,
+        "hash": "0x" + "%064x" % rng.getrandbits(256),
+        "time": t,
+        "coin": coin,
+        "side": side,
+        "px": f"{px:.6g}",
+        "sz": f"{10 ** rng.uniform(-2, 2) * 1000 / px:.5g}",
+        "startPosition": f"{rng.uniform(-5, 5):.4f}",
+        "dir": rng.choice(["Open Long", "Close Long", "Open Short", "Close Short"]),
+        "closedPnl": f"{rng.uniform(-500, 500):.2f}",
+        "fee": f"{rng.uniform(0, 5):.4f}",
+        "crossed": rng.random() < 0.5,
+    }
+
+
+def _walk(start, n, rng, vol=0.001):
+    """Random-walk price series"""
+    out, px = [], start
+    for _ in range(n):
+        px *= math.exp(rng.gauss(0, vol))
+        out.append(px)
+    return out
+
+
+def _orderbook(coin, now_ms, rng, levels=20):
+    mid = _price(coin, rng)
+    tick = mid * 0.0001
+    bids = [{"px": f"{mid - tick * (i + 0.5):.6g}", "sz": f"{rng.uniform(0.1, 50):.4f}",
+             "n": rng.randint(1, 30)} for i in range(levels)]
+    asks = [{"px": f"{mid + tick * (i + 0.5):.6g}", "sz": f"{rng.uniform(0.1, 50):.4f}",
+             "n": rng.randint(1, 30)} for i in range(levels)]
+    best_bid, best_ask = float(bids[0]["px"]), float(asks[0]["px"])
+    mid_px = (best_bid + best_ask) / 2
+    return {
+        "coin": coin,
+        "timestamp": now_ms,
+        "levels": [bids, asks],
+        "best_bid": best_bid,
+        "best_ask": best_ask,
+        "mid_price": mid_px,
+        "spread": best_ask - best_bid,
+        "spread_bps": (best_ask - best_bid) / mid_px * 10000,
+        "bid_depth": levels,
+        "ask_depth": levels,
+    }
+
+
+def _hlp_positions(rng):
+    strategies = {}
+    combined = {}
+    for i, name in enumerate(HLP_STRATEGIES):
+        positions = []
+        if i < 3 or rng.random() < 0.3:
+            for coin in rng.sample(SYMBOLS[:40], rng.randint(5, 25)):
+                px = _price(coin, rng)
+                value = rng.uniform(-5e6, 5e6)
+                positions.append({
+                    "coin": coin,
+                    "size": round(value / px, 6),
+                    "position_value": round(abs(value), 2),
+                    "entry_price": round(px * (1 + rng.uniform(-0.03, 0.03)), 6),
+                    "unrealized_pnl": round(rng.uniform(-1e5, 1e5), 2),
+                })
+                agg = combined.setdefault(coin, {"coin": coin, "long_value": 0.0, "short_value": 0.0,
+                                                 "total_long": 0.0, "total_short": 0.0,
+                                                 "long_strategies": [], "short_strategies": []})
+                if value > 0:
+                    agg["long_value"] += value
+                    agg["total_long"] += value / px
+                    agg["long_strategies"].append(name)
+                else:
+                    agg["short_value"] += -value
+                    agg["total_short"] += -value / px
+                    agg["short_strategies"].append(name)
+        strategies[name] = {
+            "address": _address(rng),
+            "account_value": round(rng.uniform(1e6, 8e7), 2),
+            "total_pnl": round(rng.uniform(-1e6, 3e6), 2),
+            "position_count": len(positions),
+            "positions": positions,
+        }
+    combined_positions = []
+    for agg in combined.values():
+        agg["net_value"] = round(agg["long_value"] - agg["short_value"], 2)
+        agg["net_size"] = round(agg["total_long"] - agg["total_short"], 6)
+        combined_positions.append(agg)
+    combined_positions.sort(key=lambda p: -abs(p["net_value"]))
+    net = sum(p["net_value"] for p in combined_positions)
+    return {
+        "summary": {
+            "total_account_value": round(sum(s["account_value"] for s in strategies.values()), 2),
+            "total_positions": sum(s["position_count"] for s in strategies.values()),
+            "strategy_count": len(strategies),
+            "net_exposure_delta": round(net, 2),
+        },
+        "combined_positions": combined_positions,
+        "strategies": strategies,
+    }
+
+
+def generate(store, seed=0, now_ms=None, scale=1.0):
+    """
+    Write a full synthetic fixture set into `store`.
+
+    Args:
+        store: FixtureStore to fill (flushed at the end)
+        seed: Random seed - same seed, same payloads
+        now_ms: "Current" time for timestamps (default: now)
+        scale: Multiplier for list sizes (positions per side, fills, ticks...)
+    """
+    rng = random.Random(seed)
+    now_ms = now_ms or int(time.time() * 1000)
+    n = lambda count: max(1, int(count * scale))
+
+    store.save_json("GET /health", {"status": "ok", "timestamp": now_ms})
+
+    # ---------- positions ----------
+    block = _positions_block(POSITION_SYMBOLS, rng, per_side=n(50))
+    block.update({"updated_at": _iso(now_ms), "min_position_value": 200000})
+    store.save_json("GET /api/positions.json", block)
+
+    symbols = {}
+    for coin in POSITION_SYMBOLS:
+        symbols[coin] = _positions_block([coin], rng, per_side=n(50))
+    store.save_json("GET /api/positions/all.json", {"updated_at": _iso(now_ms), "symbols": symbols})
+
+    # ---------- fills ----------
+    fills = [_fill(rng.choice(SYMBOLS[:10]), now_ms - i * 60_000, rng, 10**11 + i) for i in range(n(5000))]
+    store.save_json(f"GET /api/user/{SAMPLE_ADDRESS}/fills",
+                    {"address": SAMPLE_ADDRESS, "fills": fills[:100], "total": len(fills), "limit": 100})
+    store.save_json(f"GET /api/user/{SAMPLE_ADDRESS}/fills?limit=-1",
+                    {"address": SAMPLE_ADDRESS, "fills": fills, "total": len(fills), "limit": -1})
+    store.save_json(f"GET /api/fills/{SAMPLE_ADDRESS}", fills[:100])
+
+    # ---------- ticks & candles ----------
+    for coin in SYMBOLS[:5]:
+        prices = _walk(_price(coin, rng), n(10000), rng, vol=0.0002)
+        ticks = [{"t": now_ms - (len(prices) - i) * 360, "p": round(p, 6)} for i, p in enumerate(prices)]
+        store.save_json(f"GET /api/ticks/{coin}?duration=1h&limit=10000", {
+            "symbol": coin, "duration": "1h", "tick_count": len(ticks),
+            "latest_price": ticks[-1]["p"], "ticks": ticks,
+        })
+
+    interval_ms = {"1m": 60_000, "5m": 300_000, "15m": 900_000, "1h": 3_600_000, "4h": 14_400_000, "1d": 86_400_000}
+    for coin in SYMBOLS[:10]:
+        for interval, step in interval_ms.items():
+            closes = _walk(_price(coin, rng), n(500), rng, vol=0.004)
+            start = (now_ms // step - len(closes)) * step
+            candles = []
+            prev = closes[0]
+            for i, c in enumerate(closes):
+                hi, lo = max(prev, c) * (1 + rng.uniform(0, 0.002)), min(prev, c) * (1 - rng.uniform(0, 0.002))
+                candles.append({"t": start + i * step, "T": start + (i + 1) * step - 1, "s": coin, "i": interval,
+                                "o": f"{prev:.6g}", "h": f"{hi:.6g}", "l": f"{lo:.6g}", "c": f"{c:.6g}",
+                                "v": "0", "n": rng.randint(50, 400)})
+                prev = c
+            store.save_json(f"GET /api/candles/{coin}?interval={interval}", candles)
+
+    store.save_json("GET /api/candles/symbols", {
+        "symbols": SYMBOLS, "count": len(SYMBOLS), "volume_threshold": 750000,
+        "intervals": list(interval_ms),
+    })
+
+    # ---------- market data ----------
+    store.save_json("GET /api/prices", {
+        "timestamp": now_ms,
+        "count": len(ALL_COINS),
+        "prices": {c: f"{_price(c, rng):.6g}" for c in ALL_COINS},
+        "funding_rates": {c: f"{rng.gauss(0.00001, 0.00005):.8f}" for c in ALL_COINS},
+        "open_interest": {c: f"{10 ** rng.uniform(3, 7):.2f}" for c in ALL_COINS},
+    })
+    for coin in SYMBOLS:
+        book = _orderbook(coin, now_ms, rng)
+        store.save_json(f"GET /api/orderbook/{coin}", book)
+        store.save_json(f"GET /api/price/{coin}", {
+            "coin": coin, "timestamp": now_ms,
+            "best_bid": book["best_bid"], "best_ask": book["best_ask"],
+            "best_bid_size": float(book["levels"][0][0]["sz"]),
+            "best_ask_size": float(book["levels"][1][0]["sz"]),
+            "mid_price": book["mid_price"], "spread": book["spread"], "spread_bps": book["spread_bps"],
+        })
+
+    # ---------- HLP ----------
+    store.save_json("GET /api/hlp/positions", _hlp_positions(rng))
+    hlp_trades = []
+    for i in range(n(2000)):
+        trade = _fill(rng.choice(SYMBOLS[:20]), now_ms - i * 45_000, rng, 2 * 10**11 + i)
+        trade["strategy"] = rng.choice(HLP_STRATEGIES[:3])
+        hlp_trades.append(trade)
+    store.save_json("GET /api/hlp/trades", {"trades": hlp_trades[:100], "total": len(hlp_trades),
+                                            "strategies": HLP_STRATEGIES[:3]})
+    store.save_json("GET /api/hlp/trades?limit=2000", {"trades": hlp_trades, "total": len(hlp_trades),
+                                                       "strategies": HLP_STRATEGIES[:3]})
+
+    deltas = []
+    for i, value in enumerate(_walk(1.0, n(1440), rng, vol=0.02)):
+        net = (value - 1.0) * 5e7
+        deltas.append({"timestamp": now_ms - (n(1440) - i) * 60_000, "net_delta": round(net, 2),
+                       "long_exposure": round(8e7 + max(net, 0), 2), "short_exposure": round(8e7 - min(net, 0), 2)})
+    store.save_json("GET /api/hlp/deltas", {"deltas": deltas, "current": deltas[-1]["net_delta"],
+                                            "change_24h": deltas[-1]["net_delta"] - deltas[0]["net_delta"]})
+    store.save_json("GET /api/hlp/delta", {
+        "net_delta": deltas[-1]["net_delta"], "long_exposure": deltas[-1]["long_exposure"],
+        "short_exposure": deltas[-1]["short_exposure"], "position_count": 180, "timestamp": now_ms,
+    })
+    values = [d["net_delta"] for d in deltas]
+    mean = sum(values) / len(values)
+    std = (sum((v - mean) ** 2 for v in values) / len(values)) ** 0.5 or 1.0
+    z = (values[-1] - mean) / std
+    store.save_json("GET /api/hlp/sentiment", {
+        "net_delta": values[-1], "z_score": round(z, 3), "percentile": round(sum(v <= values[-1] for v in values) / len(values) * 100, 1),
+        "signal": {"direction": "long" if z > 0 else "short",
+                   "text": "Retail heavily SHORT" if z > 2 else "Retail heavily LONG" if z < -2 else "Neutral"},
+        "stats": {"mean": mean, "std": std, "min": min(values), "max": max(values)},
+    })
+    store.save_json("GET /api/hlp/positions/history", {
+        "interval": "5m",
+        "snapshots": [{"timestamp": now_ms - (288 - i) * 300_000,
+                       "strategies": {name: {"positions": [
+                           {"coin": c, "size": round(rng.uniform(-50, 50), 4),
+                            "position_value": round(rng.uniform(1e4, 5e6), 2)}
+                           for c in SYMBOLS[:8]]} for name in HLP_STRATEGIES[:3]}}
+                      for i in range(n(288))],
+    })
+    store.save_json("GET /api/hlp/correlation", {
+        "coins": {c: {"correlation": round(rng.uniform(-1, 1), 3), "samples": 1440} for c in SYMBOLS[:10]},
+    })
+    store.save_json("GET /api/hlp/flips", {"flips": [
+        {"datetime": _iso(now_ms - i * 4 * 3_600_000), "from_direction": "long" if i % 2 else "short",
+         "to_direction": "short" if i % 2 else "long", "from_delta": 500000, "to_delta": -200000,
+         "hold_duration_hours": 4.0, "btc_price": 93000, "eth_price": 3150} for i in range(n(20))]})
+
+    # ---------- liquidations & smart money ----------
+    for tf in ("10m", "1h", "4h", "12h", "24h", "2d", "7d", "14d", "30d"):
+        liqs = [{"coin": rng.choice(SYMBOLS[:20]), "side": rng.choice(["long", "short"]),
+                 "value_usd": round(10 ** rng.uniform(3, 6.5), 2), "price": 100.0,
+                 "timestamp": now_ms - i * 30_000, "user": _address(rng)} for i in range(n(200))]
+        store.save_json(f"GET /api/liquidations/{tf}.json", {
+            "stats": {"total_count": len(liqs), "total_value_usd": round(sum(l["value_usd"] for l in liqs), 2)},
+            "liquidations": liqs,
+        })
+    for tf in ("10m", "1h", "24h"):
+        store.save_json(f"GET /api/smart_money/signals_{tf}.json", {"signals": [
+            {"coin": rng.choice(SYMBOLS[:20]), "direction": rng.choice(["long", "short"]),
+             "strength": round(rng.uniform(0, 1), 3), "timestamp": now_ms - i * 120_000,
+             "address": _address(rng)} for i in range(n(100))]})
+    store.save_json("GET /api/smart_money/rankings.json", {
+        "smart_money": [{"address": _address(rng), "pnl": round(rng.uniform(1e5, 1e7), 2)} for _ in range(100)],
+        "dumb_money": [{"address": _address(rng), "pnl": round(-rng.uniform(1e5, 1e7), 2)} for _ in range(100)],
+    })
+
+    # ---------- position snapshots ----------
+    for coin in SYMBOLS[:5]:
+        snaps = []
+        users = [_address(rng) for _ in range(40)]
+        for minute in range(n(1000) // 40):
+            ts = now_ms - (n(1000) // 40 - minute) * 60_000
+            for user in users:
+                pos = _position(coin, rng.choice(["LONG", "SHORT"]), rng)
+                snaps.append({"timestamp": ts, "user": user, "symbol": coin, "side": pos["side"].lower(),
+                              "position_value": pos["value"], "size": abs(pos["size"]),
+                              "entry_price": pos["entry_price"], "liquidation_price": pos["liq_price"],
+                              "mark_price": pos["mark_price"], "distance_pct": pos["distance_pct"],
+                              "leverage": pos["leverage"]})
+        store.save_json(f"GET /api/position_snapshots/symbol/{coin}?hours=24&limit=1000",
+                        {"symbol": coin, "hours": 24, "count": len(snaps), "snapshots": snaps})
+
+    store.flush()
+    return store
+
+
+def main(fixtures_dir=DEFAULT_FIXTURES_DIR, seed=0, scale=1.0):
+    """Generate synthetic fixtures into `fixtures_dir`"""
+    store = generate(FixtureStore(fixtures_dir), seed=seed, scale=scale)
+    print(f"🌙 Moon Dev: wrote {len(store.keys())} synthetic fixtures to {fixtures_dir}")
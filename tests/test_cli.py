@@ -0,0 +1,48 @@
+"""
+🌙 Moon Dev's CLI tests - run against the replay server, no API key needed
+
+Built with love by Moon Dev 🚀
+
+Usage:
+    python -m pytest tests
+"""
+
+import io
+import os
+import sys
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from api import cli
+from replay.fixtures import FixtureStore
+from replay.server import ReplayServer
+from replay.synthetic import generate
+
+
+@pytest.fixture(scope="module")
+def server(tmp_path_factory):
+    directory = tmp_path_factory.mktemp("fixtures")
+    generate(FixtureStore(str(directory)), seed=1, now_ms=int(time.time() * 1000), scale=0.1)
+    with ReplayServer(str(directory)) as replay:
+        yield replay
+
+
+def test_watch_stops_when_reader_goes_away(server, monkeypatch):
+    """`moondev hlp-sentiment --watch 0.05 | head -1` exits instead of polling forever"""
+    read_fd, write_fd = os.pipe()
+    os.close(read_fd)
+    out = os.fdopen(write_fd, "w")
+    stderr = io.StringIO()
+    monkeypatch.setattr(sys, "stderr", stderr)
+
+    started = time.monotonic()
+    code = cli.main(["--api-key", "x", "--base-url", server.url,
+                     "hlp-sentiment", "--watch", "0.05", "--count", "100", "-f", "ndjson"], out=out)
+
+    # Polling on through 100 failed writes would take 5s and leave stderr open
+    assert code == 0
+    assert time.monotonic() - started < 2
+    assert stderr.closed